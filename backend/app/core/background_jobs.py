@@ -0,0 +1,398 @@
+"""
+Scaffolding shared by the tenant-scoped background job runners.
+
+Job tables are under row-level security, so discovery walks the tenants and
+queries each one in its own scoped session.  Two runner shapes build on that:
+
+* :class:`JobWorkerPool` feeds a fixed set of worker tasks from a queue.  It
+  suits work that is claimed row by row with ``FOR UPDATE SKIP LOCKED``
+  (batch imports, bulk publish, the post-publish outbox).
+* :class:`ClaimedJobRunner` runs one task per job, claimed with a
+  ``worker_token`` and kept by a heartbeat.  It suits jobs that advance a
+  single checkpoint (rebuild-all, compliance scans).
+
+Both rediscover pending work periodically, which also resumes jobs that a
+restart interrupted.  :func:`record_chunk_attempt` caps how often a worker
+pool retries a chunk that keeps failing as a whole.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import Select, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.db.models import Tenant
+from app.db.session import (
+    get_background_session,
+    get_tenant_background_session,
+    scope_session_to_tenant,
+)
+
+logger = get_logger(__name__)
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+ACTIVE_JOB_STATUSES = (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING)
+
+ITEM_STATUS_PENDING = "pending"
+ITEM_STATUS_FAILED = "failed"
+
+
+async def list_tenant_ids() -> list[UUID]:
+    async with get_background_session() as session:
+        return list((await session.execute(select(Tenant.id))).scalars().all())
+
+
+async def discover_in_tenants(
+    query: Callable[[UUID], Select[tuple[UUID]]],
+) -> list[tuple[UUID, UUID]]:
+    """``(tenant_id, id)`` of every row that ``query(tenant_id)`` selects, tenant by tenant."""
+    found: list[tuple[UUID, UUID]] = []
+    for tenant_id in await list_tenant_ids():
+        async with get_tenant_background_session(tenant_id) as session:
+            result = await session.execute(query(tenant_id))
+            found.extend((tenant_id, row_id) for row_id in result.scalars().all())
+    return found
+
+
+async def _cancel_all(tasks: list[asyncio.Task[Any]]) -> None:
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def record_chunk_attempt(
+    session: AsyncSession,
+    job_model: type[Any],
+    item_model: type[Any],
+    items: list[Any],
+    *,
+    max_attempts: int,
+) -> list[Any]:
+    """
+    Commit an attempt on claimed chunk ``items`` before they are processed.
+
+    A chunk that fails as a whole rolls back everything it wrote, so the
+    attempt is committed on its own; items that already used
+    ``max_attempts`` are failed (and counted on the job's ``failed``) instead
+    of being retried forever.  The commit releases the claim, so the items
+    still to process are locked again in a new transaction scoped to their
+    tenant and returned, minus any another worker has claimed meanwhile.
+    """
+    now = datetime.now(UTC)
+    exhausted = 0
+    for item in items:
+        if (item.attempts or 0) >= max_attempts:
+            item.status = ITEM_STATUS_FAILED
+            item.error = f"Gave up after {item.attempts} attempts"
+            item.processed_at = now
+            exhausted += 1
+        else:
+            item.attempts = (item.attempts or 0) + 1
+    if exhausted:
+        await session.execute(
+            update(job_model)
+            .where(job_model.id == items[0].job_id)
+            .values(failed=job_model.failed + exhausted)
+            .execution_options(synchronize_session=False)
+        )
+    attempts = {item.id: item.attempts for item in items if item.status == ITEM_STATUS_PENDING}
+    await session.commit()
+    if not attempts:
+        return []
+    await scope_session_to_tenant(session, items[0].tenant_id)
+    result = await session.execute(
+        select(item_model)
+        .where(item_model.id.in_(attempts), item_model.status == ITEM_STATUS_PENDING)
+        .order_by(item_model.item_index)
+        .with_for_update(skip_locked=True)
+        .execution_options(populate_existing=True)
+    )
+    return [item for item in result.scalars().all() if item.attempts == attempts[item.id]]
+
+
+class JobWorkerPool[K: Hashable]:
+    """
+    Worker tasks that run queued keys, and a scanner that queues pending ones.
+
+    With ``share_jobs`` a key is queued once per worker so that all of them
+    claim chunks of the same job; otherwise a key waits in the queue at most
+    once.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[K], Awaitable[object]],
+        discover: Callable[[], Awaitable[Iterable[K]]],
+        *,
+        share_jobs: bool,
+    ) -> None:
+        self.name = name
+        self._run = run
+        self._discover = discover
+        self._share_jobs = share_jobs
+        self._queue: asyncio.Queue[K] | None = None
+        self._queued: set[K] = set()
+        self._workers: list[asyncio.Task[None]] = []
+        self._scanner: asyncio.Task[None] | None = None
+
+    def enqueue(self, key: K) -> bool:
+        """Hand ``key`` to the workers; returns ``False`` if none run in this process."""
+        if self._queue is None or not self._workers:
+            return False
+        if self._share_jobs:
+            for _ in self._workers:
+                self._queue.put_nowait(key)
+        elif key not in self._queued:
+            self._queued.add(key)
+            self._queue.put_nowait(key)
+        return True
+
+    async def _work_forever(self, queue: asyncio.Queue[K]) -> None:
+        while True:
+            key = await queue.get()
+            self._queued.discard(key)
+            try:
+                await self._run(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "background_job_failed", runner=self.name, key=str(key), exc_info=True
+                )
+            finally:
+                queue.task_done()
+
+    async def _scan_forever(self, interval_seconds: int) -> None:
+        while True:
+            try:
+                queue = self._queue
+                # Shared jobs sit in the queue once per worker; rescan once they are taken.
+                if queue is not None and (not self._share_jobs or queue.empty()):
+                    for key in await self._discover():
+                        self.enqueue(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("background_job_scan_failed", runner=self.name, exc_info=True)
+            await asyncio.sleep(interval_seconds)
+
+    def start(self, concurrency: int, poll_interval_seconds: int) -> None:
+        """Start ``concurrency`` workers and the scanner (no-op when disabled or running)."""
+        if concurrency <= 0 or self._workers:
+            return
+        queue: asyncio.Queue[K] = asyncio.Queue()
+        self._queue = queue
+        self._workers.extend(
+            asyncio.create_task(self._work_forever(queue)) for _ in range(concurrency)
+        )
+        self._scanner = asyncio.create_task(self._scan_forever(poll_interval_seconds))
+
+    async def stop(self) -> None:
+        """Cancel the workers and scanner; whatever they had claimed rolls back."""
+        await _cancel_all([*self._workers, *([self._scanner] if self._scanner else [])])
+        self._workers.clear()
+        self._queued.clear()
+        self._scanner = None
+        self._queue = None
+
+
+class ClaimedJobRunner:
+    """
+    Runs jobs stored in ``model`` to completion, one task per job.
+
+    ``model`` has ``id``, ``tenant_id``, ``status``, ``worker_token``,
+    ``started_at``, ``heartbeat_at``, ``finished_at`` and ``last_error``
+    columns.  A runner claims a queued job, or a running one whose heartbeat
+    is older than ``stale_seconds()``, by writing a fresh ``worker_token``.
+    ``work(tenant_id, job_id, token)`` then advances the job under that claim
+    and returns once it called :meth:`finish` or found the claim lost.  While
+    it runs, the heartbeat is refreshed every third of ``stale_seconds()``,
+    so slow steps such as a template refresh do not let the claim go stale.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: type[Any],
+        work: Callable[[UUID, UUID, UUID], Awaitable[None]],
+        *,
+        stale_seconds: Callable[[], int],
+        poll_interval_seconds: Callable[[], int],
+    ) -> None:
+        self.name = name
+        self._model = model
+        self._work = work
+        self._stale_seconds = stale_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._running: dict[UUID, asyncio.Task[bool]] = {}
+        self._scanner: asyncio.Task[None] | None = None
+        self._started = False
+
+    def owned_by(self, job_id: UUID, token: UUID) -> Any:
+        return (self._model.id == job_id) & (self._model.worker_token == token)
+
+    def resumable(self) -> Any:
+        """Queued jobs, and running jobs whose runner stopped heart-beating."""
+        stale_before = datetime.now(UTC) - timedelta(seconds=self._stale_seconds())
+        return or_(
+            self._model.status == JOB_STATUS_QUEUED,
+            (self._model.status == JOB_STATUS_RUNNING)
+            & or_(
+                self._model.heartbeat_at.is_(None),
+                self._model.heartbeat_at < stale_before,
+            ),
+        )
+
+    async def claim(self, tenant_id: UUID, job_id: UUID, token: UUID) -> bool:
+        """Take over ``job_id`` with ``token`` if it is resumable."""
+        async with get_tenant_background_session(tenant_id) as session:
+            result = await session.execute(
+                update(self._model)
+                .where(self._model.id == job_id, self.resumable())
+                .values(
+                    status=JOB_STATUS_RUNNING,
+                    worker_token=token,
+                    heartbeat_at=func.now(),
+                    started_at=func.coalesce(self._model.started_at, func.now()),
+                )
+                .returning(self._model.id)
+            )
+            claimed = result.scalar_one_or_none() is not None
+            await session.commit()
+        return claimed
+
+    async def heartbeat(self, tenant_id: UUID, job_id: UUID, token: UUID) -> bool:
+        """Refresh the heartbeat of the claim; returns ``False`` if it was lost."""
+        async with get_tenant_background_session(tenant_id) as session:
+            result = await session.execute(
+                update(self._model)
+                .where(self.owned_by(job_id, token))
+                .values(heartbeat_at=func.now())
+                .returning(self._model.id)
+            )
+            alive = result.scalar_one_or_none() is not None
+            await session.commit()
+        return alive
+
+    async def _beat_forever(self, tenant_id: UUID, job_id: UUID, token: UUID) -> None:
+        while True:
+            await asyncio.sleep(self._stale_seconds() / 3)
+            try:
+                if not await self.heartbeat(tenant_id, job_id, token):
+                    return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "background_job_heartbeat_failed",
+                    runner=self.name,
+                    job_id=str(job_id),
+                    exc_info=True,
+                )
+
+    async def finish(
+        self,
+        tenant_id: UUID,
+        job_id: UUID,
+        token: UUID,
+        *,
+        error: str | None,
+        summarize: Callable[[AsyncSession], Awaitable[dict[str, Any]]] | None = None,
+    ) -> None:
+        """Mark the job completed or failed and release the claim.
+
+        On success ``summarize`` may add column values computed in the same
+        transaction.
+        """
+        async with get_tenant_background_session(tenant_id) as session:
+            values: dict[str, Any] = {
+                "status": JOB_STATUS_FAILED if error else JOB_STATUS_COMPLETED,
+                "last_error": error,
+                "worker_token": None,
+                "heartbeat_at": func.now(),
+                "finished_at": func.now(),
+            }
+            if error is None and summarize is not None:
+                values.update(await summarize(session))
+            await session.execute(
+                update(self._model).where(self.owned_by(job_id, token)).values(**values)
+            )
+            await session.commit()
+
+    async def run(self, tenant_id: UUID, job_id: UUID) -> bool:
+        """Claim and run a job to completion; returns whether this runner ran it."""
+        token = uuid4()
+        if not await self.claim(tenant_id, job_id, token):
+            return False
+        beat = asyncio.create_task(self._beat_forever(tenant_id, job_id, token))
+        try:
+            await self._work(tenant_id, job_id, token)
+        except asyncio.CancelledError:
+            # Leave the job running; its heartbeat goes stale and another runner resumes it.
+            raise
+        except Exception as exc:
+            logger.warning(
+                "background_job_failed", runner=self.name, job_id=str(job_id), exc_info=True
+            )
+            await self.finish(tenant_id, job_id, token, error=str(exc) or type(exc).__name__)
+        finally:
+            await _cancel_all([beat])
+        return True
+
+    def enqueue(self, tenant_id: UUID, job_id: UUID) -> bool:
+        """Start running ``job_id`` in this process; returns ``False`` if the runner is stopped."""
+        if not self._started:
+            return False
+        task = self._running.get(job_id)
+        if task is None or task.done():
+            task = asyncio.create_task(self.run(tenant_id, job_id))
+            self._running[job_id] = task
+            task.add_done_callback(lambda _: self._running.pop(job_id, None))
+        return True
+
+    async def discover(self) -> list[tuple[UUID, UUID]]:
+        """``(tenant_id, job_id)`` of every resumable job."""
+        return await discover_in_tenants(
+            lambda tenant_id: select(self._model.id).where(
+                self._model.tenant_id == tenant_id, self.resumable()
+            )
+        )
+
+    async def _scan_forever(self, interval_seconds: int) -> None:
+        while True:
+            try:
+                for tenant_id, job_id in await self.discover():
+                    self.enqueue(tenant_id, job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("background_job_scan_failed", runner=self.name, exc_info=True)
+            await asyncio.sleep(interval_seconds)
+
+    def start(self) -> None:
+        """Allow jobs to run in this process and scan for resumable ones."""
+        self._started = True
+        interval = self._poll_interval_seconds()
+        if interval > 0 and (self._scanner is None or self._scanner.done()):
+            self._scanner = asyncio.create_task(self._scan_forever(interval))
+
+    async def stop(self) -> None:
+        """Cancel running jobs; they resume from their checkpoint elsewhere or on restart."""
+        self._started = False
+        await _cancel_all([*self._running.values(), *([self._scanner] if self._scanner else [])])
+        self._running.clear()
+        self._scanner = None
@@ -0,0 +1,137 @@
+"""
+Shared Redis response cache.
+
+Cached entries are raw response bodies stored in the cache database
+(``redis_url``, DB 0 by default).  Every entry is registered under one or
+more tag sets so that writers can drop all dependent entries with a single
+``invalidate_tags`` call after their transaction commits.  Deleting entries
+cannot stop a reader that loaded older data from writing its entry afterwards,
+so keys also embed a version of their source: the published revision for
+detail responses, or a generation counter from :func:`get_generation` that
+writers advance with :func:`bump_generation`.
+
+The cache fails open: when Redis is unreachable, reads miss and writes are
+skipped, and reconnects are attempted at most once per cooldown window.
+"""
+
+from __future__ import annotations
+
+import inspect
+import time
+from collections.abc import Iterable
+
+import redis.asyncio as redis
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds to wait before retrying a Redis connection that failed to ping
+_RECONNECT_COOLDOWN_SECONDS = 30.0
+
+# Module-level Redis connection shared across requests
+_redis: redis.Redis | None = None
+_retry_after: float = 0.0
+
+
+async def get_cache_redis() -> redis.Redis | None:
+    """Get or create the module-level Redis connection for response caching."""
+    global _redis, _retry_after
+    settings = get_settings()
+    if not settings.public_response_cache_enabled or settings.redis_cache_ttl <= 0:
+        return None
+    if _redis is None:
+        if time.monotonic() < _retry_after:
+            return None
+        try:
+            _redis = redis.from_url(str(settings.redis_url))  # type: ignore[no-untyped-call]
+            ping_result = _redis.ping()
+            if inspect.isawaitable(ping_result):
+                await ping_result
+        except Exception:
+            logger.warning("response_cache_redis_unavailable")
+            _redis = None
+            _retry_after = time.monotonic() + _RECONNECT_COOLDOWN_SECONDS
+    return _redis
+
+
+async def close_cache_redis() -> None:
+    """Close the cache Redis connection (call at shutdown)."""
+    global _redis, _retry_after
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+    _retry_after = 0.0
+
+
+async def get_cached_response(key: str) -> bytes | None:
+    """Return the cached body for *key*, or ``None`` on a miss or Redis error."""
+    client = await get_cache_redis()
+    if client is None:
+        return None
+    try:
+        value = await client.get(key)
+    except Exception:
+        logger.warning("response_cache_read_failed", key=key)
+        return None
+    return value if isinstance(value, bytes) else None
+
+
+async def cache_response(key: str, content: bytes, *, tags: Iterable[str]) -> None:
+    """Store *content* under *key* and register the key with every tag set."""
+    client = await get_cache_redis()
+    if client is None:
+        return
+    ttl = get_settings().redis_cache_ttl
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(key, content, ex=ttl)
+            for tag in tags:
+                pipe.sadd(tag, key)
+                pipe.expire(tag, ttl)
+            await pipe.execute()
+    except Exception:
+        logger.warning("response_cache_write_failed", key=key)
+
+
+async def get_generation(name: str) -> int | None:
+    """Return the generation counter *name*, or ``None`` when the cache is unavailable."""
+    client = await get_cache_redis()
+    if client is None:
+        return None
+    try:
+        value = await client.get(name)
+    except Exception:
+        logger.warning("response_cache_read_failed", key=name)
+        return None
+    return int(value or 0)
+
+
+async def bump_generation(name: str) -> None:
+    """Advance the generation counter *name* so keys built from the old value are never read."""
+    client = await get_cache_redis()
+    if client is None:
+        return
+    try:
+        await client.incr(name)
+    except Exception:
+        logger.warning("response_cache_invalidation_failed", tags=[name])
+
+
+async def invalidate_tags(*tags: str) -> None:
+    """Delete every cached entry registered under the given tag sets."""
+    if not tags:
+        return
+    client = await get_cache_redis()
+    if client is None:
+        return
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.smembers(tag)
+            member_sets = await pipe.execute()
+        keys = {key for members in member_sets for key in members}
+        await client.delete(*keys, *tags)
+    except Exception:
+        logger.warning("response_cache_invalidation_failed", tags=list(tags))
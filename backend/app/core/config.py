@@ -56,6 +56,28 @@ class Settings(BaseSettings):
         default="dpp_admin_bypass",
         description="Optional DB role for platform admin RLS bypass",
     )
+    tenant_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        description=(
+            "TTL of the in-process tenant slug/hostname cache; 0 disables it. "
+            "Entries are also dropped on Postgres NOTIFY from tenants/tenant_domains."
+        ),
+    )
+    tenant_cache_max_entries: int = Field(default=1024, ge=1)
+    identity_sync_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="How long a worker skips the users upsert for unchanged token claims",
+    )
+    landing_summary_reconcile_interval_seconds: int = Field(
+        default=3600,
+        ge=0,
+        description=(
+            "Interval for recomputing public landing summary counters from source tables "
+            "(0 disables the periodic job)"
+        ),
+    )
 
     # ==========================================================================
     # Redis Configuration
@@ -66,6 +88,14 @@ class Settings(BaseSettings):
         description="Separate Redis URL for rate limiting (defaults to DB 1 of redis_url)",
     )
     redis_cache_ttl: int = Field(default=3600, description="Cache TTL in seconds")
+    public_response_cache_enabled: bool = Field(
+        default=True,
+        description="Cache public AAS repository responses in Redis (redis_url)",
+    )
+    public_dpp_cache_control: str = Field(
+        default="public, max-age=60, must-revalidate",
+        description="Cache-Control header for ETag-validated public DPP and AAS responses",
+    )
 
     # ==========================================================================
     # CIRPASS Lab Public Feed
@@ -310,6 +340,40 @@ class Settings(BaseSettings):
             'e.g. {"default":"<base64-32-byte-key>","next":"..."}'
         ),
     )
+    dpp_encryption_reuse_ciphertext: bool = Field(
+        default=True,
+        description=(
+            "Carry ciphertext of unchanged Confidentiality=encrypted values forward to new "
+            "revisions under the parent's DEK while it is wrapped by the active KEK"
+        ),
+    )
+    dpp_decryption_cache_tenant_ids: list[str] = Field(
+        default=[],
+        description=(
+            "Tenant IDs that opt in to caching decrypted revision environments and "
+            "unwrapped DEKs in worker memory"
+        ),
+    )
+    dpp_decryption_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=1,
+        description="Lifetime of a cached decrypted revision environment",
+    )
+    dpp_decryption_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        ge=0,
+        description="Memory budget per worker for cached decrypted environments (serialized size)",
+    )
+    dpp_dek_cache_ttl_seconds: int = Field(
+        default=15,
+        ge=1,
+        description="Lifetime of a cached unwrapped DEK",
+    )
+    dpp_dek_cache_max_entries: int = Field(
+        default=256,
+        ge=0,
+        description="Maximum unwrapped DEKs cached per worker",
+    )
 
     metrics_auth_token: str = Field(
         default="",
@@ -372,6 +436,22 @@ class Settings(BaseSettings):
     template_cache_ttl: int = Field(
         default=86400, description="Template cache TTL in seconds (default: 24 hours)"
     )
+    template_contract_cache_max_entries: int = Field(
+        default=64,
+        ge=0,
+        description=(
+            "Generated template contracts kept in memory per worker in front of the "
+            "template_contracts table (0 disables the in-memory tier)"
+        ),
+    )
+    template_model_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description=(
+            "Budget for parsed BaSyx template models shared per worker, estimated from "
+            "template JSON size (0 disables the cache)"
+        ),
+    )
 
     template_version_resolution_policy: Literal["latest_patch"] = Field(
         default="latest_patch",
@@ -457,10 +537,140 @@ class Settings(BaseSettings):
         default="dpp-platform-key-1",
         description="Key ID (kid) included in JWS header for key rotation support",
     )
+    dpp_signing_keys_file: str = Field(
+        default="",
+        description=(
+            "Optional JSON keyring ({active_kid, keys: [{kid, algorithm, private_key}]}) "
+            "merged over dpp_signing_key; re-read when it changes, so keys rotate "
+            "without a restart"
+        ),
+    )
+    dpp_signing_keys_reload_seconds: int = Field(
+        default=30,
+        ge=1,
+        description="Minimum interval between checks of dpp_signing_keys_file for changes",
+    )
+    dpp_signing_batch_workers: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description=(
+            "Threads that sign digests of a bulk publish chunk (0 signs in the request process)"
+        ),
+    )
+    dpp_rebuild_chunk_size: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="DPPs a rebuild-all job processes between checkpoints",
+    )
+    dpp_rebuild_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="DPPs a rebuild-all job rebuilds at once, each on its own session",
+    )
+    dpp_rebuild_stale_seconds: int = Field(
+        default=300,
+        ge=30,
+        description="Heartbeat age after which another runner may resume a rebuild-all job",
+    )
+    dpp_rebuild_poll_interval_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="How often runners look for queued or stalled rebuild-all jobs (0 disables)",
+    )
+    dpp_bulk_publish_max_items: int = Field(
+        default=50000,
+        ge=1,
+        description="Maximum number of DPPs accepted by one bulk publish job",
+    )
+    dpp_bulk_publish_chunk_size: int = Field(
+        default=200,
+        ge=1,
+        le=2000,
+        description="DPPs published per transaction by bulk publish workers",
+    )
+    dpp_bulk_publish_worker_concurrency: int = Field(
+        default=2,
+        ge=0,
+        le=32,
+        description=("Bulk publish workers per process (0 leaves jobs to other processes)"),
+    )
+    dpp_bulk_publish_poll_interval_seconds: int = Field(
+        default=30,
+        ge=1,
+        description="How often bulk publish workers scan for queued or interrupted jobs",
+    )
+    dpp_bulk_publish_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Claims of a chunk before its items are failed (the chunk kept failing)",
+    )
+    dpp_bulk_create_digest_workers: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description=(
+            "Worker processes that digest environments during bulk DPP creation "
+            "(0 digests in the request process)"
+        ),
+    )
+    batch_import_async_max_items: int = Field(
+        default=100_000,
+        ge=1,
+        description="Maximum items accepted by one asynchronous batch import job",
+    )
+    batch_import_chunk_size: int = Field(
+        default=200,
+        ge=1,
+        le=5000,
+        description="Items a batch import worker processes and commits per transaction",
+    )
+    batch_import_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Claims of a chunk before its items are failed (the chunk kept failing)",
+    )
+    batch_import_worker_concurrency: int = Field(
+        default=2,
+        ge=0,
+        description="Batch import worker tasks per process (0 disables processing here)",
+    )
+    batch_import_poll_interval_seconds: int = Field(
+        default=30,
+        ge=1,
+        description="How often idle batch import workers look for queued jobs",
+    )
     dpp_max_draft_revisions: int = Field(
         default=10,
         description="Maximum number of draft revisions to keep per DPP. Published revisions are always kept.",
     )
+    dpp_revision_storage_mode: Literal["full", "delta"] = Field(
+        default="full",
+        description=(
+            "How new revisions store aas_env_json: 'full' copies the environment, "
+            "'delta' stores a JSON Patch against the parent revision between keyframes"
+        ),
+    )
+    dpp_revision_keyframe_interval: int = Field(
+        default=20,
+        ge=1,
+        description="In delta mode, store a full keyframe at least every N revisions of a chain",
+    )
+    dpp_revision_cache_max_entries: int = Field(
+        default=256,
+        ge=0,
+        description="Materialized delta-encoded revision environments kept per worker (0 disables)",
+    )
+    aas_validation_cache_max_entries: int = Field(
+        default=2048,
+        ge=0,
+        description=(
+            "BaSyx conformance results kept per worker, keyed by the content digest of each "
+            "submodel, shell list and concept description list (0 disables)"
+        ),
+    )
     dpp_required_specific_asset_ids_default: list[str] = Field(
         default=["manufacturerPartId"],
         description=(
@@ -525,6 +735,39 @@ class Settings(BaseSettings):
     compliance_check_on_publish: bool = Field(
         default=False, description="Run compliance check before publish"
     )
+    compliance_report_cache_size: int = Field(
+        default=2048,
+        ge=0,
+        description=(
+            "Compliance reports kept per worker, keyed by revision digest and ruleset "
+            "version (0 disables the cache)"
+        ),
+    )
+    compliance_scan_chunk_size: int = Field(
+        default=200,
+        ge=1,
+        le=2000,
+        description="DPPs a compliance scan evaluates between checkpoints",
+    )
+    compliance_scan_workers: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description=(
+            "Worker processes that evaluate rules during compliance scans "
+            "(0 evaluates in the scanning process)"
+        ),
+    )
+    compliance_scan_stale_seconds: int = Field(
+        default=300,
+        ge=30,
+        description="Heartbeat age after which another runner may resume a compliance scan",
+    )
+    compliance_scan_poll_interval_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="How often runners look for queued or stalled compliance scans (0 disables)",
+    )
 
     # ==========================================================================
     # Digital Thread
@@ -668,6 +911,45 @@ class Settings(BaseSettings):
         default=25, description="Max webhook subscriptions per tenant"
     )
 
+    # ==========================================================================
+    # Post-publish outbox
+    # ==========================================================================
+    dpp_outbox_worker_concurrency: int = Field(
+        default=4,
+        ge=0,
+        le=64,
+        description=(
+            "Workers per process delivering post-publish side effects from the outbox "
+            "(0 leaves delivery to other processes)"
+        ),
+    )
+    dpp_outbox_batch_size: int = Field(
+        default=20,
+        ge=1,
+        le=500,
+        description="Outbox entries a worker delivers for one tenant before yielding to others",
+    )
+    dpp_outbox_max_attempts: int = Field(
+        default=8,
+        ge=1,
+        description="Delivery attempts before an outbox entry is marked failed",
+    )
+    dpp_outbox_retry_base_seconds: int = Field(
+        default=5,
+        ge=1,
+        description="First retry delay of a failed side effect; doubles per attempt",
+    )
+    dpp_outbox_poll_interval_seconds: int = Field(
+        default=15,
+        ge=1,
+        description="How often workers scan tenants for due outbox entries",
+    )
+    dpp_outbox_retention_hours: int = Field(
+        default=168,
+        ge=1,
+        description="How long delivered outbox entries are kept before cleanup",
+    )
+
     # ==========================================================================
     # Email Notifications
     # ==========================================================================
@@ -4,7 +4,9 @@ Cryptographic audit trail primitives.
 Pure library modules for tamper-evident integrity:
 - **hash_chain**: SHA-256 hash chaining for sequential event integrity
 - **merkle**: Merkle tree construction and inclusion proof verification
+- **environment_digest**: Merkle-structured AAS environment digests
 - **signing**: Ed25519 digital signatures for Merkle roots
+- **jws_signer**: JWS signing with preloaded, rotatable keys
 - **anchoring**: RFC 3161 Timestamp Authority client
 - **verification**: Chain and event verification utilities
 """
@@ -12,11 +14,16 @@ Pure library modules for tamper-evident integrity:
 from app.core.crypto.canonicalization import (
     CANONICALIZATION_LEGACY_JSON_V1,
     CANONICALIZATION_RFC8785,
+    CANONICALIZATION_RFC8785_MERKLE_V1,
     SHA256_ALGORITHM,
     canonicalize_jcs_bytes,
     canonicalize_legacy_json_v1_bytes,
     sha256_hex_jcs,
 )
+from app.core.crypto.environment_digest import (
+    EnvironmentDigest,
+    compute_environment_digest,
+)
 from app.core.crypto.hash_chain import canonical_json, compute_event_hash
 from app.core.crypto.merkle import (
     MerkleTree,
@@ -43,7 +50,10 @@ __all__ = [
     "sha256_hex_jcs",
     "CANONICALIZATION_RFC8785",
     "CANONICALIZATION_LEGACY_JSON_V1",
+    "CANONICALIZATION_RFC8785_MERKLE_V1",
     "SHA256_ALGORITHM",
+    "EnvironmentDigest",
+    "compute_environment_digest",
     "MerkleTree",
     "compute_merkle_root",
     "compute_inclusion_proof",
@@ -10,6 +10,9 @@ import rfc8785
 
 CANONICALIZATION_RFC8785 = "rfc8785"
 CANONICALIZATION_LEGACY_JSON_V1 = "legacy-json-v1"
+# RFC 8785 per submodel and shell, combined into a Merkle root
+# (see ``app.core.crypto.environment_digest``).
+CANONICALIZATION_RFC8785_MERKLE_V1 = "rfc8785-merkle-v1"
 SHA256_ALGORITHM = "sha-256"
 
 
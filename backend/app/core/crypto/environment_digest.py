@@ -0,0 +1,217 @@
+"""
+Merkle-structured digest of an AAS environment.
+
+Under ``rfc8785-merkle-v1`` every submodel is a leaf hashed on its own
+RFC 8785 canonical form, and the rest of the environment (shells, concept
+descriptions, ...) forms one more "shell" leaf.  The revision digest is the
+Merkle root over ``[shell, *submodels]`` in environment order.
+
+Because leaves are independent, a revision that changes one submodel only
+has to rehash that submodel: the other leaf hashes are carried over from the
+previous revision.  The leaves also yield per-submodel inclusion proofs, so
+a verifier can check a single submodel against the signed root.
+
+The shell leaf replaces the ``submodels`` array with its length.  That binds
+the leaf count into the root, so the duplicated-last-node padding of
+:func:`compute_merkle_root` cannot make two environments collide.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+from app.core.crypto.canonicalization import CANONICALIZATION_RFC8785_MERKLE_V1, sha256_hex_jcs
+from app.core.crypto.merkle import compute_inclusion_proof, compute_merkle_root
+
+_HEX_DIGEST_LENGTH = 64
+
+
+@dataclass(frozen=True)
+class SubmodelLeaf:
+    """Leaf hash of one submodel; ``submodel_id`` is ``None`` when not a string."""
+
+    submodel_id: str | None
+    sha256: str
+
+
+@dataclass(frozen=True)
+class EnvironmentDigest:
+    """Root and leaf hashes of an environment under ``rfc8785-merkle-v1``."""
+
+    root: str
+    shell_sha256: str
+    submodels: tuple[SubmodelLeaf, ...] = ()
+
+    @property
+    def leaves(self) -> list[str]:
+        """Merkle leaves in tree order: the shell leaf, then each submodel."""
+        return [self.shell_sha256, *(leaf.sha256 for leaf in self.submodels)]
+
+    def submodel_digests(self) -> dict[str, str]:
+        """Map each uniquely identified submodel to its leaf hash."""
+        counts = Counter(leaf.submodel_id for leaf in self.submodels)
+        return {
+            leaf.submodel_id: leaf.sha256
+            for leaf in self.submodels
+            if leaf.submodel_id is not None and counts[leaf.submodel_id] == 1
+        }
+
+    def submodel_inclusion_proof(self, position: int) -> list[tuple[str, str]]:
+        """Return the inclusion proof for the submodel at ``position``."""
+        return compute_inclusion_proof(self.leaves, position + 1)
+
+    def to_json(self) -> dict[str, Any]:
+        """Serialize the leaves for storage next to the revision."""
+        return {
+            "shell": self.shell_sha256,
+            "submodels": [
+                {"id": leaf.submodel_id, "sha256": leaf.sha256} for leaf in self.submodels
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: Any) -> EnvironmentDigest | None:
+        """Rebuild a digest from stored leaves, or ``None`` if they are malformed."""
+        if not isinstance(data, dict) or not _is_hex_digest(data.get("shell")):
+            return None
+        raw_submodels = data.get("submodels")
+        if not isinstance(raw_submodels, list):
+            return None
+        submodels: list[SubmodelLeaf] = []
+        for item in raw_submodels:
+            if not isinstance(item, dict) or not _is_hex_digest(item.get("sha256")):
+                return None
+            submodels.append(SubmodelLeaf(submodel_id=_submodel_id(item), sha256=item["sha256"]))
+        shell_sha256 = data["shell"]
+        return cls(
+            root=compute_merkle_root([shell_sha256, *(leaf.sha256 for leaf in submodels)]),
+            shell_sha256=shell_sha256,
+            submodels=tuple(submodels),
+        )
+
+
+def stored_environment_digest(
+    canonicalization: str | None,
+    digest_sha256: str | None,
+    leaves: Any,
+) -> EnvironmentDigest | None:
+    """Load the leaves stored with a revision if they still match its digest."""
+    if canonicalization != CANONICALIZATION_RFC8785_MERKLE_V1:
+        return None
+    digest = EnvironmentDigest.from_json(leaves)
+    if digest is None or digest.root != digest_sha256:
+        return None
+    return digest
+
+
+def _is_hex_digest(value: Any) -> bool:
+    return isinstance(value, str) and len(value) == _HEX_DIGEST_LENGTH
+
+
+def _submodel_id(submodel: Any) -> str | None:
+    raw_id = submodel.get("id") if isinstance(submodel, dict) else None
+    return raw_id if isinstance(raw_id, str) else None
+
+
+def compute_environment_digest(
+    aas_env: dict[str, Any],
+    *,
+    reuse: Mapping[str, str] | None = None,
+) -> EnvironmentDigest:
+    """Compute the ``rfc8785-merkle-v1`` digest of ``aas_env``.
+
+    ``reuse`` maps submodel IDs to leaf hashes the caller knows are still
+    current (see :func:`reusable_submodel_digests`); those submodels are not
+    canonicalized again.  An environment without a ``submodels`` array is a
+    single shell leaf.
+    """
+    raw_submodels = aas_env.get("submodels")
+    if not isinstance(raw_submodels, list):
+        shell_sha256 = sha256_hex_jcs(aas_env)
+        return EnvironmentDigest(root=shell_sha256, shell_sha256=shell_sha256)
+
+    shell_sha256 = sha256_hex_jcs({**aas_env, "submodels": len(raw_submodels)})
+    ids = [_submodel_id(submodel) for submodel in raw_submodels]
+    counts = Counter(ids)
+    reuse = reuse or {}
+    submodels: list[SubmodelLeaf] = []
+    for submodel_id, submodel in zip(ids, raw_submodels, strict=True):
+        cached = None
+        if submodel_id is not None and counts[submodel_id] == 1:
+            cached = reuse.get(submodel_id)
+        submodels.append(
+            SubmodelLeaf(
+                submodel_id=submodel_id,
+                sha256=cached if cached is not None else sha256_hex_jcs(submodel),
+            )
+        )
+    return EnvironmentDigest(
+        root=compute_merkle_root([shell_sha256, *(leaf.sha256 for leaf in submodels)]),
+        shell_sha256=shell_sha256,
+        submodels=tuple(submodels),
+    )
+
+
+def reusable_submodel_digests(
+    previous: EnvironmentDigest | None,
+    *,
+    previous_env: dict[str, Any] | None = None,
+    aas_env: dict[str, Any] | None = None,
+    changed_submodel_ids: Collection[str] | None = None,
+) -> dict[str, str]:
+    """Select the leaf hashes of ``previous`` that still describe ``aas_env``.
+
+    With ``changed_submodel_ids`` the caller vouches that every other submodel
+    is untouched, so their hashes are reused as-is.  Otherwise each submodel of
+    ``aas_env`` is compared with the same submodel of ``previous_env``; that
+    comparison is far cheaper than canonicalizing and hashing it again.
+    """
+    if previous is None:
+        return {}
+    digests = previous.submodel_digests()
+    if changed_submodel_ids is not None:
+        changed = set(changed_submodel_ids)
+        return {
+            submodel_id: sha256
+            for submodel_id, sha256 in digests.items()
+            if submodel_id not in changed
+        }
+    if previous_env is None or aas_env is None:
+        return {}
+
+    previous_submodels = _submodels_by_id(previous_env)
+    reusable: dict[str, str] = {}
+    for submodel_id, submodel in _submodels_by_id(aas_env).items():
+        sha256 = digests.get(submodel_id)
+        if sha256 is not None and _same_json(previous_submodels.get(submodel_id), submodel):
+            reusable[submodel_id] = sha256
+    return reusable
+
+
+def _same_json(left: Any, right: Any) -> bool:
+    # ``==`` alone treats ``True`` and ``1`` as equal, which JSON does not, so
+    # equal values are confirmed on their serialized bytes.
+    return bool(left == right) and orjson.dumps(left) == orjson.dumps(right)
+
+
+def _submodels_by_id(aas_env: dict[str, Any]) -> dict[str, Any]:
+    raw_submodels = aas_env.get("submodels")
+    if not isinstance(raw_submodels, list):
+        return {}
+    by_id: dict[str, Any] = {}
+    duplicates: set[str] = set()
+    for submodel in raw_submodels:
+        submodel_id = _submodel_id(submodel)
+        if submodel_id is None:
+            continue
+        if submodel_id in by_id:
+            duplicates.add(submodel_id)
+        by_id[submodel_id] = submodel
+    for submodel_id in duplicates:
+        del by_id[submodel_id]
+    return by_id
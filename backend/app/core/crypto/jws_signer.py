@@ -0,0 +1,341 @@
+"""
+JWS signing with preloaded keys.
+
+Private keys are parsed and validated once, when a :class:`JWSSigner` is
+built, instead of on every signature.  A signer holds several keys by
+``kid`` so the signing key can be rotated without a restart: add the new key
+and activate it, or point ``dpp_signing_keys_file`` at a JSON keyring that
+the signer re-reads when it changes::
+
+    {
+      "active_kid": "dpp-key-2",
+      "keys": [
+        {"kid": "dpp-key-2", "algorithm": "ES256", "private_key": "-----BEGIN ..."},
+        {"kid": "dpp-key-1", "algorithm": "RS256", "private_key": "-----BEGIN ..."}
+      ]
+    }
+
+Detached signatures follow RFC 7515 Appendix F: the payload segment of the
+compact serialization is left empty and the verifier re-attaches it with
+:func:`attach_payload`.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from jwt import api_jws
+from jwt.algorithms import get_default_algorithms
+
+from app.core.config import Settings, get_settings
+from app.core.executors import SlicedPool
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SigningError(Exception):
+    """Raised when JWS signing is configured but fails."""
+
+
+@dataclass(frozen=True, slots=True)
+class SigningKey:
+    """A private key parsed for one JWS algorithm."""
+
+    kid: str
+    algorithm: str
+    key: Any
+
+
+def load_signing_key(pem: str, *, kid: str, algorithm: str) -> SigningKey:
+    """Parse ``pem`` for ``algorithm`` and check that it can sign."""
+    try:
+        prepared = get_default_algorithms()[algorithm].prepare_key(pem)
+        api_jws.encode(b"key-check", prepared, algorithm=algorithm)
+    except KeyError as exc:
+        raise SigningError(f"Unsupported JWS algorithm {algorithm!r}") from exc
+    except Exception as exc:
+        raise SigningError(f"Invalid signing key {kid!r}: {exc}") from exc
+    return SigningKey(kid=kid, algorithm=algorithm, key=prepared)
+
+
+def load_keyring_file(path: str) -> tuple[list[SigningKey], str]:
+    """Load the keys and active ``kid`` of a JSON keyring file."""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        entries = data["keys"]
+        keys = [
+            load_signing_key(entry["private_key"], kid=entry["kid"], algorithm=entry["algorithm"])
+            for entry in entries
+        ]
+        active_kid = str(data.get("active_kid") or keys[0].kid)
+    except SigningError:
+        raise
+    except (OSError, ValueError, KeyError, IndexError, TypeError) as exc:
+        raise SigningError(f"Invalid signing keyring {path}: {exc}") from exc
+    return keys, active_kid
+
+
+def detach_payload(compact_jws: str) -> str:
+    """Drop the payload segment of a compact JWS (RFC 7515 Appendix F)."""
+    header, _payload, signature = compact_jws.split(".")
+    return f"{header}..{signature}"
+
+
+def attach_payload(detached_jws: str, payload: bytes) -> str:
+    """Re-attach ``payload`` to a detached compact JWS for verification."""
+    header, empty, signature = detached_jws.split(".")
+    if empty:
+        raise ValueError("JWS payload is not detached")
+    encoded = base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+    return f"{header}.{encoded}.{signature}"
+
+
+class JWSSigner:
+    """Sign payloads with preloaded keys, selected by ``kid``."""
+
+    def __init__(
+        self,
+        keys: Iterable[SigningKey],
+        *,
+        active_kid: str,
+        keys_file: str | None = None,
+        reload_interval_seconds: float = 30.0,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._state = self._validated_state({key.kid: key for key in keys}, active_kid)
+        self._keys_file = keys_file or None
+        self._reload_interval = reload_interval_seconds
+        self._file_mtime: float | None = None
+        self._checked_at = 0.0
+        if self._keys_file is not None:
+            self._load_keys_file(os.stat(self._keys_file).st_mtime)
+
+    @staticmethod
+    def _validated_state(
+        keys: dict[str, SigningKey], active_kid: str
+    ) -> tuple[dict[str, SigningKey], str]:
+        if active_kid not in keys:
+            raise SigningError(f"Active signing key {active_kid!r} is not loaded")
+        return keys, active_kid
+
+    @property
+    def active_kid(self) -> str:
+        self._refresh()
+        return self._state[1]
+
+    @property
+    def kids(self) -> tuple[str, ...]:
+        self._refresh()
+        return tuple(self._state[0])
+
+    def key(self, kid: str | None = None) -> SigningKey:
+        """The key for ``kid``, or the active key."""
+        self._refresh()
+        keys, active_kid = self._state
+        try:
+            return keys[kid or active_kid]
+        except KeyError as exc:
+            raise SigningError(f"Unknown signing key {kid!r}") from exc
+
+    def public_jwks(self) -> list[dict[str, Any]]:
+        """Public JWKs of every loaded key, active first, for verifier discovery.
+
+        Retired keys stay listed until they are removed so signatures made
+        before a rotation keep verifying; symmetric keys are never published.
+        """
+        self._refresh()
+        keys, active_kid = self._state
+        ordered = sorted(keys.values(), key=lambda key: key.kid != active_kid)
+        jwks: list[dict[str, Any]] = []
+        for key in ordered:
+            public_key = getattr(key.key, "public_key", None)
+            if public_key is None:
+                continue
+            jwk = get_default_algorithms()[key.algorithm].to_jwk(public_key(), as_dict=True)
+            jwks.append({**jwk, "kid": key.kid, "alg": key.algorithm, "use": "sig"})
+        return jwks
+
+    def add_key(self, key: SigningKey, *, activate: bool = False) -> None:
+        """Load ``key`` (replacing one with the same ``kid``) and optionally sign with it."""
+        with self._lock:
+            keys, active_kid = self._state
+            self._state = ({**keys, key.kid: key}, key.kid if activate else active_kid)
+
+    def activate(self, kid: str) -> None:
+        """Sign with the already loaded key ``kid`` from now on."""
+        with self._lock:
+            self._state = self._validated_state(self._state[0], kid)
+
+    def remove_key(self, kid: str) -> None:
+        """Drop a retired key; the active key cannot be removed."""
+        with self._lock:
+            keys, active_kid = self._state
+            if kid == active_kid:
+                raise SigningError("Cannot remove the active signing key")
+            self._state = ({k: v for k, v in keys.items() if k != kid}, active_kid)
+
+    def sign(self, payload: bytes, *, kid: str | None = None, detached: bool = False) -> str:
+        """Compact JWS of ``payload``; ``detached`` leaves the payload segment empty."""
+        return self._sign_with(self.key(kid), payload, detached=detached)
+
+    def sign_digest(self, digest: str, *, kid: str | None = None, detached: bool = False) -> str:
+        """Compact JWS whose payload is the hex ``digest``."""
+        return self.sign(digest.encode("utf-8"), kid=kid, detached=detached)
+
+    def sign_digests(
+        self,
+        digests: Sequence[str],
+        *,
+        kid: str | None = None,
+        detached: bool = False,
+        executor: Executor | None = None,
+    ) -> list[str]:
+        """Sign many digests with one key, in ``executor`` when given."""
+        key = self.key(kid)
+        payloads = [digest.encode("utf-8") for digest in digests]
+        if executor is None or len(payloads) < 2:
+            return [self._sign_with(key, payload, detached=detached) for payload in payloads]
+        return list(
+            executor.map(lambda payload: self._sign_with(key, payload, detached=detached), payloads)
+        )
+
+    @staticmethod
+    def _sign_with(key: SigningKey, payload: bytes, *, detached: bool) -> str:
+        try:
+            token = api_jws.encode(
+                payload,
+                key.key,
+                algorithm=key.algorithm,
+                headers={"kid": key.kid},
+            )
+        except Exception as exc:
+            raise SigningError(f"JWS signing failed: {exc}") from exc
+        return detach_payload(token) if detached else token
+
+    def _refresh(self) -> None:
+        """Reload the keyring file if it changed since it was last read."""
+        if self._keys_file is None:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < self._reload_interval:
+            return
+        self._checked_at = now
+        try:
+            mtime = os.stat(self._keys_file).st_mtime
+            if mtime != self._file_mtime:
+                self._load_keys_file(mtime)
+        except (OSError, SigningError):
+            logger.warning("signing_keyring_reload_failed", path=self._keys_file, exc_info=True)
+
+    def _load_keys_file(self, mtime: float) -> None:
+        assert self._keys_file is not None
+        file_keys, active_kid = load_keyring_file(self._keys_file)
+        with self._lock:
+            keys = {**self._state[0], **{key.kid: key for key in file_keys}}
+            self._state = self._validated_state(keys, active_kid)
+            self._file_mtime = mtime
+        logger.info("signing_keyring_loaded", path=self._keys_file, active_kid=active_kid)
+
+
+# =============================================================================
+# DPP signer from settings
+# =============================================================================
+
+_dpp_signers: dict[tuple[str, str, str, str], JWSSigner] = {}
+_dpp_signers_lock = threading.Lock()
+
+
+def get_dpp_signer(settings: Settings | None = None) -> JWSSigner | None:
+    """
+    The signer for published DPP digests, or ``None`` when signing is off.
+
+    Keys are loaded on first use per configuration and kept for the life of
+    the process; keys in ``dpp_signing_keys_file`` are merged over the
+    ``dpp_signing_key`` and the file's ``active_kid`` wins.
+    """
+    settings = settings or get_settings()
+    if not settings.dpp_signing_key:
+        return None
+    config = (
+        settings.dpp_signing_key,
+        settings.dpp_signing_key_id,
+        settings.dpp_signing_algorithm,
+        settings.dpp_signing_keys_file,
+    )
+    signer = _dpp_signers.get(config)
+    if signer is not None:
+        return signer
+    with _dpp_signers_lock:
+        signer = _dpp_signers.get(config)
+        if signer is None:
+            key = load_signing_key(
+                settings.dpp_signing_key,
+                kid=settings.dpp_signing_key_id,
+                algorithm=settings.dpp_signing_algorithm,
+            )
+            try:
+                signer = JWSSigner(
+                    [key],
+                    active_kid=key.kid,
+                    keys_file=settings.dpp_signing_keys_file,
+                    reload_interval_seconds=settings.dpp_signing_keys_reload_seconds,
+                )
+            except OSError as exc:
+                raise SigningError(f"Invalid signing keyring: {exc}") from exc
+            _dpp_signers[config] = signer
+    return signer
+
+
+def preload_signing_keys() -> None:
+    """Load and validate the configured DPP signing keys (call at startup)."""
+    try:
+        signer = get_dpp_signer()
+    except SigningError:
+        logger.error("dpp_signing_keys_invalid", exc_info=True)
+        return
+    if signer is not None:
+        logger.info("dpp_signing_keys_loaded", kids=list(signer.kids), active=signer.active_kid)
+
+
+# =============================================================================
+# Batch signing pool
+# =============================================================================
+
+# Signing in the native crypto backends releases the GIL, so threads suffice.
+_signing_pool = SlicedPool(
+    lambda: get_settings().dpp_signing_batch_workers,
+    min_items=16,
+    slices_per_worker=2,
+    thread_name_prefix="jws-sign",
+)
+
+
+async def sign_digests_batch(
+    signer: JWSSigner,
+    digests: Sequence[str],
+    *,
+    kid: str | None = None,
+    detached: bool = False,
+) -> list[str]:
+    """Sign ``digests`` in the signing pool, or inline when it is disabled or not worth it."""
+    sign = partial(signer.sign_digests, kid=kid or signer.active_kid, detached=detached)
+    parts = await _signing_pool.map_slices(sign, digests)
+    if parts is None:
+        return sign(digests)
+    return [token for part in parts for token in part]
+
+
+def shutdown_signing_pool() -> None:
+    """Stop the signing threads (call at shutdown)."""
+    _signing_pool.shutdown()
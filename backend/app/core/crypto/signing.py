@@ -8,6 +8,7 @@ verification. Signatures provide non-repudiation for audit batches.
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
@@ -64,11 +65,25 @@ def sign_merkle_root(root_hash: str, private_key_pem: str) -> str:
     str
         Base64-encoded Ed25519 signature.
     """
+    signature = load_ed25519_private_key(private_key_pem).sign(root_hash.encode("utf-8"))
+    return base64.b64encode(signature).decode("utf-8")
+
+
+@lru_cache(maxsize=8)
+def load_ed25519_private_key(private_key_pem: str) -> Ed25519PrivateKey:
+    """Parse a PEM-encoded Ed25519 private key, once per distinct key.
+
+    A rotated key is a different PEM string and is loaded on first use.
+
+    Raises
+    ------
+    TypeError
+        If the PEM holds another key type.
+    """
     private_key = load_pem_private_key(private_key_pem.encode("utf-8"), password=None)
     if not isinstance(private_key, Ed25519PrivateKey):
         raise TypeError("Expected an Ed25519 private key")
-    signature = private_key.sign(root_hash.encode("utf-8"))
-    return base64.b64encode(signature).decode("utf-8")
+    return private_key
 
 
 def verify_signature(root_hash: str, signature: str, public_key_pem: str) -> bool:
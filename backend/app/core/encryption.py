@@ -7,6 +7,9 @@ import copy
 import hashlib
 import json
 import os
+import time
+from collections import OrderedDict
+from collections.abc import Collection
 from dataclasses import dataclass
 from typing import Any, cast
 from uuid import UUID, uuid4
@@ -72,6 +75,101 @@ class DPPEncryptionResult:
     wrapped_dek: str | None
     kek_id: str | None
     dek_wrapping_algorithm: str | None
+    carried_ref_ids: list[UUID]
+
+
+@dataclass(slots=True)
+class DPPEncryptionBaseline:
+    """Encryption state of a stored revision that a child revision may carry forward.
+
+    ``markers_by_path`` holds every marker of the revision keyed by the JSON
+    pointer of its value and ``rows_by_path`` the ``encrypted_values`` rows
+    that were loaded; ``plaintext_sha256_by_path`` fingerprints the values
+    decrypted while reading it, so unchanged plaintext is recognised without
+    decrypting again.
+    """
+
+    wrapped_dek: str
+    kek_id: str
+    dek_wrapping_algorithm: str | None
+    markers_by_path: dict[str, dict[str, Any]]
+    rows_by_path: dict[str, Any]
+    plaintext_sha256_by_path: dict[str, str]
+
+
+@dataclass(slots=True)
+class DPPDecryptionResult:
+    """Decrypted AAS environment plus the baseline for writing its child revision."""
+
+    aas_env_json: dict[str, Any]
+    baseline: DPPEncryptionBaseline | None
+
+
+def scrub(buffer: bytearray) -> None:
+    """Overwrite ``buffer`` with zeros in place (best effort for key/plaintext material)."""
+    buffer[:] = bytes(len(buffer))
+
+
+class DEKCache:
+    """Short-lived LRU of unwrapped DEKs keyed by ``(kek_id, wrapped_dek)``.
+
+    Keys are held in ``bytearray`` buffers that are zeroed when an entry
+    expires, is evicted or the cache is cleared.  Limits are set with
+    :meth:`configure` by the owner of the cache.
+    """
+
+    def __init__(self, *, ttl_seconds: float = 15.0, max_entries: int = 256) -> None:
+        self._entries: OrderedDict[tuple[str, str], tuple[bytearray, float]] = OrderedDict()
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+
+    def configure(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._evict_over_limit()
+
+    def get(self, kek_id: str, wrapped_dek: str) -> bytes | None:
+        key = (kek_id, wrapped_dek)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return bytes(entry[0])
+
+    def put(self, kek_id: str, wrapped_dek: str, dek: bytes) -> None:
+        if self._max_entries <= 0 or self._ttl_seconds <= 0:
+            return
+        key = (kek_id, wrapped_dek)
+        self._discard(key)
+        self._entries[key] = (bytearray(dek), time.monotonic() + self._ttl_seconds)
+        self._evict_over_limit()
+
+    def clear(self) -> None:
+        for key in list(self._entries):
+            self._discard(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_over_limit(self) -> None:
+        while len(self._entries) > max(self._max_entries, 0):
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            scrub(entry[0])
+
+
+def _sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _under_any(path: str, pointers: Collection[str]) -> bool:
+    return any(path == pointer or path.startswith(f"{pointer}/") for pointer in pointers)
 
 
 class ConnectorConfigEncryptor:
@@ -261,44 +359,84 @@ class DPPFieldEncryptor:
         aas_env: dict[str, Any],
         *,
         tenant_id: UUID,
+        baseline: DPPEncryptionBaseline | None = None,
+        dek_cache: DEKCache | None = None,
     ) -> DPPEncryptionResult:
-        """Encrypt tagged values and return markerized payload + encrypted row records."""
+        """Encrypt tagged values and return markerized payload + encrypted row records.
+
+        With a ``baseline`` from the parent revision, values whose plaintext
+        and JSON pointer are unchanged keep the parent's marker and row, and
+        new values are encrypted under the parent's DEK so one wrapped DEK
+        still covers every marker.  The DEK is reused only while it is
+        wrapped under the active KEK; after a KEK rotation everything is
+        re-encrypted under a fresh DEK.  Markers left in ``aas_env`` by a
+        selective read are carried forward the same way.
+        """
         working = copy.deepcopy(aas_env)
         encrypted_fields: list[DPPEncryptedField] = []
-
-        dek = os.urandom(32)
-        wrapped_dek, kek_id, wrapping_algorithm = self._key_encryptor.wrap_dek(dek)
-        dek_cipher = AESGCM(dek)
+        carried_ref_ids: list[UUID] = []
+        reuse = baseline if self._can_reuse_dek(baseline) else None
+
+        dek_cipher: AESGCM | None = None
+        if reuse is not None:
+            wrapped_dek = reuse.wrapped_dek
+            kek_id = reuse.kek_id
+            wrapping_algorithm = reuse.dek_wrapping_algorithm or _DEK_WRAPPING_ALGORITHM
+        else:
+            dek = os.urandom(32)
+            wrapped_dek, kek_id, wrapping_algorithm = self._key_encryptor.wrap_dek(dek)
+            dek_cipher = AESGCM(dek)
+
+        def _cipher() -> AESGCM:
+            nonlocal dek_cipher
+            if dek_cipher is None:
+                assert reuse is not None
+                dek_cipher = AESGCM(self._unwrap_baseline_dek(reuse, dek_cache))
+            return dek_cipher
+
+        def _carry(value_path: str, plaintext: str | None, marker: Any) -> dict[str, Any] | None:
+            if reuse is None:
+                return None
+            parent_marker = reuse.markers_by_path.get(value_path)
+            if parent_marker is None:
+                return None
+            if marker is not None:
+                if marker.get("_enc_ref") != parent_marker.get("_enc_ref"):
+                    return None
+            elif reuse.plaintext_sha256_by_path.get(value_path) != _sha256_text(plaintext or ""):
+                return None
+            carried_ref_ids.append(UUID(str(parent_marker["_enc_ref"])))
+            return dict(parent_marker)
 
         def _walk(node: Any, *, path: str) -> None:
             if isinstance(node, dict):
                 if self._is_encrypted_element(node):
                     value = node.get("value")
-                    if value is not None and not self._is_encrypted_marker(value):
-                        value_path = f"{path}/value"
-                        ref_id = uuid4()
-                        plaintext = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
-                        nonce = os.urandom(_NONCE_BYTES)
-                        aad = self._build_aad(tenant_id=tenant_id, path=value_path)
-                        cipher_text = dek_cipher.encrypt(nonce, plaintext.encode("utf-8"), aad)
-                        marker_hash = hashlib.sha256(cipher_text).hexdigest()
-                        encrypted_fields.append(
-                            DPPEncryptedField(
-                                ref_id=ref_id,
-                                json_pointer_path=value_path,
-                                cipher_text=cipher_text,
-                                nonce=nonce,
-                                key_id="revision-dek",
-                                algorithm="AES-256-GCM",
-                                marker_hash=marker_hash,
+                    value_path = f"{path}/value"
+                    if isinstance(value, dict) and self._is_encrypted_marker(value):
+                        carried = _carry(value_path, None, value)
+                        if carried is not None:
+                            node["value"] = carried
+                        elif baseline is not None:
+                            node["value"] = self._encrypt_value(
+                                self._baseline_plaintext(
+                                    baseline, value_path, value, tenant_id, dek_cache
+                                ),
+                                value_path=value_path,
+                                tenant_id=tenant_id,
+                                cipher=_cipher(),
+                                encrypted_fields=encrypted_fields,
                             )
+                    elif value is not None:
+                        plaintext = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+                        carried = _carry(value_path, plaintext, None)
+                        node["value"] = carried or self._encrypt_value(
+                            plaintext,
+                            value_path=value_path,
+                            tenant_id=tenant_id,
+                            cipher=_cipher(),
+                            encrypted_fields=encrypted_fields,
                         )
-                        node["value"] = {
-                            "_enc_ref": str(ref_id),
-                            "_enc_sha256": marker_hash,
-                            "_enc_alg": "AES-256-GCM",
-                            "_enc_ver": _DPP_MARKER_VERSION,
-                        }
 
                 for key, child in list(node.items()):
                     child_path = f"{path}/{self._escape_json_pointer_token(str(key))}"
@@ -311,13 +449,14 @@ class DPPFieldEncryptor:
 
         _walk(working, path="")
 
-        if not encrypted_fields:
+        if not encrypted_fields and not carried_ref_ids:
             return DPPEncryptionResult(
                 aas_env_json=working,
                 encrypted_fields=[],
                 wrapped_dek=None,
                 kek_id=None,
                 dek_wrapping_algorithm=None,
+                carried_ref_ids=[],
             )
 
         return DPPEncryptionResult(
@@ -326,8 +465,126 @@ class DPPFieldEncryptor:
             wrapped_dek=wrapped_dek,
             kek_id=kek_id,
             dek_wrapping_algorithm=wrapping_algorithm,
+            carried_ref_ids=carried_ref_ids,
         )
 
+    def _encrypt_value(
+        self,
+        plaintext: str,
+        *,
+        value_path: str,
+        tenant_id: UUID,
+        cipher: AESGCM,
+        encrypted_fields: list[DPPEncryptedField],
+    ) -> dict[str, Any]:
+        ref_id = uuid4()
+        nonce = os.urandom(_NONCE_BYTES)
+        aad = self._build_aad(tenant_id=tenant_id, path=value_path)
+        cipher_text = cipher.encrypt(nonce, plaintext.encode("utf-8"), aad)
+        marker_hash = hashlib.sha256(cipher_text).hexdigest()
+        encrypted_fields.append(
+            DPPEncryptedField(
+                ref_id=ref_id,
+                json_pointer_path=value_path,
+                cipher_text=cipher_text,
+                nonce=nonce,
+                key_id="revision-dek",
+                algorithm="AES-256-GCM",
+                marker_hash=marker_hash,
+            )
+        )
+        return {
+            "_enc_ref": str(ref_id),
+            "_enc_sha256": marker_hash,
+            "_enc_alg": "AES-256-GCM",
+            "_enc_ver": _DPP_MARKER_VERSION,
+        }
+
+    def _can_reuse_dek(self, baseline: DPPEncryptionBaseline | None) -> bool:
+        if baseline is None or not baseline.markers_by_path:
+            return False
+        if baseline.dek_wrapping_algorithm not in (None, _DEK_WRAPPING_ALGORITHM):
+            return False
+        return baseline.kek_id == self._key_encryptor.active_key_id
+
+    def _unwrap_baseline_dek(
+        self, baseline: DPPEncryptionBaseline, dek_cache: DEKCache | None
+    ) -> bytes:
+        return self._unwrap_dek(
+            baseline.wrapped_dek,
+            kek_id=baseline.kek_id,
+            algorithm=baseline.dek_wrapping_algorithm,
+            dek_cache=dek_cache,
+        )
+
+    def _unwrap_dek(
+        self,
+        wrapped_dek: str,
+        *,
+        kek_id: str,
+        algorithm: str | None,
+        dek_cache: DEKCache | None,
+    ) -> bytes:
+        if dek_cache is not None:
+            cached = dek_cache.get(kek_id, wrapped_dek)
+            if cached is not None:
+                return cached
+        dek = self._key_encryptor.unwrap_dek(wrapped_dek, kek_id=kek_id, algorithm=algorithm)
+        if dek_cache is not None:
+            dek_cache.put(kek_id, wrapped_dek, dek)
+        return dek
+
+    def _baseline_plaintext(
+        self,
+        baseline: DPPEncryptionBaseline,
+        value_path: str,
+        marker: dict[str, Any],
+        tenant_id: UUID,
+        dek_cache: DEKCache | None,
+    ) -> str:
+        """Decrypt a marker left in place by a selective read, to re-encrypt it."""
+        row = baseline.rows_by_path.get(value_path)
+        if row is None or str(row.id) != marker.get("_enc_ref"):
+            raise EncryptionError(f"Encrypted marker at '{value_path}' has no matching row")
+        cipher = AESGCM(self._unwrap_baseline_dek(baseline, dek_cache))
+        try:
+            plaintext_bytes = cipher.decrypt(
+                bytes(row.nonce),
+                bytes(row.cipher_text),
+                self._build_aad(tenant_id=tenant_id, path=value_path),
+            )
+        except Exception as exc:
+            raise EncryptionError("Failed to decrypt encrypted DPP marker") from exc
+        return plaintext_bytes.decode("utf-8")
+
+    @classmethod
+    def marker_paths(
+        cls,
+        aas_env: dict[str, Any],
+        *,
+        pointers: Collection[str] | None = None,
+    ) -> dict[str, str]:
+        """Map each ``_enc_ref`` marker in ``aas_env`` to the JSON pointer of its value.
+
+        With ``pointers``, only markers at or below one of them are returned.
+        """
+        found: dict[str, str] = {}
+
+        def _walk(node: Any, *, path: str) -> None:
+            if isinstance(node, dict):
+                if cls._is_encrypted_marker(node):
+                    if pointers is None or _under_any(path, pointers):
+                        found[str(node["_enc_ref"])] = path
+                    return
+                for key, child in node.items():
+                    _walk(child, path=f"{path}/{cls._escape_json_pointer_token(str(key))}")
+            elif isinstance(node, list):
+                for index, child in enumerate(node):
+                    _walk(child, path=f"{path}/{index}")
+
+        _walk(aas_env, path="")
+        return found
+
     def decrypt_for_read(
         self,
         aas_env: dict[str, Any],
@@ -337,30 +594,66 @@ class DPPFieldEncryptor:
         wrapped_dek: str | None,
         kek_id: str | None,
         dek_wrapping_algorithm: str | None,
+        pointers: Collection[str] | None = None,
     ) -> dict[str, Any]:
         """Resolve ``_enc_ref`` markers back to plaintext values for authorized readers."""
-        if not encrypted_rows:
-            return copy.deepcopy(aas_env)
+        return self.decrypt_revision(
+            aas_env,
+            tenant_id=tenant_id,
+            encrypted_rows=encrypted_rows,
+            wrapped_dek=wrapped_dek,
+            kek_id=kek_id,
+            dek_wrapping_algorithm=dek_wrapping_algorithm,
+            pointers=pointers,
+        ).aas_env_json
+
+    def decrypt_revision(
+        self,
+        aas_env: dict[str, Any],
+        *,
+        tenant_id: UUID,
+        encrypted_rows: list[Any],
+        wrapped_dek: str | None,
+        kek_id: str | None,
+        dek_wrapping_algorithm: str | None,
+        pointers: Collection[str] | None = None,
+        dek_cache: DEKCache | None = None,
+    ) -> DPPDecryptionResult:
+        """Decrypt markers and describe the revision's encryption state.
+
+        With ``pointers``, only markers at or below one of those JSON pointers
+        are decrypted; the rest stay in place and can be carried forward
+        unchanged by :meth:`prepare_for_storage`.
+        """
+        if not encrypted_rows and pointers is None:
+            return DPPDecryptionResult(aas_env_json=copy.deepcopy(aas_env), baseline=None)
         if not wrapped_dek or not kek_id:
             raise EncryptionError("missing wrapped_dek/kek_id for encrypted revision")
 
-        dek = self._key_encryptor.unwrap_dek(
-            wrapped_dek,
+        by_ref = {str(row.id): row for row in encrypted_rows}
+        baseline = DPPEncryptionBaseline(
+            wrapped_dek=wrapped_dek,
             kek_id=kek_id,
-            algorithm=dek_wrapping_algorithm,
+            dek_wrapping_algorithm=dek_wrapping_algorithm,
+            markers_by_path={},
+            rows_by_path={},
+            plaintext_sha256_by_path={},
         )
-        dek_cipher = AESGCM(dek)
-        by_ref = {str(row.id): row for row in encrypted_rows}
-
-        working = copy.deepcopy(aas_env)
+        dek_cipher: AESGCM | None = None
 
-        def _walk(node: Any) -> Any:
+        def _walk(node: Any, *, path: str) -> Any:
+            nonlocal dek_cipher
             if isinstance(node, dict):
                 if self._is_encrypted_marker(node):
                     ref = str(node.get("_enc_ref", ""))
+                    baseline.markers_by_path[path] = dict(node)
+                    if pointers is not None and not _under_any(path, pointers):
+                        return dict(node)
                     row = by_ref.get(ref)
                     if row is None:
                         raise EncryptionError(f"Missing encrypted value row for ref '{ref}'")
+                    row_path = str(row.json_pointer_path)
+                    baseline.rows_by_path[row_path] = row
 
                     marker_hash = str(node.get("_enc_sha256", "")).strip()
                     if marker_hash:
@@ -368,10 +661,16 @@ class DPPFieldEncryptor:
                         if marker_hash != actual_hash:
                             raise EncryptionError("Encrypted marker hash mismatch")
 
-                    aad = self._build_aad(
-                        tenant_id=tenant_id,
-                        path=str(row.json_pointer_path),
-                    )
+                    if dek_cipher is None:
+                        dek_cipher = AESGCM(
+                            self._unwrap_dek(
+                                wrapped_dek,
+                                kek_id=kek_id,
+                                algorithm=dek_wrapping_algorithm,
+                                dek_cache=dek_cache,
+                            )
+                        )
+                    aad = self._build_aad(tenant_id=tenant_id, path=row_path)
                     try:
                         plaintext_bytes = dek_cipher.decrypt(
                             bytes(row.nonce),
@@ -380,20 +679,25 @@ class DPPFieldEncryptor:
                         )
                     except Exception as exc:
                         raise EncryptionError("Failed to decrypt encrypted DPP marker") from exc
+                    plaintext = plaintext_bytes.decode("utf-8")
+                    baseline.plaintext_sha256_by_path[row_path] = _sha256_text(plaintext)
                     try:
-                        return json.loads(plaintext_bytes.decode("utf-8"))
+                        return json.loads(plaintext)
                     except json.JSONDecodeError as exc:  # pragma: no cover - defensive
                         raise EncryptionError("Decrypted DPP payload is not valid JSON") from exc
 
-                return {key: _walk(value) for key, value in node.items()}
+                return {
+                    key: _walk(value, path=f"{path}/{self._escape_json_pointer_token(str(key))}")
+                    for key, value in node.items()
+                }
             if isinstance(node, list):
-                return [_walk(item) for item in node]
+                return [_walk(item, path=f"{path}/{index}") for index, item in enumerate(node)]
             return node
 
-        decrypted = _walk(working)
+        decrypted = _walk(aas_env, path="")
         if not isinstance(decrypted, dict):  # pragma: no cover - defensive
             raise EncryptionError("Decrypted DPP payload root must be a JSON object")
-        return cast(dict[str, Any], decrypted)
+        return DPPDecryptionResult(aas_env_json=cast(dict[str, Any], decrypted), baseline=baseline)
 
     @staticmethod
     def _escape_json_pointer_token(token: str) -> str:
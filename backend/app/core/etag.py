@@ -0,0 +1,54 @@
+"""
+HTTP conditional request helpers (RFC 9110 ETag / If-None-Match).
+
+Public read endpoints derive strong entity tags from immutable inputs such
+as published revision digests, so a validator can be computed and compared
+before the (much larger) response body is loaded or serialized.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Response, status
+
+
+def strong_etag(*parts: object) -> str:
+    """Build a quoted strong ETag from the given representation inputs.
+
+    ``None`` parts are encoded distinctly from empty strings so that e.g. a
+    missing revision never collides with an empty digest.
+    """
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(b"\x00" if part is None else str(part).encode("utf-8"))
+        hasher.update(b"\x1f")
+    return f'"{hasher.hexdigest()[:40]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True when an ``If-None-Match`` header matches *etag*.
+
+    Uses the weak comparison function mandated for ``If-None-Match``, so a
+    ``W/`` prefix on the client's copy is ignored.
+    """
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def set_validator_headers(response: Response, etag: str, cache_control: str) -> None:
+    """Attach the ETag and Cache-Control headers to *response*."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    """Build an empty 304 response that repeats the validator headers."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validator_headers(response, etag, cache_control)
+    return response
@@ -0,0 +1,90 @@
+"""
+Lazily started worker pools for CPU-bound batch work.
+
+Bulk DPP creation, compliance scans and batch signing each hand slices of a
+large input to a pool sized by a setting.  A :class:`SlicedPool` starts its
+executor on first use, restarts it when the setting changes and leaves small
+inputs to the caller, since handing them to workers costs more than it saves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class SlicedPool:
+    """Executor sized by ``workers()`` that runs a function over slices of an input.
+
+    Process pools use the ``spawn`` start method: forking a process that runs
+    an event loop and DB pools is unsafe.  Thread pools suit work that
+    releases the GIL, such as signing in native code.
+    """
+
+    def __init__(
+        self,
+        workers: Callable[[], int],
+        *,
+        min_items: int,
+        slices_per_worker: int = 4,
+        thread_name_prefix: str | None = None,
+    ) -> None:
+        self._configured_workers = workers
+        self._min_items = min_items
+        self._slices_per_worker = slices_per_worker
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: Executor | None = None
+        self._workers = 0
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def executor(self) -> Executor | None:
+        """The running executor, started or resized as configured; ``None`` when disabled."""
+        workers = self._configured_workers()
+        if workers <= 0:
+            return None
+        if self._executor is None or self._workers != workers:
+            self.shutdown()
+            if self._thread_name_prefix is not None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix=self._thread_name_prefix
+                )
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            self._workers = workers
+        return self._executor
+
+    async def map_slices[T, R](
+        self, fn: Callable[[list[T]], R], items: Sequence[T]
+    ) -> list[R] | None:
+        """
+        Run ``fn`` over consecutive slices of ``items`` in the pool.
+
+        Returns one result per slice in input order, or ``None`` when the pool
+        is disabled or ``items`` is too small to be worth it; the caller then
+        does the work inline.
+        """
+        if len(items) < self._min_items:
+            return None
+        executor = self.executor()
+        if executor is None:
+            return None
+        loop = asyncio.get_running_loop()
+        size = -(-len(items) // (self._workers * self._slices_per_worker))
+        slices = [list(items[start : start + size]) for start in range(0, len(items), size)]
+        return list(
+            await asyncio.gather(*(loop.run_in_executor(executor, fn, part) for part in slices))
+        )
+
+    def shutdown(self) -> None:
+        """Stop the workers without waiting for queued slices (call at shutdown)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self._workers = 0
@@ -0,0 +1,54 @@
+"""
+JSON responses assembled around pre-serialized payloads.
+
+DPP responses wrap a small metadata envelope around an AAS environment that
+can run to several megabytes.  The environment is taken as JSON bytes that
+are already at hand (stored public projections) or encoded once with orjson,
+and spliced into the orjson-encoded envelope.  Only the envelope goes
+through Pydantic, so FastAPI never validates or re-encodes the AAS tree.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def splice_raw_json(envelope: dict[str, Any], key: str, raw_value: bytes | None) -> bytes:
+    """Serialize ``envelope`` and append ``key`` holding pre-serialized JSON bytes.
+
+    ``raw_value`` is embedded verbatim, so it must already be valid JSON.
+    ``None`` is emitted as JSON ``null``.
+    """
+    head = orjson.dumps(envelope)
+    member = orjson.dumps(key) + b":" + (raw_value if raw_value is not None else b"null")
+    if head == b"{}":
+        return b"{" + member + b"}"
+    return head[:-1] + b"," + member + b"}"
+
+
+def splice_model_json(
+    model: BaseModel,
+    field: str,
+    raw_value: bytes | None,
+    *,
+    by_alias: bool = False,
+) -> bytes:
+    """Serialize ``model`` with its ``field`` replaced by pre-serialized JSON bytes.
+
+    The model should be built with a placeholder (``None``) for ``field`` so
+    Pydantic only validates the envelope.
+    """
+    envelope = model.model_dump(mode="json", by_alias=by_alias, exclude={field})
+    key = field
+    if by_alias:
+        key = type(model).model_fields[field].serialization_alias or field
+    return splice_raw_json(envelope, key, raw_value)
+
+
+def raw_json_response(content: bytes, *, headers: dict[str, str] | None = None) -> Response:
+    """Wrap already-encoded JSON bytes in a response FastAPI will not re-serialize."""
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
-from sqlalchemy import select
+import hashlib
+import time
+from collections import OrderedDict
+
+import orjson
+from sqlalchemy import CTE, func, literal, not_, or_, select
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.security.oidc import TokenPayload
 from app.db.models import User, UserRole
 
+# Upper bound on subjects remembered by the per-process claims cache
+_SYNCED_CLAIMS_MAX_ENTRIES = 4096
+
+# subject -> (expires_at, claims fingerprint) of rows known to match the token
+_synced_claims: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
 
 def _derive_display_name(user: TokenPayload) -> str | None:
     preferred = user.preferred_username
@@ -69,3 +82,85 @@ async def sync_user_from_token(db: AsyncSession, user: TokenPayload) -> User:
     db.add(created)
     await db.flush()
     return created
+
+
+def claims_fingerprint(user: TokenPayload) -> str:
+    """Hash of the token claims that are mirrored into the ``users`` row."""
+    payload = orjson.dumps(
+        {
+            "sub": user.sub,
+            "email": user.email or None,
+            "display_name": _derive_display_name(user) or None,
+            "attrs": _build_attrs(user),
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def claims_recently_synced(user: TokenPayload) -> bool:
+    """Whether this worker recently saw the ``users`` row match these claims."""
+    entry = _synced_claims.get(user.sub)
+    if entry is None:
+        return False
+    expires_at, fingerprint = entry
+    if expires_at <= time.monotonic():
+        del _synced_claims[user.sub]
+        return False
+    return fingerprint == claims_fingerprint(user)
+
+
+def remember_synced_claims(user: TokenPayload) -> None:
+    """Record that the ``users`` row already matches the token claims.
+
+    Only call this when the row was found unchanged: a row written by the
+    current transaction may still roll back.
+    """
+    ttl = get_settings().identity_sync_cache_ttl_seconds
+    if ttl <= 0:
+        return
+    _synced_claims[user.sub] = (time.monotonic() + ttl, claims_fingerprint(user))
+    _synced_claims.move_to_end(user.sub)
+    while len(_synced_claims) > _SYNCED_CLAIMS_MAX_ENTRIES:
+        _synced_claims.popitem(last=False)
+
+
+def user_upsert_cte(user: TokenPayload) -> CTE:
+    """Data-modifying CTE equivalent to :func:`sync_user_from_token`.
+
+    Inserts the row or merges changed claims into it; the CTE returns a row
+    only when it actually wrote, so an empty result means the row already
+    matched the token.
+    """
+    display_name = _derive_display_name(user) or None
+    attrs = _build_attrs(user)
+    stmt = insert(User).values(
+        subject=user.sub,
+        email=user.email or None,
+        display_name=display_name,
+        role=UserRole.VIEWER,
+        attrs=attrs,
+        is_active=True,
+    )
+    excluded = stmt.excluded
+    current_attrs = func.coalesce(User.attrs, literal({}, JSONB))
+    email = func.coalesce(excluded.email, User.email)
+    name = func.coalesce(excluded.display_name, User.display_name)
+    return (
+        stmt.on_conflict_do_update(
+            index_elements=[User.subject],
+            set_={
+                "email": email,
+                "display_name": name,
+                "attrs": current_attrs.op("||")(excluded.attrs),
+                "updated_at": func.now(),
+            },
+            where=or_(
+                User.email.is_distinct_from(email),
+                User.display_name.is_distinct_from(name),
+                not_(current_attrs.op("@>", is_comparison=True)(excluded.attrs)),
+            ),
+        )
+        .returning(User.id)
+        .cte("synced_user")
+    )
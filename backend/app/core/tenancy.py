@@ -6,14 +6,18 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Path, status
-from sqlalchemy import select, text
+from sqlalchemy import Select, String, cast, func, literal, select
 
 from app.core.config import get_settings
-from app.core.security.identity_sync import sync_user_from_token
+from app.core.security.identity_sync import (
+    claims_recently_synced,
+    remember_synced_claims,
+    user_upsert_cte,
+)
 from app.core.security.oidc import CurrentUser, TokenPayload
 from app.db.models import Tenant, TenantMember, TenantRole, TenantStatus
 from app.db.session import DbSession
@@ -58,23 +62,65 @@ def _expand_roles(role: TenantRole | None) -> set[str]:
     return {"viewer"}
 
 
+def _tenant_context_statement(tenant_slug: str, user: TokenPayload) -> Select[Any]:
+    """Build the single statement that prepares a tenant-scoped request.
+
+    It selects the tenant and the caller's membership role, sets
+    ``app.current_tenant`` (and the admin bypass role) for the transaction,
+    and upserts the ``users`` row unless this worker recently saw it match
+    the token claims.
+    """
+    member_role = (
+        select(TenantMember.role)
+        .where(TenantMember.tenant_id == Tenant.id, TenantMember.user_subject == user.sub)
+        .scalar_subquery()
+    )
+    columns: list[Any] = [
+        Tenant.id,
+        Tenant.slug,
+        Tenant.name,
+        Tenant.status,
+        member_role.label("member_role"),
+        func.set_config("app.current_tenant", cast(Tenant.id, String), True).label(
+            "current_tenant"
+        ),
+    ]
+
+    settings = get_settings()
+    if user.is_admin and settings.db_admin_role:
+        role = settings.db_admin_role.strip()
+        if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", role):
+            # Same effect as SET LOCAL ROLE, usable inside a query
+            columns.append(func.set_config("role", role, True).label("db_role"))
+
+    if claims_recently_synced(user):
+        columns.append(literal(None).label("user_writes"))
+    else:
+        synced_user = user_upsert_cte(user)
+        columns.append(
+            select(func.count()).select_from(synced_user).scalar_subquery().label("user_writes")
+        )
+
+    return select(*columns).where(Tenant.slug == tenant_slug)
+
+
 async def resolve_tenant_context(
     tenant_slug: Annotated[str, Path(..., min_length=1)],
     db: DbSession,
     user: CurrentUser,
 ) -> TenantContext:
-    """Resolve tenant context from path and membership."""
-    await sync_user_from_token(db, user)
-
+    """Resolve tenant context from path and membership in one round trip."""
     normalized_slug = tenant_slug.strip().lower()
-    result = await db.execute(select(Tenant).where(Tenant.slug == normalized_slug))
-    tenant = result.scalar_one_or_none()
+    result = await db.execute(_tenant_context_statement(normalized_slug, user))
+    tenant = result.one_or_none()
 
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tenant '{normalized_slug}' not found",
         )
+    if tenant.user_writes == 0:
+        remember_synced_claims(user)
 
     if tenant.status != TenantStatus.ACTIVE:
         raise HTTPException(
@@ -82,31 +128,15 @@ async def resolve_tenant_context(
             detail="Tenant is inactive",
         )
 
-    await db.execute(
-        text("SELECT set_config('app.current_tenant', :tenant_id, true)"),
-        {"tenant_id": str(tenant.id)},
-    )
-
     settings = get_settings()
-    if user.is_admin and settings.db_admin_role:
-        role = settings.db_admin_role.strip()
-        if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", role):
-            await db.execute(text(f'SET LOCAL ROLE "{role}"'))
-
     member_role: TenantRole | None = None
     roles: set[str] = set()
 
     if user.is_admin:
         roles = _expand_roles(TenantRole.TENANT_ADMIN)
     else:
-        membership_result = await db.execute(
-            select(TenantMember).where(
-                TenantMember.tenant_id == tenant.id,
-                TenantMember.user_subject == user.sub,
-            )
-        )
-        membership = membership_result.scalar_one_or_none()
-        if not membership:
+        member_role = tenant.member_role
+        if member_role is None:
             if (
                 tenant.slug == "default"
                 and settings.environment == "development"
@@ -132,18 +162,19 @@ async def resolve_tenant_context(
                 and tenant.slug == settings.onboarding_auto_join_tenant_slug
             ):
                 svc = OnboardingService(db)
-                membership = await svc.try_auto_provision(user)
-                if not membership:
+                provisioned = await svc.try_auto_provision(user)
+                if not provisioned:
                     raise HTTPException(
                         status_code=status.HTTP_403_FORBIDDEN,
                         detail="User is not a member of this tenant",
                     )
+                membership = provisioned
             else:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="User is not a member of this tenant",
                 )
-        member_role = membership.role
+            member_role = membership.role
         roles = _expand_roles(member_role)
 
     return TenantContext(
@@ -0,0 +1,227 @@
+"""
+In-process cache of tenant slug and hostname resolution.
+
+Public routes resolve ``/{tenant_slug}`` or the request host to a tenant on
+every anonymous request.  Tenants and domains change rarely, so each worker
+keeps a small, bounded TTL cache of those lookups.
+
+Freshness comes from Postgres: statement triggers on ``tenants`` and
+``tenant_domains`` ``NOTIFY`` the ``tenant_cache_invalidation`` channel,
+which is delivered only when the writing transaction commits.  Every worker
+LISTENs on a dedicated connection and drops the affected cache.  Entries are
+served only while that listener is connected, so scripts, workers started
+without it and tests always read through to the database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import Tenant, TenantStatus
+
+logger = get_logger(__name__)
+
+TENANT_CACHE_CHANNEL = "tenant_cache_invalidation"
+
+# Seconds to wait before reconnecting a dropped LISTEN connection
+_RECONNECT_DELAY_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class CachedTenant:
+    """Immutable snapshot of the tenant columns used to route a request."""
+
+    id: UUID
+    slug: str
+    name: str
+    status: TenantStatus
+
+    @classmethod
+    def from_tenant(cls, tenant: Tenant) -> CachedTenant:
+        return cls(id=tenant.id, slug=tenant.slug, name=tenant.name, status=tenant.status)
+
+
+# Cached lookups return snapshots; uncached ones return the loaded row.
+TenantRecord = Tenant | CachedTenant
+
+
+class _TTLCache[K: Hashable, V]:
+    """Bounded LRU map whose entries expire after ``tenant_cache_ttl_seconds``."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._generation = 0
+
+    async def get_or_load(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        settings = get_settings()
+        ttl = settings.tenant_cache_ttl_seconds
+        if not _listening or ttl <= 0:
+            return await load()
+
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        # A NOTIFY that arrives while the row is loading bumps the generation,
+        # so a value read before the change is never stored.
+        generation = self._generation
+        value = await load()
+        if generation == self._generation and _listening:
+            self._entries[key] = (now + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.tenant_cache_max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generation += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_tenants_by_slug: _TTLCache[tuple[str, bool], TenantRecord | None] = _TTLCache()
+_tenant_ids_by_hostname: _TTLCache[str, UUID | None] = _TTLCache()
+
+_CACHES_BY_TABLE: dict[str, _TTLCache[Any, Any]] = {
+    "tenants": _tenants_by_slug,
+    "tenant_domains": _tenant_ids_by_hostname,
+}
+
+_listening = False
+_listener_task: asyncio.Task[None] | None = None
+
+
+def tenant_cache_active() -> bool:
+    """Whether lookups are currently served from the cache."""
+    return _listening and get_settings().tenant_cache_ttl_seconds > 0
+
+
+def invalidate_tenant_cache(table: str | None = None) -> None:
+    """Drop cached lookups derived from ``table`` (or from every table)."""
+    if table is None:
+        for cache in _CACHES_BY_TABLE.values():
+            cache.clear()
+        return
+    if table not in _CACHES_BY_TABLE:
+        # Unknown payload: fail safe by dropping everything
+        invalidate_tenant_cache()
+        return
+    _CACHES_BY_TABLE[table].clear()
+
+
+async def get_tenant_by_slug(
+    db: AsyncSession,
+    tenant_slug: str,
+    *,
+    active_only: bool = False,
+) -> TenantRecord | None:
+    """Resolve a tenant by slug, optionally only if it is active."""
+    normalized_slug = tenant_slug.strip().lower()
+
+    async def _load() -> TenantRecord | None:
+        stmt = select(Tenant).where(Tenant.slug == normalized_slug)
+        if active_only:
+            stmt = stmt.where(Tenant.status == TenantStatus.ACTIVE)
+        result = await db.execute(stmt)
+        tenant = result.scalar_one_or_none()
+        if tenant is None or not tenant_cache_active():
+            return tenant
+        return CachedTenant.from_tenant(tenant)
+
+    return await _tenants_by_slug.get_or_load((normalized_slug, active_only), _load)
+
+
+async def get_tenant_id_by_hostname(
+    hostname: str,
+    load: Callable[[], Awaitable[UUID | None]],
+) -> UUID | None:
+    """Resolve a normalized hostname to its tenant, loading through ``load`` on a miss."""
+    return await _tenant_ids_by_hostname.get_or_load(hostname, load)
+
+
+def _set_listening(listening: bool) -> None:
+    global _listening
+    _listening = listening
+    # Anything cached before (re)connecting may have missed a notification
+    invalidate_tenant_cache()
+
+
+def _on_notification(
+    _connection: object,
+    _pid: int,
+    _channel: str,
+    payload: str,
+) -> None:
+    invalidate_tenant_cache(payload or None)
+
+
+def _signal_on_termination(lost: asyncio.Event) -> Callable[[object], None]:
+    def _on_termination(_connection: object) -> None:
+        lost.set()
+
+    return _on_termination
+
+
+def _listener_dsn() -> str:
+    dsn = str(get_settings().database_url)
+    return dsn.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+async def _listen_forever() -> None:
+    while True:
+        connection: asyncpg.Connection | None = None
+        try:
+            connection = await asyncpg.connect(_listener_dsn())
+            lost = asyncio.Event()
+            connection.add_termination_listener(_signal_on_termination(lost))
+            await connection.add_listener(TENANT_CACHE_CHANNEL, _on_notification)
+            _set_listening(True)
+            logger.info("tenant_cache_listener_connected")
+            await lost.wait()
+            logger.warning("tenant_cache_listener_disconnected")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("tenant_cache_listener_failed", exc_info=True)
+        finally:
+            _set_listening(False)
+            if connection is not None and not connection.is_closed():
+                connection.terminate()
+        await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+
+async def start_tenant_cache_listener() -> None:
+    """Start the LISTEN task that keeps the cache coherent (call at startup)."""
+    global _listener_task
+    if get_settings().tenant_cache_ttl_seconds <= 0:
+        return
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.create_task(_listen_forever())
+
+
+async def stop_tenant_cache_listener() -> None:
+    """Stop the LISTEN task and disable the cache (call at shutdown)."""
+    global _listener_task
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _listener_task
+    _listener_task = None
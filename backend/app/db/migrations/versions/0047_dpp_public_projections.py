@@ -0,0 +1,91 @@
+"""Add precomputed public projections of published DPP revisions.
+
+Revision ID: 0047_dpp_public_projections
+Revises: 0046_uom_registry_raw_template
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0047_dpp_public_projections"
+down_revision = "0046_uom_registry_raw_template"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dpp_public_projections",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "tenant_id",
+            sa.UUID(),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "dpp_id",
+            sa.UUID(),
+            sa.ForeignKey("dpps.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "revision_id",
+            sa.UUID(),
+            sa.ForeignKey("dpp_revisions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "projection_key",
+            sa.String(length=64),
+            nullable=False,
+            comment="ESPR tier projection key (full, consumer, recycler, denied)",
+        ),
+        sa.Column(
+            "payload",
+            sa.LargeBinary(),
+            nullable=False,
+            comment="Serialized JSON of the filtered AAS environment",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "revision_id",
+            "projection_key",
+            name="uq_dpp_public_projection_revision_key",
+        ),
+    )
+    op.create_index("ix_dpp_public_projections_tenant_id", "dpp_public_projections", ["tenant_id"])
+    op.create_index("ix_dpp_public_projections_dpp_id", "dpp_public_projections", ["dpp_id"])
+
+    op.execute("ALTER TABLE dpp_public_projections ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE dpp_public_projections FORCE ROW LEVEL SECURITY")
+    op.execute(
+        """
+        CREATE POLICY dpp_public_projections_tenant_isolation
+        ON dpp_public_projections
+        USING (tenant_id = current_setting('app.current_tenant', true)::uuid)
+        """
+    )
+
+    # Revisions published before this migration have no stored projections;
+    # public reads compute them on the fly until the DPP is published again.
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP POLICY IF EXISTS dpp_public_projections_tenant_isolation ON dpp_public_projections"
+    )
+    op.execute("ALTER TABLE dpp_public_projections NO FORCE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE dpp_public_projections DISABLE ROW LEVEL SECURITY")
+
+    op.drop_index("ix_dpp_public_projections_dpp_id", table_name="dpp_public_projections")
+    op.drop_index("ix_dpp_public_projections_tenant_id", table_name="dpp_public_projections")
+    op.drop_table("dpp_public_projections")
@@ -0,0 +1,58 @@
+"""Add indexed, tenant-unique short-link slugs to DPPs.
+
+Revision ID: 0048_dpp_short_slugs
+Revises: 0047_dpp_public_projections
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0048_dpp_short_slugs"
+down_revision = "0047_dpp_public_projections"
+branch_labels = None
+depends_on = None
+
+# Mirrors app.modules.dpps.short_slug.SHORT_SLUG_LENGTHS (full 32-hex id last)
+_SLUG_LENGTHS = (8, 12, 16, 20, 24, 28)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "dpps",
+        sa.Column(
+            "short_slug",
+            sa.String(length=32),
+            nullable=True,
+            comment="Tenant-unique short-link slug: shortest free hex prefix of the id (8-32 chars)",
+        ),
+    )
+
+    # Backfill each DPP with its shortest prefix that no other DPP of the same
+    # tenant shares. Prefixes that were already ambiguous under the old LIKE
+    # lookup stay unassigned, so existing short links never start resolving
+    # to a different passport.
+    cases = "\n".join(
+        f"WHEN count(*) OVER (PARTITION BY tenant_id, left(hex_id, {length})) = 1 "
+        f"THEN left(hex_id, {length})"
+        for length in _SLUG_LENGTHS
+    )
+    op.execute(
+        f"""
+        UPDATE dpps AS d
+        SET short_slug = slugs.slug
+        FROM (
+            SELECT id, CASE {cases} ELSE hex_id END AS slug
+            FROM (SELECT id, tenant_id, replace(id::text, '-', '') AS hex_id FROM dpps) AS ids
+        ) AS slugs
+        WHERE d.id = slugs.id
+        """
+    )
+
+    op.create_unique_constraint("uq_dpps_tenant_short_slug", "dpps", ["tenant_id", "short_slug"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_dpps_tenant_short_slug", "dpps", type_="unique")
+    op.drop_column("dpps", "short_slug")
@@ -0,0 +1,113 @@
+"""Add per-submodel rows for published DPP revisions.
+
+Revision ID: 0049_dpp_published_submodels
+Revises: 0048_dpp_short_slugs
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0049_dpp_published_submodels"
+down_revision = "0048_dpp_short_slugs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dpp_published_submodels",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "tenant_id",
+            sa.UUID(),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "dpp_id",
+            sa.UUID(),
+            sa.ForeignKey("dpps.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "revision_id",
+            sa.UUID(),
+            sa.ForeignKey("dpp_revisions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "submodel_id",
+            sa.Text(),
+            nullable=False,
+            comment="AAS submodel identifier",
+        ),
+        sa.Column(
+            "semantic_id",
+            sa.Text(),
+            nullable=True,
+            comment="First semanticId key value, used for ESPR tier visibility",
+        ),
+        sa.Column(
+            "digest_sha256",
+            sa.String(length=64),
+            nullable=False,
+            comment="SHA-256 of the RFC 8785 canonical source submodel",
+        ),
+        sa.Column(
+            "payload",
+            sa.LargeBinary(),
+            nullable=False,
+            comment="Serialized JSON of the confidentiality-filtered submodel",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "revision_id",
+            "submodel_id",
+            name="uq_dpp_published_submodel_revision_submodel",
+        ),
+    )
+    op.create_index(
+        "ix_dpp_published_submodels_tenant_id", "dpp_published_submodels", ["tenant_id"]
+    )
+    op.create_index("ix_dpp_published_submodels_dpp_id", "dpp_published_submodels", ["dpp_id"])
+    op.create_index(
+        "ix_dpp_published_submodels_revision_semantic",
+        "dpp_published_submodels",
+        ["revision_id", "semantic_id"],
+    )
+
+    op.execute("ALTER TABLE dpp_published_submodels ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE dpp_published_submodels FORCE ROW LEVEL SECURITY")
+    op.execute(
+        """
+        CREATE POLICY dpp_published_submodels_tenant_isolation
+        ON dpp_published_submodels
+        USING (tenant_id = current_setting('app.current_tenant', true)::uuid)
+        """
+    )
+
+    # Revisions published before this migration have no submodel rows;
+    # submodel reads fall back to the revision's public projection.
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP POLICY IF EXISTS dpp_published_submodels_tenant_isolation ON dpp_published_submodels"
+    )
+    op.execute("ALTER TABLE dpp_published_submodels NO FORCE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE dpp_published_submodels DISABLE ROW LEVEL SECURITY")
+
+    op.drop_index(
+        "ix_dpp_published_submodels_revision_semantic", table_name="dpp_published_submodels"
+    )
+    op.drop_index("ix_dpp_published_submodels_dpp_id", table_name="dpp_published_submodels")
+    op.drop_index("ix_dpp_published_submodels_tenant_id", table_name="dpp_published_submodels")
+    op.drop_table("dpp_published_submodels")
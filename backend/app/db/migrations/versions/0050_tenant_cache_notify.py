@@ -0,0 +1,48 @@
+"""Notify tenant resolution caches when tenants or tenant domains change.
+
+Revision ID: 0050_tenant_cache_notify
+Revises: 0049_dpp_published_submodels
+Create Date: 2026-02-23
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0050_tenant_cache_notify"
+down_revision = "0049_dpp_published_submodels"
+branch_labels = None
+depends_on = None
+
+# Mirrors app.core.tenant_cache.TENANT_CACHE_CHANNEL
+_CHANNEL = "tenant_cache_invalidation"
+_TABLES = ("tenants", "tenant_domains")
+
+
+def upgrade() -> None:
+    # NOTIFY is transactional: listeners only hear about committed changes,
+    # and repeated notifications within one transaction are collapsed.
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION notify_tenant_cache_invalidation() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('{_CHANNEL}', TG_TABLE_NAME);
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    for table in _TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_cache_invalidation
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_tenant_cache_invalidation()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_cache_invalidation ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS notify_tenant_cache_invalidation()")
@@ -0,0 +1,184 @@
+"""Add incrementally maintained public landing summary counters.
+
+Revision ID: 0051_public_landing_summaries
+Revises: 0050_tenant_cache_notify
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0051_public_landing_summaries"
+down_revision = "0050_tenant_cache_notify"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("public_landing_summaries", "public_landing_product_families")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "dpps",
+        sa.Column(
+            "has_epcis_events",
+            sa.Boolean(),
+            server_default=sa.text("false"),
+            nullable=False,
+            comment="Whether any EPCIS event references this DPP (landing summary traceability)",
+        ),
+    )
+
+    op.create_table(
+        "public_landing_summaries",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "tenant_id",
+            sa.UUID(),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "published_dpps",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of DPPs in status published",
+        ),
+        sa.Column(
+            "active_product_families",
+            sa.Integer(),
+            nullable=False,
+            comment="Distinct non-empty manufacturerPartId values among published DPPs",
+        ),
+        sa.Column(
+            "dpps_with_traceability",
+            sa.Integer(),
+            nullable=False,
+            comment="Published DPPs referenced by at least one EPCIS event",
+        ),
+        sa.Column(
+            "latest_publish_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Most recent publish of any DPP",
+        ),
+        sa.Column(
+            "reconciled_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the counters were last recomputed from source tables",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("tenant_id", name="uq_public_landing_summaries_tenant"),
+    )
+    op.create_index(
+        "ix_public_landing_summaries_tenant_id", "public_landing_summaries", ["tenant_id"]
+    )
+
+    op.create_table(
+        "public_landing_product_families",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "tenant_id",
+            sa.UUID(),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "manufacturer_part_id",
+            sa.Text(),
+            nullable=False,
+            comment="manufacturerPartId asset identifier",
+        ),
+        sa.Column(
+            "published_dpps",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of published DPPs carrying this manufacturerPartId",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "manufacturer_part_id",
+            name="uq_public_landing_product_families_tenant_part",
+        ),
+    )
+    op.create_index(
+        "ix_public_landing_product_families_tenant_id",
+        "public_landing_product_families",
+        ["tenant_id"],
+    )
+
+    # Backfill from the source tables the landing endpoints used to aggregate.
+    op.execute(
+        """
+        UPDATE dpps AS d
+        SET has_epcis_events = true
+        WHERE EXISTS (
+            SELECT 1 FROM epcis_events AS e
+            WHERE e.tenant_id = d.tenant_id AND e.dpp_id = d.id
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO public_landing_product_families
+            (tenant_id, manufacturer_part_id, published_dpps)
+        SELECT tenant_id, asset_ids ->> 'manufacturerPartId', count(*)
+        FROM dpps
+        WHERE status = 'published'
+          AND coalesce(asset_ids ->> 'manufacturerPartId', '') <> ''
+        GROUP BY tenant_id, asset_ids ->> 'manufacturerPartId'
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO public_landing_summaries (
+            tenant_id, published_dpps, active_product_families,
+            dpps_with_traceability, latest_publish_at, reconciled_at
+        )
+        SELECT
+            t.id,
+            count(d.id),
+            count(DISTINCT nullif(d.asset_ids ->> 'manufacturerPartId', '')),
+            count(d.id) FILTER (WHERE d.has_epcis_events),
+            max(d.updated_at),
+            now()
+        FROM tenants AS t
+        LEFT JOIN dpps AS d ON d.tenant_id = t.id AND d.status = 'published'
+        GROUP BY t.id
+        """
+    )
+
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY")
+        op.execute(f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY")
+        op.execute(
+            f"""
+            CREATE POLICY {table}_tenant_isolation
+            ON {table}
+            USING (tenant_id = current_setting('app.current_tenant', true)::uuid)
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(_TABLES):
+        op.execute(f"DROP POLICY IF EXISTS {table}_tenant_isolation ON {table}")
+        op.execute(f"ALTER TABLE {table} NO FORCE ROW LEVEL SECURITY")
+        op.execute(f"ALTER TABLE {table} DISABLE ROW LEVEL SECURITY")
+
+    op.drop_index(
+        "ix_public_landing_product_families_tenant_id",
+        table_name="public_landing_product_families",
+    )
+    op.drop_table("public_landing_product_families")
+    op.drop_index("ix_public_landing_summaries_tenant_id", table_name="public_landing_summaries")
+    op.drop_table("public_landing_summaries")
+    op.drop_column("dpps", "has_epcis_events")
@@ -0,0 +1,34 @@
+"""Store Merkle leaf hashes next to DPP revision digests.
+
+Revision ID: 0052_revision_digest_leaves
+Revises: 0051_public_landing_summaries
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0052_revision_digest_leaves"
+down_revision = "0051_public_landing_summaries"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing revisions keep their whole-environment rfc8785 digests; only
+    # revisions written under rfc8785-merkle-v1 carry leaves.
+    op.add_column(
+        "dpp_revisions",
+        sa.Column(
+            "digest_leaves",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Shell and per-submodel leaf hashes of an rfc8785-merkle-v1 digest",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("dpp_revisions", "digest_leaves")
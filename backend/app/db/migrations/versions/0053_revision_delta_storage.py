@@ -0,0 +1,73 @@
+"""Allow DPP revisions to store JSON Patch deltas between keyframes.
+
+Revision ID: 0053_revision_delta_storage
+Revises: 0052_revision_digest_leaves
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0053_revision_delta_storage"
+down_revision = "0052_revision_digest_leaves"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "dpp_revisions",
+        sa.Column(
+            "env_delta",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="RFC 6902 JSON Patch from delta_base_revision_id to this revision",
+        ),
+    )
+    op.add_column(
+        "dpp_revisions",
+        sa.Column(
+            "delta_base_revision_id",
+            sa.UUID(),
+            sa.ForeignKey("dpp_revisions.id"),
+            nullable=True,
+            comment="Revision env_delta applies to; NULL for full keyframes",
+        ),
+    )
+    op.add_column(
+        "dpp_revisions",
+        sa.Column(
+            "delta_depth",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Deltas to replay from the nearest keyframe (0 for keyframes)",
+        ),
+    )
+    op.create_index(
+        "ix_dpp_revisions_delta_base_revision_id",
+        "dpp_revisions",
+        ["delta_base_revision_id"],
+        postgresql_where=sa.text("delta_base_revision_id IS NOT NULL"),
+    )
+    op.alter_column("dpp_revisions", "aas_env_json", nullable=True)
+    op.create_check_constraint(
+        "ck_dpp_revisions_env_or_delta",
+        "dpp_revisions",
+        "(aas_env_json IS NOT NULL AND delta_base_revision_id IS NULL) "
+        "OR (aas_env_json IS NULL AND delta_base_revision_id IS NOT NULL "
+        "AND env_delta IS NOT NULL)",
+    )
+
+
+def downgrade() -> None:
+    # Delta rows cannot be rebuilt in SQL; downgrade only once every revision
+    # has been rewritten as a keyframe.
+    op.drop_constraint("ck_dpp_revisions_env_or_delta", "dpp_revisions", type_="check")
+    op.alter_column("dpp_revisions", "aas_env_json", nullable=False)
+    op.drop_index("ix_dpp_revisions_delta_base_revision_id", table_name="dpp_revisions")
+    op.drop_column("dpp_revisions", "delta_depth")
+    op.drop_column("dpp_revisions", "delta_base_revision_id")
+    op.drop_column("dpp_revisions", "env_delta")
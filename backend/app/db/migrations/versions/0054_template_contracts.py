@@ -0,0 +1,65 @@
+"""Persist generated template contracts.
+
+Revision ID: 0054_template_contracts
+Revises: 0053_revision_delta_storage
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0054_template_contracts"
+down_revision = "0053_revision_delta_storage"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Global like the templates table it is derived from, so no tenant RLS.
+    op.create_table(
+        "template_contracts",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "cache_key",
+            sa.String(length=64),
+            nullable=False,
+            comment="SHA-256 over format version, template source, UoM registry and lookup",
+        ),
+        sa.Column("template_key", sa.String(length=100), nullable=False),
+        sa.Column("idta_version", sa.String(length=20), nullable=False),
+        sa.Column(
+            "source_revision",
+            sa.Text(),
+            nullable=False,
+            comment="Template source_file_sha (or fetch timestamp when no sha is known)",
+        ),
+        sa.Column("uom_registry_version", sa.String(length=64), nullable=False),
+        sa.Column("lookup_fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("format_version", sa.Integer(), nullable=False),
+        sa.Column(
+            "contract",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Generated definition, schema, diagnostics and doc hints",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cache_key"),
+    )
+    op.create_index(
+        "ix_template_contracts_template_key_version",
+        "template_contracts",
+        ["template_key", "idta_version"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_template_contracts_template_key_version", table_name="template_contracts")
+    op.drop_table("template_contracts")
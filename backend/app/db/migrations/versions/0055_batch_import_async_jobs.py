@@ -0,0 +1,99 @@
+"""Run batch imports as asynchronous, chunked jobs.
+
+Revision ID: 0055_batch_import_async_jobs
+Revises: 0054_template_contracts
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0055_batch_import_async_jobs"
+down_revision = "0054_template_contracts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Jobs created before this revision ran synchronously and are finished.
+    op.add_column(
+        "batch_import_jobs",
+        sa.Column(
+            "status",
+            sa.String(length=32),
+            server_default="completed",
+            nullable=False,
+            comment="queued | running | completed",
+        ),
+    )
+    op.add_column(
+        "batch_import_jobs",
+        sa.Column(
+            "tenant_slug",
+            sa.String(length=100),
+            nullable=True,
+            comment="Tenant slug used for QR payload URLs of created DPPs",
+        ),
+    )
+    op.add_column(
+        "batch_import_jobs",
+        sa.Column("source_format", sa.String(length=16), nullable=True),
+    )
+    op.add_column(
+        "batch_import_jobs",
+        sa.Column("chunk_size", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "batch_import_jobs",
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "batch_import_jobs",
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_batch_import_jobs_active",
+        "batch_import_jobs",
+        ["tenant_id", "created_at"],
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+    op.add_column(
+        "batch_import_job_items",
+        sa.Column(
+            "payload",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Validated create request; NULL when the item was rejected at upload",
+        ),
+    )
+    op.add_column(
+        "batch_import_job_items",
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "batch_import_job_items",
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_batch_import_job_items_pending",
+        "batch_import_job_items",
+        ["job_id", "item_index"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_batch_import_job_items_pending", table_name="batch_import_job_items")
+    op.drop_column("batch_import_job_items", "processed_at")
+    op.drop_column("batch_import_job_items", "attempts")
+    op.drop_column("batch_import_job_items", "payload")
+    op.drop_index("ix_batch_import_jobs_active", table_name="batch_import_jobs")
+    op.drop_column("batch_import_jobs", "finished_at")
+    op.drop_column("batch_import_jobs", "started_at")
+    op.drop_column("batch_import_jobs", "chunk_size")
+    op.drop_column("batch_import_jobs", "source_format")
+    op.drop_column("batch_import_jobs", "tenant_slug")
+    op.drop_column("batch_import_jobs", "status")
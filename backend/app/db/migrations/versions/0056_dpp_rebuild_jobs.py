@@ -0,0 +1,105 @@
+"""Track rebuild-all runs as resumable background jobs.
+
+Revision ID: 0056_dpp_rebuild_jobs
+Revises: 0055_batch_import_async_jobs
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0056_dpp_rebuild_jobs"
+down_revision = "0055_batch_import_async_jobs"
+branch_labels = None
+depends_on = None
+
+_TABLE = "dpp_rebuild_jobs"
+
+
+def upgrade() -> None:
+    op.create_table(
+        _TABLE,
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "tenant_id",
+            sa.UUID(),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("requested_by_subject", sa.String(length=255), nullable=False),
+        sa.Column(
+            "status",
+            sa.String(length=32),
+            nullable=False,
+            comment="queued | running | completed | failed",
+        ),
+        sa.Column(
+            "refresh_templates",
+            sa.Boolean(),
+            nullable=False,
+            comment="Refresh templates from upstream before the first chunk",
+        ),
+        sa.Column("total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("processed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("skipped", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "errors",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+            comment="First per-DPP errors (capped)",
+        ),
+        sa.Column(
+            "checkpoint_dpp_id",
+            sa.UUID(),
+            nullable=True,
+            comment="Keyset cursor: every DPP with a smaller id has been processed",
+        ),
+        sa.Column("chunk_size", sa.Integer(), nullable=False),
+        sa.Column("concurrency", sa.Integer(), nullable=False),
+        sa.Column(
+            "worker_token",
+            sa.UUID(),
+            nullable=True,
+            comment="Claim of the runner currently processing the job",
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_dpp_rebuild_jobs_tenant_created", _TABLE, ["tenant_id", "created_at"])
+    op.create_index(
+        "uq_dpp_rebuild_jobs_active_tenant",
+        _TABLE,
+        ["tenant_id"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+    op.execute(f"ALTER TABLE {_TABLE} ENABLE ROW LEVEL SECURITY")
+    op.execute(f"ALTER TABLE {_TABLE} FORCE ROW LEVEL SECURITY")
+    op.execute(
+        f"""
+        CREATE POLICY {_TABLE}_tenant_isolation
+        ON {_TABLE}
+        USING (tenant_id = current_setting('app.current_tenant', true)::uuid)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(f"DROP POLICY IF EXISTS {_TABLE}_tenant_isolation ON {_TABLE}")
+    op.execute(f"ALTER TABLE {_TABLE} NO FORCE ROW LEVEL SECURITY")
+    op.execute(f"ALTER TABLE {_TABLE} DISABLE ROW LEVEL SECURITY")
+    op.drop_index("uq_dpp_rebuild_jobs_active_tenant", table_name=_TABLE)
+    op.drop_index("ix_dpp_rebuild_jobs_tenant_created", table_name=_TABLE)
+    op.drop_table(_TABLE)
@@ -0,0 +1,102 @@
+"""Add a transactional outbox for post-publish side effects.
+
+Revision ID: 0057_dpp_outbox
+Revises: 0056_dpp_rebuild_jobs
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0057_dpp_outbox"
+down_revision = "0056_dpp_rebuild_jobs"
+branch_labels = None
+depends_on = None
+
+_TABLE = "dpp_outbox"
+
+
+def upgrade() -> None:
+    op.create_table(
+        _TABLE,
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "tenant_id",
+            sa.UUID(),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "dpp_id",
+            sa.UUID(),
+            sa.ForeignKey("dpps.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "revision_id",
+            sa.UUID(),
+            sa.ForeignKey("dpp_revisions.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column(
+            "effect",
+            sa.String(length=64),
+            nullable=False,
+            comment="webhook | resolver_links | shell_descriptor",
+        ),
+        sa.Column("idempotency_key", sa.String(length=255), nullable=False),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column(
+            "status",
+            sa.String(length=32),
+            nullable=False,
+            server_default="pending",
+            comment="pending | done | failed",
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "available_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="Earliest time of the next delivery attempt",
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("tenant_id", "idempotency_key", name="uq_dpp_outbox_tenant_key"),
+    )
+    op.create_index(
+        "ix_dpp_outbox_pending",
+        _TABLE,
+        ["tenant_id", "available_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+    op.execute(f"ALTER TABLE {_TABLE} ENABLE ROW LEVEL SECURITY")
+    op.execute(f"ALTER TABLE {_TABLE} FORCE ROW LEVEL SECURITY")
+    op.execute(
+        f"""
+        CREATE POLICY {_TABLE}_tenant_isolation
+        ON {_TABLE}
+        USING (tenant_id = current_setting('app.current_tenant', true)::uuid)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(f"DROP POLICY IF EXISTS {_TABLE}_tenant_isolation ON {_TABLE}")
+    op.execute(f"ALTER TABLE {_TABLE} NO FORCE ROW LEVEL SECURITY")
+    op.execute(f"ALTER TABLE {_TABLE} DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_dpp_outbox_pending", table_name=_TABLE)
+    op.drop_table(_TABLE)
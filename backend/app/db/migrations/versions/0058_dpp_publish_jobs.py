@@ -0,0 +1,128 @@
+"""Add background bulk publish jobs.
+
+Revision ID: 0058_dpp_publish_jobs
+Revises: 0057_dpp_outbox
+Create Date: 2026-02-23
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0058_dpp_publish_jobs"
+down_revision = "0057_dpp_outbox"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("dpp_publish_jobs", "dpp_publish_job_items")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dpp_publish_jobs",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "tenant_id",
+            sa.UUID(),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("requested_by_subject", sa.String(length=255), nullable=False),
+        sa.Column(
+            "owner_subject",
+            sa.String(length=255),
+            nullable=True,
+            comment="Only DPPs owned by this subject may be published (non-admin requesters)",
+        ),
+        sa.Column(
+            "status",
+            sa.String(length=32),
+            nullable=False,
+            comment="queued | running | completed",
+        ),
+        sa.Column("total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("succeeded", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("chunk_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_dpp_publish_jobs_tenant_created", "dpp_publish_jobs", ["tenant_id", "created_at"]
+    )
+    op.create_index(
+        "ix_dpp_publish_jobs_active",
+        "dpp_publish_jobs",
+        ["tenant_id", "created_at"],
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+    op.create_table(
+        "dpp_publish_job_items",
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "tenant_id",
+            sa.UUID(),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "job_id",
+            sa.UUID(),
+            sa.ForeignKey("dpp_publish_jobs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("item_index", sa.Integer(), nullable=False),
+        sa.Column("dpp_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "status",
+            sa.String(length=32),
+            nullable=False,
+            server_default="pending",
+            comment="pending | ok | failed",
+        ),
+        sa.Column(
+            "revision_id",
+            sa.UUID(),
+            nullable=True,
+            comment="Published revision on success",
+        ),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_id", "item_index", name="uq_dpp_publish_job_item_index"),
+    )
+    op.create_index(
+        "ix_dpp_publish_job_items_pending",
+        "dpp_publish_job_items",
+        ["job_id", "item_index"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY")
+        op.execute(f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY")
+        op.execute(
+            f"""
+            CREATE POLICY {table}_tenant_isolation
+            ON {table}
+            USING (tenant_id = current_setting('app.current_tenant', true)::uuid)
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(_TABLES):
+        op.execute(f"DROP POLICY IF EXISTS {table}_tenant_isolation ON {table}")
+        op.execute(f"ALTER TABLE {table} NO FORCE ROW LEVEL SECURITY")
+        op.execute(f"ALTER TABLE {table} DISABLE ROW LEVEL SECURITY")
+    op.drop_index("ix_dpp_publish_job_items_pending", table_name="dpp_publish_job_items")
+    op.drop_table("dpp_publish_job_items")
+    op.drop_index("ix_dpp_publish_jobs_active", table_name="dpp_publish_jobs")
+    op.drop_index("ix_dpp_publish_jobs_tenant_created", table_name="dpp_publish_jobs")
+    op.drop_table("dpp_publish_jobs")
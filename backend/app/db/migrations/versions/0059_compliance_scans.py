@@ -0,0 +1,191 @@
+"""Add tenant-wide compliance scans and revision-keyed compliance reports.
+
+Revision ID: 0059_compliance_scans
+Revises: 0058_dpp_publish_jobs
+Create Date: 2026-02-24
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0059_compliance_scans"
+down_revision = "0058_dpp_publish_jobs"
+branch_labels = None
+depends_on = None
+
+_TABLE = "compliance_scans"
+
+
+def upgrade() -> None:
+    op.create_table(
+        _TABLE,
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuid_generate_v7()"), nullable=False),
+        sa.Column(
+            "tenant_id",
+            sa.UUID(),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("requested_by_subject", sa.String(length=255), nullable=False),
+        sa.Column(
+            "status",
+            sa.String(length=32),
+            nullable=False,
+            comment="queued | running | completed | failed",
+        ),
+        sa.Column(
+            "category",
+            sa.String(length=100),
+            nullable=True,
+            comment="Only DPPs detected as this category are reported (all when null)",
+        ),
+        sa.Column(
+            "ruleset_version",
+            sa.String(length=32),
+            nullable=False,
+            comment="Fingerprint of the rule files the scan evaluates with",
+        ),
+        sa.Column("total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("processed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("evaluated", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "reused",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="DPPs whose stored report for the same revision and ruleset was kept",
+        ),
+        sa.Column("skipped", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("compliant", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("non_compliant", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "summary",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Violation counts by severity, rule and category (set on completion)",
+        ),
+        sa.Column(
+            "errors",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+            comment="First per-DPP errors (capped)",
+        ),
+        sa.Column(
+            "checkpoint_dpp_id",
+            sa.UUID(),
+            nullable=True,
+            comment="Keyset cursor: every DPP with a smaller id has been processed",
+        ),
+        sa.Column("chunk_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "worker_token",
+            sa.UUID(),
+            nullable=True,
+            comment="Claim of the runner currently processing the scan",
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_compliance_scans_tenant_created", _TABLE, ["tenant_id", "created_at"])
+    op.create_index(
+        "uq_compliance_scans_active_tenant",
+        _TABLE,
+        ["tenant_id"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+    op.execute(f"ALTER TABLE {_TABLE} ENABLE ROW LEVEL SECURITY")
+    op.execute(f"ALTER TABLE {_TABLE} FORCE ROW LEVEL SECURITY")
+    op.execute(
+        f"""
+        CREATE POLICY {_TABLE}_tenant_isolation
+        ON {_TABLE}
+        USING (tenant_id = current_setting('app.current_tenant', true)::uuid)
+        """
+    )
+
+    op.add_column(
+        "compliance_reports",
+        sa.Column(
+            "revision_id",
+            sa.UUID(),
+            sa.ForeignKey("dpp_revisions.id", ondelete="CASCADE"),
+            nullable=True,
+            comment="Evaluated revision (set by compliance scans)",
+        ),
+    )
+    op.add_column(
+        "compliance_reports",
+        sa.Column(
+            "revision_digest",
+            sa.String(length=64),
+            nullable=True,
+            comment="SHA-256 digest of the evaluated revision",
+        ),
+    )
+    op.add_column(
+        "compliance_reports",
+        sa.Column(
+            "ruleset_version",
+            sa.String(length=32),
+            nullable=True,
+            comment="Fingerprint of the rule files the report was evaluated with",
+        ),
+    )
+    op.add_column(
+        "compliance_reports",
+        sa.Column(
+            "scan_id",
+            sa.UUID(),
+            sa.ForeignKey("compliance_scans.id", ondelete="SET NULL"),
+            nullable=True,
+            comment="Latest scan that evaluated or confirmed this report",
+        ),
+    )
+    op.add_column(
+        "compliance_reports",
+        sa.Column("critical_violations", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "compliance_reports",
+        sa.Column("warnings", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "uq_compliance_reports_revision_ruleset",
+        "compliance_reports",
+        ["tenant_id", "dpp_id", "revision_digest", "ruleset_version"],
+        unique=True,
+        postgresql_where=sa.text("revision_digest IS NOT NULL"),
+    )
+    op.create_index("ix_compliance_reports_scan", "compliance_reports", ["scan_id", "dpp_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_compliance_reports_scan", table_name="compliance_reports")
+    op.drop_index("uq_compliance_reports_revision_ruleset", table_name="compliance_reports")
+    for column in (
+        "warnings",
+        "critical_violations",
+        "scan_id",
+        "ruleset_version",
+        "revision_digest",
+        "revision_id",
+    ):
+        op.drop_column("compliance_reports", column)
+
+    op.execute(f"DROP POLICY IF EXISTS {_TABLE}_tenant_isolation ON {_TABLE}")
+    op.execute(f"ALTER TABLE {_TABLE} NO FORCE ROW LEVEL SECURITY")
+    op.execute(f"ALTER TABLE {_TABLE} DISABLE ROW LEVEL SECURITY")
+    op.drop_index("uq_compliance_scans_active_tenant", table_name=_TABLE)
+    op.drop_index("ix_compliance_scans_tenant_created", table_name=_TABLE)
+    op.drop_table(_TABLE)
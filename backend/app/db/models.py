@@ -630,6 +630,10 @@ class DPP(TenantScopedMixin, Base):
         Text,
         comment="URL encoded in QR code for product identification",
     )
+    short_slug: Mapped[str | None] = mapped_column(
+        String(32),
+        comment="Tenant-unique short-link slug: shortest free hex prefix of the id (8-32 chars)",
+    )
     current_published_revision_id: Mapped[UUID | None] = mapped_column(
         ForeignKey(
             "dpp_revisions.id",
@@ -637,6 +641,13 @@ class DPP(TenantScopedMixin, Base):
             use_alter=True,
         ),
     )
+    has_epcis_events: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+        comment="Whether any EPCIS event references this DPP (landing summary traceability)",
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -674,6 +685,7 @@ class DPP(TenantScopedMixin, Base):
         Index("ix_dpps_status", "status"),
         Index("ix_dpps_asset_ids", "asset_ids", postgresql_using="gin"),
         Index("ix_dpps_tenant_updated", "tenant_id", "updated_at"),
+        UniqueConstraint("tenant_id", "short_slug", name="uq_dpps_tenant_short_slug"),
     )
 
 
@@ -705,11 +717,30 @@ class DPPRevision(TenantScopedMixin, Base):
         default=RevisionState.DRAFT,
         nullable=False,
     )
+    # NULL in the database for delta-encoded rows; loaders restore the full
+    # environment through app.modules.dpps.revision_store.materialize_revision.
     aas_env_json: Mapped[dict[str, Any]] = mapped_column(
         JSONB,
-        nullable=False,
+        nullable=True,
         comment="Complete AAS Environment (AAS + Submodels + ConceptDescriptions)",
     )
+    env_delta: Mapped[list[dict[str, Any]] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="RFC 6902 JSON Patch from delta_base_revision_id to this revision",
+    )
+    delta_base_revision_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("dpp_revisions.id"),
+        nullable=True,
+        comment="Revision env_delta applies to; NULL for full keyframes",
+    )
+    delta_depth: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Deltas to replay from the nearest keyframe (0 for keyframes)",
+    )
     digest_sha256: Mapped[str] = mapped_column(
         String(64),
         nullable=False,
@@ -727,6 +758,11 @@ class DPPRevision(TenantScopedMixin, Base):
         default="rfc8785",
         comment="Canonicalization method used before digesting",
     )
+    digest_leaves: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Shell and per-submodel leaf hashes of an rfc8785-merkle-v1 digest",
+    )
     signed_jws: Mapped[str | None] = mapped_column(
         Text,
         comment="JWS signature of the digest for integrity verification",
@@ -778,6 +814,203 @@ class DPPRevision(TenantScopedMixin, Base):
         UniqueConstraint("dpp_id", "revision_no", name="uq_dpp_revision_no"),
         Index("ix_dpp_revisions_dpp_id", "dpp_id"),
         Index("ix_dpp_revisions_state", "state"),
+        Index(
+            "ix_dpp_revisions_delta_base_revision_id",
+            "delta_base_revision_id",
+            postgresql_where=text("delta_base_revision_id IS NOT NULL"),
+        ),
+        CheckConstraint(
+            "(aas_env_json IS NOT NULL AND delta_base_revision_id IS NULL) "
+            "OR (aas_env_json IS NULL AND delta_base_revision_id IS NOT NULL "
+            "AND env_delta IS NOT NULL)",
+            name="ck_dpp_revisions_env_or_delta",
+        ),
+    )
+
+
+class DPPPublicProjection(TenantScopedMixin, Base):
+    """
+    Precomputed public view of a published revision for one ESPR tier.
+
+    Stores the confidentiality- and tier-filtered AAS environment as
+    serialized JSON so public endpoints can serve it without re-filtering.
+    """
+
+    __tablename__ = "dpp_public_projections"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    dpp_id: Mapped[UUID] = mapped_column(
+        ForeignKey("dpps.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    revision_id: Mapped[UUID] = mapped_column(
+        ForeignKey("dpp_revisions.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    projection_key: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="ESPR tier projection key (full, consumer, recycler, denied)",
+    )
+    payload: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=False,
+        comment="Serialized JSON of the filtered AAS environment",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "revision_id", "projection_key", name="uq_dpp_public_projection_revision_key"
+        ),
+        Index("ix_dpp_public_projections_dpp_id", "dpp_id"),
+    )
+
+
+class DPPPublishedSubmodel(TenantScopedMixin, Base):
+    """
+    One confidentiality-filtered submodel of a published revision.
+
+    Lets submodel-level public endpoints read a single small row instead of
+    a whole environment.  ESPR tier visibility is decided from the stored
+    semantic ID at read time.
+    """
+
+    __tablename__ = "dpp_published_submodels"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    dpp_id: Mapped[UUID] = mapped_column(
+        ForeignKey("dpps.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    revision_id: Mapped[UUID] = mapped_column(
+        ForeignKey("dpp_revisions.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    submodel_id: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="AAS submodel identifier",
+    )
+    semantic_id: Mapped[str | None] = mapped_column(
+        Text,
+        comment="First semanticId key value, used for ESPR tier visibility",
+    )
+    digest_sha256: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="SHA-256 of the RFC 8785 canonical source submodel",
+    )
+    payload: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=False,
+        comment="Serialized JSON of the confidentiality-filtered submodel",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "revision_id", "submodel_id", name="uq_dpp_published_submodel_revision_submodel"
+        ),
+        Index("ix_dpp_published_submodels_revision_semantic", "revision_id", "semantic_id"),
+        Index("ix_dpp_published_submodels_dpp_id", "dpp_id"),
+    )
+
+
+class PublicLandingSummary(TenantScopedMixin, Base):
+    """
+    Per-tenant counters behind the public landing summary.
+
+    Kept up to date incrementally by publish, archive and EPCIS capture and
+    periodically recomputed from source tables, so the landing endpoints
+    read one row instead of aggregating over ``dpps``.
+    """
+
+    __tablename__ = "public_landing_summaries"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    published_dpps: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of DPPs in status published",
+    )
+    active_product_families: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Distinct non-empty manufacturerPartId values among published DPPs",
+    )
+    dpps_with_traceability: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Published DPPs referenced by at least one EPCIS event",
+    )
+    latest_publish_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="Most recent publish of any DPP",
+    )
+    reconciled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="When the counters were last recomputed from source tables",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (UniqueConstraint("tenant_id", name="uq_public_landing_summaries_tenant"),)
+
+
+class PublicLandingProductFamily(TenantScopedMixin, Base):
+    """
+    Published-DPP reference count per manufacturerPartId.
+
+    Lets the landing summary maintain its distinct product-family count
+    incrementally: a family is active while its count is above zero.
+    """
+
+    __tablename__ = "public_landing_product_families"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    manufacturer_part_id: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="manufacturerPartId asset identifier",
+    )
+    published_dpps: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of published DPPs carrying this manufacturerPartId",
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "manufacturer_part_id",
+            name="uq_public_landing_product_families_tenant_part",
+        ),
     )
 
 
@@ -828,10 +1061,25 @@ class BatchImportJob(TenantScopedMixin, Base):
     total: Mapped[int] = mapped_column(Integer, nullable=False)
     succeeded: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        default="completed",
+        server_default="completed",
+        comment="queued | running | completed",
+    )
+    tenant_slug: Mapped[str | None] = mapped_column(
+        String(100),
+        comment="Tenant slug used for QR payload URLs of created DPPs",
+    )
+    source_format: Mapped[str | None] = mapped_column(String(16))
+    chunk_size: Mapped[int | None] = mapped_column(Integer)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
     )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     items: Mapped[list["BatchImportJobItem"]] = relationship(
         back_populates="job",
@@ -842,6 +1090,12 @@ class BatchImportJob(TenantScopedMixin, Base):
     __table_args__ = (
         Index("ix_batch_import_jobs_tenant_created", "tenant_id", "created_at"),
         Index("ix_batch_import_jobs_requested_by", "requested_by_subject"),
+        Index(
+            "ix_batch_import_jobs_active",
+            "tenant_id",
+            "created_at",
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
     )
 
 
@@ -864,10 +1118,16 @@ class BatchImportJobItem(TenantScopedMixin, Base):
     )
     status: Mapped[str] = mapped_column(String(32), nullable=False)
     error: Mapped[str | None] = mapped_column(Text)
+    payload: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB,
+        comment="Validated create request; NULL when the item was rejected at upload",
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
     )
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     job: Mapped["BatchImportJob"] = relationship(back_populates="items")
 
@@ -875,6 +1135,210 @@ class BatchImportJobItem(TenantScopedMixin, Base):
         Index("ix_batch_import_job_items_job", "job_id"),
         Index("ix_batch_import_job_items_tenant_job", "tenant_id", "job_id"),
         UniqueConstraint("job_id", "item_index", name="uq_batch_import_job_item_index"),
+        Index(
+            "ix_batch_import_job_items_pending",
+            "job_id",
+            "item_index",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+
+class DPPRebuildJob(TenantScopedMixin, Base):
+    """Resumable background job rebuilding every DPP of a tenant from templates."""
+
+    __tablename__ = "dpp_rebuild_jobs"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    requested_by_subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        default="queued",
+        comment="queued | running | completed | failed",
+    )
+    refresh_templates: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=True,
+        comment="Refresh templates from upstream before the first chunk",
+    )
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    errors: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=list,
+        comment="First per-DPP errors (capped)",
+    )
+    checkpoint_dpp_id: Mapped[UUID | None] = mapped_column(
+        comment="Keyset cursor: every DPP with a smaller id has been processed",
+    )
+    chunk_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    concurrency: Mapped[int] = mapped_column(Integer, nullable=False)
+    worker_token: Mapped[UUID | None] = mapped_column(
+        comment="Claim of the runner currently processing the job",
+    )
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("ix_dpp_rebuild_jobs_tenant_created", "tenant_id", "created_at"),
+        Index(
+            "uq_dpp_rebuild_jobs_active_tenant",
+            "tenant_id",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+
+class DPPPublishJob(TenantScopedMixin, Base):
+    """Background job publishing a set of DPPs in chunks."""
+
+    __tablename__ = "dpp_publish_jobs"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    requested_by_subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    owner_subject: Mapped[str | None] = mapped_column(
+        String(255),
+        comment="Only DPPs owned by this subject may be published (non-admin requesters)",
+    )
+    status: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        default="queued",
+        comment="queued | running | completed",
+    )
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    succeeded: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    chunk_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("ix_dpp_publish_jobs_tenant_created", "tenant_id", "created_at"),
+        Index(
+            "ix_dpp_publish_jobs_active",
+            "tenant_id",
+            "created_at",
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+
+class DPPPublishJobItem(TenantScopedMixin, Base):
+    """Per-DPP outcome row of a publish job."""
+
+    __tablename__ = "dpp_publish_job_items"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    job_id: Mapped[UUID] = mapped_column(
+        ForeignKey("dpp_publish_jobs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    item_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    dpp_id: Mapped[UUID] = mapped_column(nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        default="pending",
+        comment="pending | ok | failed",
+    )
+    revision_id: Mapped[UUID | None] = mapped_column(comment="Published revision on success")
+    error: Mapped[str | None] = mapped_column(Text)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        UniqueConstraint("job_id", "item_index", name="uq_dpp_publish_job_item_index"),
+        Index(
+            "ix_dpp_publish_job_items_pending",
+            "job_id",
+            "item_index",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+
+class DPPOutboxEntry(TenantScopedMixin, Base):
+    """
+    Side effect of a DPP lifecycle change, written in the same transaction.
+
+    A worker pool delivers pending entries after commit and retries failures
+    with backoff, so a crash between commit and delivery loses nothing.
+    """
+
+    __tablename__ = "dpp_outbox"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    dpp_id: Mapped[UUID] = mapped_column(
+        ForeignKey("dpps.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    revision_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("dpp_revisions.id", ondelete="CASCADE"),
+    )
+    effect: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="webhook | resolver_links | shell_descriptor",
+    )
+    idempotency_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
+    status: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        default="pending",
+        comment="pending | done | failed",
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        comment="Earliest time of the next delivery attempt",
+    )
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "idempotency_key", name="uq_dpp_outbox_tenant_key"),
+        Index(
+            "ix_dpp_outbox_pending",
+            "tenant_id",
+            "available_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
 
@@ -1032,6 +1496,53 @@ class Template(Base):
     )
 
 
+class TemplateContract(Base):
+    """
+    Persisted output of ``TemplateRegistryService.generate_template_contract``.
+
+    Rows are keyed by a digest over everything the contract is derived from,
+    so a changed template source, UoM registry or drop-in lookup simply
+    misses and writes a new row.
+    """
+
+    __tablename__ = "template_contracts"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    cache_key: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        unique=True,
+        comment="SHA-256 over format version, template source, UoM registry and lookup",
+    )
+    template_key: Mapped[str] = mapped_column(String(100), nullable=False)
+    idta_version: Mapped[str] = mapped_column(String(20), nullable=False)
+    source_revision: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="Template source_file_sha (or fetch timestamp when no sha is known)",
+    )
+    uom_registry_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    lookup_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    format_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    contract: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Generated definition, schema, diagnostics and doc hints",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_template_contracts_template_key_version", "template_key", "idta_version"),
+    )
+
+
 # =============================================================================
 # UoM Registry Model
 # =============================================================================
@@ -1952,6 +2463,24 @@ class ComplianceReportRecord(TenantScopedMixin, Base):
         nullable=False,
         comment="Full compliance report payload",
     )
+    revision_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("dpp_revisions.id", ondelete="CASCADE"),
+        comment="Evaluated revision (set by compliance scans)",
+    )
+    revision_digest: Mapped[str | None] = mapped_column(
+        String(64),
+        comment="SHA-256 digest of the evaluated revision",
+    )
+    ruleset_version: Mapped[str | None] = mapped_column(
+        String(32),
+        comment="Fingerprint of the rule files the report was evaluated with",
+    )
+    scan_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("compliance_scans.id", ondelete="SET NULL"),
+        comment="Latest scan that evaluated or confirmed this report",
+    )
+    critical_violations: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    warnings: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -1960,6 +2489,91 @@ class ComplianceReportRecord(TenantScopedMixin, Base):
     __table_args__ = (
         Index("ix_compliance_reports_tenant_dpp", "tenant_id", "dpp_id"),
         Index("ix_compliance_reports_category", "category"),
+        Index(
+            "uq_compliance_reports_revision_ruleset",
+            "tenant_id",
+            "dpp_id",
+            "revision_digest",
+            "ruleset_version",
+            unique=True,
+            postgresql_where=text("revision_digest IS NOT NULL"),
+        ),
+        Index("ix_compliance_reports_scan", "scan_id", "dpp_id"),
+    )
+
+
+class ComplianceScan(TenantScopedMixin, Base):
+    """Resumable background compliance scan over every DPP of a tenant."""
+
+    __tablename__ = "compliance_scans"
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v7(),
+    )
+    requested_by_subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        default="queued",
+        comment="queued | running | completed | failed",
+    )
+    category: Mapped[str | None] = mapped_column(
+        String(100),
+        comment="Only DPPs detected as this category are reported (all when null)",
+    )
+    ruleset_version: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        comment="Fingerprint of the rule files the scan evaluates with",
+    )
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    evaluated: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    reused: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="DPPs whose stored report for the same revision and ruleset was kept",
+    )
+    skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    compliant: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    non_compliant: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    summary: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB,
+        comment="Violation counts by severity, rule and category (set on completion)",
+    )
+    errors: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=list,
+        comment="First per-DPP errors (capped)",
+    )
+    checkpoint_dpp_id: Mapped[UUID | None] = mapped_column(
+        comment="Keyset cursor: every DPP with a smaller id has been processed",
+    )
+    chunk_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    worker_token: Mapped[UUID | None] = mapped_column(
+        comment="Claim of the runner currently processing the scan",
+    )
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("ix_compliance_scans_tenant_created", "tenant_id", "created_at"),
+        Index(
+            "uq_compliance_scans_active_tenant",
+            "tenant_id",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
     )
 
 
@@ -6,8 +6,10 @@ Provides connection pooling and session lifecycle management.
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import Depends
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -98,5 +100,23 @@ async def get_background_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def scope_session_to_tenant(session: AsyncSession, tenant_id: UUID) -> None:
+    """Set ``app.current_tenant`` for the session's current transaction (row-level security)."""
+    await session.execute(select(func.set_config("app.current_tenant", str(tenant_id), True)))
+
+
+@asynccontextmanager
+async def get_tenant_background_session(tenant_id: UUID) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Background session whose first transaction is scoped to ``tenant_id``.
+
+    The scope is transaction-local: after a commit, call
+    :func:`scope_session_to_tenant` again before touching tenant tables.
+    """
+    async with get_background_session() as session:
+        await scope_session_to_tenant(session, tenant_id)
+        yield session
+
+
 # Type alias for dependency injection
 DbSession = Annotated[AsyncSession, Depends(get_db_session)]
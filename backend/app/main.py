@@ -12,11 +12,14 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
 from sqlalchemy import text
 
+from app.core.cache import close_cache_redis
 from app.core.config import get_settings
+from app.core.crypto.jws_signer import preload_signing_keys, shutdown_signing_pool
 from app.core.logging import configure_logging, get_logger
 from app.core.middleware import SecurityHeadersMiddleware
 from app.core.rate_limit import RateLimitMiddleware, close_redis, get_redis
 from app.core.security.abac import close_opa_client
+from app.core.tenant_cache import start_tenant_cache_listener, stop_tenant_cache_listener
 from app.db.session import close_db, get_db_session, init_db
 from app.modules.activity.router import router as activity_router
 from app.modules.audit.router import router as audit_router
@@ -24,13 +27,29 @@ from app.modules.cen_api.public_router import router as public_cen_router
 from app.modules.cen_api.router import router as cen_api_router
 from app.modules.cirpass.public_router import router as public_cirpass_router
 from app.modules.compliance.router import router as compliance_router
+from app.modules.compliance.scans import (
+    start_compliance_scan_runner,
+    stop_compliance_scan_runner,
+)
 from app.modules.connectors.router import router as connectors_router
 from app.modules.credentials.public_router import router as public_credentials_router
 from app.modules.credentials.router import router as credentials_router
 from app.modules.data_carriers.router import router as data_carriers_router
 from app.modules.dataspace.router import router as dataspace_router
 from app.modules.digital_thread.router import router as digital_thread_router
+from app.modules.dpps.batch_import import (
+    start_batch_import_workers,
+    stop_batch_import_workers,
+)
+from app.modules.dpps.bulk_create import shutdown_digest_pool
+from app.modules.dpps.landing_summary import (
+    start_landing_summary_reconciler,
+    stop_landing_summary_reconciler,
+)
+from app.modules.dpps.outbox import start_outbox_workers, stop_outbox_workers
 from app.modules.dpps.public_router import router as public_dpps_router
+from app.modules.dpps.publish_jobs import start_publish_workers, stop_publish_workers
+from app.modules.dpps.rebuild_jobs import start_rebuild_job_runner, stop_rebuild_job_runner
 from app.modules.dpps.router import router as dpps_router
 from app.modules.epcis.public_router import router as public_epcis_router
 from app.modules.epcis.router import router as epcis_router
@@ -83,12 +102,30 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup: Initialize connections
     await init_db()
     logger.info("database_initialized")
+    preload_signing_keys()
+    await start_tenant_cache_listener()
+    await start_landing_summary_reconciler()
+    await start_batch_import_workers()
+    await start_rebuild_job_runner()
+    await start_outbox_workers()
+    await start_publish_workers()
+    await start_compliance_scan_runner()
 
     yield
 
     # Shutdown: Clean up connections
     await close_opa_client()
     await close_redis()
+    await close_cache_redis()
+    await stop_compliance_scan_runner()
+    await stop_publish_workers()
+    await stop_outbox_workers()
+    await stop_rebuild_job_runner()
+    await stop_batch_import_workers()
+    shutdown_digest_pool()
+    shutdown_signing_pool()
+    await stop_landing_summary_reconciler()
+    await stop_tenant_cache_listener()
     await close_db()
     logger.info("application_shutdown_complete")
 
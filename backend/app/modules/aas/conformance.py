@@ -6,19 +6,26 @@ Validates AAS environment dicts against the AAS metamodel by:
 3. Validating semantic ID structure on submodel elements
 
 This module provides the ``validate_aas_environment`` function used
-by the compliance engine (Contract B).
+by the compliance engine (Contract B).  BaSyx results are cached per
+submodel (and per shell / concept description list) by content digest,
+so revalidating an environment after a patch only runs BaSyx on the
+submodels the patch touched.
 """
 
 from __future__ import annotations
 
+import hashlib
 import io
 import json
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
 from basyx.aas import model
 from basyx.aas.adapter import json as basyx_json
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.modules.aas.model_utils import walk_submodel_deep
 from app.modules.aas.references import reference_to_str
@@ -70,14 +77,14 @@ def validate_aas_environment(aas_env: dict[str, Any]) -> AASValidationResult:
         return result
 
     # --- 2. BaSyx round-trip validation ---
-    store = _validate_basyx_roundtrip(aas_env, result)
+    parts = _validate_basyx_roundtrip(aas_env, result)
     if result.errors:
         result.is_valid = False
         return result
 
-    # --- 3. Semantic validation ---
-    if store is not None:
-        _validate_semantics(store, result)
+    # --- 3. Semantic validation (computed per slice during the round-trip) ---
+    for part in parts:
+        result.warnings.extend(part.warnings)
 
     result.is_valid = len(result.errors) == 0
     return result
@@ -135,16 +142,146 @@ def _validate_structure(
             result.warnings.append(f"submodels[{idx}] (id={sm.get('id', '?')}): missing semanticId")
 
 
+@dataclass(frozen=True)
+class _PartValidation:
+    """BaSyx outcome for one slice of an environment, reusable while its content is unchanged."""
+
+    read_error: str | None = None
+    strict_error: str | None = None
+    serialization_error: str | None = None
+    # (id, str(identifiable)) in document order, for cross-part duplicate checks
+    identifiables: tuple[tuple[str, str], ...] = ()
+    warnings: tuple[str, ...] = ()
+
+
+class _PartValidationCache:
+    """Bounded LRU of :class:`_PartValidation` keyed by the slice's content digest."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[bytes, _PartValidation] = OrderedDict()
+
+    def get(self, key: bytes) -> _PartValidation | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: bytes, entry: _PartValidation) -> None:
+        max_entries = get_settings().aas_validation_cache_max_entries
+        if max_entries <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_part_validations = _PartValidationCache()
+
+
 def _validate_basyx_roundtrip(
     aas_env: dict[str, Any],
     result: AASValidationResult,
-) -> model.DictObjectStore[model.Identifiable] | None:
+) -> list[_PartValidation]:
     """Deserialize via BaSyx and re-serialize to detect schema violations.
 
-    Uses lenient mode first to recover as many objects as possible, then
-    attempts strict mode to surface hard errors.
+    Each submodel, the shell list and the concept description list is
+    validated on its own and the outcome cached by content digest, so after a
+    patch only the slices that changed go through BaSyx again.  The outcomes
+    are combined the way a single pass over the whole document reports them:
+    a failed read wins, then the first strict error in document order, then
+    identifiers duplicated across slices, then re-serialization failures.
+
+    Returns the slice outcomes in store order, or an empty list when nothing
+    was deserialized.
+    """
+    shells = aas_env.get("assetAdministrationShells", [])
+    concept_descriptions = aas_env.get("conceptDescriptions")
+    shell_part = _validate_part({"assetAdministrationShells": shells})
+    submodel_parts = [
+        _validate_part({"submodels": [submodel]}) for submodel in aas_env.get("submodels", [])
+    ]
+    concept_part = (
+        _validate_part({"conceptDescriptions": concept_descriptions})
+        if concept_descriptions is not None
+        else _PartValidation()
+    )
+    # BaSyx adds objects to its store in list order, but decodes the sorted
+    # payload key by key, so strict decoding reaches concept descriptions
+    # before submodels.
+    store_order = [shell_part, *submodel_parts, concept_part]
+    decode_order = [shell_part, concept_part, *submodel_parts]
+
+    read_error = next((part.read_error for part in store_order if part.read_error), None)
+    if read_error is not None:
+        result.errors.append(f"BaSyx deserialization failed: {read_error}")
+        return []
+
+    strict_error = next((part.strict_error for part in decode_order if part.strict_error), None)
+    if strict_error is None:
+        strict_error = _duplicate_identifier_error(store_order)
+    if strict_error is not None:
+        result.errors.append(f"BaSyx strict deserialization failed: {strict_error}")
+
+    if not any(part.identifiables for part in store_order):
+        expected = len(shells)
+        expected += len(aas_env.get("submodels", []))
+        expected += len(concept_descriptions or [])
+        if expected > 0:
+            result.warnings.append(
+                "BaSyx deserialized zero identifiable objects "
+                f"(expected {expected} from the environment dict)"
+            )
+        return []
+
+    serialization_error = next(
+        (part.serialization_error for part in store_order if part.serialization_error), None
+    )
+    if serialization_error is not None:
+        result.errors.append(
+            f"BaSyx re-serialization failed (round-trip broken): {serialization_error}"
+        )
+    return store_order
+
+
+def _duplicate_identifier_error(parts: list[_PartValidation]) -> str | None:
+    seen: set[str] = set()
+    for part in parts:
+        for identifier, label in part.identifiables:
+            if identifier in seen:
+                return str(
+                    KeyError(f"{label} has a duplicate identifier already parsed in the document!")
+                )
+            seen.add(identifier)
+    return None
+
+
+def _validate_part(part: dict[str, Any]) -> _PartValidation:
+    """Validate one slice of an environment, reusing a cached outcome for identical content."""
+    try:
+        key = hashlib.sha256(orjson.dumps(part, option=orjson.OPT_SORT_KEYS)).digest()
+    except orjson.JSONEncodeError:
+        return _run_part_validation(part)
+    cached = _part_validations.get(key)
+    if cached is None:
+        cached = _run_part_validation(part)
+        _part_validations.put(key, cached)
+    return cached
+
+
+def _run_part_validation(part: dict[str, Any]) -> _PartValidation:
+    """Read ``part`` leniently and strictly through BaSyx, then re-serialize it.
+
+    Lenient mode recovers as many objects as possible; strict mode surfaces
+    the hard errors lenient mode skipped over.
     """
-    payload = json.dumps(aas_env, sort_keys=True, ensure_ascii=False)
+    payload = json.dumps(part, sort_keys=True, ensure_ascii=False)
 
     # Lenient pass — collects objects even if some entries are malformed
     string_io = io.StringIO(payload)
@@ -153,42 +290,41 @@ def _validate_basyx_roundtrip(
             string_io
         )
     except Exception as exc:
-        result.errors.append(f"BaSyx deserialization failed: {exc}")
-        return None
+        return _PartValidation(read_error=str(exc))
     finally:
         string_io.close()
 
     # Strict pass — detect objects skipped in lenient mode
+    strict_error: str | None = None
     strict_io = io.StringIO(payload)
     try:
         basyx_json.read_aas_json_file(  # type: ignore[attr-defined]
             strict_io, failsafe=False
         )
     except Exception as exc:
-        result.errors.append(f"BaSyx strict deserialization failed: {exc}")
+        strict_error = str(exc)
     finally:
         strict_io.close()
 
-    identifiables = list(store)
+    identifiables = tuple((obj.id, str(obj)) for obj in store)
     if not identifiables:
-        # Count expected objects from the dict
-        expected = len(aas_env.get("assetAdministrationShells", []))
-        expected += len(aas_env.get("submodels", []))
-        expected += len(aas_env.get("conceptDescriptions", []))
-        if expected > 0:
-            result.warnings.append(
-                "BaSyx deserialized zero identifiable objects "
-                f"(expected {expected} from the environment dict)"
-            )
-        return store
+        return _PartValidation(strict_error=strict_error)
 
     # Verify round-trip serialization works
+    serialization_error: str | None = None
     try:
         basyx_json.object_store_to_json(store)  # type: ignore[attr-defined]
     except Exception as exc:
-        result.errors.append(f"BaSyx re-serialization failed (round-trip broken): {exc}")
-
-    return store
+        serialization_error = str(exc)
+
+    semantics = AASValidationResult()
+    _validate_semantics(store, semantics)
+    return _PartValidation(
+        strict_error=strict_error,
+        serialization_error=serialization_error,
+        identifiables=identifiables,
+        warnings=tuple(semantics.warnings),
+    )
 
 
 def _validate_semantics(
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import copy
-from typing import Any
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, Response, status
-from sqlalchemy import select
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
 
-from app.db.models import DPP, DPPStatus, Tenant, TenantStatus
+from app.core.config import get_settings
+from app.core.etag import etag_matches, not_modified_response, set_validator_headers, strong_etag
+from app.core.raw_json import raw_json_response, splice_model_json
+from app.core.tenant_cache import TenantRecord, get_tenant_by_slug
+from app.db.models import DPP, DPPStatus
 from app.db.session import DbSession
 from app.modules.cen_api.schemas import (
     CENDPPResponse,
@@ -18,107 +20,47 @@ from app.modules.cen_api.schemas import (
     CENPublicDPPResponse,
 )
 from app.modules.cen_api.service import CENAPIError, CENAPINotFoundError, CENAPIService
+from app.modules.dpps.public_projection import (
+    PROJECTION_FULL,
+    filter_public_aas_environment,
+    filter_public_asset_ids,
+)
+from app.modules.dpps.repository import AASRepositoryService, PublishedProjection
 from app.modules.dpps.service import DPPService
 from app.standards.cen_pren import get_cen_profiles, standards_profile_header
 
 router = APIRouter()
 
-_SENSITIVE_PUBLIC_KEYS = frozenset(
-    {
-        "dppid",
-        "aasid",
-        "serialnumber",
-        "batchid",
-        "globalassetid",
-        "payload",
-        "readpoint",
-        "bizlocation",
-        "ownersubject",
-        "usersubject",
-        "createdbysubject",
-        "email",
-    }
-)
-
-_SENSITIVE_ASSET_ID_KEYS = frozenset({"serialnumber", "batchid", "globalassetid", "dppid", "aasid"})
-
 
 def _set_standards_header(response: Response) -> None:
     response.headers["X-Standards-Profile"] = standards_profile_header(get_cen_profiles())
 
 
-async def _resolve_tenant(db: DbSession, tenant_slug: str) -> Tenant:
-    result = await db.execute(
-        select(Tenant).where(
-            Tenant.slug == tenant_slug.strip().lower(),
-            Tenant.status == TenantStatus.ACTIVE,
-        )
+def _cen_validator(
+    dpp: DPP,
+    revision_ref: UUID | str | None,
+    cen_payload: CENDPPResponse | None,
+) -> str:
+    """Fingerprint of everything a public CEN DPP representation is built from."""
+    identity = (
+        (cen_payload.product_identifier, cen_payload.identifier_scheme, cen_payload.granularity)
+        if cen_payload
+        else None
     )
-    tenant = result.scalar_one_or_none()
-    if tenant is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-    return tenant
-
-
-def _normalize_public_key(key: str) -> str:
-    return "".join(ch for ch in key.lower() if ch.isalnum())
-
-
-def _is_sensitive_public_key(key: str) -> bool:
-    return _normalize_public_key(key) in _SENSITIVE_PUBLIC_KEYS
-
-
-def _is_sensitive_asset_id_key(key: str) -> bool:
-    return _normalize_public_key(key) in _SENSITIVE_ASSET_ID_KEYS
-
-
-def _is_aas_element(node: dict[str, Any]) -> bool:
-    return "modelType" in node or "idShort" in node or "qualifiers" in node
-
-
-def _element_is_public(element: dict[str, Any]) -> bool:
-    qualifiers = element.get("qualifiers", [])
-    for qualifier in qualifiers:
-        if qualifier.get("type") == "Confidentiality":
-            return str(qualifier.get("value", "public")).lower() == "public"
-    return True
-
-
-def _filter_public_node(node: Any) -> Any:
-    if isinstance(node, list):
-        output: list[Any] = []
-        for item in node:
-            filtered = _filter_public_node(item)
-            if filtered is None:
-                continue
-            output.append(filtered)
-        return output
-
-    if isinstance(node, dict):
-        if _is_aas_element(node) and not _element_is_public(node):
-            return None
-        filtered_dict: dict[str, Any] = {}
-        for key, value in node.items():
-            if _is_sensitive_public_key(key):
-                continue
-            filtered_value = _filter_public_node(value)
-            if filtered_value is None and isinstance(value, dict) and _is_aas_element(value):
-                continue
-            filtered_dict[key] = filtered_value
-        return filtered_dict
+    return f"{dpp.id}:{dpp.updated_at}:{revision_ref}:{identity}"
 
-    return node
 
+def _not_modified(etag: str) -> Response:
+    not_modified = not_modified_response(etag, get_settings().public_dpp_cache_control)
+    _set_standards_header(not_modified)
+    return not_modified
 
-def _filter_public_aas_environment(aas_env: dict[str, Any]) -> dict[str, Any]:
-    projected = _filter_public_node(copy.deepcopy(aas_env))
-    if isinstance(projected, dict):
-        return projected
-    return {"submodels": []}
 
-
-def _filter_public_asset_ids(asset_ids: dict[str, Any]) -> dict[str, Any]:
-    return {key: value for key, value in asset_ids.items() if not _is_sensitive_asset_id_key(key)}
+async def _resolve_tenant(db: DbSession, tenant_slug: str) -> TenantRecord:
+    tenant = await get_tenant_by_slug(db, tenant_slug, active_only=True)
+    if tenant is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return tenant
 
 
 async def _to_public_response(
@@ -131,15 +73,16 @@ async def _to_public_response(
     revision = await dpp_service.get_published_revision(dpp_id=dpp.id, tenant_id=dpp.tenant_id)
     aas_env = None
     if revision is not None:
-        decrypted = await dpp_service.get_revision_aas_for_reader(revision)
+        # Encrypted elements never survive the public filter, so skip decrypting them.
+        decrypted = await dpp_service.get_revision_aas_for_reader(revision, pointers=())
         if isinstance(decrypted, dict):
-            aas_env = _filter_public_aas_environment(decrypted)
+            aas_env = filter_public_aas_environment(decrypted)
 
     resolved_cen_payload = cen_payload or await service.to_cen_dpp_response(dpp)
     return CENPublicDPPResponse(
         id=dpp.id,
         status=dpp.status.value,
-        asset_ids=_filter_public_asset_ids(dpp.asset_ids or {}),
+        asset_ids=filter_public_asset_ids(dpp.asset_ids or {}),
         created_at=dpp.created_at,
         updated_at=dpp.updated_at,
         current_revision_no=revision.revision_no if revision else None,
@@ -151,6 +94,32 @@ async def _to_public_response(
     )
 
 
+def _public_dpp_json(
+    dpp: DPP,
+    projection: PublishedProjection | None,
+    cen_payload: CENDPPResponse,
+) -> bytes:
+    """Serialize a public CEN DPP around its stored full public projection."""
+    envelope = CENPublicDPPResponse(
+        id=dpp.id,
+        status=dpp.status.value,
+        asset_ids=filter_public_asset_ids(dpp.asset_ids or {}),
+        created_at=dpp.created_at,
+        updated_at=dpp.updated_at,
+        current_revision_no=projection.revision_no if projection else None,
+        digest_sha256=projection.digest_sha256 if projection else None,
+        product_identifier=cen_payload.product_identifier,
+        identifier_scheme=cen_payload.identifier_scheme,
+        granularity=cen_payload.granularity,
+    )
+    return splice_model_json(
+        envelope,
+        "aas_environment",
+        projection.payload if projection else None,
+        by_alias=True,
+    )
+
+
 @router.get(
     "/{tenant_slug}/cen/dpps/{dpp_id:uuid}",
     response_model=CENPublicDPPResponse,
@@ -160,17 +129,37 @@ async def public_read_dpp_by_id(
     tenant_slug: str,
     dpp_id: UUID,
     db: DbSession,
-    response: Response,
-) -> CENPublicDPPResponse:
-    _set_standards_header(response)
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     tenant = await _resolve_tenant(db, tenant_slug)
     service = CENAPIService(db)
-    dpp_service = DPPService(db)
     try:
         dpp = await service.get_published_dpp(tenant_id=tenant.id, dpp_id=dpp_id)
     except CENAPINotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found") from exc
-    return await _to_public_response(service=service, dpp_service=dpp_service, dpp=dpp)
+    cen_payload = await service.to_cen_dpp_response(dpp)
+
+    repo = AASRepositoryService(db)
+    if if_none_match:
+        # Revision digest only: a 304 never reads the environment
+        ref = await repo.get_published_revision_ref(dpp)
+        etag = strong_etag(
+            "cen-dpp", _cen_validator(dpp, ref.digest_sha256 if ref else None, cen_payload)
+        )
+        if etag_matches(if_none_match, etag):
+            return _not_modified(etag)
+
+    # The full public projection is exactly the confidentiality-filtered
+    # environment, so its stored bytes are spliced in without re-encoding.
+    projection = await repo.get_published_projection(dpp, PROJECTION_FULL)
+    etag = strong_etag(
+        "cen-dpp",
+        _cen_validator(dpp, projection.digest_sha256 if projection else None, cen_payload),
+    )
+    public_response = raw_json_response(_public_dpp_json(dpp, projection, cen_payload))
+    _set_standards_header(public_response)
+    set_validator_headers(public_response, etag, get_settings().public_dpp_cache_control)
+    return public_response
 
 
 @router.get(
@@ -186,7 +175,8 @@ async def public_search_dpps(
     cursor: str | None = Query(default=None),
     identifier: str | None = Query(default=None),
     scheme: str | None = Query(default=None),
-) -> CENDPPSearchResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> CENDPPSearchResponse | Response:
     _set_standards_header(response)
     tenant = await _resolve_tenant(db, tenant_slug)
     service = CENAPIService(db)
@@ -208,6 +198,20 @@ async def public_search_dpps(
     cen_payloads = {
         payload.id: payload for payload in await service.get_public_dpp_responses(dpps=dpps)
     }
+
+    # Published revisions are immutable, so pointers identify the page content
+    # without loading or decrypting any environment.
+    etag = strong_etag(
+        "cen-search",
+        next_cursor,
+        *(
+            _cen_validator(dpp, dpp.current_published_revision_id, cen_payloads.get(dpp.id))
+            for dpp in dpps
+        ),
+    )
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
     items = [
         await _to_public_response(
             service=service,
@@ -217,4 +221,5 @@ async def public_search_dpps(
         )
         for dpp in dpps
     ]
+    set_validator_headers(response, etag, get_settings().public_dpp_cache_control)
     return CENDPPSearchResponse(items=items, paging=CENPaging(cursor=next_cursor))
@@ -31,6 +31,7 @@ from app.modules.cen_api.service import (
     CENAPIService,
     CENFeatureDisabledError,
 )
+from app.modules.dpps.public_cache import invalidate_public_dpp
 from app.modules.dpps.service import DPPService
 from app.standards.cen_pren import get_cen_profiles, standards_profile_header
 
@@ -243,6 +244,7 @@ async def archive_dpp(
     except CENAPIConflictError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     await db.commit()
+    await invalidate_public_dpp(tenant.tenant_id, dpp_id)
     await db.refresh(dpp)
     return await service.to_cen_dpp_response(dpp)
 
@@ -270,6 +272,7 @@ async def publish_dpp(
     except CENAPIConflictError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     await db.commit()
+    await invalidate_public_dpp(tenant.tenant_id, dpp_id)
     await db.refresh(dpp)
     return await service.to_cen_dpp_response(dpp)
 
@@ -1,11 +1,13 @@
 """Stateless YAML-driven ESPR compliance engine.
 
-Loads rule definitions from YAML at startup and evaluates them against
-AAS environment dicts using per-category validators.
+Loads rule definitions from YAML at startup, compiles each ruleset into a
+:class:`RulePlan` and evaluates them against AAS environment dicts using
+per-category validators.
 """
 
 from __future__ import annotations
 
+import hashlib
 from importlib import resources as importlib_resources
 from pathlib import Path
 from typing import Any
@@ -14,6 +16,7 @@ import yaml
 
 from app.core.logging import get_logger
 from app.modules.compliance.categories import detect_category
+from app.modules.compliance.plan import RulePlan
 from app.modules.compliance.schemas import (
     CategoryRuleset,
     ComplianceReport,
@@ -48,6 +51,10 @@ class ComplianceEngine:
     def __init__(self, rules_dir: str | Path | None = None) -> None:
         self._rulesets: dict[str, _LoadedRuleset] = {}
         self._load_rules(rules_dir)
+        digest = hashlib.sha256()
+        for category in sorted(self._rulesets):
+            digest.update(f"{category}={self._rulesets[category].fingerprint};".encode())
+        self._ruleset_version = digest.hexdigest()[:16]
 
     # ------------------------------------------------------------------
     # Public API
@@ -79,7 +86,7 @@ class ComplianceEngine:
             )
 
         validator = _VALIDATORS.get(resolved_category, CategoryValidator())
-        violations = validator.validate(aas_env, ruleset.rules)
+        violations = validator.validate_plan(aas_env, ruleset.plan)
 
         critical = sum(1 for v in violations if v.severity == "critical")
         warnings = sum(1 for v in violations if v.severity == "warning")
@@ -100,6 +107,11 @@ class ComplianceEngine:
             ),
         )
 
+    @property
+    def ruleset_version(self) -> str:
+        """Fingerprint of every loaded ruleset; changes whenever a rule file does."""
+        return self._ruleset_version
+
     def list_categories(self) -> list[str]:
         """Return all loaded category names."""
         return sorted(self._rulesets.keys())
@@ -163,8 +175,8 @@ class ComplianceEngine:
 
     def _load_rule_file(self, path: Path) -> None:
         """Parse a single YAML rule file and register it."""
-        with open(path, encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+        raw_file = path.read_bytes()
+        data = yaml.safe_load(raw_file)
 
         if not isinstance(data, dict):
             logger.warning("invalid_rule_file", file=str(path))
@@ -199,6 +211,7 @@ class ComplianceEngine:
             version=version,
             description=description,
             rules=rules,
+            fingerprint=f"{version}:{hashlib.sha256(raw_file).hexdigest()[:16]}",
         )
         logger.info(
             "ruleset_loaded",
@@ -209,9 +222,9 @@ class ComplianceEngine:
 
 
 class _LoadedRuleset:
-    """Internal holder for a parsed ruleset."""
+    """Internal holder for a parsed ruleset and its compiled plan."""
 
-    __slots__ = ("category", "version", "description", "rules")
+    __slots__ = ("category", "version", "description", "rules", "plan", "fingerprint")
 
     def __init__(
         self,
@@ -219,8 +232,11 @@ class _LoadedRuleset:
         version: str,
         description: str,
         rules: list[RuleDefinition],
+        fingerprint: str,
     ) -> None:
         self.category = category
         self.version = version
         self.description = description
         self.rules = rules
+        self.plan = RulePlan(rules)
+        self.fingerprint = fingerprint
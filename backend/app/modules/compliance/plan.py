@@ -0,0 +1,173 @@
+"""Compiled compliance rule plans.
+
+A :class:`RulePlan` is built once per ruleset when the YAML rule files are
+loaded.  Rules are grouped by the submodel they target (idShort plus the
+optional semanticId filter) and the element paths of each group are merged
+into a trie, so an evaluation walks the submodel list once and the element
+tree of each targeted submodel once, however many rules point into it.
+
+Resolution follows the original per-rule lookup: the first submodel with the
+rule's idShort (and semanticId, when the rule has one) is used, and at each
+level the first element with the next idShort is followed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.modules.compliance.schemas import RuleDefinition
+
+
+@dataclass(slots=True)
+class _PathNode:
+    """Element paths below one element, merged across rules."""
+
+    children: dict[str, _PathNode] = field(default_factory=dict)
+    terminal: bool = False
+
+
+@dataclass(slots=True)
+class _SubmodelTarget:
+    id_short: str
+    semantic_id: str | None
+    paths: _PathNode = field(default_factory=_PathNode)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRule:
+    """A rule with its field path split into submodel target and element path."""
+
+    rule: RuleDefinition
+    target: int
+    element_path: tuple[str, ...]
+
+
+class RulePlan:
+    """Rules of one ruleset, indexed for single-pass evaluation."""
+
+    __slots__ = ("rules", "_targets", "_targets_by_id_short")
+
+    def __init__(self, rules: list[RuleDefinition]) -> None:
+        self._targets: list[_SubmodelTarget] = []
+        self._targets_by_id_short: dict[str, list[int]] = {}
+        target_index: dict[tuple[str, str | None], int] = {}
+        compiled: list[CompiledRule] = []
+        for rule in rules:
+            submodel_id_short, *element_path = rule.field_path.split(".")
+            semantic_id = rule.semantic_id or None
+            key = (submodel_id_short, semantic_id)
+            index = target_index.get(key)
+            if index is None:
+                index = len(self._targets)
+                target_index[key] = index
+                self._targets.append(_SubmodelTarget(submodel_id_short, semantic_id))
+                self._targets_by_id_short.setdefault(submodel_id_short, []).append(index)
+            node = self._targets[index].paths
+            for id_short in element_path:
+                node = node.children.setdefault(id_short, _PathNode())
+            node.terminal = True
+            compiled.append(CompiledRule(rule, index, tuple(element_path)))
+        self.rules: tuple[CompiledRule, ...] = tuple(compiled)
+
+    def resolve(self, aas_env: dict[str, Any]) -> list[Any]:
+        """Values at the field path of every rule, in rule order (``None`` if absent)."""
+        submodels = aas_env.get("submodels")
+        if not isinstance(submodels, list):
+            return [None] * len(self.rules)
+
+        matched: list[dict[str, Any] | None] = [None] * len(self._targets)
+        pending = len(self._targets)
+        for submodel in submodels:
+            if pending == 0:
+                break
+            if not isinstance(submodel, dict):
+                continue
+            id_short = submodel.get("idShort")
+            indexes = self._targets_by_id_short.get(id_short) if isinstance(id_short, str) else None
+            if not indexes:
+                continue
+            semantic_id = first_semantic_id(submodel)
+            for index in indexes:
+                expected = self._targets[index].semantic_id
+                if matched[index] is None and (expected is None or expected == semantic_id):
+                    matched[index] = submodel
+                    pending -= 1
+
+        values: list[dict[tuple[str, ...], Any]] = []
+        for target, submodel in zip(self._targets, matched, strict=True):
+            found: dict[tuple[str, ...], Any] = {}
+            if submodel is not None:
+                _collect(submodel.get("submodelElements", []), target.paths, (), found)
+            values.append(found)
+        return [values[rule.target].get(rule.element_path) for rule in self.rules]
+
+
+def _collect(
+    elements: Any,
+    node: _PathNode,
+    prefix: tuple[str, ...],
+    found: dict[tuple[str, ...], Any],
+) -> None:
+    """Record the value of every path in ``node`` found below ``elements``."""
+    if node.terminal and not prefix:
+        found[prefix] = elements  # the rule targets the container itself
+    if not node.children or not isinstance(elements, list):
+        return
+    first: dict[str, dict[str, Any]] = {}
+    for element in elements:
+        if isinstance(element, dict):
+            id_short = element.get("idShort")
+            if isinstance(id_short, str) and id_short in node.children and id_short not in first:
+                first[id_short] = element
+    for id_short, element in first.items():
+        child = node.children[id_short]
+        path = (*prefix, id_short)
+        if child.terminal:
+            found[path] = extract_value(element)
+        if not child.children:
+            continue
+        element_type = model_type(element)
+        if element_type == "SubmodelElementCollection":
+            _collect(element.get("value", []), child, path, found)
+        elif element_type == "Entity":
+            _collect(element.get("statements", []), child, path, found)
+
+
+def extract_value(element: dict[str, Any]) -> Any:
+    """Extract the effective value from an AAS element."""
+    element_type = model_type(element)
+    if element_type == "MultiLanguageProperty":
+        values = element.get("value")
+        if isinstance(values, list):
+            return {
+                entry.get("language", ""): entry.get("text", "")
+                for entry in values
+                if isinstance(entry, dict)
+            }
+        return values
+    if element_type == "Range":
+        return {"min": element.get("min"), "max": element.get("max")}
+    return element.get("value")
+
+
+def model_type(element: dict[str, Any]) -> str:
+    """Normalise modelType to a plain string."""
+    raw = element.get("modelType", "")
+    if isinstance(raw, dict):
+        return str(raw.get("name", ""))
+    return str(raw)
+
+
+def first_semantic_id(submodel: dict[str, Any]) -> str | None:
+    """Value of the first key of a submodel's semanticId."""
+    sem_id = submodel.get("semanticId")
+    if not isinstance(sem_id, dict):
+        return None
+    keys = sem_id.get("keys")
+    if not isinstance(keys, list) or not keys:
+        return None
+    first = keys[0]
+    if not isinstance(first, dict):
+        return None
+    return str(first.get("value", ""))
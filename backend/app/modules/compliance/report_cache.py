@@ -0,0 +1,62 @@
+"""
+Per-worker cache of compliance reports keyed by content and ruleset.
+
+A report depends only on the evaluated environment, the requested category
+and the loaded rules.  Revisions never change and carry the digest of their
+environment, so ``(tenant, revision digest, category, ruleset version)``
+identifies a report: publish gates reuse a check that already ran on the same
+content, and editing a rule file changes the ruleset version so stale reports
+are never served.  Reports are copied on the way in and out, so callers may
+set ``dpp_id`` or otherwise modify the report they get.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.modules.compliance.schemas import ComplianceReport
+
+ReportKey = tuple[UUID, str, str, str]
+
+
+class ComplianceReportCache:
+    """Entry-bounded LRU of compliance reports."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[ReportKey, ComplianceReport] = OrderedDict()
+
+    def get(self, key: ReportKey) -> ComplianceReport | None:
+        report = self._entries.get(key)
+        if report is None:
+            return None
+        self._entries.move_to_end(key)
+        return report.model_copy(deep=True)
+
+    def put(self, key: ReportKey, report: ComplianceReport) -> None:
+        self._entries[key] = report.model_copy(deep=True, update={"dpp_id": None})
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache: ComplianceReportCache | None = None
+
+
+def get_report_cache() -> ComplianceReportCache | None:
+    """The worker's report cache, or ``None`` when ``compliance_report_cache_size`` is 0."""
+    global _cache  # noqa: PLW0603
+    max_entries = get_settings().compliance_report_cache_size
+    if max_entries <= 0:
+        return None
+    if _cache is None or _cache._max_entries != max_entries:
+        _cache = ComplianceReportCache(max_entries)
+    return _cache
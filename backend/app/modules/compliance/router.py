@@ -9,13 +9,16 @@ from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, Request, status
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from sqlalchemy.exc import IntegrityError
 
 from app.core.audit import emit_audit_event
 from app.core.security import require_access
 from app.core.security.resource_context import build_dpp_resource_context
-from app.core.tenancy import TenantPublisher
+from app.core.tenancy import TenantAdmin, TenantPublisher
+from app.db.models import ComplianceReportRecord, ComplianceScan
 from app.db.session import DbSession
+from app.modules.compliance import scans
 from app.modules.compliance.schemas import (
     CategoryRuleset,
     ComplianceSummary,
@@ -61,6 +64,81 @@ class AllRulesResponse(BaseModel):
     rulesets: dict[str, CategoryRuleset]
 
 
+class ComplianceScanError(BaseModel):
+    """A DPP a compliance scan could not evaluate."""
+
+    dpp_id: UUID
+    error: str
+
+
+class ComplianceScanResponse(BaseModel):
+    """Progress and results of a tenant-wide compliance scan."""
+
+    scan_id: UUID
+    status: str
+    category: str | None = None
+    ruleset_version: str
+    total: int
+    processed: int
+    evaluated: int
+    reused: int = Field(
+        description="DPPs whose stored report for the same revision and ruleset was kept"
+    )
+    skipped: int
+    failed: int
+    compliant: int
+    non_compliant: int
+    progress_percent: float
+    summary: dict[str, Any] | None = Field(
+        None, description="Violation counts by severity, rule and category (once completed)"
+    )
+    errors: list[ComplianceScanError]
+    last_error: str | None = None
+    created_at: str
+    started_at: str | None = None
+    heartbeat_at: str | None = None
+    finished_at: str | None = None
+    queued: bool = Field(
+        False, description="Whether a runner in this process picked the scan up immediately"
+    )
+
+
+class ComplianceScanListResponse(BaseModel):
+    """Paginated compliance scan listing."""
+
+    scans: list[ComplianceScanResponse]
+    count: int
+    total_count: int
+    limit: int
+    offset: int
+
+
+class ComplianceScanReport(BaseModel):
+    """Stored compliance report of one DPP revision."""
+
+    dpp_id: UUID
+    revision_id: UUID | None = None
+    category: str
+    is_compliant: bool
+    critical_violations: int
+    warnings: int
+    checked_at: str
+    violations: list[ComplianceViolation] | None = Field(
+        None, description="Included when include_violations is set"
+    )
+
+
+class ComplianceScanReportListResponse(BaseModel):
+    """Paginated per-DPP reports of a compliance scan."""
+
+    scan_id: UUID
+    reports: list[ComplianceScanReport]
+    count: int
+    total_count: int
+    limit: int
+    offset: int
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -247,3 +325,222 @@ async def get_compliance_report(
         violations=report.violations,
         summary=report.summary,
     )
+
+
+# ---------------------------------------------------------------------------
+# Tenant-wide scans
+# ---------------------------------------------------------------------------
+
+
+def _scan_response(scan: ComplianceScan, *, queued: bool = False) -> ComplianceScanResponse:
+    if scan.status == scans.SCAN_STATUS_COMPLETED:
+        progress = 100.0
+    else:
+        progress = round(scan.processed * 100 / scan.total, 1) if scan.total else 0.0
+    return ComplianceScanResponse(
+        scan_id=scan.id,
+        status=scan.status,
+        category=scan.category,
+        ruleset_version=scan.ruleset_version,
+        total=scan.total,
+        processed=scan.processed,
+        evaluated=scan.evaluated,
+        reused=scan.reused,
+        skipped=scan.skipped,
+        failed=scan.failed,
+        compliant=scan.compliant,
+        non_compliant=scan.non_compliant,
+        progress_percent=min(progress, 100.0),
+        summary=scan.summary,
+        errors=[ComplianceScanError(**entry) for entry in scan.errors],
+        last_error=scan.last_error,
+        created_at=scan.created_at.isoformat(),
+        started_at=scan.started_at.isoformat() if scan.started_at else None,
+        heartbeat_at=scan.heartbeat_at.isoformat() if scan.heartbeat_at else None,
+        finished_at=scan.finished_at.isoformat() if scan.finished_at else None,
+        queued=queued,
+    )
+
+
+def _scan_report(
+    record: ComplianceReportRecord, *, include_violations: bool
+) -> ComplianceScanReport:
+    return ComplianceScanReport(
+        dpp_id=record.dpp_id,
+        revision_id=record.revision_id,
+        category=record.category,
+        is_compliant=record.is_compliant,
+        critical_violations=record.critical_violations,
+        warnings=record.warnings,
+        checked_at=str(record.report_json.get("checked_at") or record.created_at.isoformat()),
+        violations=(
+            [ComplianceViolation(**entry) for entry in record.report_json.get("violations", [])]
+            if include_violations
+            else None
+        ),
+    )
+
+
+async def _get_scan(db: DbSession, tenant_id: UUID, scan_id: UUID) -> ComplianceScan:
+    scan = await scans.ComplianceScanService(db).get_scan(tenant_id, scan_id)
+    if scan is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Compliance scan {scan_id} not found",
+        )
+    return scan
+
+
+@router.post(
+    "/scans",
+    response_model=ComplianceScanResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_compliance_scan(
+    request: Request,
+    db: DbSession,
+    tenant: TenantAdmin,
+    category: str | None = Query(
+        None,
+        description="Only report DPPs detected as this category (battery, textile, electronic)",
+    ),
+) -> ComplianceScanResponse:
+    """Queue a background compliance scan of every DPP of the tenant.
+
+    DPPs are scanned in id order a page at a time.  A DPP whose latest
+    revision already has a stored report for the current rules is not
+    evaluated again.  Poll ``GET /scans/{scan_id}`` for progress and page
+    the results with ``GET /scans/{scan_id}/reports``.
+
+    Requires tenant admin role.
+    """
+    service = scans.ComplianceScanService(db)
+    if category is not None and category not in _get_engine().list_categories():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No rules found for category '{category}'",
+        )
+    try:
+        scan = await service.create_scan(
+            tenant_id=tenant.tenant_id,
+            requested_by_subject=tenant.user.sub,
+            category=category,
+        )
+    except (ValueError, IntegrityError) as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A compliance scan is already queued or running for this tenant",
+        ) from exc
+    await emit_audit_event(
+        db_session=db,
+        action="compliance_scan_created",
+        resource_type="compliance_scan",
+        resource_id=str(scan.id),
+        tenant_id=tenant.tenant_id,
+        user=tenant.user,
+        request=request,
+        metadata={
+            "total": scan.total,
+            "category": category,
+            "ruleset_version": scan.ruleset_version,
+        },
+    )
+    await db.commit()
+
+    queued = scans.enqueue_compliance_scan(tenant.tenant_id, scan.id)
+    return _scan_response(scan, queued=queued)
+
+
+@router.get("/scans", response_model=ComplianceScanListResponse)
+async def list_compliance_scans(
+    db: DbSession,
+    tenant: TenantAdmin,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+) -> ComplianceScanListResponse:
+    """List compliance scans for this tenant, newest first."""
+    items, total_count = await scans.ComplianceScanService(db).list_scans(
+        tenant.tenant_id, limit=limit, offset=offset
+    )
+    payload = [_scan_response(scan) for scan in items]
+    return ComplianceScanListResponse(
+        scans=payload,
+        count=len(payload),
+        total_count=total_count,
+        limit=limit,
+        offset=offset,
+    )
+
+
+@router.get("/scans/{scan_id}", response_model=ComplianceScanResponse)
+async def get_compliance_scan(
+    scan_id: UUID,
+    db: DbSession,
+    tenant: TenantAdmin,
+) -> ComplianceScanResponse:
+    """Get the progress and aggregate violation counts of a compliance scan."""
+    return _scan_response(await _get_scan(db, tenant.tenant_id, scan_id))
+
+
+@router.get("/scans/{scan_id}/reports", response_model=ComplianceScanReportListResponse)
+async def list_compliance_scan_reports(
+    scan_id: UUID,
+    db: DbSession,
+    tenant: TenantAdmin,
+    is_compliant: bool | None = Query(None, description="Filter by compliance outcome"),
+    include_violations: bool = Query(False, description="Include the violations of each report"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+) -> ComplianceScanReportListResponse:
+    """Page the stored per-DPP reports of a compliance scan.
+
+    Reports are read from the database; no rules are evaluated.  A report
+    belongs to the latest scan that evaluated or confirmed it.
+    """
+    scan = await _get_scan(db, tenant.tenant_id, scan_id)
+    records, total_count = await scans.ComplianceScanService(db).list_reports(
+        scan, is_compliant=is_compliant, limit=limit, offset=offset
+    )
+    reports = [_scan_report(record, include_violations=include_violations) for record in records]
+    return ComplianceScanReportListResponse(
+        scan_id=scan.id,
+        reports=reports,
+        count=len(reports),
+        total_count=total_count,
+        limit=limit,
+        offset=offset,
+    )
+
+
+@router.post(
+    "/scans/{scan_id}/resume",
+    response_model=ComplianceScanResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def resume_compliance_scan(
+    scan_id: UUID,
+    request: Request,
+    db: DbSession,
+    tenant: TenantAdmin,
+) -> ComplianceScanResponse:
+    """Queue a failed compliance scan again; it continues after its checkpoint."""
+    scan = await _get_scan(db, tenant.tenant_id, scan_id)
+    try:
+        await scans.ComplianceScanService(db).resume_scan(scan)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    await emit_audit_event(
+        db_session=db,
+        action="compliance_scan_resumed",
+        resource_type="compliance_scan",
+        resource_id=str(scan.id),
+        tenant_id=tenant.tenant_id,
+        user=tenant.user,
+        request=request,
+        metadata={"processed": scan.processed, "total": scan.total},
+    )
+    await db.commit()
+
+    queued = scans.enqueue_compliance_scan(tenant.tenant_id, scan.id)
+    return _scan_response(scan, queued=queued)
@@ -0,0 +1,68 @@
+"""
+Worker processes that evaluate compliance rules for tenant-wide scans.
+
+Rule evaluation is pure Python, so a scan of thousands of DPPs is CPU bound.
+With ``compliance_scan_workers`` set, environments are evaluated in a pool of
+spawned processes that each load the rule files once.  This module only
+depends on the engine so the workers do not import the service layer.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from app.core.config import get_settings
+from app.core.executors import SlicedPool
+from app.modules.compliance.engine import ComplianceEngine
+
+EvaluationResult = tuple[dict[str, Any] | None, str | None]
+
+_scan_pool = SlicedPool(lambda: get_settings().compliance_scan_workers, min_items=16)
+
+# Engine of a pool worker process, loaded on its first slice.
+_worker_engine: ComplianceEngine | None = None
+
+
+async def evaluate_environments(
+    environments: Sequence[dict[str, Any]],
+    engine: ComplianceEngine,
+) -> tuple[str, list[EvaluationResult]]:
+    """
+    Evaluate ``environments`` with auto-detected categories.
+
+    Returns the ruleset version the reports were evaluated with and, per
+    environment, the report as JSON or the error that stopped it.  Runs in the
+    pool, or with ``engine`` inline when the pool is disabled or not worth it.
+    """
+    parts = await _scan_pool.map_slices(_evaluate_slice, environments)
+    if parts is None:
+        return _evaluate_with(engine, environments)
+    versions = {version for version, _ in parts}
+    if len(versions) != 1:
+        raise ValueError("Compliance scan workers loaded different rules")
+    return versions.pop(), [result for _, part in parts for result in part]
+
+
+def _evaluate_slice(environments: list[dict[str, Any]]) -> tuple[str, list[EvaluationResult]]:
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = ComplianceEngine()
+    return _evaluate_with(_worker_engine, environments)
+
+
+def _evaluate_with(
+    engine: ComplianceEngine, environments: Sequence[dict[str, Any]]
+) -> tuple[str, list[EvaluationResult]]:
+    results: list[EvaluationResult] = []
+    for env in environments:
+        try:
+            results.append((engine.evaluate(env).model_dump(mode="json"), None))
+        except Exception as exc:
+            results.append((None, str(exc) or type(exc).__name__))
+    return engine.ruleset_version, results
+
+
+def shutdown_scan_pool() -> None:
+    """Stop the evaluation worker processes (call at shutdown)."""
+    _scan_pool.shutdown()
@@ -0,0 +1,495 @@
+"""
+Resumable tenant-wide compliance scans with persisted per-DPP reports.
+
+``POST /compliance/scans`` records a :class:`ComplianceScan` for the engine's
+current ruleset version and returns at once.  A runner claims the scan with a
+fresh ``worker_token`` and pages through the tenant's DPPs by id (keyset).
+For each page it looks up the latest revision of every DPP and keeps the
+stored report whose ``(revision digest, ruleset version)`` matches; only the
+remaining revisions are materialized and evaluated, in worker processes when
+``compliance_scan_workers`` is set.  New reports, the scan counters and the
+checkpoint of a page are committed in one transaction, so an interrupted scan
+resumes after its last complete page without counting anything twice.
+
+Every report row points at the latest scan that evaluated or confirmed it, so
+the reports of a completed scan can be paged without re-running any rules.
+Violation counts by severity, rule and category are aggregated in SQL when
+the scan completes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Integer, cast, column, func, select, true, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.background_jobs import ClaimedJobRunner
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import DPP, ComplianceReportRecord, ComplianceScan, DPPRevision
+from app.db.session import get_tenant_background_session
+from app.modules.compliance.categories import detect_category
+from app.modules.compliance.report_cache import get_report_cache
+from app.modules.compliance.scan_pool import evaluate_environments, shutdown_scan_pool
+from app.modules.compliance.schemas import ComplianceReport
+from app.modules.compliance.service import _get_engine
+from app.modules.dpps.revision_store import materialize_revisions
+
+logger = get_logger(__name__)
+
+SCAN_STATUS_QUEUED = "queued"
+SCAN_STATUS_RUNNING = "running"
+SCAN_STATUS_COMPLETED = "completed"
+SCAN_STATUS_FAILED = "failed"
+ACTIVE_SCAN_STATUSES = (SCAN_STATUS_QUEUED, SCAN_STATUS_RUNNING)
+
+_MAX_RECORDED_ERRORS = 100
+
+
+class ComplianceScanService:
+    """Create, inspect and page the results of tenant-wide compliance scans."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create_scan(
+        self,
+        *,
+        tenant_id: UUID,
+        requested_by_subject: str,
+        category: str | None = None,
+    ) -> ComplianceScan:
+        """Queue a scan of every DPP; raises ``ValueError`` if one is already active."""
+        engine = _get_engine()
+        if category is not None and category not in engine.list_categories():
+            raise ValueError(f"No rules found for category '{category}'")
+        if await self.get_active_scan(tenant_id) is not None:
+            raise ValueError("A compliance scan is already queued or running for this tenant")
+        scan = ComplianceScan(
+            tenant_id=tenant_id,
+            requested_by_subject=requested_by_subject,
+            status=SCAN_STATUS_QUEUED,
+            category=category,
+            ruleset_version=engine.ruleset_version,
+            total=await self._count_dpps(tenant_id),
+            processed=0,
+            evaluated=0,
+            reused=0,
+            skipped=0,
+            failed=0,
+            compliant=0,
+            non_compliant=0,
+            errors=[],
+            chunk_size=get_settings().compliance_scan_chunk_size,
+        )
+        self._session.add(scan)
+        await self._session.flush()
+        await self._session.refresh(scan)
+        return scan
+
+    async def get_active_scan(self, tenant_id: UUID) -> ComplianceScan | None:
+        result = await self._session.execute(
+            select(ComplianceScan).where(
+                ComplianceScan.tenant_id == tenant_id,
+                ComplianceScan.status.in_(ACTIVE_SCAN_STATUSES),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_scan(self, tenant_id: UUID, scan_id: UUID) -> ComplianceScan | None:
+        result = await self._session.execute(
+            select(ComplianceScan).where(
+                ComplianceScan.id == scan_id,
+                ComplianceScan.tenant_id == tenant_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def list_scans(
+        self, tenant_id: UUID, *, limit: int = 20, offset: int = 0
+    ) -> tuple[list[ComplianceScan], int]:
+        query = select(ComplianceScan).where(ComplianceScan.tenant_id == tenant_id)
+        total_count = await self._session.execute(
+            select(func.count()).select_from(query.subquery())
+        )
+        result = await self._session.execute(
+            query.order_by(ComplianceScan.created_at.desc()).limit(limit).offset(offset)
+        )
+        return list(result.scalars().all()), int(total_count.scalar_one())
+
+    async def list_reports(
+        self,
+        scan: ComplianceScan,
+        *,
+        is_compliant: bool | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[ComplianceReportRecord], int]:
+        """Reports last evaluated or confirmed by ``scan``, in DPP id order."""
+        query = select(ComplianceReportRecord).where(
+            ComplianceReportRecord.tenant_id == scan.tenant_id,
+            ComplianceReportRecord.scan_id == scan.id,
+        )
+        if is_compliant is not None:
+            query = query.where(ComplianceReportRecord.is_compliant == is_compliant)
+        total_count = await self._session.execute(
+            select(func.count()).select_from(query.subquery())
+        )
+        result = await self._session.execute(
+            query.order_by(ComplianceReportRecord.dpp_id).limit(limit).offset(offset)
+        )
+        return list(result.scalars().all()), int(total_count.scalar_one())
+
+    async def resume_scan(self, scan: ComplianceScan) -> ComplianceScan:
+        """Queue a failed scan again; it continues after its checkpoint."""
+        if scan.status != SCAN_STATUS_FAILED:
+            raise ValueError(f"Only failed compliance scans can be resumed (status: {scan.status})")
+        if await self.get_active_scan(scan.tenant_id) is not None:
+            raise ValueError("A compliance scan is already queued or running for this tenant")
+        scan.status = SCAN_STATUS_QUEUED
+        scan.worker_token = None
+        scan.finished_at = None
+        scan.last_error = None
+        await self._session.flush()
+        return scan
+
+    async def next_page(self, scan: ComplianceScan) -> list[UUID]:
+        """Return the ids of the next ``chunk_size`` DPPs after the checkpoint."""
+        query = select(DPP.id).where(DPP.tenant_id == scan.tenant_id)
+        if scan.checkpoint_dpp_id is not None:
+            query = query.where(DPP.id > scan.checkpoint_dpp_id)
+        result = await self._session.execute(query.order_by(DPP.id).limit(scan.chunk_size))
+        return list(result.scalars().all())
+
+    async def scan_page(self, scan: ComplianceScan, dpp_ids: Sequence[UUID]) -> ScanPageOutcome:
+        """Store a report for every in-scope DPP of the page; evaluates only new revisions."""
+        outcome = ScanPageOutcome()
+        latest = await self._session.execute(
+            select(DPPRevision.id, DPPRevision.dpp_id, DPPRevision.digest_sha256)
+            .distinct(DPPRevision.dpp_id)
+            .where(DPPRevision.tenant_id == scan.tenant_id, DPPRevision.dpp_id.in_(dpp_ids))
+            .order_by(DPPRevision.dpp_id, DPPRevision.revision_no.desc())
+        )
+        revisions = {row.dpp_id: (row.id, row.digest_sha256) for row in latest.all()}
+        stored_result = await self._session.execute(
+            select(
+                ComplianceReportRecord.id,
+                ComplianceReportRecord.dpp_id,
+                ComplianceReportRecord.revision_digest,
+                ComplianceReportRecord.category,
+                ComplianceReportRecord.is_compliant,
+            ).where(
+                ComplianceReportRecord.tenant_id == scan.tenant_id,
+                ComplianceReportRecord.dpp_id.in_(dpp_ids),
+                ComplianceReportRecord.ruleset_version == scan.ruleset_version,
+            )
+        )
+        stored = {(row.dpp_id, row.revision_digest): row for row in stored_result.all()}
+
+        reused_ids: list[UUID] = []
+        misses: list[tuple[UUID, UUID, str]] = []
+        for dpp_id in dpp_ids:
+            revision = revisions.get(dpp_id)
+            if revision is None:
+                outcome.skipped += 1
+                continue
+            row = stored.get((dpp_id, revision[1]))
+            if row is None:
+                misses.append((dpp_id, *revision))
+            elif scan.category is not None and row.category != scan.category:
+                outcome.skipped += 1
+            else:
+                reused_ids.append(row.id)
+                outcome.count(is_compliant=row.is_compliant)
+        outcome.reused = len(reused_ids)
+
+        reports = await self._evaluate_misses(scan, misses, outcome)
+        if reports:
+            await self._store_reports(scan, reports)
+        if reused_ids:
+            await self._session.execute(
+                update(ComplianceReportRecord)
+                .where(ComplianceReportRecord.id.in_(reused_ids))
+                .values(scan_id=scan.id)
+            )
+        return outcome
+
+    async def _evaluate_misses(
+        self,
+        scan: ComplianceScan,
+        misses: list[tuple[UUID, UUID, str]],
+        outcome: ScanPageOutcome,
+    ) -> list[tuple[UUID, UUID, str, ComplianceReport]]:
+        """Reports for revisions without a stored one, from the report cache or the engine."""
+        cache = get_report_cache()
+        reports: list[tuple[UUID, UUID, str, ComplianceReport]] = []
+        pending: list[tuple[UUID, UUID, str]] = []
+        for dpp_id, revision_id, digest in misses:
+            cached = (
+                cache.get((scan.tenant_id, digest, "", scan.ruleset_version))
+                if cache is not None
+                else None
+            )
+            if cached is None:
+                pending.append((dpp_id, revision_id, digest))
+            else:
+                reports.append((dpp_id, revision_id, digest, cached))
+        if pending:
+            result = await self._session.execute(
+                select(DPPRevision).where(DPPRevision.id.in_([item[1] for item in pending]))
+            )
+            loaded = {revision.id: revision for revision in result.scalars().all()}
+            await materialize_revisions(self._session, list(loaded.values()))
+            to_evaluate: list[tuple[UUID, UUID, str]] = []
+            environments: list[dict[str, Any]] = []
+            for dpp_id, revision_id, digest in pending:
+                env = loaded[revision_id].aas_env_json
+                if scan.category is not None and detect_category(env) != scan.category:
+                    outcome.skipped += 1
+                    continue
+                to_evaluate.append((dpp_id, revision_id, digest))
+                environments.append(env)
+            ruleset_version, results = await evaluate_environments(environments, _get_engine())
+            if results and ruleset_version != scan.ruleset_version:
+                raise ValueError(
+                    "Compliance rules changed since the scan was queued; start a new scan"
+                )
+            for (dpp_id, revision_id, digest), (payload, error) in zip(
+                to_evaluate, results, strict=True
+            ):
+                if payload is None:
+                    outcome.failed += 1
+                    outcome.errors.append({"dpp_id": str(dpp_id), "error": error or "failed"})
+                    continue
+                report = ComplianceReport.model_validate(payload)
+                if cache is not None:
+                    cache.put((scan.tenant_id, digest, "", scan.ruleset_version), report)
+                reports.append((dpp_id, revision_id, digest, report))
+            outcome.evaluated = len(to_evaluate) - outcome.failed
+        kept: list[tuple[UUID, UUID, str, ComplianceReport]] = []
+        for item in reports:
+            if scan.category is not None and item[3].category != scan.category:
+                outcome.skipped += 1
+                continue
+            outcome.count(is_compliant=item[3].is_compliant)
+            kept.append(item)
+        return kept
+
+    async def _store_reports(
+        self,
+        scan: ComplianceScan,
+        reports: list[tuple[UUID, UUID, str, ComplianceReport]],
+    ) -> None:
+        rows = []
+        for dpp_id, revision_id, digest, report in reports:
+            report.dpp_id = dpp_id
+            rows.append(
+                {
+                    "tenant_id": scan.tenant_id,
+                    "dpp_id": dpp_id,
+                    "revision_id": revision_id,
+                    "revision_digest": digest,
+                    "ruleset_version": scan.ruleset_version,
+                    "scan_id": scan.id,
+                    "category": report.category,
+                    "is_compliant": report.is_compliant,
+                    "critical_violations": report.summary.critical_violations,
+                    "warnings": report.summary.warnings,
+                    "report_json": report.model_dump(mode="json"),
+                }
+            )
+        statement = pg_insert(ComplianceReportRecord).values(rows)
+        await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=["tenant_id", "dpp_id", "revision_digest", "ruleset_version"],
+                index_where=ComplianceReportRecord.revision_digest.is_not(None),
+                set_={"scan_id": statement.excluded.scan_id},
+            )
+        )
+
+    async def summarize(self, scan: ComplianceScan) -> dict[str, Any]:
+        """Violation counts of the scan's reports by severity, rule and category."""
+        by_category = await self._session.execute(
+            select(
+                ComplianceReportRecord.category,
+                func.count().label("reports"),
+                func.sum(cast(ComplianceReportRecord.is_compliant, Integer)).label("compliant"),
+            )
+            .where(
+                ComplianceReportRecord.tenant_id == scan.tenant_id,
+                ComplianceReportRecord.scan_id == scan.id,
+            )
+            .group_by(ComplianceReportRecord.category)
+        )
+        violation = func.jsonb_array_elements(
+            ComplianceReportRecord.report_json["violations"]
+        ).table_valued(column("value", JSONB))
+        by_rule = await self._session.execute(
+            select(
+                violation.c.value["rule_id"].astext.label("rule_id"),
+                violation.c.value["severity"].astext.label("severity"),
+                func.count().label("violations"),
+            )
+            .select_from(ComplianceReportRecord)
+            .join(violation, true())
+            .where(
+                ComplianceReportRecord.tenant_id == scan.tenant_id,
+                ComplianceReportRecord.scan_id == scan.id,
+            )
+            .group_by("rule_id", "severity")
+            .order_by(func.count().desc(), "rule_id")
+        )
+        by_severity = {"critical": 0, "warning": 0, "info": 0}
+        rules = []
+        for row in by_rule.all():
+            by_severity[row.severity] = by_severity.get(row.severity, 0) + int(row.violations)
+            rules.append(
+                {"rule_id": row.rule_id, "severity": row.severity, "count": int(row.violations)}
+            )
+        categories = {
+            row.category: {
+                "compliant": int(row.compliant or 0),
+                "non_compliant": int(row.reports) - int(row.compliant or 0),
+            }
+            for row in by_category.all()
+        }
+        return {"by_severity": by_severity, "by_rule": rules, "by_category": categories}
+
+    async def _count_dpps(self, tenant_id: UUID) -> int:
+        result = await self._session.execute(
+            select(func.count()).select_from(DPP).where(DPP.tenant_id == tenant_id)
+        )
+        return int(result.scalar_one())
+
+
+@dataclass(slots=True)
+class ScanPageOutcome:
+    """Counters of one scanned page."""
+
+    evaluated: int = 0
+    reused: int = 0
+    skipped: int = 0
+    failed: int = 0
+    compliant: int = 0
+    non_compliant: int = 0
+    errors: list[dict[str, str]] = field(default_factory=list)
+
+    def count(self, *, is_compliant: bool) -> None:
+        if is_compliant:
+            self.compliant += 1
+        else:
+            self.non_compliant += 1
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+
+async def _run_page(tenant_id: UUID, scan_id: UUID, token: UUID) -> bool | None:
+    """
+    Scan the page after the checkpoint and commit it with the counters.
+
+    Returns ``False`` when no DPPs are left and ``None`` if the claim was lost.
+    """
+    async with get_tenant_background_session(tenant_id) as session:
+        result = await session.execute(
+            select(ComplianceScan).where(_runner.owned_by(scan_id, token)).with_for_update()
+        )
+        scan = result.scalar_one_or_none()
+        if scan is None:
+            return None
+        scans = ComplianceScanService(session)
+        dpp_ids = await scans.next_page(scan)
+        if not dpp_ids:
+            return False
+        outcome = await scans.scan_page(scan, dpp_ids)
+        scan.processed += len(dpp_ids)
+        scan.evaluated += outcome.evaluated
+        scan.reused += outcome.reused
+        scan.skipped += outcome.skipped
+        scan.failed += outcome.failed
+        scan.compliant += outcome.compliant
+        scan.non_compliant += outcome.non_compliant
+        if outcome.errors and len(scan.errors) < _MAX_RECORDED_ERRORS:
+            scan.errors = [*scan.errors, *outcome.errors][:_MAX_RECORDED_ERRORS]
+        scan.total = max(scan.total, scan.processed)
+        scan.checkpoint_dpp_id = dpp_ids[-1]
+        scan.heartbeat_at = datetime.now(UTC)
+        await session.commit()
+        logger.info(
+            "compliance_scan_progress",
+            scan_id=str(scan_id),
+            processed=scan.processed,
+            total=scan.total,
+            evaluated=outcome.evaluated,
+            reused=outcome.reused,
+        )
+        return True
+
+
+async def _summarize(session: AsyncSession, scan_id: UUID) -> dict[str, Any]:
+    """Summary columns of a completed scan, aggregated from its reports."""
+    scan = await session.get(ComplianceScan, scan_id)
+    if scan is None:
+        return {}
+    summary = await ComplianceScanService(session).summarize(scan)
+    categories = summary["by_category"].values()
+    return {
+        "summary": summary,
+        "compliant": sum(entry["compliant"] for entry in categories),
+        "non_compliant": sum(entry["non_compliant"] for entry in categories),
+    }
+
+
+async def _scan(tenant_id: UUID, scan_id: UUID, token: UUID) -> None:
+    while (more := await _run_page(tenant_id, scan_id, token)) is True:
+        pass
+    if more is None:
+        logger.warning("compliance_scan_claim_lost", scan_id=str(scan_id))
+        return
+    await _runner.finish(
+        tenant_id,
+        scan_id,
+        token,
+        error=None,
+        summarize=lambda session: _summarize(session, scan_id),
+    )
+    logger.info("compliance_scan_completed", scan_id=str(scan_id))
+
+
+_runner = ClaimedJobRunner(
+    "compliance_scan",
+    ComplianceScan,
+    _scan,
+    stale_seconds=lambda: get_settings().compliance_scan_stale_seconds,
+    poll_interval_seconds=lambda: get_settings().compliance_scan_poll_interval_seconds,
+)
+
+
+async def run_compliance_scan(tenant_id: UUID, scan_id: UUID) -> bool:
+    """Claim and run a scan to completion; returns whether this runner ran it."""
+    return await _runner.run(tenant_id, scan_id)
+
+
+def enqueue_compliance_scan(tenant_id: UUID, scan_id: UUID) -> bool:
+    """Start running ``scan_id`` in this process; returns ``False`` if the runner is stopped."""
+    return _runner.enqueue(tenant_id, scan_id)
+
+
+async def start_compliance_scan_runner() -> None:
+    """Allow compliance scans to run here and look for resumable ones (call at startup)."""
+    _runner.start()
+
+
+async def stop_compliance_scan_runner() -> None:
+    """Stop running compliance scans (call at shutdown); they resume from their checkpoint."""
+    await _runner.stop()
+    shutdown_scan_pool()
@@ -2,7 +2,9 @@
 
 Wraps the stateless ``ComplianceEngine`` with DPP-aware operations:
 retrieving the AAS environment from a DPP revision, persisting compliance
-reports, and providing the pre-publish gate (Contract C).
+reports, and providing the pre-publish gate (Contract C).  Reports of
+revisions are cached by revision digest and ruleset version, so the gate
+reuses a check that already ran on the same content.
 """
 
 from __future__ import annotations
@@ -16,7 +18,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging import get_logger
 from app.db.models import DPP, DPPRevision
 from app.modules.compliance.engine import ComplianceEngine
+from app.modules.compliance.report_cache import get_report_cache
 from app.modules.compliance.schemas import ComplianceReport
+from app.modules.dpps.revision_store import materialize_revision
 
 logger = get_logger(__name__)
 
@@ -73,9 +77,9 @@ class ComplianceService:
         Raises:
             ValueError: If the DPP or its revision cannot be found.
         """
-        aas_env = await self._get_aas_env(dpp_id, tenant_id)
+        revision = await self._get_latest_revision(dpp_id, tenant_id)
 
-        report = self._engine.evaluate(aas_env, category=category)
+        report = await self.check_revision(revision, category=category)
         report.dpp_id = dpp_id
 
         logger.info(
@@ -118,6 +122,34 @@ class ComplianceService:
 
         return report
 
+    async def check_revision(
+        self,
+        revision: DPPRevision,
+        category: str | None = None,
+    ) -> ComplianceReport:
+        """Run a compliance check on one revision, reusing a cached report.
+
+        The report is cached under the revision's tenant and content digest,
+        the category override and the engine's ruleset version; on a miss the
+        revision is materialized and evaluated.
+        """
+        cache = get_report_cache()
+        key = (
+            revision.tenant_id,
+            revision.digest_sha256,
+            category or "",
+            self._engine.ruleset_version,
+        )
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        await materialize_revision(self._session, revision)
+        report = self._engine.evaluate(revision.aas_env_json, category=category)
+        if cache is not None:
+            cache.put(key, report)
+        return report
+
     async def check_aas_env(
         self,
         aas_env: dict[str, Any],
@@ -138,12 +170,12 @@ class ComplianceService:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _get_aas_env(
+    async def _get_latest_revision(
         self,
         dpp_id: UUID,
         tenant_id: UUID,
-    ) -> dict[str, Any]:
-        """Retrieve the latest AAS environment for a DPP."""
+    ) -> DPPRevision:
+        """Retrieve the latest revision of a DPP (not yet materialized)."""
         # Verify the DPP exists and belongs to the tenant
         dpp_result = await self._session.execute(
             select(DPP).where(
@@ -168,6 +200,4 @@ class ComplianceService:
         revision = revision_result.scalar_one_or_none()
         if revision is None:
             raise ValueError(f"No revision found for DPP {dpp_id}")
-
-        aas_env: dict[str, Any] = revision.aas_env_json
-        return aas_env
+        return revision
@@ -6,6 +6,7 @@ import re
 from typing import Any
 
 from app.core.logging import get_logger
+from app.modules.compliance.plan import RulePlan, extract_value, model_type
 from app.modules.compliance.schemas import ComplianceViolation, RuleDefinition
 
 logger = get_logger(__name__)
@@ -14,7 +15,7 @@ logger = get_logger(__name__)
 class CategoryValidator:
     """Base validator that evaluates rules against an AAS environment dict.
 
-    Subclasses may override ``validate`` to add category-specific logic
+    Subclasses may override ``validate_plan`` to add category-specific logic
     beyond the standard condition checks.
     """
 
@@ -26,10 +27,17 @@ class CategoryValidator:
         rules: list[RuleDefinition],
     ) -> list[ComplianceViolation]:
         """Evaluate all *rules* against *aas_env* and return violations."""
+        return self.validate_plan(aas_env, RulePlan(rules))
+
+    def validate_plan(
+        self,
+        aas_env: dict[str, Any],
+        plan: RulePlan,
+    ) -> list[ComplianceViolation]:
+        """Evaluate the compiled rules of *plan* against *aas_env* in one pass."""
         violations: list[ComplianceViolation] = []
-        for rule in rules:
-            value = self._resolve_field(aas_env, rule)
-            violation = self._check_condition(rule, value)
+        for compiled, value in zip(plan.rules, plan.resolve(aas_env), strict=True):
+            violation = self._check_condition(compiled.rule, value)
             if violation is not None:
                 violations.append(violation)
         return violations
@@ -55,115 +63,14 @@ class CategoryValidator:
         If ``rule.semantic_id`` is set, only submodels whose semanticId
         matches that value are considered.
         """
-        submodels = aas_env.get("submodels")
-        if not isinstance(submodels, list):
-            return None
-
-        parts = rule.field_path.split(".")
-        if not parts:
-            return None
-
-        submodel_id_short = parts[0]
-        element_path = parts[1:]
-
-        for submodel in submodels:
-            if not isinstance(submodel, dict):
-                continue
-            # Match by idShort
-            if submodel.get("idShort") != submodel_id_short:
-                continue
-            # Optionally filter by semantic ID
-            if rule.semantic_id and not self._semantic_id_matches(submodel, rule.semantic_id):
-                continue
-            # Walk into submodelElements
-            return self._walk_elements(
-                submodel.get("submodelElements", []),
-                element_path,
-            )
-
-        return None
-
-    def _walk_elements(
-        self,
-        elements: list[Any],
-        path: list[str],
-    ) -> Any:
-        """Recursively walk submodelElements to find a value."""
-        if not path:
-            return elements  # return the container itself
-
-        target = path[0]
-        remaining = path[1:]
-
-        for element in elements:
-            if not isinstance(element, dict):
-                continue
-            if element.get("idShort") != target:
-                continue
-
-            if not remaining:
-                return self._extract_value(element)
-
-            # Recurse into children
-            model_type = self._get_model_type(element)
-            if model_type == "SubmodelElementCollection":
-                children = element.get("value", [])
-                if isinstance(children, list):
-                    return self._walk_elements(children, remaining)
-            elif model_type == "Entity":
-                children = element.get("statements", [])
-                if isinstance(children, list):
-                    return self._walk_elements(children, remaining)
-
-            return None
-
-        return None
+        return RulePlan([rule]).resolve(aas_env)[0]
 
     # ------------------------------------------------------------------
     # Value extraction helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _extract_value(element: dict[str, Any]) -> Any:
-        """Extract the effective value from an AAS element."""
-        model_type = CategoryValidator._get_model_type(element)
-        if model_type == "MultiLanguageProperty":
-            values = element.get("value")
-            if isinstance(values, list):
-                return {
-                    entry.get("language", ""): entry.get("text", "")
-                    for entry in values
-                    if isinstance(entry, dict)
-                }
-            return values
-        if model_type == "Range":
-            return {"min": element.get("min"), "max": element.get("max")}
-        if model_type in ("File", "Blob"):
-            return element.get("value")
-        if model_type in ("SubmodelElementCollection", "SubmodelElementList"):
-            return element.get("value")
-        return element.get("value")
-
-    @staticmethod
-    def _get_model_type(element: dict[str, Any]) -> str:
-        """Normalise modelType to a plain string."""
-        raw = element.get("modelType", "")
-        if isinstance(raw, dict):
-            return str(raw.get("name", ""))
-        return str(raw)
-
-    @staticmethod
-    def _semantic_id_matches(submodel: dict[str, Any], expected: str) -> bool:
-        sem_id = submodel.get("semanticId")
-        if not isinstance(sem_id, dict):
-            return False
-        keys = sem_id.get("keys")
-        if not isinstance(keys, list) or not keys:
-            return False
-        first = keys[0]
-        if not isinstance(first, dict):
-            return False
-        return str(first.get("value", "")) == expected
+    _extract_value = staticmethod(extract_value)
+    _get_model_type = staticmethod(model_type)
 
     # ------------------------------------------------------------------
     # Condition evaluation
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import json
+from collections.abc import Sequence
 from typing import Any
 from urllib.parse import quote
 
@@ -43,11 +44,22 @@ class DIDService:
         encoded = quote(domain, safe="") + ":t:" + quote(tenant_slug)
         return f"did:web:{encoded}"
 
-    def generate_did_document(self, tenant_slug: str) -> DIDDocument:
-        """Generate a full DID Document for a tenant."""
+    def generate_did_document(
+        self,
+        tenant_slug: str,
+        public_jwks: Sequence[dict[str, Any]] = (),
+    ) -> DIDDocument:
+        """Generate a full DID Document for a tenant.
+
+        ``public_jwks`` adds a verification method for every other ``kid``
+        (e.g. rotated DPP signing keys), so older signatures stay verifiable.
+        """
         did = self.generate_did_web(tenant_slug)
-        vm_id = f"{did}#{self._key_id}"
-        jwk = self._export_public_key_jwk()
+        methods = [(self._key_id, self._export_public_key_jwk())]
+        methods.extend(
+            (jwk["kid"], jwk) for jwk in public_jwks if jwk.get("kid") not in {self._key_id, None}
+        )
+        vm_ids = [f"{did}#{kid}" for kid, _ in methods]
 
         return DIDDocument(
             id=did,
@@ -58,9 +70,10 @@ class DIDService:
                     controller=did,
                     public_key_jwk=jwk,
                 )
+                for vm_id, (_, jwk) in zip(vm_ids, methods, strict=True)
             ],
-            authentication=[vm_id],
-            assertion_method=[vm_id],
+            authentication=vm_ids,
+            assertion_method=vm_ids,
         )
 
     # ------------------------------------------------------------------
@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException, status
 from sqlalchemy import select
 
 from app.core.config import get_settings
+from app.core.crypto.jws_signer import SigningError, get_dpp_signer
 from app.db.models import Tenant, TenantStatus
 from app.db.session import DbSession
 from app.modules.credentials.did import DIDService
@@ -44,17 +45,34 @@ def _get_did_service() -> DIDService:
     return _did_service
 
 
+def _signer_public_jwks() -> list[dict[str, Any]]:
+    """Public JWKs of every DPP signing key loaded, including retired ones."""
+    try:
+        signer = get_dpp_signer()
+    except SigningError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Signing keys are not available",
+        ) from exc
+    if signer is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Signing key is not configured",
+        )
+    return signer.public_jwks()
+
+
 @router.get(
     "/.well-known/jwks.json",
     response_model=dict[str, Any],
 )
 async def get_public_jwks() -> dict[str, Any]:
-    """Return JWKS for public signature verification."""
-    did_svc = _get_did_service()
-    settings = get_settings()
-    jwk = did_svc.export_public_jwk()
-    jwk["kid"] = settings.dpp_signing_key_id
-    return {"keys": [jwk]}
+    """Return JWKS for public signature verification.
+
+    Lists every key the DPP signer has loaded, so signatures made before a
+    key rotation still verify.
+    """
+    return {"keys": _signer_public_jwks()}
 
 
 @router.get(
@@ -80,7 +98,7 @@ async def get_did_document(tenant_slug: str, db: DbSession) -> dict[str, Any]:
         )
 
     did_svc = _get_did_service()
-    doc = did_svc.generate_did_document(tenant_slug)
+    doc = did_svc.generate_did_document(tenant_slug, _signer_public_jwks())
     return doc.model_dump(by_alias=True)
 
 
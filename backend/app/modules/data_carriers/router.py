@@ -37,6 +37,7 @@ from app.modules.data_carriers.service import (
     DataCarrierService,
     DataCarrierUnsupportedError,
 )
+from app.modules.dpps.public_cache import invalidate_public_dpp
 from app.modules.dpps.service import DPPService
 
 router = APIRouter()
@@ -392,6 +393,7 @@ async def withdraw_data_carrier(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
         ) from exc
     await db.commit()
+    await invalidate_public_dpp(tenant.tenant_id, carrier.dpp_id)
     await db.refresh(carrier)
     return _carrier_to_response(carrier)
 
@@ -51,6 +51,7 @@ from app.modules.dataspace.schemas import (
     RegulatoryEvidenceResponse,
     TransferCreateRequest,
 )
+from app.modules.dpps.revision_store import materialize_revision
 from app.modules.dpps.service import DPPService
 
 logger = get_logger(__name__)
@@ -1213,6 +1214,7 @@ class DataspaceService:
         revision = result.scalar_one_or_none()
         if revision is None:
             raise DataspaceServiceError(f"Revision {revision_id} not found for DPP {dpp_id}")
+        await materialize_revision(self._session, revision)
         return revision
 
     async def _upsert_connector_secrets(
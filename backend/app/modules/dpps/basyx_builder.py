@@ -6,10 +6,11 @@ import copy
 import io
 import json
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from contextlib import suppress
 from typing import Any, cast
 
+import orjson
 from basyx.aas import model
 from basyx.aas.adapter import json as basyx_json
 
@@ -23,10 +24,11 @@ from app.modules.aas.model_utils import (
 )
 from app.modules.aas.references import reference_from_dict, reference_to_dict, reference_to_str
 from app.modules.dpps.mime import validate_mime_type
-from app.modules.templates.basyx_parser import BasyxTemplateParser
+from app.modules.templates.basyx_parser import BasyxTemplateParser, ParsedTemplate
 from app.modules.templates.catalog import get_template_descriptor
 from app.modules.templates.definition import TemplateDefinitionBuilder
 from app.modules.templates.dropin_resolver import TemplateDropInResolver
+from app.modules.templates.model_cache import load_parsed_template, load_resolved_template
 from app.modules.templates.service import TemplateRegistryService
 
 logger = get_logger(__name__)
@@ -47,14 +49,39 @@ class BasyxDppBuilder:
         selected_templates: list[str],
         initial_data: dict[str, Any],
     ) -> dict[str, Any]:
-        store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
+        templates = await self._resolve_selected_templates(selected_templates)
+        return self._assemble_environment(asset_ids, templates, initial_data)
 
-        aas = self._build_aas(asset_ids)
-        store.add(aas)
+    async def build_environments(
+        self,
+        items: Sequence[tuple[dict[str, Any], dict[str, Any]]],
+        selected_templates: list[str],
+    ) -> list[dict[str, Any]]:
+        """Build one environment per ``(asset_ids, initial_data)`` from shared templates.
+
+        Templates are resolved once.  Items without initial data only differ
+        in identifiers, so they are stamped onto a single blueprint instead of
+        instantiating every template again.
+        """
+        templates = await self._resolve_selected_templates(selected_templates)
+        blueprint: dict[str, Any] | None = None
+        environments: list[dict[str, Any]] = []
+        for asset_ids, initial_data in items:
+            if any(initial_data.get(template_key) for template_key, _ in templates):
+                environments.append(self._assemble_environment(asset_ids, templates, initial_data))
+                continue
+            if blueprint is None:
+                blueprint = self._assemble_environment({}, templates, {})
+            environments.append(self._stamp_environment(blueprint, asset_ids, templates))
+        return environments
+
+    async def _resolve_selected_templates(
+        self, selected_templates: list[str]
+    ) -> list[tuple[str, ParsedTemplate]]:
         template_lookup: dict[str, Any] = {
             row.template_key: row for row in await self._template_service.get_all_templates()
         }
-
+        resolved: list[tuple[str, ParsedTemplate]] = []
         for template_key in selected_templates:
             template = await self._template_service.get_template(template_key)
             if not template:
@@ -84,6 +111,20 @@ class BasyxDppBuilder:
                 template_key=template_key,
                 template_lookup=template_lookup,
             )
+            resolved.append((template_key, parsed))
+        return resolved
+
+    def _assemble_environment(
+        self,
+        asset_ids: dict[str, Any],
+        templates: list[tuple[str, ParsedTemplate]],
+        initial_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
+
+        aas = self._build_aas(asset_ids)
+        store.add(aas)
+        for template_key, parsed in templates:
             submodel = self._instantiate_submodel(
                 template_key,
                 asset_ids,
@@ -101,6 +142,34 @@ class BasyxDppBuilder:
         env_json_str = basyx_json.object_store_to_json(store)  # type: ignore[attr-defined]
         return cast(dict[str, Any], json.loads(env_json_str))
 
+    def _stamp_environment(
+        self,
+        blueprint: dict[str, Any],
+        asset_ids: dict[str, Any],
+        templates: list[tuple[str, ParsedTemplate]],
+    ) -> dict[str, Any]:
+        """Copy ``blueprint`` with the shell and submodel ids of ``asset_ids``."""
+        env = cast(dict[str, Any], orjson.loads(orjson.dumps(blueprint)))
+        submodel_ids = {
+            self._submodel_id(template_key, {}): self._submodel_id(template_key, asset_ids)
+            for template_key, _ in templates
+        }
+        aas = self._build_aas(asset_ids)
+        for submodel in env.get("submodels", []):
+            submodel["id"] = submodel_ids.get(submodel.get("id"), submodel.get("id"))
+            aas.submodel.add(
+                model.ModelReference(
+                    (model.Key(model.KeyTypes.SUBMODEL, submodel["id"]),),
+                    model.Submodel,
+                )
+            )
+        shell_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore([aas])
+        shell_json = json.loads(
+            basyx_json.object_store_to_json(shell_store)  # type: ignore[attr-defined]
+        )
+        env["assetAdministrationShells"] = shell_json["assetAdministrationShells"]
+        return env
+
     def update_submodel_environment(
         self,
         aas_env_json: dict[str, Any],
@@ -258,17 +327,36 @@ class BasyxDppBuilder:
         template_key: str | None = None,
         template_lookup: dict[str, Any] | None = None,
     ) -> Any:
+        """Return the shared parsed model of ``template``, with drop-ins resolved.
+
+        The model comes from the process-wide template model cache and must
+        not be mutated; instantiation deep-copies everything it adopts.
+        """
+        if not template_key or not template_lookup:
+            return load_parsed_template(
+                template,
+                semantic_id,
+                lambda: self._parse_template_source(template, semantic_id),
+            )
+        return load_resolved_template(
+            template,
+            semantic_id,
+            template_lookup,
+            load=lambda: self._parse_template_source(template, semantic_id),
+            resolve=lambda parsed: self._resolve_dropins(
+                parsed=parsed,
+                template_key=template_key,
+                template_lookup=template_lookup,
+            ),
+        ).parsed
+
+    def _parse_template_source(self, template: Any, semantic_id: str | None) -> ParsedTemplate:
         if template.template_aasx:
             try:
-                parsed = self._template_parser.parse_aasx(
+                return self._template_parser.parse_aasx(
                     template.template_aasx,
                     expected_semantic_id=semantic_id,
                 )
-                return self._resolve_dropins(
-                    parsed=parsed,
-                    template_key=template_key,
-                    template_lookup=template_lookup,
-                )
             except Exception as exc:
                 logger.warning(
                     "template_aasx_parse_failed",
@@ -278,65 +366,40 @@ class BasyxDppBuilder:
                 )
 
         payload = json.dumps(template.template_json).encode()
-        parsed = self._template_parser.parse_json(
+        return self._template_parser.parse_json(
             payload,
             expected_semantic_id=semantic_id,
         )
-        return self._resolve_dropins(
-            parsed=parsed,
-            template_key=template_key,
-            template_lookup=template_lookup,
-        )
 
     def _resolve_dropins(
         self,
         *,
         parsed: Any,
-        template_key: str | None,
-        template_lookup: dict[str, Any] | None,
-    ) -> Any:
-        if not template_key or not template_lookup:
-            return parsed
-
-        parsed_sources: dict[str, Any] = {}
-
+        template_key: str,
+        template_lookup: dict[str, Any],
+    ) -> dict[int, dict[str, Any]]:
         def source_provider(source_template_key: str) -> model.Submodel | None:
             source_template = template_lookup.get(source_template_key)
             if source_template is None:
                 return None
-            if source_template_key not in parsed_sources:
-                descriptor = get_template_descriptor(source_template_key)
-                expected_semantic = (
-                    descriptor.semantic_id
-                    if descriptor is not None
-                    else getattr(source_template, "semantic_id", None)
-                )
-                if source_template.template_aasx:
-                    try:
-                        parsed_sources[source_template_key] = self._template_parser.parse_aasx(
-                            source_template.template_aasx,
-                            expected_semantic_id=expected_semantic,
-                        )
-                    except Exception:
-                        payload = json.dumps(source_template.template_json).encode()
-                        parsed_sources[source_template_key] = self._template_parser.parse_json(
-                            payload,
-                            expected_semantic_id=expected_semantic,
-                        )
-                else:
-                    payload = json.dumps(source_template.template_json).encode()
-                    parsed_sources[source_template_key] = self._template_parser.parse_json(
-                        payload,
-                        expected_semantic_id=expected_semantic,
-                    )
-            return cast(model.Submodel, parsed_sources[source_template_key].submodel)
+            descriptor = get_template_descriptor(source_template_key)
+            expected_semantic = (
+                descriptor.semantic_id
+                if descriptor is not None
+                else getattr(source_template, "semantic_id", None)
+            )
+            source = load_parsed_template(
+                source_template,
+                expected_semantic,
+                lambda: self._parse_template_source(source_template, expected_semantic),
+            )
+            return source.submodel
 
-        self._dropin_resolver.resolve(
+        return self._dropin_resolver.resolve(
             template_key=template_key,
             submodel=parsed.submodel,
             source_provider=source_provider,
         )
-        return parsed
 
     def _load_environment(
         self, aas_env_json: dict[str, Any]
@@ -435,6 +498,10 @@ class BasyxDppBuilder:
             return f"_{normalized}"
         return normalized
 
+    @staticmethod
+    def _submodel_id(template_key: str, asset_ids: dict[str, Any]) -> str:
+        return f"urn:dpp:sm:{template_key}:{asset_ids.get('manufacturerPartId', 'unknown')}"
+
     def _instantiate_submodel(
         self,
         template_key: str,
@@ -442,7 +509,7 @@ class BasyxDppBuilder:
         template_submodel: model.Submodel,
         initial_values: dict[str, Any],
     ) -> model.Submodel:
-        submodel_id = f"urn:dpp:sm:{template_key}:{asset_ids.get('manufacturerPartId', 'unknown')}"
+        submodel_id = self._submodel_id(template_key, asset_ids)
 
         elements = [
             self._instantiate_element(element, initial_values.get(element.id_short))
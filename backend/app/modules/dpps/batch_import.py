@@ -0,0 +1,583 @@
+"""
+Asynchronous, chunked batch import of DPPs.
+
+``POST /dpps/batch-import/jobs`` streams an upload (JSON, NDJSON or CSV) into
+``batch_import_job_items`` rows with status ``pending`` and returns at once.
+Worker tasks started with the application claim pending items of a job in
+chunks with ``FOR UPDATE SKIP LOCKED``, so several workers and processes can
+share one job.  Items of a chunk that share templates are created with one
+bulk call (falling back to a savepoint per item); item outcomes, the job
+counters and a single audit event are committed once per chunk.  Each
+claim of a chunk is counted on its items in a transaction of its own, so a
+chunk that keeps failing as a whole fails its items after
+``batch_import_max_attempts`` claims.
+
+Jobs are discovered per tenant (the tables are under row-level security)
+when they are created in this process and by a periodic scan, which also
+picks up jobs interrupted by a restart.  Failed items keep their validated
+payload and are put back to ``pending`` by
+:meth:`BatchImportJobService.resume_failed`.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+import orjson
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.audit import emit_audit_event
+from app.core.background_jobs import (
+    ACTIVE_JOB_STATUSES,
+    ITEM_STATUS_FAILED,
+    ITEM_STATUS_PENDING,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JobWorkerPool,
+    discover_in_tenants,
+    record_chunk_attempt,
+)
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import BatchImportJob, BatchImportJobItem
+from app.db.session import get_tenant_background_session
+from app.modules.dpps.bulk_create import BulkDPPItem
+from app.modules.dpps.service import DPPService
+
+logger = get_logger(__name__)
+
+ITEM_STATUS_OK = "ok"
+
+SOURCE_FORMAT_JSON = "json"
+SOURCE_FORMAT_NDJSON = "ndjson"
+SOURCE_FORMAT_CSV = "csv"
+
+_CONTENT_TYPES = {
+    "application/json": SOURCE_FORMAT_JSON,
+    "application/x-ndjson": SOURCE_FORMAT_NDJSON,
+    "application/ndjson": SOURCE_FORMAT_NDJSON,
+    "application/jsonl": SOURCE_FORMAT_NDJSON,
+    "text/csv": SOURCE_FORMAT_CSV,
+}
+
+# CSV columns that are not asset identifiers; list columns use ";" separators.
+_CSV_LIST_COLUMNS = ("selected_templates", "required_specific_asset_ids")
+_CSV_JSON_COLUMNS = ("initial_data",)
+
+_MAX_ERROR_LENGTH = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class UploadRecord:
+    """One item of an upload: its raw mapping, or why it could not be read."""
+
+    payload: dict[str, Any] | None
+    error: str | None = None
+
+
+# =============================================================================
+# Upload parsing
+# =============================================================================
+
+
+def source_format_for(content_type: str | None) -> str | None:
+    """Map a request ``Content-Type`` to a supported upload format."""
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    return _CONTENT_TYPES.get(media_type)
+
+
+async def iter_upload_records(
+    chunks: AsyncIterator[bytes],
+    source_format: str,
+) -> AsyncIterator[UploadRecord]:
+    """Yield the items of an upload.
+
+    NDJSON and CSV are parsed incrementally as bytes arrive; JSON (an array
+    or ``{"dpps": [...]}``) has to be read completely.  Raises ``ValueError``
+    when the upload as a whole is unreadable.
+    """
+    if source_format == SOURCE_FORMAT_NDJSON:
+        async for record in _iter_ndjson(chunks):
+            yield record
+    elif source_format == SOURCE_FORMAT_CSV:
+        async for record in _iter_csv(chunks):
+            yield record
+    elif source_format == SOURCE_FORMAT_JSON:
+        for record in await _read_json(chunks):
+            yield record
+    else:
+        raise ValueError(f"Unsupported batch import format: {source_format}")
+
+
+def _record(value: Any) -> UploadRecord:
+    if isinstance(value, dict):
+        return UploadRecord(payload=value)
+    return UploadRecord(payload=None, error="Item must be a JSON object")
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def _iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[UploadRecord]:
+    async for line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            yield _record(orjson.loads(line))
+        except orjson.JSONDecodeError as exc:
+            yield UploadRecord(payload=None, error=f"Invalid JSON line: {exc}")
+
+
+async def _read_json(chunks: AsyncIterator[bytes]) -> list[UploadRecord]:
+    body = bytearray()
+    async for chunk in chunks:
+        body.extend(chunk)
+    try:
+        document = orjson.loads(body)
+    except orjson.JSONDecodeError as exc:
+        raise ValueError(f"Invalid JSON upload: {exc}") from exc
+    if isinstance(document, dict):
+        document = document.get("dpps")
+    if not isinstance(document, list):
+        raise ValueError("JSON upload must be an array of items or an object with 'dpps'")
+    return [_record(value) for value in document]
+
+
+async def _iter_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[UploadRecord]:
+    header: list[str] | None = None
+    buffered: list[str] = []
+    async for line in _iter_lines(chunks):
+        buffered.append(line)
+        # A record continues while a quoted field spans the line break.
+        if sum(part.count('"') for part in buffered) % 2:
+            continue
+        text, buffered = "\n".join(buffered), []
+        if not text.strip():
+            continue
+        row = next(csv.reader([text]))
+        if header is None:
+            header = [column.strip() for column in row]
+            continue
+        yield _csv_record(header, row)
+    if buffered:
+        yield UploadRecord(payload=None, error="Unterminated quoted CSV field")
+
+
+def _csv_record(header: list[str], row: list[str]) -> UploadRecord:
+    if len(row) > len(header):
+        return UploadRecord(payload=None, error="CSV row has more fields than the header")
+    payload: dict[str, Any] = {"asset_ids": {}}
+    for column, raw in zip(header, row, strict=False):
+        value = raw.strip()
+        if not column or not value:
+            continue
+        if column in _CSV_LIST_COLUMNS:
+            payload[column] = [part.strip() for part in value.split(";") if part.strip()]
+        elif column in _CSV_JSON_COLUMNS:
+            try:
+                payload[column] = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                return UploadRecord(payload=None, error=f"Column '{column}' is not valid JSON")
+        else:
+            payload["asset_ids"][column] = value
+    return UploadRecord(payload=payload)
+
+
+# =============================================================================
+# Jobs
+# =============================================================================
+
+
+class BatchImportJobService:
+    """Create, stage, process and resume asynchronous batch import jobs."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create_job(
+        self,
+        *,
+        tenant_id: UUID,
+        tenant_slug: str,
+        requested_by_subject: str,
+        source_format: str,
+        chunk_size: int,
+    ) -> BatchImportJob:
+        """Create an empty queued job; items are added by :meth:`stage_items`."""
+        job = BatchImportJob(
+            tenant_id=tenant_id,
+            tenant_slug=tenant_slug,
+            requested_by_subject=requested_by_subject,
+            payload_hash="",
+            total=0,
+            succeeded=0,
+            failed=0,
+            status=JOB_STATUS_QUEUED,
+            source_format=source_format,
+            chunk_size=chunk_size,
+        )
+        self._session.add(job)
+        await self._session.flush()
+        return job
+
+    async def stage_items(
+        self,
+        job: BatchImportJob,
+        records: AsyncIterator[UploadRecord],
+        *,
+        validate: Callable[[dict[str, Any]], dict[str, Any]],
+        max_items: int,
+    ) -> int:
+        """Insert one pending item per record, ``chunk_size`` rows per statement.
+
+        ``validate`` turns a raw record into the stored create request and
+        raises ``ValueError`` for items that cannot be imported; those are
+        stored as failed without a payload.  Raises ``ValueError`` when the
+        upload exceeds ``max_items``.
+        """
+        chunk_size = job.chunk_size or get_settings().batch_import_chunk_size
+        rows: list[dict[str, Any]] = []
+        total = 0
+        rejected = 0
+        async for record in records:
+            if total >= max_items:
+                raise ValueError(f"Batch import is limited to {max_items} items")
+            row: dict[str, Any] = {
+                "tenant_id": job.tenant_id,
+                "job_id": job.id,
+                "item_index": total,
+                "status": ITEM_STATUS_PENDING,
+            }
+            error = record.error
+            if record.payload is not None:
+                try:
+                    row["payload"] = validate(record.payload)
+                except ValueError as exc:
+                    error = str(exc)
+            if error is not None:
+                row.update(
+                    status=ITEM_STATUS_FAILED,
+                    payload=None,
+                    error=error[:_MAX_ERROR_LENGTH],
+                )
+                rejected += 1
+            rows.append(row)
+            total += 1
+            if len(rows) >= chunk_size:
+                await self._insert_items(rows)
+                rows = []
+        if rows:
+            await self._insert_items(rows)
+        job.total = total
+        job.failed = rejected
+        if total == rejected:
+            job.status = JOB_STATUS_COMPLETED
+            job.finished_at = datetime.now(UTC)
+        await self._session.flush()
+        return total
+
+    async def _insert_items(self, rows: list[dict[str, Any]]) -> None:
+        columns = ("payload", "error")
+        for row in rows:
+            for column in columns:
+                row.setdefault(column, None)
+        await self._session.execute(insert(BatchImportJobItem), rows)
+
+    async def resume_failed(self, job: BatchImportJob) -> int:
+        """Put failed items that have a payload back to pending; returns how many."""
+        result = await self._session.execute(
+            update(BatchImportJobItem)
+            .where(
+                BatchImportJobItem.job_id == job.id,
+                BatchImportJobItem.status == ITEM_STATUS_FAILED,
+                BatchImportJobItem.payload.is_not(None),
+            )
+            .values(status=ITEM_STATUS_PENDING, error=None, dpp_id=None, attempts=0)
+            .returning(BatchImportJobItem.id)
+            .execution_options(synchronize_session=False)
+        )
+        resumed = len(result.scalars().all())
+        if resumed:
+            # Workers add to the counters in SQL as well, so adjust them there.
+            await self._session.execute(
+                update(BatchImportJob)
+                .where(BatchImportJob.id == job.id)
+                .values(
+                    failed=func.greatest(BatchImportJob.failed - resumed, 0),
+                    status=JOB_STATUS_QUEUED,
+                    finished_at=None,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self._session.refresh(job)
+        return resumed
+
+    async def claim_chunk(self, job: BatchImportJob) -> list[BatchImportJobItem]:
+        """Lock the next pending items of ``job`` that no other worker holds."""
+        limit = job.chunk_size or get_settings().batch_import_chunk_size
+        result = await self._session.execute(
+            select(BatchImportJobItem)
+            .where(
+                BatchImportJobItem.job_id == job.id,
+                BatchImportJobItem.status == ITEM_STATUS_PENDING,
+            )
+            .order_by(BatchImportJobItem.item_index)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def process_chunk(
+        self,
+        job: BatchImportJob,
+        items: list[BatchImportJobItem],
+        dpp_service: DPPService,
+    ) -> tuple[int, int]:
+        """Create the DPPs of claimed items and record outcomes; returns (ok, failed).
+
+        Items sharing templates are created together through
+        :meth:`DPPService.create_dpps_bulk`; if a bulk call fails as a whole
+        its items are retried one by one in their own savepoints.
+        """
+        now = datetime.now(UTC)
+        for item in items:
+            item.processed_at = now
+
+        remaining: list[BatchImportJobItem] = []
+        for group in _bulk_groups(items):
+            if len(group) < 2 or not await self._create_bulk(job, group, dpp_service):
+                remaining.extend(group)
+        for item in sorted(remaining, key=lambda item: item.item_index):
+            payload = item.payload or {}
+            try:
+                async with self._session.begin_nested():
+                    dpp = await dpp_service.create_dpp(
+                        tenant_id=job.tenant_id,
+                        tenant_slug=job.tenant_slug or "",
+                        owner_subject=job.requested_by_subject,
+                        asset_ids=payload.get("asset_ids") or {},
+                        selected_templates=payload.get("selected_templates") or [],
+                        initial_data=payload.get("initial_data"),
+                        required_specific_asset_ids=payload.get("required_specific_asset_ids"),
+                    )
+            except ValueError as exc:
+                _record_outcome(item, error=str(exc))
+            except Exception:
+                logger.warning(
+                    "batch_import_item_failed",
+                    job_id=str(job.id),
+                    index=item.item_index,
+                    exc_info=True,
+                )
+                _record_outcome(item, error="Import failed")
+            else:
+                _record_outcome(item, dpp_id=dpp.id)
+
+        succeeded = sum(1 for item in items if item.status == ITEM_STATUS_OK)
+        failed = len(items) - succeeded
+        await self._session.execute(
+            update(BatchImportJob)
+            .where(BatchImportJob.id == job.id)
+            .values(
+                succeeded=BatchImportJob.succeeded + succeeded,
+                failed=BatchImportJob.failed + failed,
+                status=JOB_STATUS_RUNNING,
+                started_at=func.coalesce(BatchImportJob.started_at, func.now()),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await emit_audit_event(
+            db_session=self._session,
+            action="batch_import_chunk",
+            resource_type="batch_import_job",
+            resource_id=str(job.id),
+            tenant_id=job.tenant_id,
+            metadata={
+                "requested_by": job.requested_by_subject,
+                "first_index": items[0].item_index,
+                "last_index": items[-1].item_index,
+                "succeeded": succeeded,
+                "failed": failed,
+            },
+        )
+        await self._session.flush()
+        return succeeded, failed
+
+    async def _create_bulk(
+        self,
+        job: BatchImportJob,
+        group: list[BatchImportJobItem],
+        dpp_service: DPPService,
+    ) -> bool:
+        first = group[0].payload or {}
+        try:
+            async with self._session.begin_nested():
+                outcomes = await dpp_service.create_dpps_bulk(
+                    tenant_id=job.tenant_id,
+                    tenant_slug=job.tenant_slug or "",
+                    owner_subject=job.requested_by_subject,
+                    items=[
+                        BulkDPPItem(
+                            asset_ids=(item.payload or {}).get("asset_ids") or {},
+                            initial_data=(item.payload or {}).get("initial_data") or {},
+                        )
+                        for item in group
+                    ],
+                    selected_templates=first.get("selected_templates") or [],
+                    required_specific_asset_ids=first.get("required_specific_asset_ids"),
+                )
+        except Exception:
+            logger.warning(
+                "batch_import_bulk_create_failed",
+                job_id=str(job.id),
+                items=len(group),
+                exc_info=True,
+            )
+            return False
+        for outcome in outcomes:
+            _record_outcome(group[outcome.index], dpp_id=outcome.dpp_id, error=outcome.error)
+        return True
+
+    async def complete_if_drained(self, job: BatchImportJob) -> bool:
+        """Mark ``job`` completed once no pending items remain."""
+        pending = await self._session.execute(
+            select(func.count())
+            .select_from(BatchImportJobItem)
+            .where(
+                BatchImportJobItem.job_id == job.id,
+                BatchImportJobItem.status == ITEM_STATUS_PENDING,
+            )
+        )
+        if int(pending.scalar_one()) > 0:
+            return False
+        await self._session.execute(
+            update(BatchImportJob)
+            .where(
+                BatchImportJob.id == job.id,
+                BatchImportJob.status.in_(ACTIVE_JOB_STATUSES),
+            )
+            .values(status=JOB_STATUS_COMPLETED, finished_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return True
+
+
+def _bulk_groups(items: list[BatchImportJobItem]) -> list[list[BatchImportJobItem]]:
+    """Group items that can share one bulk creation (same templates and required ids)."""
+    groups: dict[str, list[BatchImportJobItem]] = {}
+    for item in items:
+        payload = item.payload or {}
+        key = orjson.dumps(
+            [payload.get("selected_templates"), payload.get("required_specific_asset_ids")]
+        ).decode()
+        groups.setdefault(key, []).append(item)
+    return list(groups.values())
+
+
+def _record_outcome(
+    item: BatchImportJobItem,
+    *,
+    dpp_id: UUID | None = None,
+    error: str | None = None,
+) -> None:
+    if error is None and dpp_id is not None:
+        item.status, item.dpp_id, item.error = ITEM_STATUS_OK, dpp_id, None
+    else:
+        item.status, item.error = ITEM_STATUS_FAILED, (error or "Import failed")[:_MAX_ERROR_LENGTH]
+
+
+# =============================================================================
+# Worker pool
+# =============================================================================
+
+
+async def run_batch_import_job(tenant_id: UUID, job_id: UUID) -> int:
+    """Process chunks of one job until none are left; returns items processed here."""
+    processed = 0
+    while True:
+        async with get_tenant_background_session(tenant_id) as session:
+            job = await session.get(BatchImportJob, job_id)
+            if job is None or job.status not in ACTIVE_JOB_STATUSES:
+                return processed
+            service = BatchImportJobService(session)
+            items = await service.claim_chunk(job)
+            if not items:
+                completed = await service.complete_if_drained(job)
+                await session.commit()
+                if completed:
+                    logger.info("batch_import_job_completed", job_id=str(job_id))
+                return processed
+            items = await record_chunk_attempt(
+                session,
+                BatchImportJob,
+                BatchImportJobItem,
+                items,
+                max_attempts=get_settings().batch_import_max_attempts,
+            )
+            if not items:
+                continue
+            succeeded, failed = await service.process_chunk(job, items, DPPService(session))
+            await session.commit()
+        processed += succeeded + failed
+        logger.info(
+            "batch_import_chunk_processed",
+            job_id=str(job_id),
+            succeeded=succeeded,
+            failed=failed,
+        )
+
+
+async def discover_batch_import_jobs() -> list[tuple[UUID, UUID]]:
+    """Return ``(tenant_id, job_id)`` of every queued or running job."""
+    return await discover_in_tenants(
+        lambda tenant_id: select(BatchImportJob.id)
+        .where(
+            BatchImportJob.tenant_id == tenant_id,
+            BatchImportJob.status.in_(ACTIVE_JOB_STATUSES),
+        )
+        .order_by(BatchImportJob.created_at)
+    )
+
+
+_pool: JobWorkerPool[tuple[UUID, UUID]] = JobWorkerPool(
+    "batch_import",
+    lambda key: run_batch_import_job(*key),
+    discover_batch_import_jobs,
+    share_jobs=True,
+)
+
+
+def enqueue_batch_import_job(tenant_id: UUID, job_id: UUID) -> bool:
+    """Hand a job to this process's workers; returns ``False`` if none are running."""
+    return _pool.enqueue((tenant_id, job_id))
+
+
+async def start_batch_import_workers() -> None:
+    """Start the worker pool and the job scanner (call at startup)."""
+    settings = get_settings()
+    _pool.start(
+        settings.batch_import_worker_concurrency, settings.batch_import_poll_interval_seconds
+    )
+
+
+async def stop_batch_import_workers() -> None:
+    """Stop the worker pool (call at shutdown); unfinished chunks roll back."""
+    await _pool.stop()
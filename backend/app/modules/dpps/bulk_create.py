@@ -0,0 +1,59 @@
+"""
+Building blocks for creating many DPPs from the same templates at once.
+
+:meth:`DPPService.create_dpps_bulk` builds every environment from one set of
+resolved templates, digests them in a process pool when
+``dpp_bulk_create_digest_workers`` is set, and writes ``dpps`` and
+``dpp_revisions`` with multi-row INSERTs.  This module holds its item and
+result types and the digest pool.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.crypto.environment_digest import EnvironmentDigest, compute_environment_digest
+from app.core.executors import SlicedPool
+
+
+@dataclass(frozen=True, slots=True)
+class BulkDPPItem:
+    """Per-DPP input of a bulk creation; templates are shared by the whole batch."""
+
+    asset_ids: dict[str, Any]
+    initial_data: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class BulkDPPResult:
+    """Outcome of one bulk item: the new DPP id, or why it was skipped."""
+
+    index: int
+    dpp_id: UUID | None = None
+    error: str | None = None
+
+
+_digest_pool = SlicedPool(lambda: get_settings().dpp_bulk_create_digest_workers, min_items=32)
+
+
+async def compute_environment_digests(
+    environments: Sequence[dict[str, Any]],
+) -> list[EnvironmentDigest]:
+    """Digest ``environments`` in the pool, or inline when it is disabled or not worth it."""
+    parts = await _digest_pool.map_slices(_digest_slice, environments)
+    if parts is None:
+        return [compute_environment_digest(env) for env in environments]
+    return [digest for part in parts for digest in part]
+
+
+def _digest_slice(environments: list[dict[str, Any]]) -> list[EnvironmentDigest]:
+    return [compute_environment_digest(env) for env in environments]
+
+
+def shutdown_digest_pool() -> None:
+    """Stop the digest worker processes (call at shutdown)."""
+    _digest_pool.shutdown()
@@ -0,0 +1,26 @@
+"""
+Result type of publishing many DPPs at once.
+
+:meth:`DPPService.publish_dpps_bulk` evaluates the publish gates of a whole
+batch from shared inputs (templates, data carrier gate configuration, signing
+key) and set-based lookups, and reports one :class:`BulkPublishResult` per
+requested DPP.  Publish jobs (``publish_jobs``) drive it chunk by chunk.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class BulkPublishResult:
+    """Outcome of one DPP of a bulk publish: its published revision, or why it was blocked."""
+
+    dpp_id: UUID
+    revision_id: UUID | None = None
+    error: str | None = None
+
+    @property
+    def published(self) -> bool:
+        return self.error is None and self.revision_id is not None
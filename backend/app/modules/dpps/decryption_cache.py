@@ -0,0 +1,167 @@
+"""
+Per-worker cache of decrypted revision environments for opted-in tenants.
+
+Internal readers (exports, compliance, LCA, diffs and the editor itself)
+decrypt the same draft revision many times during an editing session.  For
+tenants listed in ``dpp_decryption_cache_tenant_ids`` the plaintext of a
+fully decrypted revision is kept for ``dpp_decryption_cache_ttl_seconds``
+within a ``dpp_decryption_cache_max_bytes`` budget, and unwrapped DEKs are
+kept separately for the shorter ``dpp_dek_cache_ttl_seconds``.
+
+Revision content never changes, so entries need no invalidation beyond
+their TTL; deleted revisions are dropped eagerly.  Every hit hands out an
+independent copy.  Cached plaintext is held as serialized bytes in a
+``bytearray`` that is overwritten when its entry expires or is evicted, but
+that is only best-effort: serialization, copies handed to callers and the
+decoded objects all leave immutable plaintext in process memory until it is
+garbage collected, so opting a tenant in keeps its plaintext in worker
+memory for at least the TTL.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+from app.core.config import get_settings
+from app.core.encryption import DEKCache, DPPEncryptionBaseline, scrub
+
+
+@dataclass(slots=True)
+class _Entry:
+    tenant_id: UUID
+    wrapped_dek: str
+    payload: bytearray
+    baseline: DPPEncryptionBaseline | None
+    expires_at: float
+
+
+class DecryptedEnvironmentCache:
+    """Byte-bounded LRU with a TTL of decrypted environments keyed by revision id."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[UUID, _Entry] = OrderedDict()
+        self._size_bytes = 0
+
+    def get(
+        self, revision_id: UUID, *, tenant_id: UUID, wrapped_dek: str
+    ) -> tuple[dict[str, Any], DPPEncryptionBaseline | None] | None:
+        entry = self._entries.get(revision_id)
+        if entry is None:
+            return None
+        if (
+            entry.expires_at <= time.monotonic()
+            or entry.tenant_id != tenant_id
+            or entry.wrapped_dek != wrapped_dek
+        ):
+            self._discard(revision_id)
+            return None
+        self._entries.move_to_end(revision_id)
+        env: dict[str, Any] = orjson.loads(entry.payload)
+        return env, entry.baseline
+
+    def put(
+        self,
+        revision_id: UUID,
+        *,
+        tenant_id: UUID,
+        wrapped_dek: str,
+        env: dict[str, Any],
+        baseline: DPPEncryptionBaseline | None,
+    ) -> None:
+        settings = get_settings()
+        try:
+            payload = bytearray(orjson.dumps(env))
+        except orjson.JSONEncodeError:
+            return
+        if len(payload) > settings.dpp_decryption_cache_max_bytes:
+            scrub(payload)
+            return
+        self._discard(revision_id)
+        self._entries[revision_id] = _Entry(
+            tenant_id=tenant_id,
+            wrapped_dek=wrapped_dek,
+            payload=payload,
+            baseline=baseline,
+            expires_at=time.monotonic() + settings.dpp_decryption_cache_ttl_seconds,
+        )
+        self._size_bytes += len(payload)
+        while self._size_bytes > settings.dpp_decryption_cache_max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    def discard(self, revision_ids: Collection[UUID]) -> None:
+        for revision_id in revision_ids:
+            self._discard(revision_id)
+
+    def clear(self) -> None:
+        self.discard(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, revision_id: UUID) -> None:
+        entry = self._entries.pop(revision_id, None)
+        if entry is None:
+            return
+        self._size_bytes -= len(entry.payload)
+        scrub(entry.payload)
+
+
+_environments = DecryptedEnvironmentCache()
+_deks = DEKCache()
+
+
+def decryption_cache_enabled(tenant_id: UUID) -> bool:
+    """Return whether ``tenant_id`` opted in to caching decrypted revisions."""
+    return str(tenant_id) in get_settings().dpp_decryption_cache_tenant_ids
+
+
+def get_decrypted_environment(
+    tenant_id: UUID, revision_id: UUID, *, wrapped_dek: str
+) -> tuple[dict[str, Any], DPPEncryptionBaseline | None] | None:
+    """Return a cached decryption of ``revision_id`` for an opted-in tenant."""
+    if not decryption_cache_enabled(tenant_id):
+        return None
+    return _environments.get(revision_id, tenant_id=tenant_id, wrapped_dek=wrapped_dek)
+
+
+def remember_decrypted_environment(
+    tenant_id: UUID,
+    revision_id: UUID,
+    *,
+    wrapped_dek: str,
+    env: dict[str, Any],
+    baseline: DPPEncryptionBaseline | None,
+) -> None:
+    """Cache a full decryption of ``revision_id`` if its tenant opted in."""
+    if decryption_cache_enabled(tenant_id):
+        _environments.put(
+            revision_id,
+            tenant_id=tenant_id,
+            wrapped_dek=wrapped_dek,
+            env=env,
+            baseline=baseline,
+        )
+
+
+def forget_decrypted_environments(revision_ids: Collection[UUID]) -> None:
+    """Drop cached plaintext of deleted revisions."""
+    _environments.discard(revision_ids)
+
+
+def tenant_dek_cache(tenant_id: UUID) -> DEKCache | None:
+    """Return the unwrapped-DEK cache when ``tenant_id`` opted in, else ``None``."""
+    if not decryption_cache_enabled(tenant_id):
+        return None
+    settings = get_settings()
+    _deks.configure(
+        ttl_seconds=settings.dpp_dek_cache_ttl_seconds,
+        max_entries=settings.dpp_dek_cache_max_entries,
+    )
+    return _deks
@@ -0,0 +1,374 @@
+"""
+Incrementally maintained counters for the public landing summary.
+
+The unauthenticated landing endpoints read one ``public_landing_summaries``
+row per tenant instead of aggregating over ``dpps`` and ``epcis_events`` on
+every hit.  Publish, archive and EPCIS capture apply deltas to that row in
+their own transaction; a periodic reconciliation recomputes the counters
+from the source tables to repair drift (for example ``latest_publish_at``
+after the newest DPP is archived).
+
+Recording transactions hold a shared per-tenant advisory lock and
+reconciliation an exclusive one, so a recount never overwrites a delta
+that has not committed yet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import orjson
+from sqlalchemy import case, delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.background_jobs import list_tenant_ids
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import (
+    DPP,
+    DPPStatus,
+    EPCISEvent,
+    PublicLandingProductFamily,
+    PublicLandingSummary,
+    Tenant,
+    TenantStatus,
+)
+from app.db.session import get_background_session, scope_session_to_tenant
+
+logger = get_logger(__name__)
+
+_reconciler_task: asyncio.Task[None] | None = None
+
+
+@dataclass(frozen=True)
+class LandingSummaryCounts:
+    """Aggregate counters shown on the public landing page."""
+
+    published_dpps: int
+    active_product_families: int
+    dpps_with_traceability: int
+    latest_publish_at: datetime | None
+
+
+def manufacturer_part_id(asset_ids: dict[str, Any] | None) -> str | None:
+    """Return a DPP's product family key as ``asset_ids->>'manufacturerPartId'``."""
+    if not isinstance(asset_ids, dict):
+        return None
+    value = asset_ids.get("manufacturerPartId")
+    if value is None:
+        return None
+    text_value = value if isinstance(value, str) else orjson.dumps(value).decode()
+    return text_value or None
+
+
+def _lock_key(tenant_id: UUID) -> Any:
+    return func.hashtextextended(f"public_landing_summary:{tenant_id}", 0)
+
+
+class LandingSummaryService:
+    """Read, update and reconcile the per-tenant landing summary counters."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_summary(self, tenant_id: UUID | None) -> LandingSummaryCounts:
+        """Read a tenant's counters, or the totals over all active tenants."""
+        if tenant_id is not None:
+            result = await self._session.execute(
+                select(
+                    PublicLandingSummary.published_dpps,
+                    PublicLandingSummary.active_product_families,
+                    PublicLandingSummary.dpps_with_traceability,
+                    PublicLandingSummary.latest_publish_at,
+                ).where(PublicLandingSummary.tenant_id == tenant_id)
+            )
+        else:
+            # Part IDs are shared across tenants, so families are counted
+            # distinct over the per-part rows rather than summed.
+            families = (
+                select(func.count(func.distinct(PublicLandingProductFamily.manufacturer_part_id)))
+                .join(Tenant, Tenant.id == PublicLandingProductFamily.tenant_id)
+                .where(
+                    PublicLandingProductFamily.published_dpps > 0,
+                    Tenant.status == TenantStatus.ACTIVE,
+                )
+                .scalar_subquery()
+            )
+            result = await self._session.execute(
+                select(
+                    func.sum(PublicLandingSummary.published_dpps).label("published_dpps"),
+                    families.label("active_product_families"),
+                    func.sum(PublicLandingSummary.dpps_with_traceability).label(
+                        "dpps_with_traceability"
+                    ),
+                    func.max(PublicLandingSummary.latest_publish_at).label("latest_publish_at"),
+                )
+                .join(Tenant, Tenant.id == PublicLandingSummary.tenant_id)
+                .where(Tenant.status == TenantStatus.ACTIVE)
+            )
+        row = result.one_or_none()
+        if row is None:
+            return LandingSummaryCounts(0, 0, 0, None)
+        return LandingSummaryCounts(
+            published_dpps=int(row.published_dpps or 0),
+            active_product_families=int(row.active_product_families or 0),
+            dpps_with_traceability=int(row.dpps_with_traceability or 0),
+            latest_publish_at=row.latest_publish_at,
+        )
+
+    async def record_published(self, dpp: DPP, *, newly_published: bool) -> None:
+        """Count a publish of ``dpp``; call after its status change is flushed.
+
+        Re-publishing an already published DPP only advances
+        ``latest_publish_at``.
+        """
+        await self._lock(dpp.tenant_id, shared=True)
+        if newly_published:
+            await self._apply_dpp(dpp, 1, latest_publish_at=func.now())
+        else:
+            await self._apply(dpp.tenant_id, latest_publish_at=func.now())
+
+    async def record_archived(self, dpp: DPP) -> None:
+        """Stop counting a formerly published DPP."""
+        await self._lock(dpp.tenant_id, shared=True)
+        await self._apply_dpp(dpp, -1)
+
+    async def record_epcis_events(self, tenant_id: UUID, dpp_ids: Iterable[UUID]) -> None:
+        """Mark DPPs as traced after EPCIS events referencing them were added."""
+        ids = set(dpp_ids)
+        if not ids:
+            return
+        # Only the first event of a DPP flips the flag; the row lock makes
+        # concurrent captures and publishes of the same DPP count it once.
+        # Like publish and archive, take the row lock before the advisory one.
+        result = await self._session.execute(
+            update(DPP)
+            .where(
+                DPP.tenant_id == tenant_id,
+                DPP.id.in_(ids),
+                DPP.has_epcis_events.is_(False),
+            )
+            .values(has_epcis_events=True, updated_at=DPP.updated_at)
+            .returning(DPP.status)
+            .execution_options(synchronize_session=False)
+        )
+        newly_traced = sum(1 for status in result.scalars().all() if status == DPPStatus.PUBLISHED)
+        if newly_traced:
+            await self._lock(tenant_id, shared=True)
+            await self._apply(tenant_id, dpps_with_traceability=newly_traced)
+
+    async def repair_epcis_flags(self, tenant_id: UUID) -> int:
+        """Set ``has_epcis_events`` on DPPs whose events were not recorded.
+
+        Run and commit this before :meth:`reconcile` so the recount sees the
+        repaired flags without holding their row locks under the exclusive
+        advisory lock.
+        """
+        has_events = (
+            select(EPCISEvent.id)
+            .where(EPCISEvent.tenant_id == DPP.tenant_id, EPCISEvent.dpp_id == DPP.id)
+            .exists()
+        )
+        result = await self._session.execute(
+            update(DPP)
+            .where(DPP.tenant_id == tenant_id, DPP.has_epcis_events.is_(False), has_events)
+            .values(has_epcis_events=True, updated_at=DPP.updated_at)
+            .returning(DPP.id)
+            .execution_options(synchronize_session=False)
+        )
+        return len(result.scalars().all())
+
+    async def reconcile(self, tenant_id: UUID) -> LandingSummaryCounts:
+        """Recompute a tenant's counters from ``dpps``."""
+        await self._lock(tenant_id, shared=False)
+
+        part = func.nullif(DPP.asset_ids["manufacturerPartId"].astext, "")
+        published = (DPP.tenant_id == tenant_id, DPP.status == DPPStatus.PUBLISHED)
+        counts = (
+            await self._session.execute(
+                select(
+                    func.count().label("published_dpps"),
+                    func.count(func.distinct(part)).label("active_product_families"),
+                    func.count()
+                    .filter(DPP.has_epcis_events.is_(True))
+                    .label("dpps_with_traceability"),
+                    func.max(DPP.updated_at).label("latest_publish_at"),
+                ).where(*published)
+            )
+        ).one()
+
+        await self._session.execute(
+            delete(PublicLandingProductFamily).where(
+                PublicLandingProductFamily.tenant_id == tenant_id
+            )
+        )
+        parts = select(part.label("part")).where(*published, part.is_not(None)).subquery()
+        await self._session.execute(
+            insert(PublicLandingProductFamily).from_select(
+                ["tenant_id", "manufacturer_part_id", "published_dpps"],
+                select(literal(tenant_id), parts.c.part, func.count()).group_by(parts.c.part),
+            )
+        )
+
+        summary = LandingSummaryCounts(
+            published_dpps=int(counts.published_dpps or 0),
+            active_product_families=int(counts.active_product_families or 0),
+            dpps_with_traceability=int(counts.dpps_with_traceability or 0),
+            latest_publish_at=counts.latest_publish_at,
+        )
+        values = {
+            "published_dpps": summary.published_dpps,
+            "active_product_families": summary.active_product_families,
+            "dpps_with_traceability": summary.dpps_with_traceability,
+            "latest_publish_at": summary.latest_publish_at,
+            "reconciled_at": func.now(),
+        }
+        stmt = insert(PublicLandingSummary).values(tenant_id=tenant_id, **values)
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PublicLandingSummary.tenant_id],
+                set_={**values, "updated_at": func.now()},
+            )
+        )
+        return summary
+
+    async def _lock(self, tenant_id: UUID, *, shared: bool) -> None:
+        lock = func.pg_advisory_xact_lock_shared if shared else func.pg_advisory_xact_lock
+        await self._session.execute(select(lock(_lock_key(tenant_id))))
+
+    async def _apply_dpp(self, dpp: DPP, delta: int, *, latest_publish_at: Any = None) -> None:
+        # Read the flag in the statement: the caller holds the DPP row lock,
+        # so it reflects every committed capture.
+        traced = (
+            select(case((DPP.has_epcis_events.is_(True), delta), else_=0))
+            .where(DPP.id == dpp.id)
+            .scalar_subquery()
+        )
+        families: Any = 0
+        part = manufacturer_part_id(dpp.asset_ids)
+        if part is not None:
+            family_stmt = insert(PublicLandingProductFamily).values(
+                tenant_id=dpp.tenant_id,
+                manufacturer_part_id=part,
+                published_dpps=delta,
+            )
+            family = (
+                family_stmt.on_conflict_do_update(
+                    index_elements=[
+                        PublicLandingProductFamily.tenant_id,
+                        PublicLandingProductFamily.manufacturer_part_id,
+                    ],
+                    set_={
+                        "published_dpps": PublicLandingProductFamily.published_dpps
+                        + family_stmt.excluded.published_dpps
+                    },
+                )
+                .returning(PublicLandingProductFamily.published_dpps)
+                .cte("family")
+            )
+            # The family appears on the first publish and disappears with the last
+            activated_at = 1 if delta > 0 else 0
+            families = (
+                select(case((family.c.published_dpps == activated_at, delta), else_=0))
+                .select_from(family)
+                .scalar_subquery()
+            )
+        await self._apply(
+            dpp.tenant_id,
+            published_dpps=delta,
+            active_product_families=func.coalesce(families, 0),
+            dpps_with_traceability=func.coalesce(traced, 0),
+            latest_publish_at=latest_publish_at,
+        )
+
+    async def _apply(
+        self,
+        tenant_id: UUID,
+        *,
+        published_dpps: Any = 0,
+        active_product_families: Any = 0,
+        dpps_with_traceability: Any = 0,
+        latest_publish_at: Any = None,
+    ) -> None:
+        stmt = insert(PublicLandingSummary).values(
+            tenant_id=tenant_id,
+            published_dpps=published_dpps,
+            active_product_families=active_product_families,
+            dpps_with_traceability=dpps_with_traceability,
+            latest_publish_at=latest_publish_at,
+        )
+        excluded = stmt.excluded
+        summary = PublicLandingSummary
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[summary.tenant_id],
+                set_={
+                    "published_dpps": func.greatest(
+                        summary.published_dpps + excluded.published_dpps, 0
+                    ),
+                    "active_product_families": func.greatest(
+                        summary.active_product_families + excluded.active_product_families, 0
+                    ),
+                    "dpps_with_traceability": func.greatest(
+                        summary.dpps_with_traceability + excluded.dpps_with_traceability, 0
+                    ),
+                    "latest_publish_at": func.greatest(
+                        summary.latest_publish_at, excluded.latest_publish_at
+                    ),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+
+async def reconcile_landing_summaries() -> int:
+    """Recompute the landing summary of every tenant; returns the tenant count."""
+    tenant_ids = await list_tenant_ids()
+    for tenant_id in tenant_ids:
+        async with get_background_session() as session:
+            service = LandingSummaryService(session)
+            for step in (service.repair_epcis_flags, service.reconcile):
+                await scope_session_to_tenant(session, tenant_id)
+                await step(tenant_id)
+                await session.commit()
+    return len(tenant_ids)
+
+
+async def _reconcile_forever(interval_seconds: int) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            tenants = await reconcile_landing_summaries()
+            logger.info("landing_summary_reconciled", tenants=tenants)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("landing_summary_reconcile_failed", exc_info=True)
+
+
+async def start_landing_summary_reconciler() -> None:
+    """Start the periodic reconciliation task (call at startup)."""
+    global _reconciler_task
+    interval = get_settings().landing_summary_reconcile_interval_seconds
+    if interval <= 0:
+        return
+    if _reconciler_task is None or _reconciler_task.done():
+        _reconciler_task = asyncio.create_task(_reconcile_forever(interval))
+
+
+async def stop_landing_summary_reconciler() -> None:
+    """Stop the periodic reconciliation task (call at shutdown)."""
+    global _reconciler_task
+    if _reconciler_task is None:
+        return
+    _reconciler_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _reconciler_task
+    _reconciler_task = None
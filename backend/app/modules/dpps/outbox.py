@@ -0,0 +1,347 @@
+"""
+Transactional outbox for side effects of publishing a DPP.
+
+Publish writes one :class:`DPPOutboxEntry` per side effect (webhooks,
+resolver links, registry shell descriptor) in the publish transaction and
+returns as soon as it commits.  A worker pool leases due entries one at a
+time: a short ``FOR UPDATE SKIP LOCKED`` transaction counts the attempt and
+pushes ``available_at`` past the lease, the effect then runs without holding
+the row lock, and a second short transaction marks it done or pushes
+``available_at`` back with exponential backoff.
+
+Entries are unique per ``(tenant_id, idempotency_key)`` and the key is derived
+from the published revision, so enqueuing the same publish twice is a no-op.
+Every effect is safe to run again after a crash between running it and
+recording it as done: resolver links and shell descriptors are upserts.
+Webhooks are delivered inline and a failure at any subscription retries the
+entry; a retry skips subscriptions whose delivery log already records success
+for the entry.  Payloads carry the entry id as ``event_id`` so receivers can
+still dedupe the rare resend after a crash between delivery and logging.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.background_jobs import JobWorkerPool, list_tenant_ids
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import DPP, DPPOutboxEntry, DPPRevision
+from app.db.session import get_tenant_background_session
+from app.modules.registry.handlers import register_shell_descriptor
+from app.modules.resolver.handlers import register_resolver_links
+from app.modules.webhooks.service import DELIVERY_CONCURRENCY, deliver_event
+
+logger = get_logger(__name__)
+
+EFFECT_WEBHOOK = "webhook"
+EFFECT_RESOLVER_LINKS = "resolver_links"
+EFFECT_SHELL_DESCRIPTOR = "shell_descriptor"
+
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+_MAX_ERROR_LENGTH = 1000
+_MAX_RETRY_DELAY_SECONDS = 3600
+_WEBHOOK_DEADLINE_HEADROOM_SECONDS = 30
+
+
+def publish_side_effects(dpp: DPP, *, created_by: str) -> list[dict[str, Any]]:
+    """Outbox rows for the side effects of publishing ``dpp``'s current revision."""
+    revision_id = dpp.current_published_revision_id
+    marker = revision_id or dpp.id
+    base = {"tenant_id": dpp.tenant_id, "dpp_id": dpp.id, "revision_id": revision_id}
+    rows: list[dict[str, Any]] = [
+        {
+            **base,
+            "effect": EFFECT_WEBHOOK,
+            "idempotency_key": f"{EFFECT_WEBHOOK}:DPP_PUBLISHED:{marker}",
+            "payload": {
+                "event_type": "DPP_PUBLISHED",
+                "payload": {
+                    "event": "DPP_PUBLISHED",
+                    "dpp_id": str(dpp.id),
+                    "status": dpp.status.value,
+                },
+            },
+        },
+        {
+            **base,
+            "effect": EFFECT_RESOLVER_LINKS,
+            "idempotency_key": f"{EFFECT_RESOLVER_LINKS}:{marker}",
+            "payload": {"created_by": created_by},
+        },
+    ]
+    if revision_id is not None:
+        rows.append(
+            {
+                **base,
+                "effect": EFFECT_SHELL_DESCRIPTOR,
+                "idempotency_key": f"{EFFECT_SHELL_DESCRIPTOR}:{revision_id}",
+                "payload": {"created_by": created_by},
+            }
+        )
+    return rows
+
+
+async def enqueue_publish_side_effects(session: AsyncSession, dpp: DPP, *, created_by: str) -> None:
+    """Record the post-publish side effects of ``dpp`` in the caller's transaction."""
+    await enqueue_entries(session, publish_side_effects(dpp, created_by=created_by))
+
+
+async def enqueue_entries(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Insert outbox rows, skipping any whose idempotency key is already recorded."""
+    if not rows:
+        return
+    await session.execute(
+        pg_insert(DPPOutboxEntry)
+        .values(rows)
+        .on_conflict_do_nothing(constraint="uq_dpp_outbox_tenant_key")
+    )
+
+
+# =============================================================================
+# Delivery
+# =============================================================================
+
+
+async def _deliver_webhook(session: AsyncSession, entry: DPPOutboxEntry) -> None:
+    await deliver_event(
+        session,
+        entry.tenant_id,
+        entry.payload["event_type"],
+        entry.payload["payload"],
+        event_id=str(entry.id),
+        since=entry.created_at,
+        attempt=entry.attempts,
+    )
+
+
+async def _register_resolver_links(session: AsyncSession, entry: DPPOutboxEntry) -> None:
+    dpp = await session.get(DPP, entry.dpp_id)
+    if dpp is not None:
+        await register_resolver_links(session, dpp, entry.tenant_id, entry.payload["created_by"])
+
+
+async def _register_shell_descriptor(session: AsyncSession, entry: DPPOutboxEntry) -> None:
+    dpp = await session.get(DPP, entry.dpp_id)
+    revision = await session.get(DPPRevision, entry.revision_id) if entry.revision_id else None
+    if dpp is not None and revision is not None:
+        await register_shell_descriptor(
+            session, dpp, revision, entry.tenant_id, entry.payload["created_by"]
+        )
+
+
+_EFFECTS: dict[str, Callable[[AsyncSession, DPPOutboxEntry], Awaitable[None]]] = {
+    EFFECT_WEBHOOK: _deliver_webhook,
+    EFFECT_RESOLVER_LINKS: _register_resolver_links,
+    EFFECT_SHELL_DESCRIPTOR: _register_shell_descriptor,
+}
+
+
+def webhook_deadline_seconds() -> int:
+    """Upper bound on one webhook effect, well above a single HTTP timeout.
+
+    Subscriptions queue on the shared delivery limit, so a tenant with the
+    maximum number of them may need several rounds of HTTP timeouts; one
+    extra round plus headroom covers waiting behind other deliveries.
+    """
+    settings = get_settings()
+    rounds = -(-settings.webhook_max_subscriptions // DELIVERY_CONCURRENCY) + 1
+    return max(settings.webhook_timeout_seconds, 1) * rounds + _WEBHOOK_DEADLINE_HEADROOM_SECONDS
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt after ``attempts`` failed ones."""
+    base = get_settings().dpp_outbox_retry_base_seconds
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), _MAX_RETRY_DELAY_SECONDS))
+
+
+def lease_duration() -> timedelta:
+    """How long a leased entry stays hidden from other workers while it runs."""
+    return timedelta(seconds=webhook_deadline_seconds() + _WEBHOOK_DEADLINE_HEADROOM_SECONDS)
+
+
+async def claim_due_entries(
+    session: AsyncSession, tenant_id: UUID, *, limit: int
+) -> list[DPPOutboxEntry]:
+    """Lock up to ``limit`` due entries that no other worker holds."""
+    result = await session.execute(
+        select(DPPOutboxEntry)
+        .where(
+            DPPOutboxEntry.tenant_id == tenant_id,
+            DPPOutboxEntry.status == STATUS_PENDING,
+            DPPOutboxEntry.available_at <= func.now(),
+        )
+        .order_by(DPPOutboxEntry.available_at, DPPOutboxEntry.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return list(result.scalars().all())
+
+
+async def lease_next_entry(tenant_id: UUID) -> tuple[DPPOutboxEntry | None, bool]:
+    """Lease the next due entry of a tenant in a transaction of its own.
+
+    The attempt is counted and ``available_at`` pushed past :func:`lease_duration`
+    before committing, so other workers skip the entry while it runs without a
+    row lock being held; if this worker dies the entry is due again once the
+    lease runs out.  Also returns whether another entry is due.
+    """
+    async with get_tenant_background_session(tenant_id) as session:
+        due = await claim_due_entries(session, tenant_id, limit=2)
+        if not due:
+            return None, False
+        entry = due[0]
+        entry.attempts += 1
+        entry.available_at = datetime.now(UTC) + lease_duration()
+        await session.commit()
+    return entry, len(due) > 1
+
+
+async def deliver_entry(entry: DPPOutboxEntry) -> bool:
+    """Run one leased side effect and record its outcome in a short transaction.
+
+    Database effects commit together with their outcome.  A webhook's session
+    only reads subscriptions and delivery logs, so no row lock is held while it
+    waits on remote hosts.
+    """
+    try:
+        handler = _EFFECTS[entry.effect]
+        async with get_tenant_background_session(entry.tenant_id) as session:
+            if entry.effect == EFFECT_WEBHOOK:
+                # Only webhooks wait on remote hosts; database effects run to completion.
+                await asyncio.wait_for(handler(session, entry), timeout=webhook_deadline_seconds())
+            else:
+                await handler(session, entry)
+            await _record_outcome(
+                session,
+                entry,
+                status=STATUS_DONE,
+                processed_at=datetime.now(UTC),
+                last_error=None,
+            )
+            await session.commit()
+    except Exception as exc:
+        await _record_failure(entry, (str(exc) or type(exc).__name__)[:_MAX_ERROR_LENGTH])
+        return False
+    return True
+
+
+async def _record_failure(entry: DPPOutboxEntry, error: str) -> None:
+    now = datetime.now(UTC)
+    async with get_tenant_background_session(entry.tenant_id) as session:
+        if entry.attempts >= get_settings().dpp_outbox_max_attempts:
+            await _record_outcome(
+                session, entry, status=STATUS_FAILED, processed_at=now, last_error=error
+            )
+            logger.warning(
+                "dpp_outbox_entry_failed",
+                entry_id=str(entry.id),
+                effect=entry.effect,
+                attempts=entry.attempts,
+                exc_info=True,
+            )
+        else:
+            await _record_outcome(
+                session, entry, available_at=now + retry_delay(entry.attempts), last_error=error
+            )
+            logger.info(
+                "dpp_outbox_entry_retry_scheduled",
+                entry_id=str(entry.id),
+                effect=entry.effect,
+                attempts=entry.attempts,
+                error=error,
+            )
+        await session.commit()
+
+
+async def _record_outcome(session: AsyncSession, entry: DPPOutboxEntry, **values: Any) -> None:
+    # Matching the attempt count keeps a worker whose lease ran out from
+    # overwriting the outcome of the worker that leased the entry next.
+    await session.execute(
+        update(DPPOutboxEntry)
+        .where(DPPOutboxEntry.id == entry.id, DPPOutboxEntry.attempts == entry.attempts)
+        .values(**values)
+    )
+    for name, value in values.items():
+        setattr(entry, name, value)
+
+
+async def drain_tenant(tenant_id: UUID) -> int:
+    """Lease and deliver due entries of one tenant one at a time; returns entries handled."""
+    batch_size = get_settings().dpp_outbox_batch_size
+    for handled in range(batch_size):
+        entry, more_due = await lease_next_entry(tenant_id)
+        if entry is None:
+            return handled
+        if more_due:
+            # Let an idle worker lease the next entries meanwhile.
+            notify_outbox(tenant_id)
+        await deliver_entry(entry)
+    # Hand the tenant back to the pool so other tenants get a turn.
+    notify_outbox(tenant_id)
+    return batch_size
+
+
+# =============================================================================
+# Worker pool
+# =============================================================================
+
+
+async def scan_outbox() -> list[UUID]:
+    """Purge old delivered entries and return the tenants that have due ones."""
+    retention = timedelta(hours=get_settings().dpp_outbox_retention_hours)
+    due_tenants: list[UUID] = []
+    for tenant_id in await list_tenant_ids():
+        async with get_tenant_background_session(tenant_id) as session:
+            due = await session.execute(
+                select(DPPOutboxEntry.id)
+                .where(
+                    DPPOutboxEntry.tenant_id == tenant_id,
+                    DPPOutboxEntry.status == STATUS_PENDING,
+                    DPPOutboxEntry.available_at <= func.now(),
+                )
+                .limit(1)
+            )
+            await session.execute(
+                delete(DPPOutboxEntry).where(
+                    DPPOutboxEntry.tenant_id == tenant_id,
+                    DPPOutboxEntry.status == STATUS_DONE,
+                    DPPOutboxEntry.processed_at < datetime.now(UTC) - retention,
+                )
+            )
+            await session.commit()
+        if due.scalar_one_or_none() is not None:
+            due_tenants.append(tenant_id)
+    return due_tenants
+
+
+_pool: JobWorkerPool[UUID] = JobWorkerPool(
+    "dpp_outbox", drain_tenant, scan_outbox, share_jobs=False
+)
+
+
+def notify_outbox(tenant_id: UUID) -> bool:
+    """Wake a worker for ``tenant_id``; returns ``False`` if none run in this process."""
+    return _pool.enqueue(tenant_id)
+
+
+async def start_outbox_workers() -> None:
+    """Start the outbox worker pool and scanner (call at startup)."""
+    settings = get_settings()
+    _pool.start(settings.dpp_outbox_worker_concurrency, settings.dpp_outbox_poll_interval_seconds)
+
+
+async def stop_outbox_workers() -> None:
+    """Stop the outbox workers (call at shutdown); undelivered entries stay pending."""
+    await _pool.stop()
@@ -0,0 +1,94 @@
+"""
+Cache keys and invalidation for public DPP / AAS repository responses.
+
+Detail responses are tagged per DPP; paged shell listings are tagged per
+tenant because publishing or archiving any DPP changes their membership.
+Writers call :func:`invalidate_public_dpp` after committing a change that
+alters what the public endpoints serve for a DPP.
+
+A reader that loaded data before such a commit may write its entry after the
+invalidation ran.  Detail keys therefore carry the published revision they
+were rendered from (:func:`published_cache_key`) and listing keys the
+tenant's listing generation, so a late write lands under a key that no later
+reader looks up and simply expires.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from app.core.cache import bump_generation, get_generation, invalidate_tags
+
+if TYPE_CHECKING:
+    from app.db.models import DPP
+
+_KEY_PREFIX = "dpp-public"
+
+
+def public_cache_key(
+    tenant_id: UUID,
+    scope: str,
+    identifier: str,
+    *,
+    tier: str = "",
+    content: str = "",
+) -> str:
+    """Build the cache key for a public response.
+
+    *identifier* may be an arbitrary AAS/submodel id, so it is hashed to keep
+    keys short and free of Redis-unfriendly characters.
+    """
+    digest = hashlib.sha256(identifier.encode("utf-8")).hexdigest()[:32]
+    return f"{_KEY_PREFIX}:{tenant_id}:{scope}:{digest}:{tier}:{content}"
+
+
+def published_cache_key(key: str, dpp: DPP) -> str:
+    """Qualify *key* with the published state of *dpp* that the response renders."""
+    return f"{key}:{dpp.current_published_revision_id}:{dpp.updated_at.isoformat()}"
+
+
+async def shells_generation(tenant_id: UUID) -> int | None:
+    """Current listing generation of a tenant; ``None`` when the cache is unavailable."""
+    return await get_generation(_shells_generation_key(tenant_id))
+
+
+def _shells_generation_key(tenant_id: UUID) -> str:
+    return f"{_KEY_PREFIX}-generation:{tenant_id}:shells"
+
+
+def dpp_cache_tag(tenant_id: UUID, dpp_id: UUID) -> str:
+    """Tag set holding every cached response derived from one DPP."""
+    return f"{_KEY_PREFIX}-tag:{tenant_id}:dpp:{dpp_id}"
+
+
+def shells_cache_tag(tenant_id: UUID) -> str:
+    """Tag set holding every cached shell listing page of a tenant."""
+    return f"{_KEY_PREFIX}-tag:{tenant_id}:shells"
+
+
+async def invalidate_public_dpp(tenant_id: UUID, dpp_id: UUID) -> None:
+    """Drop cached public responses for a DPP and its tenant's listings."""
+    await bump_generation(_shells_generation_key(tenant_id))
+    await invalidate_tags(dpp_cache_tag(tenant_id, dpp_id), shells_cache_tag(tenant_id))
+
+
+async def invalidate_public_dpps(tenant_id: UUID, dpp_ids: Iterable[UUID]) -> None:
+    """Like :func:`invalidate_public_dpp` for many DPPs, in one invalidation."""
+    tags = [dpp_cache_tag(tenant_id, dpp_id) for dpp_id in dpp_ids]
+    if tags:
+        await bump_generation(_shells_generation_key(tenant_id))
+        await invalidate_tags(*tags, shells_cache_tag(tenant_id))
+
+
+def pack_cached_response(etag: str, content: bytes) -> bytes:
+    """Prefix a response body with its ETag for storage in a single cache entry."""
+    return etag.encode("ascii") + b"\n" + content
+
+
+def unpack_cached_response(raw: bytes) -> tuple[str, bytes]:
+    """Split a cache entry written by :func:`pack_cached_response`."""
+    etag, _, content = raw.partition(b"\n")
+    return etag.decode("ascii"), content
@@ -0,0 +1,227 @@
+"""Precomputed public projections of published DPP revisions.
+
+Public (unauthenticated) reads only ever see a confidentiality-filtered and
+ESPR-tier-filtered view of a published revision.  Because published revisions
+are immutable, that view is computed once at publish time for every distinct
+tier visibility and stored as serialized JSON bytes, so the public endpoints
+can serve it without copying or walking the AAS tree per request.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+from app.core.crypto.canonicalization import sha256_hex_jcs
+from app.modules.dpps.submodel_filter import (
+    ESPR_TIER_SUBMODEL_MAP,
+    extract_semantic_id,
+    filter_aas_env_by_espr_tier,
+)
+
+# Projection keys.  Tiers with unrestricted submodel access share the
+# ``full`` projection; tiers that are not recognised share ``denied``.
+PROJECTION_FULL = "full"
+PROJECTION_DENIED = "denied"
+
+_SENSITIVE_PUBLIC_KEYS = frozenset(
+    {
+        "dppid",
+        "aasid",
+        "serialnumber",
+        "batchid",
+        "globalassetid",
+        "payload",
+        "readpoint",
+        "bizlocation",
+        "ownersubject",
+        "usersubject",
+        "createdbysubject",
+        "email",
+    }
+)
+
+_SENSITIVE_ASSET_ID_KEYS = frozenset({"serialnumber", "batchid", "globalassetid", "dppid", "aasid"})
+
+
+def _normalize_public_key(key: str) -> str:
+    return "".join(ch for ch in key.lower() if ch.isalnum())
+
+
+def _is_sensitive_public_key(key: str) -> bool:
+    return _normalize_public_key(key) in _SENSITIVE_PUBLIC_KEYS
+
+
+def _is_sensitive_asset_id_key(key: str) -> bool:
+    return _normalize_public_key(key) in _SENSITIVE_ASSET_ID_KEYS
+
+
+def filter_public_aas_environment(aas_env: dict[str, Any]) -> dict[str, Any]:
+    """Remove non-public and sensitive fields from AAS env for unauthenticated access.
+
+    Filtering is recursive:
+    - Drops any AAS element marked with ``Confidentiality`` qualifier != ``public``
+    - Removes known sensitive keys from nested dict structures
+    """
+    filtered = copy.deepcopy(aas_env)
+    projected = _filter_public_node(filtered)
+    if isinstance(projected, dict):
+        return projected
+    return {"submodels": []}
+
+
+def _is_aas_element(node: dict[str, Any]) -> bool:
+    return "modelType" in node or "idShort" in node or "qualifiers" in node
+
+
+def _filter_public_node(node: Any) -> Any:
+    """Recursively filter nested AAS structures for unauthenticated responses."""
+    if isinstance(node, list):
+        result: list[Any] = []
+        for item in node:
+            filtered_item = _filter_public_node(item)
+            if filtered_item is None:
+                continue
+            result.append(filtered_item)
+        return result
+
+    if isinstance(node, dict):
+        if _is_aas_element(node) and not element_is_public(node):
+            return None
+
+        filtered_dict: dict[str, Any] = {}
+        for key, value in node.items():
+            if _is_sensitive_public_key(key):
+                continue
+            filtered_value = _filter_public_node(value)
+            if filtered_value is None and isinstance(value, dict) and _is_aas_element(value):
+                continue
+            filtered_dict[key] = filtered_value
+        return filtered_dict
+
+    return node
+
+
+def element_is_public(element: dict[str, Any]) -> bool:
+    """Check if an element's confidentiality qualifiers allow public access."""
+    qualifiers = element.get("qualifiers", [])
+    for q in qualifiers:
+        if q.get("type") == "Confidentiality":
+            return str(q.get("value", "public")).lower() == "public"
+    return True
+
+
+def filter_public_asset_ids(asset_ids: dict[str, Any]) -> dict[str, Any]:
+    """Strip sensitive product-level identifiers from public asset ID maps."""
+    return {key: value for key, value in asset_ids.items() if not _is_sensitive_asset_id_key(key)}
+
+
+def projection_key_for_tier(espr_tier: str | None) -> str:
+    """Map a requested ESPR tier onto the stored projection that serves it.
+
+    Mirrors :func:`filter_aas_env_by_espr_tier`: anonymous callers get the
+    consumer view, unrestricted tiers share the full view and unknown tiers
+    fail closed.
+    """
+    if not espr_tier or not espr_tier.strip():
+        espr_tier = "consumer"
+    if espr_tier not in ESPR_TIER_SUBMODEL_MAP:
+        return PROJECTION_DENIED
+    if ESPR_TIER_SUBMODEL_MAP[espr_tier] is None:
+        return PROJECTION_FULL
+    return espr_tier
+
+
+def projection_keys() -> tuple[str, ...]:
+    """Return every projection key stored for a published revision."""
+    restricted = tuple(
+        tier for tier, allowed in ESPR_TIER_SUBMODEL_MAP.items() if allowed is not None
+    )
+    return (PROJECTION_FULL, *restricted, PROJECTION_DENIED)
+
+
+def _project(public_env: dict[str, Any], projection_key: str) -> dict[str, Any]:
+    if projection_key == PROJECTION_FULL:
+        return public_env
+    if projection_key == PROJECTION_DENIED:
+        return {**public_env, "submodels": []}
+    return filter_aas_env_by_espr_tier(public_env, projection_key)
+
+
+def build_public_projection(aas_env: dict[str, Any], projection_key: str) -> bytes:
+    """Build one serialized public projection of a revision environment."""
+    public_env = filter_public_aas_environment(aas_env)
+    return orjson.dumps(_project(public_env, projection_key))
+
+
+def build_public_projections(aas_env: dict[str, Any]) -> dict[str, bytes]:
+    """Build every serialized public projection of a revision environment.
+
+    The confidentiality filter runs once; tier projections are derived from
+    its result.
+    """
+    public_env = filter_public_aas_environment(aas_env)
+    return {key: orjson.dumps(_project(public_env, key)) for key in projection_keys()}
+
+
+@dataclass(frozen=True)
+class PublicSubmodel:
+    """One confidentiality-filtered submodel of a revision, ready to store."""
+
+    submodel_id: str
+    semantic_id: str | None
+    digest_sha256: str
+    payload: bytes
+
+
+def build_public_submodels(
+    aas_env: dict[str, Any],
+    submodel_digests: Mapping[str, str] | None = None,
+) -> list[PublicSubmodel]:
+    """Split a revision environment into per-submodel public rows.
+
+    Each digest covers the RFC 8785 canonical form of the source submodel,
+    so it changes only when that submodel does.  ``submodel_digests`` passes
+    the revision's Merkle leaf hashes, which are exactly those digests.
+    Submodels removed by the confidentiality filter get no row; a repeated
+    submodel ID keeps its first public occurrence, as lookups in the
+    projection do.
+    """
+    submodel_digests = submodel_digests or {}
+    rows: list[PublicSubmodel] = []
+    seen: set[str] = set()
+    for submodel in aas_env.get("submodels", []):
+        submodel_id = submodel.get("id")
+        if not isinstance(submodel_id, str) or submodel_id in seen:
+            continue
+        public_submodel = _filter_public_node(copy.deepcopy(submodel))
+        if not isinstance(public_submodel, dict):
+            continue
+        seen.add(submodel_id)
+        rows.append(
+            PublicSubmodel(
+                submodel_id=submodel_id,
+                semantic_id=extract_semantic_id(public_submodel) or None,
+                digest_sha256=submodel_digests.get(submodel_id) or sha256_hex_jcs(submodel),
+                payload=orjson.dumps(public_submodel),
+            )
+        )
+    return rows
+
+
+def submodel_in_projection(semantic_id: str | None, projection_key: str) -> bool:
+    """Whether a submodel with ``semantic_id`` belongs to a tier projection.
+
+    Applies the same semantic ID prefix rule as :func:`_project`, so a
+    stored submodel row can be tier-checked without its projection.
+    """
+    if projection_key == PROJECTION_FULL:
+        return True
+    allowed = ESPR_TIER_SUBMODEL_MAP.get(projection_key)
+    if not allowed or not semantic_id:
+        return False
+    return any(semantic_id.startswith(prefix) for prefix in allowed)
@@ -8,129 +8,62 @@ Only DPPs with status=PUBLISHED are served; drafts/archived return 404.
 from __future__ import annotations
 
 import base64
-import copy
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import UTC, datetime
-from typing import Any, Literal
+from typing import Annotated, Any, Literal, TypeVar
 from uuid import UUID
 
 import jwt
-from fastapi import APIRouter, HTTPException, Query, Response, status
-from fastapi.responses import HTMLResponse
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
+from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import func, select
+from sqlalchemy import select
 
+from app.core.cache import cache_response, get_cached_response
 from app.core.config import get_settings
+from app.core.crypto.environment_digest import EnvironmentDigest, stored_environment_digest
+from app.core.etag import etag_matches, not_modified_response, set_validator_headers, strong_etag
+from app.core.raw_json import splice_raw_json
+from app.core.tenant_cache import TenantRecord, get_tenant_by_slug
 from app.db.models import (
     DPP,
     AuditMerkleRoot,
     DataCarrier,
     DataCarrierStatus,
+    DPPPublishedSubmodel,
     DPPRevision,
     DPPStatus,
-    EPCISEvent,
-    Tenant,
-    TenantStatus,
 )
-from app.db.session import DbSession
+from app.db.session import DbSession, get_background_session
 from app.modules.dpps.idta_schemas import (
     PagedResult,
     PagingMetadata,
     ServiceDescription,
+    decode_cursor,
 )
-from app.modules.dpps.repository import AASRepositoryService
-from app.modules.dpps.submodel_filter import filter_aas_env_by_espr_tier
-
-_SENSITIVE_PUBLIC_KEYS = frozenset(
-    {
-        "dppid",
-        "aasid",
-        "serialnumber",
-        "batchid",
-        "globalassetid",
-        "payload",
-        "readpoint",
-        "bizlocation",
-        "ownersubject",
-        "usersubject",
-        "createdbysubject",
-        "email",
-    }
+from app.modules.dpps.landing_summary import LandingSummaryService
+from app.modules.dpps.public_cache import (
+    dpp_cache_tag,
+    pack_cached_response,
+    public_cache_key,
+    published_cache_key,
+    shells_cache_tag,
+    shells_generation,
+    unpack_cached_response,
 )
-
-_SENSITIVE_ASSET_ID_KEYS = frozenset({"serialnumber", "batchid", "globalassetid", "dppid", "aasid"})
-
-
-def _normalize_public_key(key: str) -> str:
-    return "".join(ch for ch in key.lower() if ch.isalnum())
-
-
-def _is_sensitive_public_key(key: str) -> bool:
-    return _normalize_public_key(key) in _SENSITIVE_PUBLIC_KEYS
-
-
-def _is_sensitive_asset_id_key(key: str) -> bool:
-    return _normalize_public_key(key) in _SENSITIVE_ASSET_ID_KEYS
-
-
-def _filter_public_aas_environment(aas_env: dict[str, Any]) -> dict[str, Any]:
-    """Remove non-public and sensitive fields from AAS env for unauthenticated access.
-
-    Filtering is recursive:
-    - Drops any AAS element marked with ``Confidentiality`` qualifier != ``public``
-    - Removes known sensitive keys from nested dict structures
-    """
-    filtered = copy.deepcopy(aas_env)
-    projected = _filter_public_node(filtered)
-    if isinstance(projected, dict):
-        return projected
-    return {"submodels": []}
-
-
-def _is_aas_element(node: dict[str, Any]) -> bool:
-    return "modelType" in node or "idShort" in node or "qualifiers" in node
-
-
-def _filter_public_node(node: Any) -> Any:
-    """Recursively filter nested AAS structures for unauthenticated responses."""
-    if isinstance(node, list):
-        result: list[Any] = []
-        for item in node:
-            filtered_item = _filter_public_node(item)
-            if filtered_item is None:
-                continue
-            result.append(filtered_item)
-        return result
-
-    if isinstance(node, dict):
-        if _is_aas_element(node) and not _element_is_public(node):
-            return None
-
-        filtered_dict: dict[str, Any] = {}
-        for key, value in node.items():
-            if _is_sensitive_public_key(key):
-                continue
-            filtered_value = _filter_public_node(value)
-            if filtered_value is None and isinstance(value, dict) and _is_aas_element(value):
-                continue
-            filtered_dict[key] = filtered_value
-        return filtered_dict
-
-    return node
-
-
-def _element_is_public(element: dict[str, Any]) -> bool:
-    """Check if an element's confidentiality qualifiers allow public access."""
-    qualifiers = element.get("qualifiers", [])
-    for q in qualifiers:
-        if q.get("type") == "Confidentiality":
-            return str(q.get("value", "public")).lower() == "public"
-    return True
-
-
-def _filter_public_asset_ids(asset_ids: dict[str, Any]) -> dict[str, Any]:
-    """Strip sensitive product-level identifiers from public asset ID maps."""
-    return {key: value for key, value in asset_ids.items() if not _is_sensitive_asset_id_key(key)}
-
+from app.modules.dpps.public_projection import (
+    PROJECTION_FULL,
+    filter_public_asset_ids,
+    projection_key_for_tier,
+)
+from app.modules.dpps.repository import (
+    AASRepositoryService,
+    PublishedProjection,
+    PublishedRevisionRef,
+    PublishedSubmodel,
+)
+from app.modules.dpps.short_slug import normalize_short_slug
 
 router = APIRouter()
 LANDING_REFRESH_SLA_SECONDS = 30
@@ -143,6 +76,7 @@ class PublicDPPResponse(BaseModel):
     id: UUID
     status: str
     asset_ids: dict[str, Any]
+    short_slug: str | None = None
     created_at: str
     updated_at: str
     current_revision_no: int | None
@@ -180,6 +114,30 @@ class PublicIntegrityAnchorRef(BaseModel):
     tsa_token_present: bool = Field(default=False, alias="tsaTokenPresent")
 
 
+class PublicMerkleProofStep(BaseModel):
+    """One sibling hash on the path from a leaf to the revision digest.
+
+    ``side`` is ``"left"`` or ``"right"``: the sibling's position when the
+    pair is hashed.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    sibling_sha256: str = Field(alias="siblingSha256")
+    side: str
+
+
+class PublicSubmodelInclusionProof(BaseModel):
+    """Merkle inclusion proof of one public submodel in an rfc8785-merkle-v1 digest."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    submodel_id: str = Field(alias="submodelId")
+    leaf_sha256: str = Field(alias="leafSha256")
+    leaf_index: int = Field(alias="leafIndex")
+    proof: list[PublicMerkleProofStep]
+
+
 class PublicDPPIntegrityResponse(BaseModel):
     """Integrity bundle for public verification clients."""
 
@@ -195,17 +153,15 @@ class PublicDPPIntegrityResponse(BaseModel):
     signature_kid: str | None = Field(default=None, alias="signatureKid")
     verification_method_urls: list[str] = Field(alias="verificationMethodUrls")
     anchor: PublicIntegrityAnchorRef | None = None
+    shell_digest_sha256: str | None = Field(default=None, alias="shellDigestSha256")
+    submodel_proofs: list[PublicSubmodelInclusionProof] = Field(
+        default_factory=list, alias="submodelProofs"
+    )
 
 
-async def _resolve_tenant(db: DbSession, tenant_slug: str) -> Tenant:
+async def _resolve_tenant(db: DbSession, tenant_slug: str) -> TenantRecord:
     """Look up an active tenant by slug (no auth required)."""
-    result = await db.execute(
-        select(Tenant).where(
-            Tenant.slug == tenant_slug.strip().lower(),
-            Tenant.status == TenantStatus.ACTIVE,
-        )
-    )
-    tenant = result.scalar_one_or_none()
+    tenant = await get_tenant_by_slug(db, tenant_slug, active_only=True)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -284,91 +240,16 @@ async def _load_public_landing_summary(
     tenant_slug: str,
     scope: Literal["default", "all"] | None = None,
 ) -> PublicLandingSummaryResponse:
-    """Compute public aggregate metrics for landing page consumption."""
-    if tenant_id is not None:
-        published_count_stmt = select(func.count(DPP.id)).where(
-            DPP.tenant_id == tenant_id,
-            DPP.status == DPPStatus.PUBLISHED,
-        )
-    else:
-        published_count_stmt = (
-            select(func.count(DPP.id))
-            .select_from(DPP)
-            .join(Tenant, DPP.tenant_id == Tenant.id)
-            .where(
-                DPP.status == DPPStatus.PUBLISHED,
-                Tenant.status == TenantStatus.ACTIVE,
-            )
-        )
-    published_count_result = await db.execute(published_count_stmt)
-    published_dpps = int(published_count_result.scalar_one() or 0)
-
-    if tenant_id is not None:
-        families_stmt = select(
-            func.count(func.distinct(DPP.asset_ids["manufacturerPartId"].astext))
-        ).where(
-            DPP.tenant_id == tenant_id,
-            DPP.status == DPPStatus.PUBLISHED,
-            DPP.asset_ids["manufacturerPartId"].astext.is_not(None),
-            DPP.asset_ids["manufacturerPartId"].astext != "",
-        )
-    else:
-        families_stmt = (
-            select(func.count(func.distinct(DPP.asset_ids["manufacturerPartId"].astext)))
-            .select_from(DPP)
-            .join(Tenant, DPP.tenant_id == Tenant.id)
-            .where(
-                DPP.status == DPPStatus.PUBLISHED,
-                Tenant.status == TenantStatus.ACTIVE,
-                DPP.asset_ids["manufacturerPartId"].astext.is_not(None),
-                DPP.asset_ids["manufacturerPartId"].astext != "",
-            )
-        )
-    families_result = await db.execute(families_stmt)
-    active_product_families = int(families_result.scalar_one() or 0)
-
-    traceability_stmt = (
-        select(func.count(func.distinct(EPCISEvent.dpp_id)))
-        .select_from(EPCISEvent)
-        .join(
-            DPP,
-            (DPP.id == EPCISEvent.dpp_id) & (DPP.tenant_id == EPCISEvent.tenant_id),
-        )
-        .where(DPP.status == DPPStatus.PUBLISHED)
-    )
-    if tenant_id is not None:
-        traceability_stmt = traceability_stmt.where(EPCISEvent.tenant_id == tenant_id)
-    else:
-        traceability_stmt = traceability_stmt.join(Tenant, DPP.tenant_id == Tenant.id).where(
-            Tenant.status == TenantStatus.ACTIVE
-        )
-    traceability_result = await db.execute(traceability_stmt)
-    dpps_with_traceability = int(traceability_result.scalar_one() or 0)
-
-    if tenant_id is not None:
-        latest_publish_stmt = select(func.max(DPP.updated_at)).where(
-            DPP.tenant_id == tenant_id,
-            DPP.status == DPPStatus.PUBLISHED,
-        )
-    else:
-        latest_publish_stmt = (
-            select(func.max(DPP.updated_at))
-            .select_from(DPP)
-            .join(Tenant, DPP.tenant_id == Tenant.id)
-            .where(
-                DPP.status == DPPStatus.PUBLISHED,
-                Tenant.status == TenantStatus.ACTIVE,
-            )
-        )
-    latest_publish_result = await db.execute(latest_publish_stmt)
-    latest_publish_dt = latest_publish_result.scalar_one()
-
+    """Read the maintained public aggregate metrics for landing page consumption."""
+    counts = await LandingSummaryService(db).get_summary(tenant_id)
     return PublicLandingSummaryResponse(
         tenant_slug=tenant_slug,
-        published_dpps=published_dpps,
-        active_product_families=active_product_families,
-        dpps_with_traceability=dpps_with_traceability,
-        latest_publish_at=latest_publish_dt.isoformat() if latest_publish_dt else None,
+        published_dpps=counts.published_dpps,
+        active_product_families=counts.active_product_families,
+        dpps_with_traceability=counts.dpps_with_traceability,
+        latest_publish_at=(
+            counts.latest_publish_at.isoformat() if counts.latest_publish_at else None
+        ),
         generated_at=datetime.now(UTC).isoformat(),
         scope=scope,
         refresh_sla_seconds=LANDING_REFRESH_SLA_SECONDS,
@@ -465,6 +346,132 @@ async def get_public_landing_summary(
     return summary
 
 
+def _public_dpp_json(dpp: DPP, projection: PublishedProjection | None) -> bytes:
+    """Serialize a public DPP envelope around a stored projection without re-parsing it."""
+    envelope = {
+        "id": dpp.id,
+        "status": dpp.status.value,
+        "asset_ids": filter_public_asset_ids(dpp.asset_ids),
+        "short_slug": dpp.short_slug,
+        "created_at": dpp.created_at.isoformat(),
+        "updated_at": dpp.updated_at.isoformat(),
+        "current_revision_no": projection.revision_no if projection else None,
+        "digest_sha256": projection.digest_sha256 if projection else None,
+    }
+    return splice_raw_json(
+        envelope,
+        "aas_environment",
+        projection.payload if projection else None,
+    )
+
+
+IfNoneMatch = Annotated[str | None, Header()]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_NDJSON_FLUSH_BYTES = 64 * 1024
+
+_PublishedT = TypeVar("_PublishedT", PublishedProjection, PublishedSubmodel)
+
+
+def _json_response(content: bytes, etag: str) -> Response:
+    response = Response(content=content, media_type="application/json")
+    set_validator_headers(response, etag, get_settings().public_dpp_cache_control)
+    return response
+
+
+def _projection_etag(
+    dpp: DPP,
+    revision: PublishedRevisionRef | PublishedProjection | PublishedSubmodel | None,
+    projection_key: str,
+    *variant: str,
+) -> str:
+    """Strong ETag for a representation derived from a DPP's published projection."""
+    return strong_etag(
+        dpp.id,
+        dpp.updated_at,
+        revision.revision_id if revision else None,
+        revision.digest_sha256 if revision else None,
+        projection_key,
+        *variant,
+    )
+
+
+async def _cached_response(cache_key: str, if_none_match: str | None) -> Response | None:
+    """Serve a shared-cache hit, answering 304 when the client's copy is current."""
+    cached = await get_cached_response(cache_key)
+    if cached is None:
+        return None
+    etag, content = unpack_cached_response(cached)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, get_settings().public_dpp_cache_control)
+    return _json_response(content, etag)
+
+
+async def _published_response(
+    db: DbSession,
+    dpp: DPP,
+    projection_key: str,
+    *,
+    cache_key: str,
+    if_none_match: str | None,
+    load: Callable[[AASRepositoryService], Awaitable[_PublishedT | None]],
+    render: Callable[[_PublishedT | None], bytes],
+    variant: tuple[str, ...] = (),
+) -> Response:
+    """Render a representation of a DPP's published revision with validators.
+
+    *cache_key* is qualified with the published revision of *dpp*, so an
+    entry written late by a reader that loaded an older revision is never
+    served.  When the client sends ``If-None-Match``, the ETag is first
+    computed from the revision digest alone so a 304 never loads any stored
+    payload.
+    """
+    cache_key = published_cache_key(cache_key, dpp)
+    cached = await _cached_response(cache_key, if_none_match)
+    if cached is not None:
+        return cached
+
+    repo = AASRepositoryService(db)
+    if if_none_match:
+        ref = await repo.get_published_revision_ref(dpp)
+        etag = _projection_etag(dpp, ref, projection_key, *variant)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag, get_settings().public_dpp_cache_control)
+
+    published = await load(repo)
+    etag = _projection_etag(dpp, published, projection_key, *variant)
+    content = render(published)
+    await cache_response(
+        cache_key,
+        pack_cached_response(etag, content),
+        tags=[dpp_cache_tag(dpp.tenant_id, dpp.id)],
+    )
+    return _json_response(content, etag)
+
+
+async def _projection_response(
+    db: DbSession,
+    dpp: DPP,
+    projection_key: str,
+    *,
+    cache_key: str,
+    if_none_match: str | None,
+    render: Callable[[PublishedProjection | None], bytes],
+    variant: tuple[str, ...] = (),
+) -> Response:
+    """Render a representation of a DPP's published tier projection."""
+    return await _published_response(
+        db,
+        dpp,
+        projection_key,
+        cache_key=cache_key,
+        if_none_match=if_none_match,
+        load=lambda repo: repo.get_published_projection(dpp, projection_key),
+        render=render,
+        variant=variant,
+    )
+
+
 @router.get(
     "/{tenant_slug}/dpps/{dpp_id}",
     response_model=PublicDPPResponse,
@@ -473,7 +480,8 @@ async def get_published_dpp(
     tenant_slug: str,
     dpp_id: UUID,
     db: DbSession,
-) -> PublicDPPResponse:
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
     Get a published DPP by ID (no authentication required).
 
@@ -481,6 +489,8 @@ async def get_published_dpp(
     """
     tenant = await _resolve_tenant(db, tenant_slug)
 
+    cache_key = public_cache_key(tenant.id, "dpp", str(dpp_id), tier=PROJECTION_FULL)
+
     result = await db.execute(
         select(DPP).where(
             DPP.id == dpp_id,
@@ -495,17 +505,13 @@ async def get_published_dpp(
             detail="Not found",
         )
 
-    revision = await _get_published_revision(db, dpp)
-
-    return PublicDPPResponse(
-        id=dpp.id,
-        status=dpp.status.value,
-        asset_ids=_filter_public_asset_ids(dpp.asset_ids),
-        created_at=dpp.created_at.isoformat(),
-        updated_at=dpp.updated_at.isoformat(),
-        current_revision_no=revision.revision_no if revision else None,
-        aas_environment=_filter_public_aas_environment(revision.aas_env_json) if revision else None,
-        digest_sha256=revision.digest_sha256 if revision else None,
+    return await _projection_response(
+        db,
+        dpp,
+        PROJECTION_FULL,
+        cache_key=cache_key,
+        if_none_match=if_none_match,
+        render=lambda projection: _public_dpp_json(dpp, projection),
     )
 
 
@@ -570,6 +576,15 @@ async def get_public_dpp_integrity_bundle(
             tsa_token_present=latest_anchor.tsa_token is not None,
         )
 
+    environment_digest = stored_environment_digest(
+        revision.digest_canonicalization,
+        revision.digest_sha256,
+        revision.digest_leaves,
+    )
+    submodel_proofs: list[PublicSubmodelInclusionProof] = []
+    if environment_digest is not None:
+        submodel_proofs = await _public_submodel_proofs(db, revision, environment_digest)
+
     return PublicDPPIntegrityResponse(
         dpp_id=dpp.id,
         revision_id=revision.id,
@@ -581,7 +596,49 @@ async def get_public_dpp_integrity_bundle(
         signature_kid=signature_kid,
         verification_method_urls=verification_urls,
         anchor=anchor,
+        shell_digest_sha256=(
+            environment_digest.shell_sha256 if environment_digest is not None else None
+        ),
+        submodel_proofs=submodel_proofs,
+    )
+
+
+async def _public_submodel_proofs(
+    db: DbSession,
+    revision: DPPRevision,
+    environment_digest: EnvironmentDigest,
+) -> list[PublicSubmodelInclusionProof]:
+    """Build inclusion proofs for the submodels that survived the public filter.
+
+    Submodels withheld by the confidentiality filter get no proof, so their
+    identifiers are not disclosed; they stay covered by the root all the same.
+    """
+    result = await db.execute(
+        select(DPPPublishedSubmodel.submodel_id).where(
+            DPPPublishedSubmodel.revision_id == revision.id,
+            DPPPublishedSubmodel.tenant_id == revision.tenant_id,
+        )
     )
+    public_ids = set(result.scalars().all())
+    unique_digests = environment_digest.submodel_digests()
+    proofs: list[PublicSubmodelInclusionProof] = []
+    for position, leaf in enumerate(environment_digest.submodels):
+        if leaf.submodel_id is None or leaf.submodel_id not in public_ids:
+            continue
+        if leaf.submodel_id not in unique_digests:
+            continue
+        proofs.append(
+            PublicSubmodelInclusionProof(
+                submodel_id=leaf.submodel_id,
+                leaf_sha256=leaf.sha256,
+                leaf_index=position + 1,
+                proof=[
+                    PublicMerkleProofStep(sibling_sha256=sibling, side=side)
+                    for sibling, side in environment_digest.submodel_inclusion_proof(position)
+                ],
+            )
+        )
+    return proofs
 
 
 @router.get(
@@ -592,49 +649,40 @@ async def get_published_dpp_by_slug(
     tenant_slug: str,
     slug: str,
     db: DbSession,
-) -> PublicDPPResponse:
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """
     Get a published DPP by its short-link slug (no authentication required).
 
-    The slug is the first 8 hex characters of the DPP UUID,
-    as used in QR code short links.
+    The slug is the tenant-unique hex prefix of the DPP UUID (8 characters,
+    longer on prefix collisions), as used in QR code short links.
     """
     tenant = await _resolve_tenant(db, tenant_slug)
 
-    if not slug or len(slug) != 8:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-    try:
-        int(slug.lower(), 16)
-    except ValueError:
+    normalized_slug = normalize_short_slug(slug)
+    if normalized_slug is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
 
-    from sqlalchemy import String, cast
+    cache_key = public_cache_key(tenant.id, "dpp-slug", normalized_slug, tier=PROJECTION_FULL)
 
     result = await db.execute(
-        select(DPP)
-        .where(
-            cast(DPP.id, String).like(f"{slug.lower()[:8]}%"),
+        select(DPP).where(
             DPP.tenant_id == tenant.id,
+            DPP.short_slug == normalized_slug,
             DPP.status == DPPStatus.PUBLISHED,
         )
-        .limit(2)
     )
-    matches = list(result.scalars().all())
-    if len(matches) != 1:
+    dpp = result.scalar_one_or_none()
+    if dpp is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
 
-    dpp = matches[0]
-    revision = await _get_published_revision(db, dpp)
-
-    return PublicDPPResponse(
-        id=dpp.id,
-        status=dpp.status.value,
-        asset_ids=_filter_public_asset_ids(dpp.asset_ids),
-        created_at=dpp.created_at.isoformat(),
-        updated_at=dpp.updated_at.isoformat(),
-        current_revision_no=revision.revision_no if revision else None,
-        aas_environment=_filter_public_aas_environment(revision.aas_env_json) if revision else None,
-        digest_sha256=revision.digest_sha256 if revision else None,
+    return await _projection_response(
+        db,
+        dpp,
+        PROJECTION_FULL,
+        cache_key=cache_key,
+        if_none_match=if_none_match,
+        render=lambda projection: _public_dpp_json(dpp, projection),
     )
 
 
@@ -687,43 +735,121 @@ async def get_service_description(
     return ServiceDescription(profiles=[SSP_002])
 
 
-@router.get("/{tenant_slug}/shells")
+async def _stream_shells_ndjson(tenant_id: UUID, after: UUID | None) -> AsyncIterator[bytes]:
+    """Yield published shells as NDJSON from a server-side cursor.
+
+    The crawl runs on its own session so it does not depend on when the
+    request-scoped session is closed relative to the response body.  Lines
+    are flushed in chunks of roughly ``_NDJSON_FLUSH_BYTES``.
+    """
+    async with get_background_session() as session:
+        repo = AASRepositoryService(session)
+        buffer = bytearray()
+        async for dpp, projection in repo.stream_published_shells(
+            tenant_id, PROJECTION_FULL, after=after
+        ):
+            buffer += _public_dpp_json(dpp, projection)
+            buffer += b"\n"
+            if len(buffer) >= _NDJSON_FLUSH_BYTES:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+
+@router.get("/{tenant_slug}/shells", response_model=PagedResult[PublicDPPResponse])
 async def list_shells(
     tenant_slug: str,
     db: DbSession,
     limit: int = Query(default=10, ge=1, le=100),
     cursor: str | None = Query(default=None),
-) -> PagedResult[PublicDPPResponse]:
-    """List all published shells with cursor-based pagination."""
+    if_none_match: IfNoneMatch = None,
+    accept: Annotated[str | None, Header()] = None,
+) -> Response:
+    """List all published shells with cursor-based pagination.
+
+    With ``Accept: application/x-ndjson`` the whole tenant (after ``cursor``)
+    is streamed instead, one shell per line, and ``limit`` is ignored.
+    """
     tenant = await _resolve_tenant(db, tenant_slug)
+
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        after = decode_cursor(cursor) if cursor else None
+        return StreamingResponse(
+            _stream_shells_ndjson(tenant.id, after),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={"Cache-Control": "no-store"},
+        )
+
+    generation = await shells_generation(tenant.id)
+    cache_key = public_cache_key(
+        tenant.id,
+        "shells",
+        cursor or "",
+        tier=PROJECTION_FULL,
+        content=f"{limit}:{generation}",
+    )
+    cached = await _cached_response(cache_key, if_none_match)
+    if cached is not None:
+        return cached
+
     repo = AASRepositoryService(db)
     dpps, next_cursor = await repo.list_published_shells(tenant.id, cursor, limit)
 
-    revisions_by_id = await repo.get_published_revisions_batch(dpps)
-
-    items: list[PublicDPPResponse] = []
-    for dpp in dpps:
-        revision = revisions_by_id.get(dpp.current_published_revision_id)  # type: ignore[arg-type]
-        aas_env: dict[str, Any] | None = None
-        if revision:
-            aas_env = _filter_public_aas_environment(revision.aas_env_json)
-        items.append(
-            PublicDPPResponse(
-                id=dpp.id,
-                status=dpp.status.value,
-                asset_ids=_filter_public_asset_ids(dpp.asset_ids),
-                created_at=dpp.created_at.isoformat(),
-                updated_at=dpp.updated_at.isoformat(),
-                current_revision_no=(revision.revision_no if revision else None),
-                aas_environment=aas_env,
-                digest_sha256=(revision.digest_sha256 if revision else None),
-            )
-        )
+    # Published revisions are immutable, so the page is identified by its
+    # members' revision pointers without loading any projection.
+    etag = strong_etag(
+        "shells",
+        PROJECTION_FULL,
+        next_cursor,
+        *(f"{dpp.id}:{dpp.current_published_revision_id}:{dpp.updated_at}" for dpp in dpps),
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, get_settings().public_dpp_cache_control)
 
-    return PagedResult[PublicDPPResponse](
-        result=items,
-        paging_metadata=PagingMetadata(cursor=next_cursor),
+    projections_by_id = await repo.get_published_projections_batch(dpps, PROJECTION_FULL)
+
+    items = [
+        _public_dpp_json(
+            dpp,
+            projections_by_id.get(dpp.current_published_revision_id),  # type: ignore[arg-type]
+        )
+        for dpp in dpps
+    ]
+    paging = PagingMetadata(cursor=next_cursor).model_dump()
+    content = splice_raw_json(
+        {"pagingMetadata": paging},
+        "result",
+        b"[" + b",".join(items) + b"]",
+    )
+    await cache_response(
+        cache_key,
+        pack_cached_response(etag, content),
+        tags=[shells_cache_tag(tenant.id)],
     )
+    return _json_response(content, etag)
+
+
+async def _get_shell(db: DbSession, tenant: TenantRecord, aas_id: str) -> DPP:
+    """Resolve a published shell by AAS ID or raise 404."""
+    dpp = await AASRepositoryService(db).get_shell_by_aas_id(tenant.id, aas_id)
+    if not dpp:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not found",
+        )
+    return dpp
+
+
+def _require_projection(projection: PublishedProjection | None) -> dict[str, Any]:
+    """Parse a shell's projection, raising 404 when the DPP has none."""
+    if not projection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not found",
+        )
+    aas_env: dict[str, Any] = orjson.loads(projection.payload)
+    return aas_env
 
 
 @router.get(
@@ -735,79 +861,123 @@ async def get_shell_by_aas_id(
     aas_id_b64: str,
     db: DbSession,
     espr_tier: str | None = Query(default=None, alias="espr_tier"),
-) -> PublicDPPResponse:
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """IDTA-01002 AAS Repository -- Get a shell (DPP) by base64url-encoded AAS ID."""
     tenant = await _resolve_tenant(db, tenant_slug)
     aas_id = _decode_b64(aas_id_b64)
+    projection_key = projection_key_for_tier(espr_tier)
 
-    repo = AASRepositoryService(db)
-    dpp = await repo.get_shell_by_aas_id(tenant.id, aas_id)
-    if not dpp:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not found",
-        )
+    cache_key = public_cache_key(tenant.id, "shell", aas_id, tier=projection_key)
 
-    revision = await repo.get_published_revision(dpp)
-    aas_env: dict[str, Any] | None = None
-    if revision:
-        aas_env = _filter_public_aas_environment(revision.aas_env_json)
-        aas_env = filter_aas_env_by_espr_tier(aas_env, espr_tier, in_place=True)
-
-    return PublicDPPResponse(
-        id=dpp.id,
-        status=dpp.status.value,
-        asset_ids=_filter_public_asset_ids(dpp.asset_ids),
-        created_at=dpp.created_at.isoformat(),
-        updated_at=dpp.updated_at.isoformat(),
-        current_revision_no=revision.revision_no if revision else None,
-        aas_environment=aas_env,
-        digest_sha256=revision.digest_sha256 if revision else None,
+    dpp = await _get_shell(db, tenant, aas_id)
+    return await _projection_response(
+        db,
+        dpp,
+        projection_key,
+        cache_key=cache_key,
+        if_none_match=if_none_match,
+        render=lambda projection: _public_dpp_json(dpp, projection),
     )
 
 
+def _render_submodel_refs(projection: PublishedProjection | None) -> bytes:
+    aas_env = _require_projection(projection)
+    refs: list[dict[str, Any]] = []
+    for sm in aas_env.get("submodels", []):
+        ref: dict[str, Any] = {"id": sm.get("id", "")}
+        if "semanticId" in sm:
+            ref["semanticId"] = sm["semanticId"]
+        refs.append(ref)
+    return orjson.dumps(refs)
+
+
 @router.get(
     "/{tenant_slug}/shells/{aas_id_b64}/submodels",
+    response_model=list[dict[str, Any]],
 )
 async def list_submodel_refs(
     tenant_slug: str,
     aas_id_b64: str,
     db: DbSession,
     espr_tier: str | None = Query(default=None, alias="espr_tier"),
-) -> list[dict[str, Any]]:
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """List submodel references (id + semanticId) for a shell."""
     tenant = await _resolve_tenant(db, tenant_slug)
     aas_id = _decode_b64(aas_id_b64)
+    projection_key = projection_key_for_tier(espr_tier)
 
-    repo = AASRepositoryService(db)
-    dpp = await repo.get_shell_by_aas_id(tenant.id, aas_id)
-    if not dpp:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not found",
-        )
+    cache_key = public_cache_key(tenant.id, "submodel-refs", aas_id, tier=projection_key)
 
-    revision = await repo.get_published_revision(dpp)
-    if not revision:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not found",
-        )
+    dpp = await _get_shell(db, tenant, aas_id)
+    return await _projection_response(
+        db,
+        dpp,
+        projection_key,
+        cache_key=cache_key,
+        if_none_match=if_none_match,
+        render=_render_submodel_refs,
+        variant=("submodel-refs",),
+    )
 
-    aas_env = _filter_public_aas_environment(revision.aas_env_json)
-    aas_env = filter_aas_env_by_espr_tier(aas_env, espr_tier, in_place=True)
 
-    refs: list[dict[str, Any]] = []
-    for sm in aas_env.get("submodels", []):
-        ref: dict[str, Any] = {"id": sm.get("id", "")}
-        if "semanticId" in sm:
-            ref["semanticId"] = sm["semanticId"]
-        refs.append(ref)
-    return refs
+async def _submodel_response(
+    db: DbSession,
+    tenant_slug: str,
+    aas_id_b64: str,
+    submodel_id_b64: str,
+    espr_tier: str | None,
+    content_mode: Literal["normal", "value"],
+    if_none_match: str | None,
+) -> Response:
+    """Serve one submodel of a published shell, read through the response cache."""
+    tenant = await _resolve_tenant(db, tenant_slug)
+    aas_id = _decode_b64(aas_id_b64)
+    submodel_id = _decode_b64(submodel_id_b64)
+    projection_key = projection_key_for_tier(espr_tier)
+
+    cache_key = public_cache_key(
+        tenant.id,
+        "submodel",
+        f"{aas_id}\n{submodel_id}",
+        tier=projection_key,
+        content=content_mode,
+    )
+
+    def _render(published: PublishedSubmodel | None) -> bytes:
+        if not published:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Not found",
+            )
+        # Stored submodel rows are already confidentiality filtered and tier checked
+        if published.payload is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Submodel not found",
+            )
+        if content_mode == "value":
+            submodel = orjson.loads(published.payload)
+            return orjson.dumps({"submodelElements": submodel.get("submodelElements", [])})
+        return published.payload
+
+    dpp = await _get_shell(db, tenant, aas_id)
+    return await _published_response(
+        db,
+        dpp,
+        projection_key,
+        cache_key=cache_key,
+        if_none_match=if_none_match,
+        load=lambda repo: repo.get_published_submodel(dpp, submodel_id, projection_key),
+        render=_render,
+        variant=("submodel", submodel_id, content_mode),
+    )
 
 
 @router.get(
     "/{tenant_slug}/shells/{aas_id_b64}/submodels/{submodel_id_b64}",
+    response_model=dict[str, Any],
 )
 async def get_submodel_by_id(
     tenant_slug: str,
@@ -816,49 +986,21 @@ async def get_submodel_by_id(
     db: DbSession,
     espr_tier: str | None = Query(default=None, alias="espr_tier"),
     content: Literal["normal", "value"] = Query(default="normal"),
-) -> dict[str, Any]:
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """Get a specific submodel from a published DPP.
 
     Use ``?content=value`` to return only submodelElements (same as
     the ``/$value`` path suffix).
     """
-    tenant = await _resolve_tenant(db, tenant_slug)
-    aas_id = _decode_b64(aas_id_b64)
-    submodel_id = _decode_b64(submodel_id_b64)
-
-    repo = AASRepositoryService(db)
-    dpp = await repo.get_shell_by_aas_id(tenant.id, aas_id)
-    if not dpp:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not found",
-        )
-
-    revision = await repo.get_published_revision(dpp)
-    if not revision:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not found",
-        )
-
-    # Apply confidentiality + tier filters, then extract
-    aas_env = _filter_public_aas_environment(revision.aas_env_json)
-    aas_env = filter_aas_env_by_espr_tier(aas_env, espr_tier, in_place=True)
-
-    submodel = repo.get_submodel_from_revision(aas_env, submodel_id)
-    if not submodel:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Submodel not found",
-        )
-
-    if content == "value":
-        return {"submodelElements": submodel.get("submodelElements", [])}
-    return submodel
+    return await _submodel_response(
+        db, tenant_slug, aas_id_b64, submodel_id_b64, espr_tier, content, if_none_match
+    )
 
 
 @router.get(
     "/{tenant_slug}/shells/{aas_id_b64}/submodels/{submodel_id_b64}/$value",
+    response_model=dict[str, Any],
 )
 async def get_submodel_value(
     tenant_slug: str,
@@ -866,35 +1008,9 @@ async def get_submodel_value(
     submodel_id_b64: str,
     db: DbSession,
     espr_tier: str | None = Query(default=None, alias="espr_tier"),
-) -> dict[str, Any]:
+    if_none_match: IfNoneMatch = None,
+) -> Response:
     """Get submodel $value (submodelElements only) -- Catena-X standard endpoint."""
-    tenant = await _resolve_tenant(db, tenant_slug)
-    aas_id = _decode_b64(aas_id_b64)
-    submodel_id = _decode_b64(submodel_id_b64)
-
-    repo = AASRepositoryService(db)
-    dpp = await repo.get_shell_by_aas_id(tenant.id, aas_id)
-    if not dpp:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not found",
-        )
-
-    revision = await repo.get_published_revision(dpp)
-    if not revision:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not found",
-        )
-
-    aas_env = _filter_public_aas_environment(revision.aas_env_json)
-    aas_env = filter_aas_env_by_espr_tier(aas_env, espr_tier, in_place=True)
-
-    submodel = repo.get_submodel_from_revision(aas_env, submodel_id)
-    if not submodel:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Submodel not found",
-        )
-
-    return {"submodelElements": submodel.get("submodelElements", [])}
+    return await _submodel_response(
+        db, tenant_slug, aas_id_b64, submodel_id_b64, espr_tier, "value", if_none_match
+    )
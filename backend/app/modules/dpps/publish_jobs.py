@@ -0,0 +1,374 @@
+"""
+Background bulk publish of DPPs.
+
+``POST /dpps/bulk-publish/jobs`` records one ``dpp_publish_job_items`` row per
+requested DPP and returns at once.  Worker tasks claim pending items in chunks
+with ``FOR UPDATE SKIP LOCKED`` and publish each chunk through
+:meth:`DPPService.publish_dpps_bulk`, which evaluates the publish gates of
+the whole chunk from shared inputs.  Item outcomes, lifecycle events, outbox
+entries for the post-publish side effects, the job counters and one audit
+event are committed once per chunk.  As for batch imports, each claim of a
+chunk is counted on its items first, so a chunk that keeps failing as a whole
+fails its items after ``dpp_bulk_publish_max_attempts`` claims.
+
+Like batch import jobs, jobs are discovered per tenant when created in this
+process and by a periodic scan that also resumes jobs interrupted by a
+restart.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.audit import emit_audit_event
+from app.core.background_jobs import (
+    ACTIVE_JOB_STATUSES,
+    ITEM_STATUS_FAILED,
+    ITEM_STATUS_PENDING,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JobWorkerPool,
+    discover_in_tenants,
+    record_chunk_attempt,
+)
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import DPP, DPPPublishJob, DPPPublishJobItem, DPPStatus, VisibilityScope
+from app.db.session import get_tenant_background_session
+from app.modules.digital_thread.handlers import record_lifecycle_event
+from app.modules.dpps import outbox
+from app.modules.dpps.public_cache import invalidate_public_dpps
+from app.modules.dpps.service import DPPService
+from app.modules.epcis.handlers import record_epcis_lifecycle_event
+
+logger = get_logger(__name__)
+
+ITEM_STATUS_OK = "ok"
+
+_MAX_ERROR_LENGTH = 1000
+
+
+def unique_dpp_ids(dpp_ids: Sequence[UUID]) -> list[UUID]:
+    """Drop duplicate ids, rejecting empty and oversized requests with ``ValueError``."""
+    max_items = get_settings().dpp_bulk_publish_max_items
+    unique_ids = list(dict.fromkeys(dpp_ids))
+    if not unique_ids:
+        raise ValueError("Bulk publish requires at least one DPP id")
+    if len(unique_ids) > max_items:
+        raise ValueError(f"Bulk publish is limited to {max_items} DPPs")
+    return unique_ids
+
+
+class PublishJobService:
+    """Create, process and inspect bulk publish jobs."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create_job(
+        self,
+        *,
+        tenant_id: UUID,
+        requested_by_subject: str,
+        owner_subject: str | None,
+        dpp_ids: Sequence[UUID],
+        denied: Mapping[UUID, str] | None = None,
+    ) -> DPPPublishJob:
+        """Queue a publish of ``dpp_ids`` (duplicates are dropped).
+
+        DPPs in ``denied`` are recorded as failed items with the given reason
+        and never published.
+        """
+        settings = get_settings()
+        unique_ids = unique_dpp_ids(dpp_ids)
+        denied = denied or {}
+        now = datetime.now(UTC)
+        job = DPPPublishJob(
+            tenant_id=tenant_id,
+            requested_by_subject=requested_by_subject,
+            owner_subject=owner_subject,
+            status=JOB_STATUS_QUEUED,
+            total=len(unique_ids),
+            succeeded=0,
+            failed=sum(1 for dpp_id in unique_ids if dpp_id in denied),
+            chunk_size=settings.dpp_bulk_publish_chunk_size,
+        )
+        self._session.add(job)
+        await self._session.flush()
+        await self._session.refresh(job)
+        for start in range(0, len(unique_ids), job.chunk_size):
+            await self._session.execute(
+                insert(DPPPublishJobItem),
+                [
+                    {
+                        "tenant_id": tenant_id,
+                        "job_id": job.id,
+                        "item_index": index,
+                        "dpp_id": dpp_id,
+                        "status": ITEM_STATUS_FAILED if dpp_id in denied else ITEM_STATUS_PENDING,
+                        "error": denied[dpp_id][:_MAX_ERROR_LENGTH] if dpp_id in denied else None,
+                        "attempts": 0,
+                        "processed_at": now if dpp_id in denied else None,
+                    }
+                    for index, dpp_id in enumerate(
+                        unique_ids[start : start + job.chunk_size], start=start
+                    )
+                ],
+            )
+        return job
+
+    async def load_access_fields(
+        self, tenant_id: UUID, dpp_ids: Sequence[UUID]
+    ) -> list[Row[tuple[UUID, str, DPPStatus, VisibilityScope]]]:
+        """Fields of ``dpp_ids`` that the publish policy is evaluated on."""
+        chunk_size = get_settings().dpp_bulk_publish_chunk_size
+        rows: list[Row[tuple[UUID, str, DPPStatus, VisibilityScope]]] = []
+        for start in range(0, len(dpp_ids), chunk_size):
+            result = await self._session.execute(
+                select(DPP.id, DPP.owner_subject, DPP.status, DPP.visibility_scope).where(
+                    DPP.tenant_id == tenant_id,
+                    DPP.id.in_(dpp_ids[start : start + chunk_size]),
+                )
+            )
+            rows.extend(result.all())
+        return rows
+
+    async def get_job(self, tenant_id: UUID, job_id: UUID) -> DPPPublishJob | None:
+        result = await self._session.execute(
+            select(DPPPublishJob).where(
+                DPPPublishJob.id == job_id,
+                DPPPublishJob.tenant_id == tenant_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def list_jobs(
+        self,
+        tenant_id: UUID,
+        *,
+        requester_subject: str | None,
+        limit: int,
+        offset: int,
+    ) -> tuple[list[DPPPublishJob], int]:
+        """List jobs, newest first; ``requester_subject`` limits to one requester."""
+        query = select(DPPPublishJob).where(DPPPublishJob.tenant_id == tenant_id)
+        if requester_subject is not None:
+            query = query.where(DPPPublishJob.requested_by_subject == requester_subject)
+        total_count = await self._session.execute(
+            select(func.count()).select_from(query.subquery())
+        )
+        result = await self._session.execute(
+            query.order_by(DPPPublishJob.created_at.desc()).limit(limit).offset(offset)
+        )
+        return list(result.scalars().all()), int(total_count.scalar_one())
+
+    async def list_items(
+        self,
+        job: DPPPublishJob,
+        *,
+        status: str | None,
+        limit: int,
+        offset: int,
+    ) -> list[DPPPublishJobItem]:
+        query = select(DPPPublishJobItem).where(DPPPublishJobItem.job_id == job.id)
+        if status is not None:
+            query = query.where(DPPPublishJobItem.status == status)
+        result = await self._session.execute(
+            query.order_by(DPPPublishJobItem.item_index).limit(limit).offset(offset)
+        )
+        return list(result.scalars().all())
+
+    async def claim_chunk(self, job: DPPPublishJob) -> list[DPPPublishJobItem]:
+        """Lock the next pending items of ``job`` that no other worker holds."""
+        result = await self._session.execute(
+            select(DPPPublishJobItem)
+            .where(
+                DPPPublishJobItem.job_id == job.id,
+                DPPPublishJobItem.status == ITEM_STATUS_PENDING,
+            )
+            .order_by(DPPPublishJobItem.item_index)
+            .limit(job.chunk_size)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def process_chunk(
+        self,
+        job: DPPPublishJob,
+        items: list[DPPPublishJobItem],
+        dpp_service: DPPService,
+    ) -> list[UUID]:
+        """Publish the DPPs of claimed items and record outcomes; returns published ids."""
+        now = datetime.now(UTC)
+        outcomes = await dpp_service.publish_dpps_bulk(
+            tenant_id=job.tenant_id,
+            dpp_ids=[item.dpp_id for item in items],
+            published_by_subject=job.requested_by_subject,
+            owner_subject=job.owner_subject,
+        )
+        by_dpp = {outcome.dpp_id: outcome for outcome in outcomes}
+        published: list[UUID] = []
+        side_effects: list[dict[str, Any]] = []
+        for item in items:
+            item.processed_at = now
+            outcome = by_dpp[item.dpp_id]
+            if not outcome.published:
+                item.status = ITEM_STATUS_FAILED
+                item.error = (outcome.error or "Publish failed")[:_MAX_ERROR_LENGTH]
+                continue
+            item.status, item.revision_id, item.error = ITEM_STATUS_OK, outcome.revision_id, None
+            published.append(item.dpp_id)
+            for record in (record_epcis_lifecycle_event, record_lifecycle_event):
+                await record(
+                    session=self._session,
+                    dpp_id=item.dpp_id,
+                    tenant_id=job.tenant_id,
+                    action="publish",
+                    created_by=job.requested_by_subject,
+                )
+            dpp = await self._session.get(DPP, item.dpp_id)
+            if dpp is not None:
+                side_effects.extend(
+                    outbox.publish_side_effects(dpp, created_by=job.requested_by_subject)
+                )
+        await outbox.enqueue_entries(self._session, side_effects)
+
+        failed = len(items) - len(published)
+        await self._session.execute(
+            update(DPPPublishJob)
+            .where(DPPPublishJob.id == job.id)
+            .values(
+                succeeded=DPPPublishJob.succeeded + len(published),
+                failed=DPPPublishJob.failed + failed,
+                status=JOB_STATUS_RUNNING,
+                started_at=func.coalesce(DPPPublishJob.started_at, func.now()),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await emit_audit_event(
+            db_session=self._session,
+            action="bulk_publish_chunk",
+            resource_type="dpp_publish_job",
+            resource_id=str(job.id),
+            tenant_id=job.tenant_id,
+            metadata={
+                "requested_by": job.requested_by_subject,
+                "published_dpp_ids": [str(dpp_id) for dpp_id in published],
+                "failed": failed,
+            },
+        )
+        await self._session.flush()
+        return published
+
+    async def complete_if_drained(self, job: DPPPublishJob) -> bool:
+        """Mark ``job`` completed once no pending items remain."""
+        pending = await self._session.execute(
+            select(func.count())
+            .select_from(DPPPublishJobItem)
+            .where(
+                DPPPublishJobItem.job_id == job.id,
+                DPPPublishJobItem.status == ITEM_STATUS_PENDING,
+            )
+        )
+        if int(pending.scalar_one()) > 0:
+            return False
+        await self._session.execute(
+            update(DPPPublishJob)
+            .where(
+                DPPPublishJob.id == job.id,
+                DPPPublishJob.status.in_(ACTIVE_JOB_STATUSES),
+            )
+            .values(status=JOB_STATUS_COMPLETED, finished_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return True
+
+
+# =============================================================================
+# Worker pool
+# =============================================================================
+
+
+async def run_publish_job(tenant_id: UUID, job_id: UUID) -> int:
+    """Publish chunks of one job until none are left; returns DPPs published here."""
+    published_total = 0
+    while True:
+        async with get_tenant_background_session(tenant_id) as session:
+            job = await session.get(DPPPublishJob, job_id)
+            if job is None or job.status not in ACTIVE_JOB_STATUSES:
+                return published_total
+            service = PublishJobService(session)
+            items = await service.claim_chunk(job)
+            if not items:
+                completed = await service.complete_if_drained(job)
+                await session.commit()
+                if completed:
+                    logger.info("dpp_publish_job_completed", job_id=str(job_id))
+                return published_total
+            items = await record_chunk_attempt(
+                session,
+                DPPPublishJob,
+                DPPPublishJobItem,
+                items,
+                max_attempts=get_settings().dpp_bulk_publish_max_attempts,
+            )
+            if not items:
+                continue
+            published = await service.process_chunk(job, items, DPPService(session))
+            await session.commit()
+        if published:
+            await invalidate_public_dpps(tenant_id, published)
+            outbox.notify_outbox(tenant_id)
+        published_total += len(published)
+        logger.info(
+            "dpp_publish_chunk_processed",
+            job_id=str(job_id),
+            published=len(published),
+            failed=len(items) - len(published),
+        )
+
+
+async def discover_publish_jobs() -> list[tuple[UUID, UUID]]:
+    """Return ``(tenant_id, job_id)`` of every queued or running job."""
+    return await discover_in_tenants(
+        lambda tenant_id: select(DPPPublishJob.id)
+        .where(
+            DPPPublishJob.tenant_id == tenant_id,
+            DPPPublishJob.status.in_(ACTIVE_JOB_STATUSES),
+        )
+        .order_by(DPPPublishJob.created_at)
+    )
+
+
+_pool: JobWorkerPool[tuple[UUID, UUID]] = JobWorkerPool(
+    "dpp_publish",
+    lambda key: run_publish_job(*key),
+    discover_publish_jobs,
+    share_jobs=True,
+)
+
+
+def enqueue_publish_job(tenant_id: UUID, job_id: UUID) -> bool:
+    """Hand a job to this process's workers; returns ``False`` if none are running."""
+    return _pool.enqueue((tenant_id, job_id))
+
+
+async def start_publish_workers() -> None:
+    """Start the bulk publish worker pool and job scanner (call at startup)."""
+    settings = get_settings()
+    _pool.start(
+        settings.dpp_bulk_publish_worker_concurrency,
+        settings.dpp_bulk_publish_poll_interval_seconds,
+    )
+
+
+async def stop_publish_workers() -> None:
+    """Stop the worker pool (call at shutdown); unfinished chunks roll back."""
+    await _pool.stop()
@@ -0,0 +1,311 @@
+"""
+Resumable background rebuild of every DPP of a tenant from the latest templates.
+
+``POST /dpps/rebuild-all`` records a :class:`DPPRebuildJob` and returns at
+once.  A runner claims the job with a fresh ``worker_token``, optionally
+refreshes templates, then pages through the tenant's DPPs by id (keyset).
+Each DPP of a page is rebuilt and committed on its own session, up to
+``concurrency`` at a time; afterwards the job counters and the checkpoint
+(the last id of the page) are committed together.
+
+The runner refreshes the job's heartbeat in the background while it works,
+including during the template refresh and within a page.  A restarted or
+crashed runner stops heart-beating; after ``dpp_rebuild_stale_seconds`` any
+runner may claim the job again and continue after the checkpoint.  DPPs of
+an interrupted page are rebuilt a second time, which leaves them unchanged
+because a rebuild only writes a revision when the templates changed
+something.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.background_jobs import (
+    ACTIVE_JOB_STATUSES,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_QUEUED,
+    ClaimedJobRunner,
+)
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import DPP, DPPRebuildJob, Template
+from app.db.session import get_tenant_background_session
+from app.modules.dpps.service import DPPService
+from app.modules.templates.service import TemplateRegistryService
+
+logger = get_logger(__name__)
+
+_MAX_RECORDED_ERRORS = 100
+
+
+@dataclass(frozen=True, slots=True)
+class RebuildProgress:
+    """Completion and throughput estimate of a rebuild job."""
+
+    percent: float
+    rate_per_second: float | None
+    eta_seconds: int | None
+
+
+def rebuild_progress(job: DPPRebuildJob, *, now: datetime | None = None) -> RebuildProgress:
+    """Estimate progress from the processed count since ``started_at``."""
+    total = job.total or 0
+    processed = min(job.processed or 0, total) if total else job.processed or 0
+    if job.status == JOB_STATUS_COMPLETED:
+        return RebuildProgress(percent=100.0, rate_per_second=None, eta_seconds=0)
+    percent = round(processed * 100 / total, 1) if total else 0.0
+    if job.started_at is None or processed == 0:
+        return RebuildProgress(percent=percent, rate_per_second=None, eta_seconds=None)
+    elapsed = ((job.heartbeat_at or now or datetime.now(UTC)) - job.started_at).total_seconds()
+    if elapsed <= 0:
+        return RebuildProgress(percent=percent, rate_per_second=None, eta_seconds=None)
+    rate = processed / elapsed
+    return RebuildProgress(
+        percent=percent,
+        rate_per_second=round(rate, 3),
+        eta_seconds=round(max(total - processed, 0) / rate),
+    )
+
+
+class DPPRebuildJobService:
+    """Create, inspect and resume rebuild-all jobs of a tenant."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create_job(
+        self,
+        *,
+        tenant_id: UUID,
+        requested_by_subject: str,
+        refresh_templates: bool = True,
+    ) -> DPPRebuildJob:
+        """Queue a rebuild of every DPP; raises ``ValueError`` if one is already active."""
+        if await self.get_active_job(tenant_id) is not None:
+            raise ValueError("A rebuild-all job is already queued or running for this tenant")
+        settings = get_settings()
+        job = DPPRebuildJob(
+            tenant_id=tenant_id,
+            requested_by_subject=requested_by_subject,
+            status=JOB_STATUS_QUEUED,
+            refresh_templates=refresh_templates,
+            total=await self._count_dpps(tenant_id),
+            processed=0,
+            updated=0,
+            skipped=0,
+            failed=0,
+            errors=[],
+            chunk_size=settings.dpp_rebuild_chunk_size,
+            concurrency=settings.dpp_rebuild_concurrency,
+        )
+        self._session.add(job)
+        await self._session.flush()
+        await self._session.refresh(job)
+        return job
+
+    async def get_active_job(self, tenant_id: UUID) -> DPPRebuildJob | None:
+        result = await self._session.execute(
+            select(DPPRebuildJob).where(
+                DPPRebuildJob.tenant_id == tenant_id,
+                DPPRebuildJob.status.in_(ACTIVE_JOB_STATUSES),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_job(self, tenant_id: UUID, job_id: UUID) -> DPPRebuildJob | None:
+        result = await self._session.execute(
+            select(DPPRebuildJob).where(
+                DPPRebuildJob.id == job_id,
+                DPPRebuildJob.tenant_id == tenant_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def list_jobs(
+        self, tenant_id: UUID, *, limit: int = 20, offset: int = 0
+    ) -> tuple[list[DPPRebuildJob], int]:
+        query = select(DPPRebuildJob).where(DPPRebuildJob.tenant_id == tenant_id)
+        total_count = await self._session.execute(
+            select(func.count()).select_from(query.subquery())
+        )
+        result = await self._session.execute(
+            query.order_by(DPPRebuildJob.created_at.desc()).limit(limit).offset(offset)
+        )
+        return list(result.scalars().all()), int(total_count.scalar_one())
+
+    async def resume_job(self, job: DPPRebuildJob) -> DPPRebuildJob:
+        """Queue a failed job again; it continues after its checkpoint."""
+        if job.status != JOB_STATUS_FAILED:
+            raise ValueError(f"Only failed rebuild jobs can be resumed (status: {job.status})")
+        if await self.get_active_job(job.tenant_id) is not None:
+            raise ValueError("A rebuild-all job is already queued or running for this tenant")
+        job.status = JOB_STATUS_QUEUED
+        job.worker_token = None
+        job.finished_at = None
+        job.last_error = None
+        await self._session.flush()
+        return job
+
+    async def next_page(self, job: DPPRebuildJob) -> list[UUID]:
+        """Return the ids of the next ``chunk_size`` DPPs after the checkpoint."""
+        query = select(DPP.id).where(DPP.tenant_id == job.tenant_id)
+        if job.checkpoint_dpp_id is not None:
+            query = query.where(DPP.id > job.checkpoint_dpp_id)
+        result = await self._session.execute(query.order_by(DPP.id).limit(job.chunk_size))
+        return list(result.scalars().all())
+
+    async def _count_dpps(self, tenant_id: UUID) -> int:
+        result = await self._session.execute(
+            select(func.count()).select_from(DPP).where(DPP.tenant_id == tenant_id)
+        )
+        return int(result.scalar_one())
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+
+async def _load_templates(session: AsyncSession, job: DPPRebuildJob) -> list[Template]:
+    template_service = TemplateRegistryService(session)
+    if job.refresh_templates and job.processed == 0:
+        templates, _ = await template_service.refresh_all_templates()
+        await session.commit()
+        return templates
+    templates = await template_service.get_all_templates()
+    if not templates:
+        templates, _ = await template_service.refresh_all_templates()
+        await session.commit()
+    return templates
+
+
+async def _rebuild_one(
+    tenant_id: UUID,
+    dpp_id: UUID,
+    templates: list[Template],
+    updated_by_subject: str,
+) -> str:
+    """Rebuild one DPP in its own transaction; returns its outcome or the error message."""
+    async with get_tenant_background_session(tenant_id) as session:
+        dpp = await session.get(DPP, dpp_id)
+        if dpp is None:
+            return "skipped"
+        try:
+            updated = await DPPService(session).rebuild_dpp_from_templates(
+                dpp, templates, updated_by_subject
+            )
+            await session.commit()
+        except Exception as exc:
+            await session.rollback()
+            logger.warning("dpp_rebuild_failed", dpp_id=str(dpp_id), exc_info=True)
+            return str(exc) or type(exc).__name__
+    return "updated" if updated else "skipped"
+
+
+async def _rebuild_page(
+    job: DPPRebuildJob,
+    dpp_ids: list[UUID],
+    templates: list[Template],
+) -> list[str]:
+    semaphore = asyncio.Semaphore(max(job.concurrency, 1))
+
+    async def run(dpp_id: UUID) -> str:
+        async with semaphore:
+            return await _rebuild_one(job.tenant_id, dpp_id, templates, job.requested_by_subject)
+
+    return list(await asyncio.gather(*(run(dpp_id) for dpp_id in dpp_ids)))
+
+
+async def _checkpoint(
+    tenant_id: UUID,
+    job_id: UUID,
+    token: UUID,
+    dpp_ids: list[UUID],
+    outcomes: list[str],
+) -> DPPRebuildJob | None:
+    """Commit the counters and cursor of a finished page; ``None`` if the claim was lost."""
+    async with get_tenant_background_session(tenant_id) as session:
+        result = await session.execute(select(DPPRebuildJob).where(_runner.owned_by(job_id, token)))
+        job = result.scalar_one_or_none()
+        if job is None:
+            return None
+        errors = [
+            {"dpp_id": str(dpp_id), "error": outcome}
+            for dpp_id, outcome in zip(dpp_ids, outcomes, strict=True)
+            if outcome not in ("updated", "skipped")
+        ]
+        job.processed += len(dpp_ids)
+        job.updated += outcomes.count("updated")
+        job.skipped += outcomes.count("skipped")
+        job.failed += len(errors)
+        if errors and len(job.errors) < _MAX_RECORDED_ERRORS:
+            job.errors = [*job.errors, *errors][:_MAX_RECORDED_ERRORS]
+        job.total = max(job.total, job.processed)
+        job.checkpoint_dpp_id = dpp_ids[-1]
+        job.heartbeat_at = datetime.now(UTC)
+        await session.commit()
+        return job
+
+
+async def _rebuild(tenant_id: UUID, job_id: UUID, token: UUID) -> None:
+    async with get_tenant_background_session(tenant_id) as session:
+        loaded = await session.get(DPPRebuildJob, job_id)
+        if loaded is None:
+            return
+        job: DPPRebuildJob | None = loaded
+        templates = await _load_templates(session, loaded)
+    while job is not None:
+        async with get_tenant_background_session(tenant_id) as session:
+            dpp_ids = await DPPRebuildJobService(session).next_page(job)
+        if not dpp_ids:
+            await _runner.finish(tenant_id, job_id, token, error=None)
+            logger.info("dpp_rebuild_job_completed", job_id=str(job_id))
+            return
+        outcomes = await _rebuild_page(job, dpp_ids, templates)
+        job = await _checkpoint(tenant_id, job_id, token, dpp_ids, outcomes)
+        if job is not None:
+            logger.info(
+                "dpp_rebuild_job_progress",
+                job_id=str(job_id),
+                processed=job.processed,
+                total=job.total,
+                eta_seconds=rebuild_progress(job).eta_seconds,
+            )
+    logger.warning("dpp_rebuild_job_claim_lost", job_id=str(job_id))
+
+
+_runner = ClaimedJobRunner(
+    "dpp_rebuild",
+    DPPRebuildJob,
+    _rebuild,
+    stale_seconds=lambda: get_settings().dpp_rebuild_stale_seconds,
+    poll_interval_seconds=lambda: get_settings().dpp_rebuild_poll_interval_seconds,
+)
+
+
+async def run_rebuild_job(tenant_id: UUID, job_id: UUID) -> bool:
+    """Claim and run a rebuild job to completion; returns whether this runner ran it."""
+    return await _runner.run(tenant_id, job_id)
+
+
+def enqueue_rebuild_job(tenant_id: UUID, job_id: UUID) -> bool:
+    """Start running ``job_id`` in this process; returns ``False`` if the runner is stopped."""
+    return _runner.enqueue(tenant_id, job_id)
+
+
+async def start_rebuild_job_runner() -> None:
+    """Allow rebuild jobs to run here and scan for resumable ones (call at startup)."""
+    _runner.start()
+
+
+async def stop_rebuild_job_runner() -> None:
+    """Stop running rebuild jobs (call at shutdown); they resume from their checkpoint."""
+    await _runner.stop()
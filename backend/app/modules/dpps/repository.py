@@ -2,15 +2,62 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import cast, select
+import orjson
+from sqlalchemy import case, cast, null, select
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.db.models import DPP, DPPRevision, DPPStatus
+from app.db.models import (
+    DPP,
+    DPPPublicProjection,
+    DPPPublishedSubmodel,
+    DPPRevision,
+    DPPStatus,
+)
 from app.modules.dpps.idta_schemas import decode_cursor, encode_cursor
+from app.modules.dpps.public_projection import (
+    build_public_projection,
+    submodel_in_projection,
+)
+
+
+@dataclass(frozen=True)
+class PublishedRevisionRef:
+    """Identity of a published revision, without any of its payload."""
+
+    revision_id: UUID
+    revision_no: int
+    digest_sha256: str
+
+
+@dataclass(frozen=True)
+class PublishedProjection:
+    """Published revision metadata with its serialized public projection."""
+
+    revision_id: UUID
+    revision_no: int
+    digest_sha256: str
+    payload: bytes
+
+
+@dataclass(frozen=True)
+class PublishedSubmodel:
+    """Published revision metadata with one serialized public submodel.
+
+    ``payload`` is ``None`` when the revision has no such submodel or the
+    requested tier may not see it.
+    """
+
+    revision_id: UUID
+    revision_no: int
+    digest_sha256: str
+    payload: bytes | None
 
 
 class AASRepositoryService:
@@ -73,6 +120,32 @@ class AASRepositoryService:
         )
         return result.scalar_one_or_none()
 
+    async def get_published_revision_ref(
+        self,
+        dpp: DPP,
+    ) -> PublishedRevisionRef | None:
+        """Get the id, number and digest of a DPP's current published revision.
+
+        Used to evaluate conditional requests without reading the revision's
+        environment or projections.
+        """
+        if not dpp.current_published_revision_id:
+            return None
+        result = await self._session.execute(
+            select(DPPRevision.id, DPPRevision.revision_no, DPPRevision.digest_sha256).where(
+                DPPRevision.id == dpp.current_published_revision_id,
+                DPPRevision.tenant_id == dpp.tenant_id,
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return PublishedRevisionRef(
+            revision_id=row.id,
+            revision_no=row.revision_no,
+            digest_sha256=row.digest_sha256,
+        )
+
     async def get_published_revisions_batch(
         self,
         dpps: list[DPP],
@@ -86,6 +159,153 @@ class AASRepositoryService:
         result = await self._session.execute(select(DPPRevision).where(DPPRevision.id.in_(rev_ids)))
         return {rev.id: rev for rev in result.scalars().all()}
 
+    def _published_projection_stmt(self, projection_key: str) -> Any:
+        return select(
+            DPPRevision.id,
+            DPPRevision.revision_no,
+            DPPRevision.digest_sha256,
+            DPPPublicProjection.payload,
+        ).outerjoin(
+            DPPPublicProjection,
+            (DPPPublicProjection.revision_id == DPPRevision.id)
+            & (DPPPublicProjection.projection_key == projection_key),
+        )
+
+    async def get_published_projection(
+        self,
+        dpp: DPP,
+        projection_key: str,
+    ) -> PublishedProjection | None:
+        """Get the stored public projection of a DPP's current published revision.
+
+        Only the serialized projection and revision metadata are loaded; the
+        full ``aas_env_json`` is read only for revisions published before
+        projections were stored.
+        """
+        if not dpp.current_published_revision_id:
+            return None
+        result = await self._session.execute(
+            self._published_projection_stmt(projection_key).where(
+                DPPRevision.id == dpp.current_published_revision_id,
+                DPPRevision.tenant_id == dpp.tenant_id,
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        payload = row.payload
+        if payload is None:
+            revision = await self.get_published_revision(dpp)
+            if revision is None:
+                return None
+            payload = build_public_projection(revision.aas_env_json, projection_key)
+        return PublishedProjection(
+            revision_id=row.id,
+            revision_no=row.revision_no,
+            digest_sha256=row.digest_sha256,
+            payload=payload,
+        )
+
+    async def get_published_submodel(
+        self,
+        dpp: DPP,
+        submodel_id: str,
+        projection_key: str,
+    ) -> PublishedSubmodel | None:
+        """Get one public submodel of a DPP's current published revision.
+
+        Reads a single per-submodel row and applies the tier check to its
+        semantic ID.  Revisions published before submodel rows were stored
+        fall back to the tier projection.
+        """
+        if not dpp.current_published_revision_id:
+            return None
+        any_submodel = aliased(DPPPublishedSubmodel)
+        has_submodel_rows = (
+            select(any_submodel.id).where(any_submodel.revision_id == DPPRevision.id).exists()
+        )
+        result = await self._session.execute(
+            select(
+                DPPRevision.id,
+                DPPRevision.revision_no,
+                DPPRevision.digest_sha256,
+                DPPPublishedSubmodel.semantic_id,
+                DPPPublishedSubmodel.payload,
+                has_submodel_rows.label("has_submodel_rows"),
+            )
+            .outerjoin(
+                DPPPublishedSubmodel,
+                (DPPPublishedSubmodel.revision_id == DPPRevision.id)
+                & (DPPPublishedSubmodel.submodel_id == submodel_id),
+            )
+            .where(
+                DPPRevision.id == dpp.current_published_revision_id,
+                DPPRevision.tenant_id == dpp.tenant_id,
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        payload: bytes | None = None
+        if row.has_submodel_rows:
+            if row.payload is not None and submodel_in_projection(row.semantic_id, projection_key):
+                payload = row.payload
+        else:
+            projection = await self.get_published_projection(dpp, projection_key)
+            if projection is None:
+                return None
+            submodel = self.get_submodel_from_revision(
+                orjson.loads(projection.payload), submodel_id
+            )
+            if submodel is not None:
+                payload = orjson.dumps(submodel)
+        return PublishedSubmodel(
+            revision_id=row.id,
+            revision_no=row.revision_no,
+            digest_sha256=row.digest_sha256,
+            payload=payload,
+        )
+
+    async def get_published_projections_batch(
+        self,
+        dpps: list[DPP],
+        projection_key: str,
+    ) -> dict[UUID, PublishedProjection]:
+        """Batch-fetch stored public projections keyed by published revision ID."""
+        rev_ids = [
+            dpp.current_published_revision_id for dpp in dpps if dpp.current_published_revision_id
+        ]
+        if not rev_ids:
+            return {}
+        result = await self._session.execute(
+            self._published_projection_stmt(projection_key).where(DPPRevision.id.in_(rev_ids))
+        )
+        rows = list(result.all())
+
+        legacy_ids = [row.id for row in rows if row.payload is None]
+        legacy_envs: dict[UUID, dict[str, Any]] = {}
+        if legacy_ids:
+            legacy_result = await self._session.execute(
+                select(DPPRevision.id, DPPRevision.aas_env_json).where(
+                    DPPRevision.id.in_(legacy_ids)
+                )
+            )
+            legacy_envs = {row.id: row.aas_env_json for row in legacy_result.all()}
+
+        projections: dict[UUID, PublishedProjection] = {}
+        for row in rows:
+            payload = row.payload
+            if payload is None:
+                payload = build_public_projection(legacy_envs.get(row.id) or {}, projection_key)
+            projections[row.id] = PublishedProjection(
+                revision_id=row.id,
+                revision_no=row.revision_no,
+                digest_sha256=row.digest_sha256,
+                payload=payload,
+            )
+        return projections
+
     @staticmethod
     def get_submodel_from_revision(
         aas_env: dict[str, Any],
@@ -139,3 +359,67 @@ class AASRepositoryService:
             next_cursor = None
 
         return items, next_cursor
+
+    async def stream_published_shells(
+        self,
+        tenant_id: UUID,
+        projection_key: str,
+        *,
+        after: UUID | None = None,
+        batch_size: int = 200,
+    ) -> AsyncIterator[tuple[DPP, PublishedProjection | None]]:
+        """Walk every published DPP of a tenant with its stored projection.
+
+        Rows come from a server-side cursor in id order, ``batch_size`` at a
+        time, so memory stays bounded regardless of the tenant's size.  The
+        revision's ``aas_env_json`` is only read for revisions published
+        before projections were stored.
+        """
+        stmt = (
+            select(
+                DPP,
+                DPPRevision.id.label("revision_id"),
+                DPPRevision.revision_no,
+                DPPRevision.digest_sha256,
+                DPPPublicProjection.payload,
+                case(
+                    (DPPPublicProjection.payload.is_(None), DPPRevision.aas_env_json),
+                    else_=null(),
+                ).label("legacy_env"),
+            )
+            .outerjoin(DPPRevision, DPPRevision.id == DPP.current_published_revision_id)
+            .outerjoin(
+                DPPPublicProjection,
+                (DPPPublicProjection.revision_id == DPPRevision.id)
+                & (DPPPublicProjection.projection_key == projection_key),
+            )
+            .where(
+                DPP.tenant_id == tenant_id,
+                DPP.status == DPPStatus.PUBLISHED,
+            )
+            .order_by(DPP.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if after is not None:
+            stmt = stmt.where(DPP.id > after)
+
+        result = await self._session.stream(stmt)
+        try:
+            async for row in result:
+                if row.revision_id is None:
+                    yield row.DPP, None
+                    continue
+                payload = row.payload
+                if payload is None:
+                    payload = build_public_projection(row.legacy_env or {}, projection_key)
+                yield (
+                    row.DPP,
+                    PublishedProjection(
+                        revision_id=row.revision_id,
+                        revision_no=row.revision_no,
+                        digest_sha256=row.digest_sha256,
+                        payload=payload,
+                    ),
+                )
+        finally:
+            await result.close()
@@ -0,0 +1,338 @@
+"""
+Delta-encoded storage of DPP revision environments.
+
+With ``dpp_revision_storage_mode = "delta"`` a new draft revision stores an
+RFC 6902 JSON Patch against its parent (``env_delta``) instead of a full copy
+of ``aas_env_json``.  The first revision of a DPP, every published revision
+and every revision that would make a chain reach
+``dpp_revision_keyframe_interval`` is written as a full keyframe, so
+rebuilding any revision replays fewer than that many small patches.
+
+Code that loads ``DPPRevision`` rows calls :func:`materialize_revision`,
+which restores ``aas_env_json`` on the loaded object without marking it
+dirty.  Revision content never changes, so rebuilt environments are kept in
+a bounded per-worker LRU keyed by revision id.  A revision written or read
+by this worker turns its child's reconstruction into a single patch without
+a query, which keeps reads of the current draft O(1) in the common case;
+published revisions are keyframes and never need rebuilding.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from collections.abc import Collection
+from typing import Any
+from uuid import UUID
+
+import orjson
+from sqlalchemy import Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import DPPRevision, RevisionState
+
+logger = get_logger(__name__)
+
+REVISION_STORAGE_DELTA = "delta"
+
+
+class _EnvironmentCache:
+    """Bounded LRU of serialized environments keyed by revision id.
+
+    Entries are stored as JSON bytes so every hit hands out an independent
+    copy that callers are free to mutate.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[UUID, bytes] = OrderedDict()
+
+    def get(self, revision_id: UUID) -> dict[str, Any] | None:
+        payload = self._entries.get(revision_id)
+        if payload is None:
+            return None
+        self._entries.move_to_end(revision_id)
+        env: dict[str, Any] = orjson.loads(payload)
+        return env
+
+    def put(self, revision_id: UUID, env: dict[str, Any]) -> None:
+        max_entries = get_settings().dpp_revision_cache_max_entries
+        if max_entries <= 0:
+            return
+        try:
+            self._entries[revision_id] = orjson.dumps(env)
+        except orjson.JSONEncodeError:
+            return
+        self._entries.move_to_end(revision_id)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_environments = _EnvironmentCache()
+
+
+# =============================================================================
+# JSON Patch encoding
+# =============================================================================
+
+
+def diff_environment(old: Any, new: Any) -> list[dict[str, Any]]:
+    """Return an RFC 6902 JSON Patch that turns ``old`` into ``new``.
+
+    Identical subtrees are skipped without descending into them, so the cost
+    is dominated by the parts that changed.  Lists are compared by position;
+    items are appended or removed at the tail.
+    """
+    operations: list[dict[str, Any]] = []
+    _diff(old, new, "", operations)
+    return operations
+
+
+def _diff(old: Any, new: Any, path: str, operations: list[dict[str, Any]]) -> None:
+    if _identical(old, new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                operations.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child_path = f"{path}/{_escape(key)}"
+            if key in old:
+                _diff(old[key], value, child_path, operations)
+            else:
+                operations.append({"op": "add", "path": child_path, "value": value})
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        shared = min(len(old), len(new))
+        for index in range(shared):
+            _diff(old[index], new[index], f"{path}/{index}", operations)
+        for index in range(shared, len(new)):
+            operations.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        for index in range(len(old) - 1, shared - 1, -1):
+            operations.append({"op": "remove", "path": f"{path}/{index}"})
+        return
+    operations.append({"op": "replace", "path": path, "value": new})
+
+
+def _identical(old: Any, new: Any) -> bool:
+    # ``==`` alone treats ``True`` and ``1`` as equal, which JSON does not, so
+    # equal values are confirmed on their serialized bytes.
+    if old != new:
+        return False
+    try:
+        return orjson.dumps(old) == orjson.dumps(new)
+    except orjson.JSONEncodeError:
+        return False
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def apply_environment_delta(env: Any, delta: list[dict[str, Any]]) -> Any:
+    """Apply a patch produced by :func:`diff_environment` to ``env`` in place.
+
+    Returns the patched document (a new object only when the patch replaces
+    the root).  Raises ``ValueError`` when the patch does not fit ``env``.
+    """
+    for operation in delta:
+        op = operation.get("op")
+        path = operation.get("path")
+        value = copy.deepcopy(operation.get("value"))
+        if not isinstance(path, str):
+            raise ValueError(f"JSON Patch operation has no path: {operation!r}")
+        if path == "":
+            if op != "replace":
+                raise ValueError(f"Unsupported JSON Patch operation on document root: {op}")
+            env = value
+            continue
+
+        *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+        target = env
+        try:
+            for token in parents:
+                target = target[int(token)] if isinstance(target, list) else target[token]
+            if isinstance(target, list):
+                index = len(target) if last == "-" else int(last)
+                if op == "add":
+                    target.insert(index, value)
+                elif op == "remove":
+                    del target[index]
+                elif op == "replace":
+                    target[index] = value
+                else:
+                    raise ValueError(f"Unsupported JSON Patch operation: {op}")
+            elif isinstance(target, dict):
+                if op in {"add", "replace"}:
+                    target[last] = value
+                elif op == "remove":
+                    del target[last]
+                else:
+                    raise ValueError(f"Unsupported JSON Patch operation: {op}")
+            else:
+                raise ValueError(f"JSON Patch path '{path}' does not address a container")
+        except (KeyError, IndexError, TypeError) as exc:
+            raise ValueError(f"JSON Patch path '{path}' does not match the document") from exc
+    return env
+
+
+# =============================================================================
+# Writing and reading revisions
+# =============================================================================
+
+
+def _delta_parent(revision: DPPRevision, parent: DPPRevision | None) -> DPPRevision | None:
+    """Return ``parent`` when ``revision`` should be stored as a delta against it."""
+    settings = get_settings()
+    if settings.dpp_revision_storage_mode != REVISION_STORAGE_DELTA:
+        return None
+    if parent is None or parent.aas_env_json is None or parent.dpp_id != revision.dpp_id:
+        return None
+    if revision.state == RevisionState.PUBLISHED:
+        return None
+    if parent.delta_depth + 1 >= settings.dpp_revision_keyframe_interval:
+        return None
+    return parent
+
+
+async def add_revision(
+    session: AsyncSession,
+    revision: DPPRevision,
+    *,
+    parent: DPPRevision | None,
+) -> None:
+    """Insert ``revision`` and flush, delta-encoding it against ``parent`` when enabled.
+
+    ``revision.aas_env_json`` stays populated on the object either way.
+    """
+    base = _delta_parent(revision, parent)
+    if base is None:
+        session.add(revision)
+        await session.flush()
+        return
+
+    env = revision.aas_env_json
+    revision.env_delta = diff_environment(base.aas_env_json, env)
+    revision.delta_base_revision_id = base.id
+    revision.delta_depth = base.delta_depth + 1
+    revision.aas_env_json = None  # type: ignore[assignment]
+    session.add(revision)
+    await session.flush()
+    set_committed_value(revision, "aas_env_json", env)
+    _environments.put(revision.id, env)
+
+
+async def materialize_revision(session: AsyncSession, revision: DPPRevision | None) -> None:
+    """Restore ``aas_env_json`` on a loaded delta-encoded revision (no-op for keyframes)."""
+    if revision is None or revision.aas_env_json is not None:
+        return
+    env = _environments.get(revision.id)
+    if env is None:
+        env = await _rebuild_environment(session, revision)
+        _environments.put(revision.id, env)
+    set_committed_value(revision, "aas_env_json", env)
+
+
+async def materialize_revisions(session: AsyncSession, revisions: Collection[DPPRevision]) -> None:
+    """Materialize each revision in ``revisions``."""
+    for revision in revisions:
+        await materialize_revision(session, revision)
+
+
+def _chain_statement(base_revision_id: UUID) -> Select[Any]:
+    """Select ``base_revision_id`` and its delta ancestors down to the nearest keyframe."""
+    chain = (
+        select(
+            DPPRevision.id,
+            DPPRevision.delta_base_revision_id,
+            DPPRevision.env_delta,
+            DPPRevision.aas_env_json,
+        )
+        .where(DPPRevision.id == base_revision_id)
+        .cte("revision_chain", recursive=True)
+    )
+    ancestor = aliased(DPPRevision)
+    chain = chain.union_all(
+        select(
+            ancestor.id,
+            ancestor.delta_base_revision_id,
+            ancestor.env_delta,
+            ancestor.aas_env_json,
+        ).join(chain, ancestor.id == chain.c.delta_base_revision_id)
+    )
+    return select(chain)
+
+
+async def _rebuild_environment(session: AsyncSession, revision: DPPRevision) -> dict[str, Any]:
+    if revision.delta_base_revision_id is None or revision.env_delta is None:
+        raise ValueError(f"Revision {revision.id} has neither an environment nor a delta")
+
+    deltas = [revision.env_delta]
+    env = _environments.get(revision.delta_base_revision_id)
+    if env is None:
+        result = await session.execute(_chain_statement(revision.delta_base_revision_id))
+        rows = {row.id: row for row in result.all()}
+        current = rows.get(revision.delta_base_revision_id)
+        while current is not None and current.aas_env_json is None:
+            deltas.append(current.env_delta)
+            current = rows.get(current.delta_base_revision_id)
+        if current is None:
+            raise ValueError(f"Revision {revision.id} has a broken delta chain")
+        env = current.aas_env_json
+
+    for delta in reversed(deltas):
+        env = apply_environment_delta(env, delta)
+    logger.debug(
+        "revision_materialized",
+        revision_id=str(revision.id),
+        deltas_applied=len(deltas),
+    )
+    return env
+
+
+async def promote_to_keyframe(session: AsyncSession, revision: DPPRevision) -> None:
+    """Rewrite a delta-encoded revision as a full keyframe."""
+    if getattr(revision, "delta_base_revision_id", None) is None:
+        return
+    await materialize_revision(session, revision)
+    await session.execute(
+        update(DPPRevision)
+        .where(DPPRevision.id == revision.id)
+        .values(
+            aas_env_json=revision.aas_env_json,
+            env_delta=None,
+            delta_base_revision_id=None,
+            delta_depth=0,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    set_committed_value(revision, "env_delta", None)
+    set_committed_value(revision, "delta_base_revision_id", None)
+    set_committed_value(revision, "delta_depth", 0)
+
+
+async def detach_revisions(session: AsyncSession, revision_ids: Collection[UUID]) -> None:
+    """Promote revisions that are deltas on ``revision_ids`` before those are deleted."""
+    if not revision_ids:
+        return
+    result = await session.execute(
+        select(DPPRevision).where(
+            DPPRevision.delta_base_revision_id.in_(revision_ids),
+            DPPRevision.id.not_in(revision_ids),
+        )
+    )
+    for dependent in result.scalars().all():
+        await promote_to_keyframe(session, dependent)
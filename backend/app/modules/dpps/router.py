@@ -11,31 +11,44 @@ from contextlib import asynccontextmanager
 from typing import Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, Request, UploadFile, status
+import orjson
+from fastapi import (
+    APIRouter,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field, RootModel, field_validator
+from pydantic import BaseModel, Field, RootModel, ValidationError, field_validator
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 
 from app.core.audit import emit_audit_event
+from app.core.background_jobs import JOB_STATUS_QUEUED
 from app.core.config import get_settings
 from app.core.identifiers import IdentifierValidationError
 from app.core.logging import get_logger
-from app.core.security import require_access
+from app.core.raw_json import raw_json_response, splice_model_json
+from app.core.security import PolicyEffect, check_access, require_access
 from app.core.security.actor_metadata import actor_payload, load_users_by_subject
 from app.core.security.resource_context import build_dpp_resource_context
 from app.core.tenancy import TenantAdmin, TenantContext, TenantContextDep, TenantPublisher
-from app.db.models import DPPStatus
+from app.db.models import BatchImportJob, DPPPublishJob, DPPRebuildJob, DPPStatus
 from app.db.session import DbSession
 from app.modules.aas.conformance import validate_aas_environment
 from app.modules.digital_thread.handlers import record_lifecycle_event
+from app.modules.dpps import batch_import, outbox, publish_jobs, rebuild_jobs
 from app.modules.dpps.aasx_ingest import AasxIngestService
 from app.modules.dpps.attachment_service import AttachmentNotFoundError, AttachmentService
+from app.modules.dpps.public_cache import invalidate_public_dpp
 from app.modules.dpps.service import AmbiguousSubmodelBindingError, DPPService
 from app.modules.epcis.handlers import record_epcis_lifecycle_event
 from app.modules.masters.service import DPPMasterService
-from app.modules.registry.handlers import auto_register_shell_descriptor
-from app.modules.resolver.handlers import auto_register_resolver_links
-from app.modules.templates.service import TemplateRegistryService
 from app.modules.units.payload import strip_uom_data_specifications
 from app.modules.webhooks.service import trigger_webhooks
 
@@ -43,6 +56,7 @@ logger = get_logger(__name__)
 router = APIRouter()
 _refresh_rebuild_local_locks: dict[str, asyncio.Lock] = {}
 _refresh_rebuild_local_locks_guard = asyncio.Lock()
+_BULK_PUBLISH_POLICY_CONCURRENCY = 20
 
 
 def _can_view_drafts(dpp: Any, tenant: TenantContext, *, shared_with_current_user: bool) -> bool:
@@ -261,6 +275,7 @@ class DPPResponse(BaseModel):
     access: AccessSummary
     asset_ids: dict[str, Any]
     qr_payload: str | None
+    short_slug: str | None = None
     created_at: str
     updated_at: str
 
@@ -295,6 +310,19 @@ class DPPDetailResponse(DPPResponse):
     publish_blockers: list[str] = Field(default_factory=list)
 
 
+def _detail_json_response(
+    detail: DPPDetailResponse,
+    aas_environment: dict[str, Any] | None,
+) -> Response:
+    """Serialize a DPP detail with its AAS environment encoded by orjson alone.
+
+    ``detail`` carries no environment, so Pydantic validates only the
+    envelope and the (potentially multi-megabyte) tree is encoded once.
+    """
+    raw_environment = orjson.dumps(aas_environment) if aas_environment is not None else None
+    return raw_json_response(splice_model_json(detail, "aas_environment", raw_environment))
+
+
 class DPPListResponse(BaseModel):
     """Response model for list of DPPs."""
 
@@ -344,6 +372,39 @@ class BulkRebuildResponse(BaseModel):
     errors: list[BulkRebuildError]
 
 
+class DPPRebuildJobResponse(BulkRebuildResponse):
+    """Progress of a background rebuild-all job."""
+
+    job_id: UUID
+    status: str
+    processed: int
+    failed: int
+    checkpoint_dpp_id: UUID | None = Field(
+        None, description="Every DPP with an id up to this one has been processed"
+    )
+    progress_percent: float
+    eta_seconds: int | None = None
+    refresh_templates: bool
+    last_error: str | None = None
+    created_at: str
+    started_at: str | None = None
+    heartbeat_at: str | None = None
+    finished_at: str | None = None
+    queued: bool = Field(
+        False, description="Whether a runner in this process picked the job up immediately"
+    )
+
+
+class DPPRebuildJobListResponse(BaseModel):
+    """Paginated rebuild-all job listing."""
+
+    jobs: list[DPPRebuildJobResponse]
+    count: int
+    total_count: int
+    limit: int
+    offset: int
+
+
 class RefreshRebuildFailure(BaseModel):
     """Single template/submodel refresh+rebuild failure entry."""
 
@@ -465,7 +526,10 @@ class BatchImportJobSummaryResponse(BaseModel):
     total: int
     succeeded: int
     failed: int
+    status: str = "completed"
     created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
 
 
 class BatchImportJobListResponse(BaseModel):
@@ -479,9 +543,85 @@ class BatchImportJobListResponse(BaseModel):
 
 
 class BatchImportJobDetailResponse(BatchImportJobSummaryResponse):
-    """Batch import job with per-item outcomes."""
+    """Batch import job with a page of per-item outcomes."""
 
     items: list[BatchImportJobItemResponse]
+    item_limit: int
+    item_offset: int
+
+
+class BatchImportJobAcceptedResponse(BaseModel):
+    """Asynchronous batch import job accepted for processing."""
+
+    job_id: UUID
+    status: str
+    total: int
+    rejected: int = Field(0, description="Items recorded as failed during upload validation")
+    resumed: int = Field(0, description="Failed items put back to pending")
+    queued: bool = Field(
+        description="Whether a worker in this process picked the job up immediately",
+    )
+
+
+class BulkPublishRequest(BaseModel):
+    """DPPs to publish in one background job."""
+
+    dpp_ids: list[UUID] = Field(min_length=1)
+
+
+class DPPPublishJobItemResponse(BaseModel):
+    """Persisted bulk publish item outcome."""
+
+    index: int
+    dpp_id: UUID
+    status: str
+    revision_id: UUID | None = None
+    error: str | None = None
+    processed_at: str | None = None
+
+
+class DPPPublishJobSummaryResponse(BaseModel):
+    """Persisted bulk publish job summary row."""
+
+    id: UUID
+    requested_by_subject: str
+    requested_by: ActorSummary
+    total: int
+    succeeded: int
+    failed: int
+    status: str
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+
+
+class DPPPublishJobListResponse(BaseModel):
+    """Paginated bulk publish job listing."""
+
+    jobs: list[DPPPublishJobSummaryResponse]
+    count: int
+    total_count: int
+    limit: int
+    offset: int
+
+
+class DPPPublishJobDetailResponse(DPPPublishJobSummaryResponse):
+    """Bulk publish job with a page of per-item outcomes."""
+
+    items: list[DPPPublishJobItemResponse]
+    item_limit: int
+    item_offset: int
+
+
+class DPPPublishJobAcceptedResponse(BaseModel):
+    """Bulk publish job accepted for processing."""
+
+    job_id: UUID
+    status: str
+    total: int
+    queued: bool = Field(
+        description="Whether a worker in this process picked the job up immediately",
+    )
 
 
 class DiffEntry(BaseModel):
@@ -535,6 +675,7 @@ def _dpp_response_payload(
         ),
         asset_ids=dpp.asset_ids,
         qr_payload=dpp.qr_payload,
+        short_slug=dpp.short_slug,
         created_at=dpp.created_at.isoformat(),
         updated_at=dpp.updated_at.isoformat(),
     )
@@ -773,16 +914,7 @@ async def list_batch_import_jobs(
     subjects = [job.requested_by_subject for job in jobs]
     users = await load_users_by_subject(db, subjects)
     payload = [
-        BatchImportJobSummaryResponse(
-            id=job.id,
-            requested_by_subject=job.requested_by_subject,
-            requested_by=ActorSummary(**actor_payload(job.requested_by_subject, users)),
-            total=job.total,
-            succeeded=job.succeeded,
-            failed=job.failed,
-            created_at=job.created_at.isoformat(),
-        )
-        for job in jobs
+        BatchImportJobSummaryResponse(**_batch_import_job_fields(job, users)) for job in jobs
     ]
     return BatchImportJobListResponse(
         jobs=payload,
@@ -793,15 +925,176 @@ async def list_batch_import_jobs(
     )
 
 
+@router.post(
+    "/batch-import/jobs",
+    response_model=BatchImportJobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_batch_import_job(
+    request: Request,
+    db: DbSession,
+    tenant: TenantPublisher,
+) -> BatchImportJobAcceptedResponse:
+    """
+    Queue an asynchronous batch import.
+
+    The request body is a JSON array (or ``{"dpps": [...]}``), NDJSON
+    (``application/x-ndjson``) or CSV (``text/csv``) of batch import items and
+    is staged while it streams in.  Items that fail validation are recorded as
+    failed immediately; the rest are created by background workers in chunks.
+    Poll ``GET /batch-import/jobs/{job_id}`` for progress.
+    """
+    await require_access(tenant.user, "create", {"type": "dpp"}, tenant=tenant)
+    source_format = batch_import.source_format_for(request.headers.get("content-type"))
+    if source_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Batch import accepts application/json, application/x-ndjson or text/csv",
+        )
+    settings = get_settings()
+    digest = hashlib.sha256()
+
+    async def hashed_body() -> AsyncIterator[bytes]:
+        async for chunk in request.stream():
+            digest.update(chunk)
+            yield chunk
+
+    jobs = batch_import.BatchImportJobService(db)
+    job = await jobs.create_job(
+        tenant_id=tenant.tenant_id,
+        tenant_slug=tenant.tenant_slug,
+        requested_by_subject=tenant.user.sub,
+        source_format=source_format,
+        chunk_size=settings.batch_import_chunk_size,
+    )
+    try:
+        await jobs.stage_items(
+            job,
+            batch_import.iter_upload_records(hashed_body(), source_format),
+            validate=_validated_batch_import_item,
+            max_items=settings.batch_import_async_max_items,
+        )
+    except ValueError as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+    if job.total == 0:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Batch import contains no items",
+        )
+    job.payload_hash = digest.hexdigest()
+    await emit_audit_event(
+        db_session=db,
+        action="batch_import_job_created",
+        resource_type="batch_import_job",
+        resource_id=str(job.id),
+        tenant_id=tenant.tenant_id,
+        user=tenant.user,
+        request=request,
+        metadata={
+            "total": job.total,
+            "rejected": job.failed,
+            "source_format": source_format,
+            "async": True,
+        },
+    )
+    await db.commit()
+
+    queued = job.status == JOB_STATUS_QUEUED and (
+        batch_import.enqueue_batch_import_job(tenant.tenant_id, job.id)
+    )
+    return BatchImportJobAcceptedResponse(
+        job_id=job.id,
+        status=job.status,
+        total=job.total,
+        rejected=job.failed,
+        queued=queued,
+    )
+
+
+@router.post(
+    "/batch-import/jobs/{job_id}/resume",
+    response_model=BatchImportJobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def resume_batch_import_job(
+    job_id: UUID,
+    request: Request,
+    db: DbSession,
+    tenant: TenantPublisher,
+) -> BatchImportJobAcceptedResponse:
+    """Retry the failed items of a batch import job that passed upload validation."""
+    await require_access(tenant.user, "create", {"type": "dpp"}, tenant=tenant)
+    job = await _get_visible_batch_import_job(db, tenant, job_id)
+    resumed = await batch_import.BatchImportJobService(db).resume_failed(job)
+    await emit_audit_event(
+        db_session=db,
+        action="batch_import_job_resumed",
+        resource_type="batch_import_job",
+        resource_id=str(job.id),
+        tenant_id=tenant.tenant_id,
+        user=tenant.user,
+        request=request,
+        metadata={"resumed": resumed},
+    )
+    await db.commit()
+
+    queued = resumed > 0 and batch_import.enqueue_batch_import_job(tenant.tenant_id, job.id)
+    return BatchImportJobAcceptedResponse(
+        job_id=job.id,
+        status=job.status,
+        total=job.total,
+        resumed=resumed,
+        queued=queued,
+    )
+
+
 @router.get("/batch-import/jobs/{job_id}", response_model=BatchImportJobDetailResponse)
 async def get_batch_import_job(
     job_id: UUID,
     db: DbSession,
     tenant: TenantPublisher,
+    item_status: str | None = Query(None, description="Only items with this status"),
+    item_limit: int = Query(1000, ge=1, le=5000),
+    item_offset: int = Query(0, ge=0),
 ) -> BatchImportJobDetailResponse:
-    """Get one persisted batch import job and its item outcomes."""
-    service = DPPService(db)
-    job = await service.get_batch_import_job(tenant_id=tenant.tenant_id, job_id=job_id)
+    """Get one persisted batch import job and a page of its item outcomes."""
+    job = await _get_visible_batch_import_job(db, tenant, job_id)
+    items = await DPPService(db).list_batch_import_job_items(
+        tenant_id=tenant.tenant_id,
+        job_id=job.id,
+        status=item_status,
+        limit=item_limit,
+        offset=item_offset,
+    )
+    users = await load_users_by_subject(db, [job.requested_by_subject])
+    return BatchImportJobDetailResponse(
+        **_batch_import_job_fields(job, users),
+        items=[
+            BatchImportJobItemResponse(
+                index=item.item_index,
+                dpp_id=item.dpp_id,
+                status=item.status,
+                error=item.error,
+                created_at=item.created_at.isoformat(),
+            )
+            for item in items
+        ],
+        item_limit=item_limit,
+        item_offset=item_offset,
+    )
+
+
+async def _get_visible_batch_import_job(
+    db: DbSession,
+    tenant: TenantContext,
+    job_id: UUID,
+) -> BatchImportJob:
+    job = await DPPService(db).get_batch_import_job(tenant_id=tenant.tenant_id, job_id=job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -812,28 +1105,208 @@ async def get_batch_import_job(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied",
         )
-    users = await load_users_by_subject(db, [job.requested_by_subject])
-    return BatchImportJobDetailResponse(
-        id=job.id,
-        requested_by_subject=job.requested_by_subject,
-        requested_by=ActorSummary(**actor_payload(job.requested_by_subject, users)),
+    return job
+
+
+def _batch_import_job_fields(job: BatchImportJob, users: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": job.id,
+        "requested_by_subject": job.requested_by_subject,
+        "requested_by": ActorSummary(**actor_payload(job.requested_by_subject, users)),
+        "total": job.total,
+        "succeeded": job.succeeded,
+        "failed": job.failed,
+        "status": job.status,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+def _validated_batch_import_item(raw: dict[str, Any]) -> dict[str, Any]:
+    """Validate one uploaded item into the create request stored on the job item."""
+    try:
+        item = BatchImportItem.model_validate(raw)
+    except ValidationError as exc:
+        raise ValueError(
+            "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in exc.errors()
+            )
+        ) from exc
+    return {
+        "asset_ids": item.asset_ids.model_dump(exclude_none=True),
+        "selected_templates": item.selected_templates,
+        "initial_data": item.initial_data,
+        "required_specific_asset_ids": item.required_specific_asset_ids,
+    }
+
+
+async def _bulk_publish_denials(
+    jobs: publish_jobs.PublishJobService, tenant: TenantContext, dpp_ids: list[UUID]
+) -> dict[UUID, str]:
+    """Evaluate the publish policy per DPP; returns the reason of each denial.
+
+    Workers publish without the requester's token, so the policy is checked
+    here.  Unknown ids are left to the job, which reports them as not found.
+    """
+    if not get_settings().opa_enabled:
+        return {}
+    rows = await jobs.load_access_fields(tenant.tenant_id, dpp_ids)
+    denied: dict[UUID, str] = {}
+    for start in range(0, len(rows), _BULK_PUBLISH_POLICY_CONCURRENCY):
+        batch = rows[start : start + _BULK_PUBLISH_POLICY_CONCURRENCY]
+        decisions = await asyncio.gather(
+            *(
+                check_access(tenant.user, "publish", build_dpp_resource_context(row), tenant=tenant)
+                for row in batch
+            )
+        )
+        for row, decision in zip(batch, decisions, strict=True):
+            if decision.effect == PolicyEffect.DENY:
+                denied[row.id] = decision.reason or "Access denied by policy"
+    return denied
+
+
+@router.post(
+    "/bulk-publish/jobs",
+    response_model=DPPPublishJobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_bulk_publish_job(
+    body: BulkPublishRequest,
+    request: Request,
+    db: DbSession,
+    tenant: TenantPublisher,
+) -> DPPPublishJobAcceptedResponse:
+    """
+    Queue a publish of many DPPs.
+
+    Background workers publish the DPPs in chunks, evaluating the publish
+    gates of each chunk from shared inputs.  DPPs that cannot be published
+    are recorded as failed items with the reason; the rest of the job goes
+    on.  Non-admins can only publish DPPs they own, and DPPs the publish
+    policy denies are recorded as failed items up front.  Poll
+    ``GET /bulk-publish/jobs/{job_id}`` for progress.
+    """
+    jobs = publish_jobs.PublishJobService(db)
+    try:
+        dpp_ids = publish_jobs.unique_dpp_ids(body.dpp_ids)
+        job = await jobs.create_job(
+            tenant_id=tenant.tenant_id,
+            requested_by_subject=tenant.user.sub,
+            owner_subject=None if tenant.is_tenant_admin else tenant.user.sub,
+            dpp_ids=dpp_ids,
+            denied=await _bulk_publish_denials(jobs, tenant, dpp_ids),
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+    await emit_audit_event(
+        db_session=db,
+        action="bulk_publish_job_created",
+        resource_type="dpp_publish_job",
+        resource_id=str(job.id),
+        tenant_id=tenant.tenant_id,
+        user=tenant.user,
+        request=request,
+        metadata={"total": job.total},
+    )
+    await db.commit()
+
+    queued = publish_jobs.enqueue_publish_job(tenant.tenant_id, job.id)
+    return DPPPublishJobAcceptedResponse(
+        job_id=job.id,
+        status=job.status,
         total=job.total,
-        succeeded=job.succeeded,
-        failed=job.failed,
-        created_at=job.created_at.isoformat(),
+        queued=queued,
+    )
+
+
+@router.get("/bulk-publish/jobs", response_model=DPPPublishJobListResponse)
+async def list_bulk_publish_jobs(
+    db: DbSession,
+    tenant: TenantPublisher,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+) -> DPPPublishJobListResponse:
+    """List bulk publish jobs for this tenant (own jobs only for non-admins)."""
+    jobs, total_count = await publish_jobs.PublishJobService(db).list_jobs(
+        tenant.tenant_id,
+        requester_subject=None if tenant.is_tenant_admin else tenant.user.sub,
+        limit=limit,
+        offset=offset,
+    )
+    users = await load_users_by_subject(db, [job.requested_by_subject for job in jobs])
+    payload = [DPPPublishJobSummaryResponse(**_publish_job_fields(job, users)) for job in jobs]
+    return DPPPublishJobListResponse(
+        jobs=payload,
+        count=len(payload),
+        total_count=total_count,
+        limit=limit,
+        offset=offset,
+    )
+
+
+@router.get("/bulk-publish/jobs/{job_id}", response_model=DPPPublishJobDetailResponse)
+async def get_bulk_publish_job(
+    job_id: UUID,
+    db: DbSession,
+    tenant: TenantPublisher,
+    item_status: str | None = Query(None, description="Only items with this status"),
+    item_limit: int = Query(1000, ge=1, le=5000),
+    item_offset: int = Query(0, ge=0),
+) -> DPPPublishJobDetailResponse:
+    """Get one bulk publish job and a page of its item outcomes."""
+    service = publish_jobs.PublishJobService(db)
+    job = await service.get_job(tenant.tenant_id, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Bulk publish job {job_id} not found",
+        )
+    if not tenant.is_tenant_admin and job.requested_by_subject != tenant.user.sub:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
+        )
+    items = await service.list_items(job, status=item_status, limit=item_limit, offset=item_offset)
+    users = await load_users_by_subject(db, [job.requested_by_subject])
+    return DPPPublishJobDetailResponse(
+        **_publish_job_fields(job, users),
         items=[
-            BatchImportJobItemResponse(
+            DPPPublishJobItemResponse(
                 index=item.item_index,
                 dpp_id=item.dpp_id,
                 status=item.status,
+                revision_id=item.revision_id,
                 error=item.error,
-                created_at=item.created_at.isoformat(),
+                processed_at=item.processed_at.isoformat() if item.processed_at else None,
             )
-            for item in job.items
+            for item in items
         ],
+        item_limit=item_limit,
+        item_offset=item_offset,
     )
 
 
+def _publish_job_fields(job: DPPPublishJob, users: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": job.id,
+        "requested_by_subject": job.requested_by_subject,
+        "requested_by": ActorSummary(**actor_payload(job.requested_by_subject, users)),
+        "total": job.total,
+        "succeeded": job.succeeded,
+        "failed": job.failed,
+        "status": job.status,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
 @router.post("/import", response_model=DPPResponse, status_code=status.HTTP_201_CREATED)
 async def import_dpp(
     body: ImportDPPRequest,
@@ -1131,37 +1604,153 @@ async def import_dpp_aasx(
     )
 
 
-@router.post("/rebuild-all", response_model=BulkRebuildResponse)
+def _rebuild_job_response(job: DPPRebuildJob, *, queued: bool = False) -> DPPRebuildJobResponse:
+    progress = rebuild_jobs.rebuild_progress(job)
+    return DPPRebuildJobResponse(
+        job_id=job.id,
+        status=job.status,
+        total=job.total,
+        processed=job.processed,
+        updated=job.updated,
+        skipped=job.skipped,
+        failed=job.failed,
+        errors=[BulkRebuildError(**entry) for entry in job.errors],
+        checkpoint_dpp_id=job.checkpoint_dpp_id,
+        progress_percent=progress.percent,
+        eta_seconds=progress.eta_seconds,
+        refresh_templates=job.refresh_templates,
+        last_error=job.last_error,
+        created_at=job.created_at.isoformat(),
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        heartbeat_at=job.heartbeat_at.isoformat() if job.heartbeat_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None,
+        queued=queued,
+    )
+
+
+async def _get_rebuild_job(db: DbSession, tenant: TenantContext, job_id: UUID) -> DPPRebuildJob:
+    job = await rebuild_jobs.DPPRebuildJobService(db).get_job(tenant.tenant_id, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Rebuild job {job_id} not found",
+        )
+    return job
+
+
+@router.post(
+    "/rebuild-all",
+    response_model=DPPRebuildJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def rebuild_all_dpps(
+    request: Request,
     db: DbSession,
     tenant: TenantAdmin,
-) -> BulkRebuildResponse:
+    refresh_templates: bool = Query(True, description="Refresh templates before rebuilding"),
+) -> DPPRebuildJobResponse:
     """
-    Refresh templates and rebuild submodels for all DPPs.
+    Queue a background rebuild of all DPPs from the latest templates.
+
+    DPPs are rebuilt in id order, a chunk at a time, and the job records a
+    checkpoint after every chunk so an interrupted run resumes where it
+    stopped.  Poll ``GET /rebuild-all/jobs/{job_id}`` for progress.
 
     Requires tenant admin role.
     """
-    template_service = TemplateRegistryService(db)
-    await template_service.refresh_all_templates()
-
-    service = DPPService(db)
-    summary = await service.rebuild_all_from_templates(
+    jobs = rebuild_jobs.DPPRebuildJobService(db)
+    try:
+        job = await jobs.create_job(
+            tenant_id=tenant.tenant_id,
+            requested_by_subject=tenant.user.sub,
+            refresh_templates=refresh_templates,
+        )
+    except (ValueError, IntegrityError) as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A rebuild-all job is already queued or running for this tenant",
+        ) from exc
+    await emit_audit_event(
+        db_session=db,
+        action="rebuild_all_job_created",
+        resource_type="dpp_rebuild_job",
+        resource_id=str(job.id),
         tenant_id=tenant.tenant_id,
-        updated_by_subject=tenant.user.sub,
+        user=tenant.user,
+        request=request,
+        metadata={"total": job.total, "refresh_templates": refresh_templates},
     )
     await db.commit()
 
-    return BulkRebuildResponse(
-        total=summary["total"],
-        updated=summary["updated"],
-        skipped=summary["skipped"],
-        errors=[
-            BulkRebuildError(dpp_id=entry["dpp_id"], error=entry["error"])
-            for entry in summary.get("errors", [])
-        ],
+    queued = rebuild_jobs.enqueue_rebuild_job(tenant.tenant_id, job.id)
+    return _rebuild_job_response(job, queued=queued)
+
+
+@router.get("/rebuild-all/jobs", response_model=DPPRebuildJobListResponse)
+async def list_rebuild_jobs(
+    db: DbSession,
+    tenant: TenantAdmin,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+) -> DPPRebuildJobListResponse:
+    """List rebuild-all jobs for this tenant, newest first."""
+    jobs, total_count = await rebuild_jobs.DPPRebuildJobService(db).list_jobs(
+        tenant.tenant_id, limit=limit, offset=offset
+    )
+    payload = [_rebuild_job_response(job) for job in jobs]
+    return DPPRebuildJobListResponse(
+        jobs=payload,
+        count=len(payload),
+        total_count=total_count,
+        limit=limit,
+        offset=offset,
     )
 
 
+@router.get("/rebuild-all/jobs/{job_id}", response_model=DPPRebuildJobResponse)
+async def get_rebuild_job(
+    job_id: UUID,
+    db: DbSession,
+    tenant: TenantAdmin,
+) -> DPPRebuildJobResponse:
+    """Get progress and estimated time remaining of a rebuild-all job."""
+    return _rebuild_job_response(await _get_rebuild_job(db, tenant, job_id))
+
+
+@router.post(
+    "/rebuild-all/jobs/{job_id}/resume",
+    response_model=DPPRebuildJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def resume_rebuild_job(
+    job_id: UUID,
+    request: Request,
+    db: DbSession,
+    tenant: TenantAdmin,
+) -> DPPRebuildJobResponse:
+    """Queue a failed rebuild-all job again; it continues after its checkpoint."""
+    job = await _get_rebuild_job(db, tenant, job_id)
+    try:
+        await rebuild_jobs.DPPRebuildJobService(db).resume_job(job)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    await emit_audit_event(
+        db_session=db,
+        action="rebuild_all_job_resumed",
+        resource_type="dpp_rebuild_job",
+        resource_id=str(job.id),
+        tenant_id=tenant.tenant_id,
+        user=tenant.user,
+        request=request,
+        metadata={"processed": job.processed, "total": job.total},
+    )
+    await db.commit()
+
+    queued = rebuild_jobs.enqueue_rebuild_job(tenant.tenant_id, job.id)
+    return _rebuild_job_response(job, queued=queued)
+
+
 @router.post("/repair-invalid-lists", response_model=RepairInvalidListsResponse)
 async def repair_invalid_lists(
     body: RepairInvalidListsRequest,
@@ -1260,22 +1849,16 @@ async def get_dpp_by_slug(
     slug: str,
     db: DbSession,
     tenant: TenantContextDep,
-) -> DPPDetailResponse:
+) -> Response:
     """
     Get a DPP by its short-link slug.
 
-    The slug is the first 8 hex characters of the DPP UUID,
-    as used in QR code short links (/p/{slug}).
+    The slug is the tenant-unique hex prefix of the DPP UUID (8 characters,
+    longer on prefix collisions), as used in QR code short links (/p/{slug}).
     """
     service = DPPService(db)
 
-    try:
-        dpp = await service.get_dpp_by_slug(slug, tenant.tenant_id)
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(exc),
-        ) from exc
+    dpp = await service.get_dpp_by_slug(slug, tenant.tenant_id)
     if not dpp:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1328,7 +1911,7 @@ async def get_dpp_by_slug(
     constraints = await service.get_revision_publish_constraints(revision=revision)
     owners = await load_users_by_subject(db, [dpp.owner_subject])
 
-    return DPPDetailResponse(
+    detail = DPPDetailResponse(
         **_dpp_response_payload(
             dpp,
             owner=actor_payload(dpp.owner_subject, owners),
@@ -1336,7 +1919,7 @@ async def get_dpp_by_slug(
             shared_with_current_user=shared_with_current_user,
         ).model_dump(),
         current_revision_no=revision.revision_no if revision else None,
-        aas_environment=aas_environment,
+        aas_environment=None,
         digest_sha256=revision.digest_sha256 if revision else None,
         required_specific_asset_ids=constraints["required_specific_asset_ids"],
         missing_required_specific_asset_ids=constraints["missing_required_specific_asset_ids"],
@@ -1357,6 +1940,7 @@ async def get_dpp_by_slug(
             for binding in submodel_bindings
         ],
     )
+    return _detail_json_response(detail, aas_environment)
 
 
 @router.get("/{dpp_id}", response_model=DPPDetailResponse)
@@ -1364,7 +1948,7 @@ async def get_dpp(
     dpp_id: UUID,
     db: DbSession,
     tenant: TenantContextDep,
-) -> DPPDetailResponse:
+) -> Response:
     """
     Get a specific DPP by ID.
 
@@ -1425,7 +2009,7 @@ async def get_dpp(
     constraints = await service.get_revision_publish_constraints(revision=revision)
     owners = await load_users_by_subject(db, [dpp.owner_subject])
 
-    return DPPDetailResponse(
+    detail = DPPDetailResponse(
         **_dpp_response_payload(
             dpp,
             owner=actor_payload(dpp.owner_subject, owners),
@@ -1433,7 +2017,7 @@ async def get_dpp(
             shared_with_current_user=shared_with_current_user,
         ).model_dump(),
         current_revision_no=revision.revision_no if revision else None,
-        aas_environment=aas_environment,
+        aas_environment=None,
         digest_sha256=revision.digest_sha256 if revision else None,
         required_specific_asset_ids=constraints["required_specific_asset_ids"],
         missing_required_specific_asset_ids=constraints["missing_required_specific_asset_ids"],
@@ -1454,6 +2038,7 @@ async def get_dpp(
             for binding in submodel_bindings
         ],
     )
+    return _detail_json_response(detail, aas_environment)
 
 
 @router.put("/{dpp_id}/submodel", response_model=RevisionResponse)
@@ -1940,44 +2525,9 @@ async def publish_dpp(
             action="publish",
             created_by=tenant.user.sub,
         )
-        await db.commit()
-        await db.refresh(published_dpp)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-
-    side_effect_timeout_seconds = max(get_settings().webhook_timeout_seconds, 1)
-
-    async def _run_post_publish_side_effect(name: str, task: Any) -> None:
-        try:
-            await asyncio.wait_for(task, timeout=side_effect_timeout_seconds)
-        except TimeoutError:
-            logger.warning(
-                "Post-publish side effect timed out",
-                extra={
-                    "side_effect": name,
-                    "timeout_seconds": side_effect_timeout_seconds,
-                    "dpp_id": str(dpp_id),
-                    "tenant_id": str(tenant.tenant_id),
-                },
-            )
-        except Exception:
-            logger.warning(
-                "Post-publish side effect failed",
-                extra={
-                    "side_effect": name,
-                    "dpp_id": str(dpp_id),
-                    "tenant_id": str(tenant.tenant_id),
-                },
-                exc_info=True,
-            )
-
-    # Post-commit side effects — failures are logged, not raised to the user
-    await _run_post_publish_side_effect(
-        "emit_audit_event",
-        emit_audit_event(
+        # The audit event and the outbox entries commit with the publish; outbox
+        # workers deliver webhooks and registrations afterwards, with retries.
+        await emit_audit_event(
             db_session=db,
             action="publish_dpp",
             resource_type="dpp",
@@ -1985,56 +2535,18 @@ async def publish_dpp(
             tenant_id=tenant.tenant_id,
             user=tenant.user,
             request=request,
-        ),
-    )
-
-    await _run_post_publish_side_effect(
-        "trigger_webhooks",
-        trigger_webhooks(
-            db,
-            tenant.tenant_id,
-            "DPP_PUBLISHED",
-            {
-                "event": "DPP_PUBLISHED",
-                "dpp_id": str(dpp_id),
-                "status": published_dpp.status.value,
-            },
-        ),
-    )
-
-    # Run resolver + registry auto-registration concurrently
-    auto_tasks: list[tuple[str, Any]] = [
-        (
-            "auto_register_resolver_links",
-            auto_register_resolver_links(db, published_dpp, tenant.tenant_id, tenant.user.sub),
-        ),
-    ]
-    if published_dpp.current_published_revision_id:
-        from sqlalchemy import select as _select
-
-        from app.db.models import DPPRevision as _DPPRevision
-
-        _rev_result = await db.execute(
-            _select(_DPPRevision).where(
-                _DPPRevision.id == published_dpp.current_published_revision_id
-            )
         )
-        _pub_rev = _rev_result.scalar_one_or_none()
-        if _pub_rev:
-            auto_tasks.append(
-                (
-                    "auto_register_shell_descriptor",
-                    auto_register_shell_descriptor(
-                        db, published_dpp, _pub_rev, tenant.tenant_id, tenant.user.sub
-                    ),
-                )
-            )
-    await asyncio.gather(
-        *(
-            _run_post_publish_side_effect(side_effect_name, side_effect_task)
-            for side_effect_name, side_effect_task in auto_tasks
+        await outbox.enqueue_publish_side_effects(db, published_dpp, created_by=tenant.user.sub)
+        await db.commit()
+        await db.refresh(published_dpp)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
-    )
+
+    await invalidate_public_dpp(tenant.tenant_id, dpp_id)
+    outbox.notify_outbox(tenant.tenant_id)
 
     owners = await load_users_by_subject(db, [published_dpp.owner_subject])
     return _dpp_response_payload(
@@ -2082,6 +2594,7 @@ async def archive_dpp(
         archived_dpp = await service.archive_dpp(dpp_id, tenant.tenant_id)
         await db.commit()
         await db.refresh(archived_dpp)
+        await invalidate_public_dpp(tenant.tenant_id, dpp_id)
         await record_epcis_lifecycle_event(
             session=db,
             dpp_id=dpp_id,
@@ -5,6 +5,7 @@ Handles DPP lifecycle, revision management, and data hydration.
 
 import inspect
 import json
+from collections.abc import Callable, Collection, Sequence
 from datetime import UTC, datetime
 from typing import Any
 from typing import cast as typing_cast
@@ -12,18 +13,30 @@ from uuid import UUID
 
 from jwt import api_jws
 from jwt.exceptions import PyJWTError
-from sqlalchemy import String, false, func, or_, select
-from sqlalchemy import cast as sql_cast
+from sqlalchemy import false, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.config import get_settings
 from app.core.crypto.canonicalization import (
     CANONICALIZATION_RFC8785,
+    CANONICALIZATION_RFC8785_MERKLE_V1,
     SHA256_ALGORITHM,
     sha256_hex_for_canonicalization,
 )
-from app.core.encryption import ConnectorConfigEncryptor, DPPFieldEncryptor, EncryptionError
+from app.core.crypto.environment_digest import (
+    EnvironmentDigest,
+    compute_environment_digest,
+    reusable_submodel_digests,
+    stored_environment_digest,
+)
+from app.core.crypto.jws_signer import JWSSigner, SigningError, get_dpp_signer
+from app.core.encryption import (
+    ConnectorConfigEncryptor,
+    DPPEncryptionBaseline,
+    DPPFieldEncryptor,
+    EncryptionError,
+)
 from app.core.identifiers import (
     IdentifierValidationError,
     build_global_asset_id,
@@ -38,6 +51,8 @@ from app.db.models import (
     DataCarrier,
     DataCarrierIdentifierScheme,
     DataCarrierStatus,
+    DPPPublicProjection,
+    DPPPublishedSubmodel,
     DPPRevision,
     DPPStatus,
     EncryptedValue,
@@ -65,7 +80,28 @@ from app.modules.data_carriers.profile import (
     parse_data_carrier_compliance_profile,
 )
 from app.modules.dpps.basyx_builder import BasyxDppBuilder
+from app.modules.dpps.bulk_create import (
+    BulkDPPItem,
+    BulkDPPResult,
+    compute_environment_digests,
+)
+from app.modules.dpps.bulk_publish import BulkPublishResult
 from app.modules.dpps.canonical_patch import apply_canonical_patch
+from app.modules.dpps.decryption_cache import (
+    forget_decrypted_environments,
+    get_decrypted_environment,
+    remember_decrypted_environment,
+    tenant_dek_cache,
+)
+from app.modules.dpps.landing_summary import LandingSummaryService
+from app.modules.dpps.public_projection import build_public_projections, build_public_submodels
+from app.modules.dpps.revision_store import (
+    add_revision,
+    detach_revisions,
+    materialize_revision,
+    promote_to_keyframe,
+)
+from app.modules.dpps.short_slug import normalize_short_slug, short_slug_candidates
 from app.modules.dpps.submodel_binding import (
     ResolvedSubmodelBinding,
     resolve_submodel_bindings,
@@ -81,10 +117,6 @@ from app.standards.cen_pren.identifiers_18219 import (
 logger = get_logger(__name__)
 
 
-class SigningError(Exception):
-    """Raised when JWS signing is configured but fails."""
-
-
 class AmbiguousSubmodelBindingError(ValueError):
     """Raised when a template key matches multiple submodels without an explicit target."""
 
@@ -119,6 +151,7 @@ class DPPService:
                 active_key_id=self._settings.encryption_active_key_id,
             )
             self._field_encryptor = DPPFieldEncryptor(key_encryptor)
+        self._encryption_baselines: dict[UUID, DPPEncryptionBaseline] = {}
 
     def _is_cen_dpp_enabled(self) -> bool:
         value = getattr(self._settings, "cen_dpp_enabled", False)
@@ -161,8 +194,19 @@ class DPPService:
         value = getattr(revision, field, None)
         return value if isinstance(value, dict) else {}
 
-    async def _decrypt_revision_aas_env(self, revision: DPPRevision) -> dict[str, Any]:
-        """Return revision AAS payload with encrypted markers resolved for internal operations."""
+    async def _decrypt_revision_aas_env(
+        self,
+        revision: DPPRevision,
+        *,
+        pointers: Collection[str] | None = None,
+    ) -> dict[str, Any]:
+        """Return revision AAS payload with encrypted markers resolved for internal operations.
+
+        With ``pointers`` only markers at or below those JSON pointers are
+        loaded and decrypted; the others are returned as markers.  Full
+        decryptions are remembered so the next revision written on top of
+        this one can carry unchanged ciphertext forward.
+        """
         field_encryptor: DPPFieldEncryptor | None = getattr(self, "_field_encryptor", None)
         wrapped_dek = getattr(revision, "wrapped_dek", None)
         kek_id = getattr(revision, "kek_id", None)
@@ -170,48 +214,140 @@ class DPPService:
             raise ValueError("Encryption keyring is not configured for encrypted DPP revision")
         if field_encryptor is None or not wrapped_dek or not kek_id:
             return revision.aas_env_json
+        if pointers is None:
+            cached = get_decrypted_environment(
+                revision.tenant_id, revision.id, wrapped_dek=wrapped_dek
+            )
+            if cached is not None:
+                self._remember_encryption_baseline(revision.id, cached[1])
+                return cached[0]
+        ref_ids: list[UUID] = []
+        for ref in field_encryptor.marker_paths(revision.aas_env_json, pointers=pointers):
+            try:
+                ref_ids.append(UUID(ref))
+            except ValueError:
+                continue
+        if not ref_ids:
+            return revision.aas_env_json
+        # Rows are looked up by marker ref rather than by revision: carried-forward
+        # ciphertext is owned by whichever revision wrote or last adopted it.
         result = await self._session.execute(
-            select(EncryptedValue).where(EncryptedValue.revision_id == revision.id)
+            select(EncryptedValue).where(
+                EncryptedValue.tenant_id == revision.tenant_id,
+                EncryptedValue.id.in_(ref_ids),
+            )
         )
         encrypted_rows = list(result.scalars().all())
         if not encrypted_rows:
             return revision.aas_env_json
         try:
-            return field_encryptor.decrypt_for_read(
+            decrypted = field_encryptor.decrypt_revision(
                 revision.aas_env_json,
                 tenant_id=revision.tenant_id,
                 encrypted_rows=encrypted_rows,
                 wrapped_dek=wrapped_dek,
                 kek_id=kek_id,
                 dek_wrapping_algorithm=getattr(revision, "dek_wrapping_algorithm", None),
+                pointers=pointers,
+                dek_cache=tenant_dek_cache(revision.tenant_id),
             )
         except EncryptionError as exc:
             raise ValueError(f"Failed to decrypt encrypted revision payload: {exc}") from exc
+        if pointers is None:
+            self._remember_encryption_baseline(revision.id, decrypted.baseline)
+            remember_decrypted_environment(
+                revision.tenant_id,
+                revision.id,
+                wrapped_dek=wrapped_dek,
+                env=decrypted.aas_env_json,
+                baseline=decrypted.baseline,
+            )
+        return decrypted.aas_env_json
 
-    async def get_revision_aas_for_reader(self, revision: DPPRevision) -> dict[str, Any]:
-        """Return reader-facing AAS payload with encrypted markers decrypted."""
-        return await self._decrypt_revision_aas_env(revision)
+    def _remember_encryption_baseline(
+        self, revision_id: UUID, baseline: DPPEncryptionBaseline | None
+    ) -> None:
+        baselines = getattr(self, "_encryption_baselines", None)
+        if baselines is not None and baseline is not None:
+            baselines[revision_id] = baseline
+
+    async def get_revision_aas_for_reader(
+        self,
+        revision: DPPRevision,
+        *,
+        pointers: Collection[str] | None = None,
+    ) -> dict[str, Any]:
+        """Return reader-facing AAS payload with encrypted markers decrypted.
+
+        Pass ``pointers`` to decrypt only the fields a reader needs; an empty
+        collection skips decryption entirely.
+        """
+        return await self._decrypt_revision_aas_env(revision, pointers=pointers)
 
     async def _prepare_revision_payload(
         self,
         *,
         tenant_id: UUID,
         aas_env: dict[str, Any],
+        previous_revision: DPPRevision | None = None,
+    ) -> tuple[dict[str, Any], list[EncryptedValue], dict[str, Any]]:
+        """Apply field-level encryption and digest metadata for a revision write.
+
+        Submodels stored unchanged from ``previous_revision`` keep their leaf
+        hashes, so only edited submodels are canonicalized and hashed again.
+        """
+        stored_aas, encrypted_rows, metadata = self._encrypt_revision_payload(
+            tenant_id=tenant_id,
+            aas_env=aas_env,
+            previous_revision=previous_revision,
+        )
+        digest = self._calculate_environment_digest(
+            stored_aas,
+            previous_revision=previous_revision,
+        )
+        metadata.update(self._digest_metadata(digest))
+        return stored_aas, encrypted_rows, metadata
+
+    @staticmethod
+    def _digest_metadata(digest: EnvironmentDigest) -> dict[str, Any]:
+        return {
+            "digest_sha256": digest.root,
+            "digest_algorithm": SHA256_ALGORITHM,
+            "digest_canonicalization": CANONICALIZATION_RFC8785_MERKLE_V1,
+            "digest_leaves": digest.to_json(),
+        }
+
+    def _encrypt_revision_payload(
+        self,
+        *,
+        tenant_id: UUID,
+        aas_env: dict[str, Any],
+        previous_revision: DPPRevision | None = None,
     ) -> tuple[dict[str, Any], list[EncryptedValue], dict[str, Any]]:
-        """Apply field-level encryption and digest metadata for a revision write."""
+        """Apply field-level encryption; returns the stored payload, rows and key metadata."""
         stored_aas = aas_env
         encrypted_rows: list[EncryptedValue] = []
+        carried_encrypted_value_ids: list[UUID] = []
         wrapped_dek: str | None = None
         kek_id: str | None = None
         dek_wrapping_algorithm: str | None = None
 
         field_encryptor: DPPFieldEncryptor | None = getattr(self, "_field_encryptor", None)
         if field_encryptor is not None:
-            encrypted = field_encryptor.prepare_for_storage(aas_env, tenant_id=tenant_id)
+            baseline = None
+            if previous_revision is not None and self._settings.dpp_encryption_reuse_ciphertext:
+                baseline = getattr(self, "_encryption_baselines", {}).get(previous_revision.id)
+            encrypted = field_encryptor.prepare_for_storage(
+                aas_env,
+                tenant_id=tenant_id,
+                baseline=baseline,
+                dek_cache=tenant_dek_cache(tenant_id),
+            )
             stored_aas = encrypted.aas_env_json
             wrapped_dek = encrypted.wrapped_dek
             kek_id = encrypted.kek_id
             dek_wrapping_algorithm = encrypted.dek_wrapping_algorithm
+            carried_encrypted_value_ids = encrypted.carried_ref_ids
             encrypted_rows = [
                 EncryptedValue(
                     tenant_id=tenant_id,
@@ -231,17 +367,46 @@ class DPPService:
                 "(or ENCRYPTION_MASTER_KEY fallback) to be configured"
             )
 
-        digest = self._calculate_digest(stored_aas)
         metadata = {
-            "digest_sha256": digest,
-            "digest_algorithm": SHA256_ALGORITHM,
-            "digest_canonicalization": CANONICALIZATION_RFC8785,
             "wrapped_dek": wrapped_dek,
             "kek_id": kek_id,
             "dek_wrapping_algorithm": dek_wrapping_algorithm,
+            "carried_encrypted_value_ids": carried_encrypted_value_ids,
         }
         return stored_aas, encrypted_rows, metadata
 
+    async def _store_encrypted_rows(
+        self,
+        revision: DPPRevision,
+        encrypted_rows: list[EncryptedValue],
+        digest_metadata: dict[str, Any],
+    ) -> None:
+        """Persist new ciphertext rows and adopt rows carried forward from the parent.
+
+        A carried row moves to the new revision unless a published revision
+        already owns it.  Draft cleanup deletes the oldest drafts first, so a
+        row owned by the newest draft or a published revision that references
+        it is never cascaded away while another revision still points at it.
+        """
+        for row in encrypted_rows:
+            row.revision_id = revision.id
+            self._session.add(row)
+        carried_ids = digest_metadata.get("carried_encrypted_value_ids") or []
+        if carried_ids:
+            await self._session.execute(
+                update(EncryptedValue)
+                .where(
+                    EncryptedValue.id.in_(carried_ids),
+                    EncryptedValue.revision_id.in_(
+                        select(DPPRevision.id).where(DPPRevision.state == RevisionState.DRAFT)
+                    ),
+                )
+                .values(revision_id=revision.id)
+                .execution_options(synchronize_session=False)
+            )
+        if encrypted_rows:
+            await self._session.flush()
+
     def _aas_requires_field_encryption(self, aas_env: dict[str, Any]) -> bool:
         def _walk(node: Any) -> bool:
             if isinstance(node, dict):
@@ -387,47 +552,82 @@ class DPPService:
                 DataCarrier.dpp_id == dpp_id,
             )
         )
-        carriers = list(result.scalars().all())
+        self._assert_carriers_satisfy_profile(list(result.scalars().all()), profile)
+
+    def _assert_carriers_satisfy_profile(
+        self, carriers: list[DataCarrier], profile: DataCarrierComplianceProfile
+    ) -> None:
         if not carriers:
             raise ValueError(
                 "Publish blocked: data carrier gate requires at least one managed carrier"
             )
+        if not any(self._carrier_satisfies_profile(carrier, profile) for carrier in carriers):
+            raise ValueError(
+                "Publish blocked: no data carrier satisfies the active compliance profile "
+                f"('{profile.name}')"
+            )
 
-        allowed_types = {item.value for item in profile.allowed_carrier_types}
-        allowed_levels = {item.value for item in profile.allowed_identity_levels}
-        allowed_schemes = {item.value for item in profile.allowed_identifier_schemes}
-        allowed_statuses = {item.value for item in profile.publish_allowed_statuses}
-
-        for carrier in carriers:
-            status_value = carrier.status.value
-            if (
-                profile.publish_require_active_carrier
-                and carrier.status != DataCarrierStatus.ACTIVE
-            ):
-                continue
-            if status_value not in allowed_statuses:
-                continue
-            if carrier.carrier_type.value not in allowed_types:
-                continue
-            if carrier.identity_level.value not in allowed_levels:
-                continue
-            if carrier.identifier_scheme.value not in allowed_schemes:
-                continue
-            if profile.publish_require_pre_sale_enabled and not carrier.pre_sale_enabled:
-                continue
-            if (
-                profile.enforce_gtin_verified
-                and carrier.identifier_scheme == DataCarrierIdentifierScheme.GS1_GTIN
-                and not carrier.is_gtin_verified
-            ):
-                continue
-            return
+    @staticmethod
+    def _carrier_satisfies_profile(
+        carrier: DataCarrier, profile: DataCarrierComplianceProfile
+    ) -> bool:
+        """Whether one managed carrier satisfies the publish gate of ``profile``."""
+        if profile.publish_require_active_carrier and carrier.status != DataCarrierStatus.ACTIVE:
+            return False
+        if carrier.status.value not in {item.value for item in profile.publish_allowed_statuses}:
+            return False
+        if carrier.carrier_type.value not in {item.value for item in profile.allowed_carrier_types}:
+            return False
+        if carrier.identity_level.value not in {
+            item.value for item in profile.allowed_identity_levels
+        }:
+            return False
+        if carrier.identifier_scheme.value not in {
+            item.value for item in profile.allowed_identifier_schemes
+        }:
+            return False
+        if profile.publish_require_pre_sale_enabled and not carrier.pre_sale_enabled:
+            return False
+        return not (
+            profile.enforce_gtin_verified
+            and carrier.identifier_scheme == DataCarrierIdentifierScheme.GS1_GTIN
+            and not carrier.is_gtin_verified
+        )
 
-        raise ValueError(
-            "Publish blocked: no data carrier satisfies the active compliance profile "
-            f"('{profile.name}')"
+    async def _global_asset_id_base(self) -> str | None:
+        """Return the normalized admin-managed base URI for globalAssetIds, if any."""
+        settings_service = SettingsService(self._session)
+        base_uri = await settings_service.get_setting("global_asset_id_base_uri")
+        if not base_uri:
+            base_uri = self._settings.global_asset_id_base_uri_default
+        if not base_uri:
+            return None
+        return normalize_base_uri(
+            base_uri,
+            allowed_schemes=self._allowed_global_asset_uri_schemes(),
         )
 
+    def _apply_global_asset_id(
+        self, asset_ids: dict[str, Any], normalized_base: str | None
+    ) -> None:
+        """Check a provided globalAssetId against the base URI or derive one from it."""
+        if not normalized_base:
+            return
+        provided_global_id = str(asset_ids.get("globalAssetId", "")).strip()
+        if provided_global_id:
+            if not provided_global_id.startswith(normalized_base):
+                raise IdentifierValidationError(
+                    "globalAssetId must start with the configured base URI."
+                )
+        else:
+            manufacturer_part_id = str(asset_ids.get("manufacturerPartId", "")).strip()
+            if manufacturer_part_id:
+                asset_ids["globalAssetId"] = build_global_asset_id(
+                    normalized_base,
+                    asset_ids,
+                    allowed_schemes=self._allowed_global_asset_uri_schemes(),
+                )
+
     async def create_dpp(
         self,
         tenant_id: UUID,
@@ -463,29 +663,7 @@ class DPPService:
         )
 
         # Resolve globalAssetId if not provided (admin-managed base URI)
-        settings_service = SettingsService(self._session)
-        base_uri = await settings_service.get_setting("global_asset_id_base_uri")
-        if not base_uri:
-            base_uri = self._settings.global_asset_id_base_uri_default
-        if base_uri:
-            normalized_base = normalize_base_uri(
-                base_uri,
-                allowed_schemes=self._allowed_global_asset_uri_schemes(),
-            )
-            provided_global_id = str(asset_ids.get("globalAssetId", "")).strip()
-            if provided_global_id:
-                if not provided_global_id.startswith(normalized_base):
-                    raise IdentifierValidationError(
-                        "globalAssetId must start with the configured base URI."
-                    )
-            else:
-                manufacturer_part_id = str(asset_ids.get("manufacturerPartId", "")).strip()
-                if manufacturer_part_id:
-                    asset_ids["globalAssetId"] = build_global_asset_id(
-                        normalized_base,
-                        asset_ids,
-                        allowed_schemes=self._allowed_global_asset_uri_schemes(),
-                    )
+        self._apply_global_asset_id(asset_ids, await self._global_asset_id_base())
 
         # Build initial AAS Environment from selected templates
         aas_env = await self._build_initial_environment(
@@ -503,6 +681,7 @@ class DPPService:
         )
         self._session.add(dpp)
         await self._session.flush()
+        await self._assign_short_slug(dpp)
 
         # Generate QR payload URL
         qr_service = QRCodeService()
@@ -529,6 +708,7 @@ class DPPService:
             digest_sha256=digest_metadata["digest_sha256"],
             digest_algorithm=digest_metadata["digest_algorithm"],
             digest_canonicalization=digest_metadata["digest_canonicalization"],
+            digest_leaves=digest_metadata["digest_leaves"],
             wrapped_dek=digest_metadata["wrapped_dek"],
             kek_id=digest_metadata["kek_id"],
             dek_wrapping_algorithm=digest_metadata["dek_wrapping_algorithm"],
@@ -539,11 +719,7 @@ class DPPService:
         )
         self._session.add(revision)
         await self._session.flush()
-        if encrypted_rows:
-            for row in encrypted_rows:
-                row.revision_id = revision.id
-                self._session.add(row)
-            await self._session.flush()
+        await self._store_encrypted_rows(revision, encrypted_rows, digest_metadata)
 
         logger.info(
             "dpp_created",
@@ -554,6 +730,137 @@ class DPPService:
 
         return dpp
 
+    async def create_dpps_bulk(
+        self,
+        tenant_id: UUID,
+        tenant_slug: str,
+        owner_subject: str,
+        items: Sequence[BulkDPPItem],
+        selected_templates: list[str],
+        required_specific_asset_ids: list[str] | None = None,
+    ) -> list[BulkDPPResult]:
+        """
+        Create many DPPs that share ``selected_templates`` in a few statements.
+
+        Equivalent to calling :meth:`create_dpp` per item, but templates,
+        settings and provenance are resolved once, items without initial data
+        are stamped onto one built environment, digests are computed by
+        :func:`compute_environment_digests` and all rows are written with
+        multi-row INSERTs.  Items failing asset-id validation are reported in
+        their result and skipped; database errors abort the whole call.
+        """
+        await self._ensure_user_exists(owner_subject)
+
+        required_asset_ids = self.resolve_required_specific_asset_ids(
+            selected_templates=selected_templates,
+            profile_required_specific_asset_ids=required_specific_asset_ids,
+        )
+        base_uri = await self._global_asset_id_base()
+        results: list[BulkDPPResult] = []
+        accepted: list[tuple[int, BulkDPPItem]] = []
+        for index, item in enumerate(items):
+            try:
+                self._validate_required_specific_asset_ids(
+                    asset_ids=item.asset_ids,
+                    required_specific_asset_ids=required_asset_ids,
+                )
+                self._apply_global_asset_id(item.asset_ids, base_uri)
+            except ValueError as exc:
+                results.append(BulkDPPResult(index=index, error=str(exc)))
+                continue
+            accepted.append((index, item))
+        if not accepted:
+            return results
+
+        environments = await self._basyx_builder.build_environments(
+            [(item.asset_ids, item.initial_data) for _, item in accepted],
+            selected_templates,
+        )
+        template_provenance = await self._build_template_provenance(selected_templates)
+        encrypted: list[tuple[int, BulkDPPItem]] = []
+        payloads: list[tuple[dict[str, Any], list[EncryptedValue], dict[str, Any]]] = []
+        for (index, item), env in zip(accepted, environments, strict=True):
+            try:
+                payloads.append(self._encrypt_revision_payload(tenant_id=tenant_id, aas_env=env))
+            except ValueError as exc:
+                results.append(BulkDPPResult(index=index, error=str(exc)))
+                continue
+            encrypted.append((index, item))
+        accepted = encrypted
+        if not accepted:
+            results.sort(key=lambda result: result.index)
+            return results
+        digests = await compute_environment_digests([stored for stored, _, _ in payloads])
+
+        count = len(accepted)
+        id_result = await self._session.execute(
+            select(func.uuid_generate_v7()).select_from(func.generate_series(1, 2 * count))
+        )
+        new_ids = list(id_result.scalars().all())
+        dpp_ids, revision_ids = new_ids[:count], new_ids[count:]
+        slugs = await self._allocate_short_slugs(tenant_id, dpp_ids)
+        qr_service = QRCodeService()
+
+        dpp_rows: list[dict[str, Any]] = []
+        revision_rows: list[dict[str, Any]] = []
+        encrypted_rows: list[EncryptedValue] = []
+        for (index, item), dpp_id, revision_id, (stored_aas, rows, metadata), digest in zip(
+            accepted, dpp_ids, revision_ids, payloads, digests, strict=True
+        ):
+            dpp_rows.append(
+                {
+                    "id": dpp_id,
+                    "tenant_id": tenant_id,
+                    "status": DPPStatus.DRAFT,
+                    "owner_subject": owner_subject,
+                    "asset_ids": item.asset_ids,
+                    "short_slug": slugs[dpp_id],
+                    "qr_payload": qr_service.build_dpp_url(
+                        str(dpp_id),
+                        tenant_slug=tenant_slug,
+                        short_link=False,
+                    ),
+                }
+            )
+            revision_rows.append(
+                {
+                    "id": revision_id,
+                    "tenant_id": tenant_id,
+                    "dpp_id": dpp_id,
+                    "revision_no": 1,
+                    "state": RevisionState.DRAFT,
+                    "aas_env_json": stored_aas,
+                    **self._digest_metadata(digest),
+                    "wrapped_dek": metadata["wrapped_dek"],
+                    "kek_id": metadata["kek_id"],
+                    "dek_wrapping_algorithm": metadata["dek_wrapping_algorithm"],
+                    "created_by_subject": owner_subject,
+                    "template_provenance": template_provenance,
+                    "supplementary_manifest": {},
+                    "doc_hints_manifest": {},
+                }
+            )
+            for row in rows:
+                row.revision_id = revision_id
+            encrypted_rows.extend(rows)
+            results.append(BulkDPPResult(index=index, dpp_id=dpp_id))
+
+        await self._session.execute(insert(DPP), dpp_rows)
+        await self._session.execute(insert(DPPRevision), revision_rows)
+        if encrypted_rows:
+            self._session.add_all(encrypted_rows)
+            await self._session.flush()
+
+        logger.info(
+            "dpps_bulk_created",
+            count=count,
+            skipped=len(items) - count,
+            owner=owner_subject,
+            templates=selected_templates,
+        )
+        results.sort(key=lambda result: result.index)
+        return results
+
     async def create_dpp_from_environment(
         self,
         tenant_id: UUID,
@@ -581,29 +888,7 @@ class DPPService:
         )
 
         # Ensure globalAssetId if missing (same rules as regular create)
-        settings_service = SettingsService(self._session)
-        base_uri = await settings_service.get_setting("global_asset_id_base_uri")
-        if not base_uri:
-            base_uri = self._settings.global_asset_id_base_uri_default
-        if base_uri:
-            normalized_base = normalize_base_uri(
-                base_uri,
-                allowed_schemes=self._allowed_global_asset_uri_schemes(),
-            )
-            provided_global_id = str(asset_ids.get("globalAssetId", "")).strip()
-            if provided_global_id:
-                if not provided_global_id.startswith(normalized_base):
-                    raise IdentifierValidationError(
-                        "globalAssetId must start with the configured base URI."
-                    )
-            else:
-                manufacturer_part_id = str(asset_ids.get("manufacturerPartId", "")).strip()
-                if manufacturer_part_id:
-                    asset_ids["globalAssetId"] = build_global_asset_id(
-                        normalized_base,
-                        asset_ids,
-                        allowed_schemes=self._allowed_global_asset_uri_schemes(),
-                    )
+        self._apply_global_asset_id(asset_ids, await self._global_asset_id_base())
 
         stored_aas, encrypted_rows, digest_metadata = await self._prepare_revision_payload(
             tenant_id=tenant_id,
@@ -618,6 +903,7 @@ class DPPService:
         )
         self._session.add(dpp)
         await self._session.flush()
+        await self._assign_short_slug(dpp)
 
         qr_service = QRCodeService()
         dpp.qr_payload = qr_service.build_dpp_url(
@@ -635,6 +921,7 @@ class DPPService:
             digest_sha256=digest_metadata["digest_sha256"],
             digest_algorithm=digest_metadata["digest_algorithm"],
             digest_canonicalization=digest_metadata["digest_canonicalization"],
+            digest_leaves=digest_metadata["digest_leaves"],
             wrapped_dek=digest_metadata["wrapped_dek"],
             kek_id=digest_metadata["kek_id"],
             dek_wrapping_algorithm=digest_metadata["dek_wrapping_algorithm"],
@@ -645,11 +932,7 @@ class DPPService:
         )
         self._session.add(revision)
         await self._session.flush()
-        if encrypted_rows:
-            for row in encrypted_rows:
-                row.revision_id = revision.id
-                self._session.add(row)
-            await self._session.flush()
+        await self._store_encrypted_rows(revision, encrypted_rows, digest_metadata)
 
         logger.info("dpp_imported", dpp_id=str(dpp.id), owner=owner_subject)
 
@@ -695,41 +978,66 @@ class DPPService:
         result = await self._session.execute(query)
         return result.scalar_one_or_none()
 
+    async def _assign_short_slug(self, dpp: DPP) -> None:
+        """Give a freshly flushed DPP the shortest free short-link slug in its tenant.
+
+        A transaction-scoped advisory lock on the 8-hex prefix serialises
+        concurrent creations that could otherwise pick the same slug.
+        """
+        slugs = await self._allocate_short_slugs(dpp.tenant_id, [dpp.id])
+        dpp.short_slug = slugs[dpp.id]
+
+    async def _allocate_short_slugs(
+        self, tenant_id: UUID, dpp_ids: Sequence[UUID]
+    ) -> dict[UUID, str]:
+        """Pick free short-link slugs for new DPP ids, also distinct from each other.
+
+        Prefix locks are taken in sorted order so concurrent bulk creations
+        cannot deadlock on each other.
+        """
+        candidates = {dpp_id: short_slug_candidates(dpp_id) for dpp_id in dpp_ids}
+        for prefix in sorted({slugs[0] for slugs in candidates.values()}):
+            lock_key = f"dpp-short-slug:{tenant_id}:{prefix}"
+            await self._session.execute(
+                select(func.pg_advisory_xact_lock(func.hashtextextended(lock_key, 0)))
+            )
+        result = await self._session.execute(
+            select(DPP.short_slug).where(
+                DPP.tenant_id == tenant_id,
+                DPP.short_slug.in_([slug for slugs in candidates.values() for slug in slugs]),
+            )
+        )
+        taken = set(result.scalars().all())
+        allocated: dict[UUID, str] = {}
+        for dpp_id, slugs in candidates.items():
+            slug = next((candidate for candidate in slugs if candidate not in taken), slugs[-1])
+            taken.add(slug)
+            allocated[dpp_id] = slug
+        return allocated
+
     async def get_dpp_by_slug(
         self,
         slug: str,
         tenant_id: UUID,
     ) -> DPP | None:
         """
-        Get a DPP by its short-link slug (first 8 hex chars of UUID).
+        Get a DPP by its short-link slug.
 
-        The slug is the first 8 characters of the UUID without hyphens,
-        as generated by QRCodeService.build_dpp_url().
+        Slugs are tenant-unique hex prefixes of the DPP UUID (8 characters,
+        longer when DPPs created close together share a prefix) and are
+        resolved through the ``uq_dpps_tenant_short_slug`` index.
         """
-        # Validate slug format (8 hex characters)
-        if not slug or len(slug) != 8:
-            return None
-        slug = slug.lower()
-        try:
-            int(slug, 16)  # Validate hex
-        except ValueError:
+        normalized = normalize_short_slug(slug)
+        if normalized is None:
             return None
 
-        # Query by UUID prefix using PostgreSQL text cast
-        query = (
-            select(DPP)
-            .where(
-                sql_cast(DPP.id, String).like(f"{slug[:8]}%"),
+        result = await self._session.execute(
+            select(DPP).where(
                 DPP.tenant_id == tenant_id,
+                DPP.short_slug == normalized,
             )
-            .limit(2)
         )
-
-        result = await self._session.execute(query)
-        matches = list(result.scalars().all())
-        if len(matches) > 1:
-            raise ValueError("Slug collision detected")
-        return matches[0] if matches else None
+        return result.scalar_one_or_none()
 
     async def get_dpps_for_owner(
         self,
@@ -1010,17 +1318,36 @@ class DPPService:
         tenant_id: UUID,
         job_id: UUID,
     ) -> BatchImportJob | None:
-        """Get a batch import job with its items."""
+        """Get a batch import job; items are paged by :meth:`list_batch_import_job_items`."""
         result = await self._session.execute(
-            select(BatchImportJob)
-            .options(selectinload(BatchImportJob.items))
-            .where(
+            select(BatchImportJob).where(
                 BatchImportJob.id == job_id,
                 BatchImportJob.tenant_id == tenant_id,
             )
         )
         return result.scalar_one_or_none()
 
+    async def list_batch_import_job_items(
+        self,
+        *,
+        tenant_id: UUID,
+        job_id: UUID,
+        status: str | None = None,
+        limit: int = 1000,
+        offset: int = 0,
+    ) -> list[BatchImportJobItem]:
+        """List item outcomes of a batch import job in upload order."""
+        query = select(BatchImportJobItem).where(
+            BatchImportJobItem.job_id == job_id,
+            BatchImportJobItem.tenant_id == tenant_id,
+        )
+        if status is not None:
+            query = query.where(BatchImportJobItem.status == status)
+        result = await self._session.execute(
+            query.order_by(BatchImportJobItem.item_index).limit(limit).offset(offset)
+        )
+        return list(result.scalars().all())
+
     async def get_latest_revision(self, dpp_id: UUID, tenant_id: UUID) -> DPPRevision | None:
         """
         Get the latest revision of a DPP (draft or published).
@@ -1031,7 +1358,9 @@ class DPPService:
             .order_by(DPPRevision.revision_no.desc())
             .limit(1)
         )
-        return result.scalar_one_or_none()
+        revision = result.scalar_one_or_none()
+        await materialize_revision(self._session, revision)
+        return revision
 
     async def get_published_revision(self, dpp_id: UUID, tenant_id: UUID) -> DPPRevision | None:
         """
@@ -1047,7 +1376,9 @@ class DPPService:
                 DPPRevision.tenant_id == tenant_id,
             )
         )
-        return result.scalar_one_or_none()
+        revision = result.scalar_one_or_none()
+        await materialize_revision(self._session, revision)
+        return revision
 
     async def get_revision_by_no(
         self, dpp_id: UUID, tenant_id: UUID, rev_no: int
@@ -1060,7 +1391,9 @@ class DPPService:
                 DPPRevision.revision_no == rev_no,
             )
         )
-        return result.scalar_one_or_none()
+        revision = result.scalar_one_or_none()
+        await materialize_revision(self._session, revision)
+        return revision
 
     @staticmethod
     def _diff_json(
@@ -1162,6 +1495,7 @@ class DPPService:
                 )
             )
             revision = result.scalar_one_or_none()
+            await materialize_revision(self._session, revision)
         elif revision_selector == "published":
             revision = await self.get_published_revision(dpp_id, tenant_id)
         else:
@@ -1351,7 +1685,13 @@ class DPPService:
         *,
         revision: DPPRevision,
         templates: list[Template],
+        unsupported_counts: dict[str, int] | None = None,
     ) -> None:
+        """Block publish when a bound template has nodes the editor cannot render.
+
+        ``unsupported_counts`` memoizes the per-template count across calls
+        that share ``templates`` (bulk publish).
+        """
         template_lookup = {template.template_key: template for template in templates}
         bindings = resolve_submodel_bindings(
             aas_env_json=revision.aas_env_json,
@@ -1365,21 +1705,19 @@ class DPPService:
             if not template_key or template_key in seen_template_keys:
                 continue
             seen_template_keys.add(template_key)
-            template = template_lookup.get(template_key)
-            if template is None:
-                continue
-            contract = await self._generate_template_contract_safe(
-                template,
-                template_lookup=template_lookup,
-            )
-            if contract is None:
-                continue
-            unsupported_nodes = contract.get("unsupported_nodes", [])
-            if isinstance(unsupported_nodes, list) and unsupported_nodes:
+            if unsupported_counts is not None and template_key in unsupported_counts:
+                unsupported_count = unsupported_counts[template_key]
+            else:
+                unsupported_count = await self._count_unsupported_nodes(
+                    template_lookup.get(template_key), template_lookup
+                )
+                if unsupported_counts is not None:
+                    unsupported_counts[template_key] = unsupported_count
+            if unsupported_count:
                 blocked.append(
                     {
                         "template_key": template_key,
-                        "unsupported_count": len(unsupported_nodes),
+                        "unsupported_count": unsupported_count,
                     }
                 )
 
@@ -1392,6 +1730,20 @@ class DPPService:
                 f"{summary}. Save draft is allowed, publish is blocked until support is added."
             )
 
+    async def _count_unsupported_nodes(
+        self, template: Template | None, template_lookup: dict[str, Template]
+    ) -> int:
+        if template is None:
+            return 0
+        contract = await self._generate_template_contract_safe(
+            template,
+            template_lookup=template_lookup,
+        )
+        if contract is None:
+            return 0
+        unsupported_nodes = contract.get("unsupported_nodes", [])
+        return len(unsupported_nodes) if isinstance(unsupported_nodes, list) else 0
+
     async def update_submodel(
         self,
         dpp_id: UUID,
@@ -1761,6 +2113,7 @@ class DPPService:
         stored_aas, encrypted_rows, digest_metadata = await self._prepare_revision_payload(
             tenant_id=tenant_id,
             aas_env=aas_env,
+            previous_revision=current_revision,
         )
         new_revision_no = current_revision.revision_no + 1
         revision = DPPRevision(
@@ -1772,6 +2125,7 @@ class DPPService:
             digest_sha256=digest_metadata["digest_sha256"],
             digest_algorithm=digest_metadata["digest_algorithm"],
             digest_canonicalization=digest_metadata["digest_canonicalization"],
+            digest_leaves=digest_metadata["digest_leaves"],
             wrapped_dek=digest_metadata["wrapped_dek"],
             kek_id=digest_metadata["kek_id"],
             dek_wrapping_algorithm=digest_metadata["dek_wrapping_algorithm"],
@@ -1782,13 +2136,8 @@ class DPPService:
             ),
             doc_hints_manifest=doc_hints_manifest,
         )
-        self._session.add(revision)
-        await self._session.flush()
-        if encrypted_rows:
-            for row in encrypted_rows:
-                row.revision_id = revision.id
-                self._session.add(row)
-            await self._session.flush()
+        await add_revision(self._session, revision, parent=current_revision)
+        await self._store_encrypted_rows(revision, encrypted_rows, digest_metadata)
         return revision
 
     def _build_patch_ops_from_form_payload(
@@ -2053,6 +2402,19 @@ class DPPService:
 
         return summary
 
+    async def rebuild_dpp_from_templates(
+        self,
+        dpp: DPP,
+        templates: list[Template],
+        updated_by_subject: str,
+    ) -> bool:
+        """
+        Rebuild one DPP from already loaded templates.
+
+        Returns ``True`` when a new draft revision was written.
+        """
+        return await self._rebuild_dpp_from_templates(dpp, templates, updated_by_subject)
+
     async def repair_invalid_list_item_id_shorts(
         self,
         *,
@@ -2131,6 +2493,7 @@ class DPPService:
                 stored_aas, encrypted_rows, digest_metadata = await self._prepare_revision_payload(
                     tenant_id=tenant_id,
                     aas_env=sanitized_env,
+                    previous_revision=current_revision,
                 )
                 new_revision_no = current_revision.revision_no + 1
                 revision = DPPRevision(
@@ -2142,6 +2505,7 @@ class DPPService:
                     digest_sha256=digest_metadata["digest_sha256"],
                     digest_algorithm=digest_metadata["digest_algorithm"],
                     digest_canonicalization=digest_metadata["digest_canonicalization"],
+                    digest_leaves=digest_metadata["digest_leaves"],
                     wrapped_dek=digest_metadata["wrapped_dek"],
                     kek_id=digest_metadata["kek_id"],
                     dek_wrapping_algorithm=digest_metadata["dek_wrapping_algorithm"],
@@ -2154,13 +2518,8 @@ class DPPService:
                         current_revision, "doc_hints_manifest"
                     ),
                 )
-                self._session.add(revision)
-                await self._session.flush()
-                if encrypted_rows:
-                    for row in encrypted_rows:
-                        row.revision_id = revision.id
-                        self._session.add(row)
-                    await self._session.flush()
+                await add_revision(self._session, revision, parent=current_revision)
+                await self._store_encrypted_rows(revision, encrypted_rows, digest_metadata)
                 await self._cleanup_old_draft_revisions(dpp.id, tenant_id)
                 summary["repaired"] += 1
             except Exception as exc:  # pragma: no cover - defensive
@@ -2241,32 +2600,66 @@ class DPPService:
         latest_revision = await self.get_latest_revision(dpp_id, tenant_id)
         if not latest_revision:
             raise ValueError(f"No revision found for DPP {dpp_id}")
-        has_submodels = (
-            isinstance(latest_revision.aas_env_json, dict)
-            and isinstance(latest_revision.aas_env_json.get("submodels"), list)
-            and len(latest_revision.aas_env_json.get("submodels", [])) > 0
-        )
-        if has_submodels:
-            current_templates = await self._template_service.get_all_templates()
-            self._assert_revision_binding_compatibility(
-                revision=latest_revision,
-                templates=current_templates,
-                operation="publish",
+        if self._has_submodels(latest_revision):
+            await self._assert_revision_publishable(
                 dpp_id=dpp_id,
-            )
-            await self._assert_publish_supported_nodes(
                 revision=latest_revision,
-                templates=current_templates,
+                templates=await self._template_service.get_all_templates(),
             )
 
+        await self._publish_latest_revision(
+            dpp, latest_revision, published_by_subject, sign=self._sign_digest
+        )
+        return dpp
+
+    @staticmethod
+    def _has_submodels(revision: DPPRevision) -> bool:
+        return (
+            isinstance(revision.aas_env_json, dict)
+            and isinstance(revision.aas_env_json.get("submodels"), list)
+            and len(revision.aas_env_json.get("submodels", [])) > 0
+        )
+
+    async def _assert_revision_publishable(
+        self,
+        *,
+        dpp_id: UUID,
+        revision: DPPRevision,
+        templates: list[Template],
+        unsupported_counts: dict[str, int] | None = None,
+    ) -> None:
+        self._assert_revision_binding_compatibility(
+            revision=revision,
+            templates=templates,
+            operation="publish",
+            dpp_id=dpp_id,
+        )
+        await self._assert_publish_supported_nodes(
+            revision=revision,
+            templates=templates,
+            unsupported_counts=unsupported_counts,
+        )
+
+    async def _publish_latest_revision(
+        self,
+        dpp: DPP,
+        latest_revision: DPPRevision,
+        published_by_subject: str,
+        *,
+        sign: Callable[[str], str | None],
+    ) -> DPPRevision:
+        """Publish ``latest_revision`` of a DPP that passed the publish gates."""
+        tenant_id = dpp.tenant_id
+        dpp_id = dpp.id
         if latest_revision.state == RevisionState.PUBLISHED:
             # Already published, create new revision
             latest_plain_aas = await self._decrypt_revision_aas_env(latest_revision)
             stored_aas, encrypted_rows, digest_metadata = await self._prepare_revision_payload(
                 tenant_id=tenant_id,
                 aas_env=latest_plain_aas,
+                previous_revision=latest_revision,
             )
-            signed_jws = self._sign_digest(digest_metadata["digest_sha256"])
+            signed_jws = sign(digest_metadata["digest_sha256"])
             new_revision_no = latest_revision.revision_no + 1
             revision = DPPRevision(
                 tenant_id=tenant_id,
@@ -2277,6 +2670,7 @@ class DPPService:
                 digest_sha256=digest_metadata["digest_sha256"],
                 digest_algorithm=digest_metadata["digest_algorithm"],
                 digest_canonicalization=digest_metadata["digest_canonicalization"],
+                digest_leaves=digest_metadata["digest_leaves"],
                 wrapped_dek=digest_metadata["wrapped_dek"],
                 kek_id=digest_metadata["kek_id"],
                 dek_wrapping_algorithm=digest_metadata["dek_wrapping_algorithm"],
@@ -2290,23 +2684,26 @@ class DPPService:
             )
             self._session.add(revision)
             await self._session.flush()
-            if encrypted_rows:
-                for row in encrypted_rows:
-                    row.revision_id = revision.id
-                    self._session.add(row)
-                await self._session.flush()
+            await self._store_encrypted_rows(revision, encrypted_rows, digest_metadata)
         else:
-            # Mark current draft as published
-            signed_jws = self._sign_digest(latest_revision.digest_sha256)
+            # Mark current draft as published; published revisions are always
+            # keyframes so public reads never replay deltas.
+            await promote_to_keyframe(self._session, latest_revision)
+            signed_jws = sign(latest_revision.digest_sha256)
             latest_revision.state = RevisionState.PUBLISHED
             latest_revision.signed_jws = signed_jws
             revision = latest_revision
 
         # Update DPP status and pointer
+        newly_published = dpp.status != DPPStatus.PUBLISHED
         dpp.status = DPPStatus.PUBLISHED
         dpp.current_published_revision_id = revision.id
+        self._store_public_projections(dpp, revision)
 
         await self._session.flush()
+        await LandingSummaryService(self._session).record_published(
+            dpp, newly_published=newly_published
+        )
 
         logger.info(
             "dpp_published",
@@ -2315,7 +2712,179 @@ class DPPService:
             published_by=published_by_subject,
         )
 
-        return dpp
+        return revision
+
+    async def publish_dpps_bulk(
+        self,
+        *,
+        tenant_id: UUID,
+        dpp_ids: Sequence[UUID],
+        published_by_subject: str,
+        owner_subject: str | None = None,
+    ) -> list[BulkPublishResult]:
+        """
+        Publish many DPPs, sharing gate inputs and the signing key.
+
+        Applies the gates of :meth:`publish_dpp`, but loads templates and the
+        data carrier gate configuration once and fetches the DPPs, their latest
+        revisions, active product identifiers and carriers with one query each.
+        Every DPP is published and signed in its own savepoint, so a blocked
+        DPP or a failed signature is reported without affecting the others.
+        When ``owner_subject`` is given, DPPs owned by someone else are
+        rejected.
+        """
+        ids = list(dict.fromkeys(dpp_ids))
+        if not ids:
+            return []
+        result = await self._session.execute(
+            select(DPP).where(DPP.tenant_id == tenant_id, DPP.id.in_(ids))
+        )
+        dpps = {dpp.id: dpp for dpp in result.scalars().all()}
+
+        errors: dict[UUID, str] = {}
+        for dpp_id in ids:
+            dpp = dpps.get(dpp_id)
+            if dpp is None:
+                errors[dpp_id] = f"DPP {dpp_id} not found"
+            elif dpp.status == DPPStatus.ARCHIVED:
+                errors[dpp_id] = "Cannot publish an archived DPP"
+            elif owner_subject is not None and dpp.owner_subject != owner_subject:
+                errors[dpp_id] = "Only the owner can publish this DPP"
+        candidates = [dpp_id for dpp_id in ids if dpp_id not in errors]
+
+        identified: set[UUID] | None = None
+        if candidates and self._is_cen_dpp_enabled():
+            identifier_service = IdentifierService(self._session)
+            for dpp_id in candidates:
+                try:
+                    async with self._session.begin_nested():
+                        await identifier_service.ensure_dpp_product_identifier_from_asset_ids(
+                            dpp=dpps[dpp_id],
+                            created_by=published_by_subject,
+                        )
+                except IdentifierGovernanceError as exc:
+                    errors[dpp_id] = f"Publish blocked: {exc}"
+            identified = await identifier_service.product_identified_dpp_ids(
+                tenant_id=tenant_id, dpp_ids=candidates
+            )
+
+        gate_enabled, profile = await self._load_data_carrier_publish_gate()
+        carriers: dict[UUID, list[DataCarrier]] = {}
+        if candidates and gate_enabled:
+            carrier_result = await self._session.execute(
+                select(DataCarrier).where(
+                    DataCarrier.tenant_id == tenant_id,
+                    DataCarrier.dpp_id.in_(candidates),
+                )
+            )
+            for carrier in carrier_result.scalars().all():
+                carriers.setdefault(carrier.dpp_id, []).append(carrier)
+
+        revisions = await self._latest_revisions(tenant_id, candidates)
+        templates: list[Template] = []
+        if any(self._has_submodels(revision) for revision in revisions.values()):
+            templates = await self._template_service.get_all_templates()
+        compliance = (
+            ComplianceService(self._session) if self._settings.compliance_check_on_publish else None
+        )
+        unsupported_counts: dict[str, int] = {}
+
+        results: list[BulkPublishResult] = []
+        for dpp_id in ids:
+            error = errors.get(dpp_id)
+            if error is not None:
+                results.append(BulkPublishResult(dpp_id=dpp_id, error=error))
+                continue
+            dpp = dpps[dpp_id]
+            latest_revision = revisions.get(dpp_id)
+            try:
+                async with self._session.begin_nested():
+                    if identified is not None and dpp_id not in identified:
+                        raise ValueError(
+                            "Publish blocked: at least one active canonical product "
+                            "identifier is required"
+                        )
+                    if gate_enabled:
+                        self._assert_carriers_satisfy_profile(carriers.get(dpp_id, []), profile)
+                    if latest_revision is None:
+                        raise ValueError(f"No revision found for DPP {dpp_id}")
+                    if compliance is not None:
+                        report = await compliance.check_revision(latest_revision)
+                        if not report.is_compliant:
+                            raise ValueError(
+                                f"Publish blocked: {report.summary.critical_violations} "
+                                "critical compliance violation(s) in category "
+                                f"'{report.category}'"
+                            )
+                    if self._has_submodels(latest_revision):
+                        await self._assert_revision_publishable(
+                            dpp_id=dpp_id,
+                            revision=latest_revision,
+                            templates=templates,
+                            unsupported_counts=unsupported_counts,
+                        )
+                    revision = await self._publish_latest_revision(
+                        dpp, latest_revision, published_by_subject, sign=self._sign_digest
+                    )
+            except (ValueError, SigningError) as exc:
+                results.append(BulkPublishResult(dpp_id=dpp_id, error=str(exc)))
+            else:
+                results.append(BulkPublishResult(dpp_id=dpp_id, revision_id=revision.id))
+        return results
+
+    async def _latest_revisions(
+        self, tenant_id: UUID, dpp_ids: Sequence[UUID]
+    ) -> dict[UUID, DPPRevision]:
+        """Latest revision of each DPP, materialized, keyed by DPP id."""
+        if not dpp_ids:
+            return {}
+        result = await self._session.execute(
+            select(DPPRevision)
+            .distinct(DPPRevision.dpp_id)
+            .where(DPPRevision.tenant_id == tenant_id, DPPRevision.dpp_id.in_(dpp_ids))
+            .order_by(DPPRevision.dpp_id, DPPRevision.revision_no.desc())
+        )
+        revisions = {revision.dpp_id: revision for revision in result.scalars().all()}
+        for revision in revisions.values():
+            await materialize_revision(self._session, revision)
+        return revisions
+
+    def _store_public_projections(self, dpp: DPP, revision: DPPRevision) -> None:
+        """Persist the public projections and submodel rows of a newly published revision."""
+        projections = build_public_projections(revision.aas_env_json)
+        self._session.add_all(
+            [
+                DPPPublicProjection(
+                    tenant_id=dpp.tenant_id,
+                    dpp_id=dpp.id,
+                    revision_id=revision.id,
+                    projection_key=projection_key,
+                    payload=payload,
+                )
+                for projection_key, payload in projections.items()
+            ]
+        )
+        self._session.add_all(
+            [
+                DPPPublishedSubmodel(
+                    tenant_id=dpp.tenant_id,
+                    dpp_id=dpp.id,
+                    revision_id=revision.id,
+                    submodel_id=submodel.submodel_id,
+                    semantic_id=submodel.semantic_id,
+                    digest_sha256=submodel.digest_sha256,
+                    payload=submodel.payload,
+                )
+                for submodel in build_public_submodels(
+                    revision.aas_env_json, self._revision_submodel_digests(revision)
+                )
+            ]
+        )
+
+    def _revision_submodel_digests(self, revision: DPPRevision) -> dict[str, str]:
+        """Leaf hashes of a Merkle-digested revision, keyed by submodel ID."""
+        digest = self._stored_revision_digest(revision)
+        return digest.submodel_digests() if digest is not None else {}
 
     async def _rebuild_dpp_from_templates(
         self,
@@ -2394,6 +2963,7 @@ class DPPService:
         stored_aas, encrypted_rows, digest_metadata = await self._prepare_revision_payload(
             tenant_id=dpp.tenant_id,
             aas_env=aas_env,
+            previous_revision=current_revision,
         )
         new_revision_no = current_revision.revision_no + 1
 
@@ -2406,6 +2976,7 @@ class DPPService:
             digest_sha256=digest_metadata["digest_sha256"],
             digest_algorithm=digest_metadata["digest_algorithm"],
             digest_canonicalization=digest_metadata["digest_canonicalization"],
+            digest_leaves=digest_metadata["digest_leaves"],
             wrapped_dek=digest_metadata["wrapped_dek"],
             kek_id=digest_metadata["kek_id"],
             dek_wrapping_algorithm=digest_metadata["dek_wrapping_algorithm"],
@@ -2416,13 +2987,8 @@ class DPPService:
             ),
             doc_hints_manifest=self._revision_manifest(current_revision, "doc_hints_manifest"),
         )
-        self._session.add(revision)
-        await self._session.flush()
-        if encrypted_rows:
-            for row in encrypted_rows:
-                row.revision_id = revision.id
-                self._session.add(row)
-            await self._session.flush()
+        await add_revision(self._session, revision, parent=current_revision)
+        await self._store_encrypted_rows(revision, encrypted_rows, digest_metadata)
 
         logger.info(
             "dpp_rebuilt_from_templates_basyx",
@@ -2454,6 +3020,7 @@ class DPPService:
 
         dpp.status = DPPStatus.ARCHIVED
         await self._session.flush()
+        await LandingSummaryService(self._session).record_archived(dpp)
 
         logger.info("dpp_archived", dpp_id=str(dpp_id))
 
@@ -2476,7 +3043,9 @@ class DPPService:
         )
         old_ids = list(result.scalars().all())
         if old_ids:
+            await detach_revisions(self._session, old_ids)
             await self._session.execute(delete(DPPRevision).where(DPPRevision.id.in_(old_ids)))
+            forget_decrypted_environments(old_ids)
         return len(old_ids)
 
     async def _build_initial_environment(
@@ -2978,32 +3547,60 @@ class DPPService:
 
         Uses deterministic JSON serialization for consistent hashing.
         """
+        if canonicalization == CANONICALIZATION_RFC8785_MERKLE_V1:
+            return compute_environment_digest(aas_env).root
         return sha256_hex_for_canonicalization(
             aas_env,
             canonicalization=canonicalization,
         )
 
+    def _stored_revision_digest(self, revision: DPPRevision | None) -> EnvironmentDigest | None:
+        """Leaves stored with ``revision``, when it was digested under the Merkle scheme."""
+        if revision is None:
+            return None
+        return stored_environment_digest(
+            getattr(revision, "digest_canonicalization", None),
+            getattr(revision, "digest_sha256", None),
+            getattr(revision, "digest_leaves", None),
+        )
+
+    def _calculate_environment_digest(
+        self,
+        aas_env: dict[str, Any],
+        *,
+        previous_revision: DPPRevision | None = None,
+    ) -> EnvironmentDigest:
+        """Calculate the Merkle revision digest, reusing unchanged submodel leaves."""
+        previous = self._stored_revision_digest(previous_revision)
+        if previous_revision is None or previous is None:
+            return compute_environment_digest(aas_env)
+        reuse = reusable_submodel_digests(
+            previous,
+            previous_env=previous_revision.aas_env_json,
+            aas_env=aas_env,
+        )
+        return compute_environment_digest(aas_env, reuse=reuse)
+
     def _sign_digest(self, digest: str) -> str | None:
         """
         Sign a SHA-256 digest using JWS (JSON Web Signature).
 
         Returns a compact JWS string, or None if no signing key is configured.
-        The JWS payload is the hex digest string. The header includes a key ID
-        (kid) for key rotation support.
+        The JWS payload is the hex digest string. The header includes the key
+        ID (kid) of the active signing key for key rotation support.
         """
-        signing_key = self._settings.dpp_signing_key
-        if not signing_key:
+        signer = self._signer()
+        if signer is None:
+            return None
+        return signer.sign_digest(digest)
+
+    def _signer(self) -> JWSSigner | None:
+        """The preloaded DPP signer, or None if no signing key is configured."""
+        if not self._settings.dpp_signing_key:
             return None
-        algorithm = self._settings.dpp_signing_algorithm
-        kid = self._settings.dpp_signing_key_id
         try:
-            return api_jws.encode(
-                digest.encode("utf-8"),
-                signing_key,
-                algorithm=algorithm,
-                headers={"kid": kid},
-            )
-        except Exception as exc:
+            return get_dpp_signer(self._settings)
+        except SigningError as exc:
             raise SigningError(f"JWS signing failed: {exc}") from exc
 
     @staticmethod
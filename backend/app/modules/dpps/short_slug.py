@@ -0,0 +1,33 @@
+"""
+Short-link slugs for DPP QR codes (``/p/{slug}``).
+
+A DPP's slug is the shortest prefix of its hex UUID that is not already
+taken in the tenant, starting at 8 characters.  DPP ids are UUIDv7, whose
+leading digits encode the creation time, so passports created within the
+same minute share their 8-hex prefix and fall back to longer slugs.  The
+full 32-character hex id is always unique and ends the fallback chain.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+SHORT_SLUG_LENGTHS = (8, 12, 16, 20, 24, 28, 32)
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def short_slug_candidates(dpp_id: UUID) -> tuple[str, ...]:
+    """Return the slugs a DPP may take, shortest first."""
+    hex_id = dpp_id.hex
+    return tuple(hex_id[:length] for length in SHORT_SLUG_LENGTHS)
+
+
+def normalize_short_slug(slug: str) -> str | None:
+    """Lower-case a requested slug, or return ``None`` if it cannot exist."""
+    candidate = slug.strip().lower()
+    if not SHORT_SLUG_LENGTHS[0] <= len(candidate) <= SHORT_SLUG_LENGTHS[-1]:
+        return None
+    if not set(candidate) <= _HEX_DIGITS:
+        return None
+    return candidate
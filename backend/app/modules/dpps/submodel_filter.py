@@ -67,13 +67,13 @@ def _submodel_matches_tier(
     allowed_prefixes: frozenset[str],
 ) -> bool:
     """Check if a submodel's semantic ID matches any allowed prefix."""
-    semantic_id = _extract_semantic_id(submodel)
+    semantic_id = extract_semantic_id(submodel)
     if not semantic_id:
         return False  # No semantic ID = deny-by-default
     return any(semantic_id.startswith(prefix) for prefix in allowed_prefixes)
 
 
-def _extract_semantic_id(submodel: dict[str, Any]) -> str:
+def extract_semantic_id(submodel: dict[str, Any]) -> str:
     """Extract the semantic ID string from a submodel dict."""
     sem_id = submodel.get("semanticId", {})
     keys = sem_id.get("keys", [])
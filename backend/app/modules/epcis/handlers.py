@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.db.models import EPCISEvent, EPCISEventType
+from app.modules.dpps.landing_summary import LandingSummaryService
 
 logger = get_logger(__name__)
 
@@ -77,6 +78,7 @@ async def record_epcis_lifecycle_event(
                 created_by_subject=created_by,
             )
             session.add(event)
+            await LandingSummaryService(session).record_epcis_events(tenant_id, [dpp_id])
     except Exception:
         logger.warning(
             "epcis_auto_record_failed",
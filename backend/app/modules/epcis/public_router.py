@@ -11,7 +11,8 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, status
 from sqlalchemy import select
 
-from app.db.models import DPP, DPPStatus, EPCISEvent, Tenant, TenantStatus
+from app.core.tenant_cache import TenantRecord, get_tenant_by_slug
+from app.db.models import DPP, DPPStatus, EPCISEvent
 from app.db.session import DbSession
 
 from .schemas import PublicEPCISEventResponse, PublicEPCISQueryResponse
@@ -21,15 +22,9 @@ router = APIRouter()
 MAX_PUBLIC_EVENTS = 100
 
 
-async def _resolve_tenant(db: DbSession, tenant_slug: str) -> Tenant:
+async def _resolve_tenant(db: DbSession, tenant_slug: str) -> TenantRecord:
     """Look up an active tenant by slug (no auth required)."""
-    result = await db.execute(
-        select(Tenant).where(
-            Tenant.slug == tenant_slug.strip().lower(),
-            Tenant.status == TenantStatus.ACTIVE,
-        )
-    )
-    tenant = result.scalar_one_or_none()
+    tenant = await get_tenant_by_slug(db, tenant_slug, active_only=True)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.db.models import EPCISEvent, EPCISEventType, EPCISNamedQuery
+from app.modules.dpps.landing_summary import LandingSummaryService
 
 from .gs1_validator import validate_against_gs1_schema
 from .schemas import (
@@ -139,6 +140,7 @@ class EPCISService:
             count += 1
 
         await self._session.flush()
+        await LandingSummaryService(self._session).record_epcis_events(tenant_id, [dpp_id])
 
         logger.info(
             "epcis_events_captured",
@@ -13,6 +13,7 @@ from uuid import UUID
 from xml.etree import ElementTree as ET
 
 import defusedxml.ElementTree as DefusedET
+import jwt
 import pyecma376_2
 from basyx.aas import model
 from basyx.aas.adapter import aasx
@@ -90,6 +91,7 @@ class ExportService:
         Returns the AAS Environment JSON with metadata
         including digest and timestamp.
         """
+        signature_header = _jws_header(revision.signed_jws)
         export_data = {
             "aasEnvironment": self._resolve_export_environment(revision, aas_env_json),
             "metadata": {
@@ -97,10 +99,8 @@ class ExportService:
                 "revisionNo": revision.revision_no,
                 "digestSha256": revision.digest_sha256,
                 "signedJws": revision.signed_jws,
-                "signingKeyId": self._settings.dpp_signing_key_id if revision.signed_jws else None,
-                "signingAlgorithm": (
-                    self._settings.dpp_signing_algorithm if revision.signed_jws else None
-                ),
+                "signingKeyId": signature_header.get("kid") if revision.signed_jws else None,
+                "signingAlgorithm": signature_header.get("alg") if revision.signed_jws else None,
             },
         }
 
@@ -472,3 +472,13 @@ class ExportService:
             "errors": errors,
             "warnings": warnings,
         }
+
+
+def _jws_header(signed_jws: str | None) -> dict[str, Any]:
+    """Protected header of a revision signature; keys rotate, so read it from the JWS."""
+    if not signed_jws:
+        return {}
+    try:
+        return jwt.get_unverified_header(signed_jws)
+    except jwt.PyJWTError:
+        return {}
@@ -19,6 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.db.models import DPP, DPPRevision, LCACalculation
+from app.modules.dpps.revision_store import materialize_revision
 from app.modules.lca.engine import PCFEngine
 from app.modules.lca.extractor import extract_material_inventory
 from app.modules.lca.factors.loader import FactorDatabase
@@ -221,6 +222,7 @@ class LCAService:
         revision = revision_result.scalar_one_or_none()
         if revision is None:
             raise ValueError(f"No revision found for DPP {dpp_id}")
+        await materialize_revision(self._session, revision)
 
         aas_env: dict[str, Any] = revision.aas_env_json
         return aas_env, revision.revision_no
@@ -32,6 +32,7 @@ from app.db.models import (
     OPCUANodeSet,
     OPCUASource,
 )
+from app.modules.dpps.revision_store import materialize_revision
 
 from .schemas import (
     DryRunDiffEntry,
@@ -706,6 +707,7 @@ class MappingService:
                 .limit(1)
             )
             rev = result.scalar_one_or_none()
+            await materialize_revision(self._session, rev)
             if rev and rev.aas_env_json:
                 revision_json = rev.aas_env_json
 
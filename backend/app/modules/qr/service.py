@@ -243,6 +243,7 @@ class QRCodeService:
         dpp_id: str,
         tenant_slug: str | None = None,
         short_link: bool = True,
+        short_slug: str | None = None,
     ) -> str:
         """
         Build the DPP viewer URL for QR code encoding.
@@ -250,6 +251,8 @@ class QRCodeService:
         Args:
             dpp_id: The DPP identifier
             short_link: Use short link format (/p/{slug}) vs full (/dpp/{id})
+            short_slug: The DPP's stored short-link slug. Without one the
+                full URL is built, since id prefixes are not unique.
 
         Returns:
             Complete URL for DPP viewer
@@ -260,12 +263,10 @@ class QRCodeService:
             else "http://localhost:5173"
         )
 
-        if short_link:
-            # Generate short slug (first 8 chars of ID)
-            slug = dpp_id.replace("-", "")[:8]
+        if short_link and short_slug:
             if tenant_slug:
-                return f"{base_url}/t/{tenant_slug}/p/{slug}"
-            return f"{base_url}/p/{slug}"
+                return f"{base_url}/t/{tenant_slug}/p/{short_slug}"
+            return f"{base_url}/p/{short_slug}"
         if tenant_slug:
             return f"{base_url}/t/{tenant_slug}/dpp/{dpp_id}"
         return f"{base_url}/dpp/{dpp_id}"
@@ -6,29 +6,31 @@ Follows the ``_resolve_tenant()`` pattern from ``dpps/public_router.py``.
 from __future__ import annotations
 
 import base64
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
 from pydantic import BaseModel
 from sqlalchemy import select
 
-from app.db.models import ShellDescriptorRecord, Tenant, TenantStatus
+from app.core.etag import etag_matches, not_modified_response, set_validator_headers, strong_etag
+from app.core.tenant_cache import TenantRecord, get_tenant_by_slug
+from app.db.models import ShellDescriptorRecord
 from app.db.session import DbSession
 from app.modules.dpps.idta_schemas import PagedResult, PagingMetadata
 from app.modules.registry.service import BuiltInRegistryService, DiscoveryService
 
 router = APIRouter()
 
+_DISCOVERY_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+_DESCRIPTOR_LIST_CACHE_CONTROL = "public, max-age=60"
+_DESCRIPTOR_CACHE_CONTROL = "public, max-age=300"
 
-async def _resolve_tenant(db: DbSession, tenant_slug: str) -> Tenant:
+IfNoneMatch = Annotated[str | None, Header()]
+
+
+async def _resolve_tenant(db: DbSession, tenant_slug: str) -> TenantRecord:
     """Look up an active tenant by slug (no auth required)."""
-    result = await db.execute(
-        select(Tenant).where(
-            Tenant.slug == tenant_slug.strip().lower(),
-            Tenant.status == TenantStatus.ACTIVE,
-        )
-    )
-    tenant = result.scalar_one_or_none()
+    tenant = await get_tenant_by_slug(db, tenant_slug, active_only=True)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -66,27 +68,44 @@ async def public_discovery_lookup(
     response: Response,
     key: str = Query(..., description="Asset ID key"),
     value: str = Query(..., description="Asset ID value"),
-) -> list[str]:
+    if_none_match: IfNoneMatch = None,
+) -> list[str] | Response:
     """Public discovery: look up AAS IDs by asset ID key/value (no auth)."""
     tenant = await _resolve_tenant(db, tenant_slug)
     svc = DiscoveryService(db)
-    response.headers["Cache-Control"] = "public, max-age=60, stale-while-revalidate=300"
-    return await svc.lookup(tenant.id, key, value)
+    aas_ids = await svc.lookup(tenant.id, key, value)
+    etag = strong_etag("discovery", *aas_ids)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, _DISCOVERY_CACHE_CONTROL)
+    set_validator_headers(response, etag, _DISCOVERY_CACHE_CONTROL)
+    return aas_ids
 
 
-@router.get("/{tenant_slug}/shell-descriptors")
+@router.get(
+    "/{tenant_slug}/shell-descriptors",
+    response_model=PagedResult[PublicShellDescriptorResponse],
+)
 async def public_list_shell_descriptors(
     tenant_slug: str,
     db: DbSession,
     response: Response,
     limit: int = Query(default=10, ge=1, le=100),
     cursor: str | None = Query(default=None),
-) -> PagedResult[PublicShellDescriptorResponse]:
+    if_none_match: IfNoneMatch = None,
+) -> PagedResult[PublicShellDescriptorResponse] | Response:
     """List shell descriptors with cursor-based pagination (no auth)."""
     tenant = await _resolve_tenant(db, tenant_slug)
     svc = BuiltInRegistryService(db)
     records, next_cursor = await svc.list_shell_descriptors_cursor(tenant.id, cursor, limit)
 
+    etag = strong_etag(
+        "shell-descriptors",
+        next_cursor,
+        *(f"{r.aas_id}:{r.updated_at}" for r in records),
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, _DESCRIPTOR_LIST_CACHE_CONTROL)
+
     items = [
         PublicShellDescriptorResponse(
             aas_id=r.aas_id,
@@ -98,7 +117,7 @@ async def public_list_shell_descriptors(
         for r in records
     ]
 
-    response.headers["Cache-Control"] = "public, max-age=60"
+    set_validator_headers(response, etag, _DESCRIPTOR_LIST_CACHE_CONTROL)
     return PagedResult[PublicShellDescriptorResponse](
         result=items,
         paging_metadata=PagingMetadata(cursor=next_cursor),
@@ -114,7 +133,8 @@ async def public_get_shell_descriptor(
     aas_id_b64: str,
     db: DbSession,
     response: Response,
-) -> PublicShellDescriptorResponse:
+    if_none_match: IfNoneMatch = None,
+) -> PublicShellDescriptorResponse | Response:
     """Public shell descriptor lookup by base64-encoded AAS ID (no auth)."""
     tenant = await _resolve_tenant(db, tenant_slug)
     aas_id = _decode_aas_id(aas_id_b64)
@@ -132,7 +152,10 @@ async def public_get_shell_descriptor(
             detail="Not found",
         )
 
-    response.headers["Cache-Control"] = "public, max-age=300"
+    etag = strong_etag("shell-descriptor", record.aas_id, record.updated_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, _DESCRIPTOR_CACHE_CONTROL)
+    set_validator_headers(response, etag, _DESCRIPTOR_CACHE_CONTROL)
     return PublicShellDescriptorResponse(
         aas_id=record.aas_id,
         id_short=record.id_short,
@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.db.models import DPP, DataCarrier, DPPStatus, EPCISEvent, EPCISEventType
+from app.modules.dpps.landing_summary import LandingSummaryService
 from app.modules.epcis.digital_link import parse_digital_link
 from app.modules.rfid.schemas import (
     RFIDDecodeRequest,
@@ -276,6 +277,10 @@ class RFIDService:
             )
 
         await self._session.flush()
+        await LandingSummaryService(self._session).record_epcis_events(
+            tenant_id,
+            [entry.dpp_id for entry in results if entry.dpp_id is not None],
+        )
         logger.info(
             "rfid_ingest_completed",
             tenant_id=str(tenant_id),
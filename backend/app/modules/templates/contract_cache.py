@@ -0,0 +1,191 @@
+"""
+Two-tier cache of generated template contracts.
+
+Generating a contract parses the template, resolves drop-ins against the
+other templates, applies the UoM registry and derives the schema, UoM
+diagnostics and doc hints.  The result only depends on those inputs, so it
+is stored in the ``template_contracts`` table under a digest of them and
+kept in a bounded per-worker LRU in front of it.
+
+Bump :data:`CONTRACT_FORMAT_VERSION` whenever contract generation changes
+its output; older rows then stop matching and are replaced on first use.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import astuple, dataclass
+from datetime import datetime
+from typing import Any
+
+import orjson
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import Template, TemplateContract
+
+logger = get_logger(__name__)
+
+CONTRACT_FORMAT_VERSION = 1
+
+# Contract sections derived from the template content.  Template metadata
+# (source_metadata, display fields) is cheap and may change without a new
+# source, so it is always read from the current row instead.
+CACHED_CONTRACT_SECTIONS = (
+    "definition",
+    "schema",
+    "dropin_resolution_report",
+    "unsupported_nodes",
+    "doc_hints",
+    "uom_diagnostics",
+)
+
+
+@dataclass(frozen=True)
+class TemplateContractKey:
+    """Everything a generated contract is derived from."""
+
+    template_key: str
+    idta_version: str
+    semantic_id: str
+    source_revision: str
+    uom_registry_version: str
+    lookup_fingerprint: str
+    strict_unknown_model_types: bool
+
+    @property
+    def digest(self) -> str:
+        payload = json.dumps([CONTRACT_FORMAT_VERSION, *astuple(self)], separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def template_source_revision(template: Template) -> str | None:
+    """Identify the stored content of ``template``, or ``None`` if it cannot be pinned."""
+    source_file_sha = getattr(template, "source_file_sha", None)
+    if source_file_sha:
+        return str(source_file_sha)
+    fetched_at = getattr(template, "fetched_at", None)
+    if isinstance(fetched_at, datetime):
+        return f"fetched:{fetched_at.isoformat()}"
+    return None
+
+
+def template_lookup_fingerprint(template_lookup: Mapping[str, Template] | None) -> str | None:
+    """Digest the drop-in source templates, or ``None`` if one cannot be pinned."""
+    entries: list[list[str]] = []
+    for source_key, source_template in sorted((template_lookup or {}).items()):
+        revision = template_source_revision(source_template)
+        if revision is None:
+            return None
+        entries.append([source_key, str(source_template.idta_version), revision])
+    payload = json.dumps(entries, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _ContractMemoryTier:
+    """Bounded LRU of serialized contract sections keyed by cache digest.
+
+    Entries are stored as JSON bytes so every hit hands out an independent
+    copy that callers are free to mutate.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, digest: str) -> dict[str, Any] | None:
+        payload = self._entries.get(digest)
+        if payload is None:
+            return None
+        self._entries.move_to_end(digest)
+        sections: dict[str, Any] = orjson.loads(payload)
+        return sections
+
+    def put(self, digest: str, sections: dict[str, Any]) -> None:
+        max_entries = get_settings().template_contract_cache_max_entries
+        if max_entries <= 0:
+            return
+        try:
+            self._entries[digest] = orjson.dumps(sections)
+        except orjson.JSONEncodeError:
+            return
+        self._entries.move_to_end(digest)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_memory_tier = _ContractMemoryTier()
+
+
+class TemplateContractCache:
+    """Read-through access to persisted contracts with an in-memory tier.
+
+    Persistence is best effort: each statement runs in a savepoint, and a
+    failure is logged and treated as a miss so contract generation never
+    fails because of the cache.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, key: TemplateContractKey) -> dict[str, Any] | None:
+        digest = key.digest
+        sections = _memory_tier.get(digest)
+        if sections is not None:
+            return sections
+        try:
+            async with self._session.begin_nested():
+                result = await self._session.execute(
+                    select(TemplateContract.contract).where(TemplateContract.cache_key == digest)
+                )
+                stored = result.scalar_one_or_none()
+        except Exception as exc:
+            logger.warning("template_contract_cache_read_failed", error=str(exc))
+            return None
+        if not isinstance(stored, dict):
+            return None
+        _memory_tier.put(digest, stored)
+        return stored
+
+    async def put(self, key: TemplateContractKey, sections: dict[str, Any]) -> None:
+        digest = key.digest
+        _memory_tier.put(digest, sections)
+        statement = (
+            pg_insert(TemplateContract)
+            .values(
+                cache_key=digest,
+                template_key=key.template_key,
+                idta_version=key.idta_version,
+                source_revision=key.source_revision,
+                uom_registry_version=key.uom_registry_version,
+                lookup_fingerprint=key.lookup_fingerprint,
+                format_version=CONTRACT_FORMAT_VERSION,
+                contract=sections,
+            )
+            .on_conflict_do_nothing(index_elements=["cache_key"])
+        )
+        try:
+            async with self._session.begin_nested():
+                # Contracts of an earlier source of this template can never
+                # match again once it has been refreshed.
+                await self._session.execute(
+                    delete(TemplateContract).where(
+                        TemplateContract.template_key == key.template_key,
+                        TemplateContract.idta_version == key.idta_version,
+                        TemplateContract.source_revision != key.source_revision,
+                    )
+                )
+                await self._session.execute(statement)
+        except Exception as exc:
+            logger.warning("template_contract_cache_write_failed", error=str(exc))
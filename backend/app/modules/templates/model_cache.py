@@ -0,0 +1,226 @@
+"""
+Process-wide cache of parsed BaSyx template models.
+
+Parsing a template AASX or JSON into BaSyx objects is the most expensive
+step of building definitions, creating DPPs and rebuilding them from
+templates, and the result only depends on the stored template source.
+Models are therefore shared across requests, keyed by the template's
+source revision (see :func:`template_source_revision`), in a byte-bounded
+LRU.
+
+Cached models are shared and must be treated as read-only; every consumer
+in the builders deep-copies what it adopts.  Drop-in resolution is the one
+step that mutates a model, so a resolved variant is derived copy-on-write:
+the shared unresolved model is deep-copied once, resolved, and cached under
+the drop-in lookup fingerprint next to its resolution report.
+
+Entry sizes are estimated from the template's JSON serialization, the
+representation the BaSyx object graph mirrors.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import orjson
+from prometheus_client import Counter, Gauge
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import Template
+from app.modules.templates.basyx_parser import ParsedTemplate
+from app.modules.templates.contract_cache import (
+    template_lookup_fingerprint,
+    template_source_revision,
+)
+
+logger = get_logger(__name__)
+
+_lookups_total = Counter(
+    "dpp_template_model_cache_lookups_total",
+    "Parsed template model cache lookups grouped by variant and result.",
+    ("variant", "result"),
+)
+_evictions_total = Counter(
+    "dpp_template_model_cache_evictions_total",
+    "Parsed template models evicted to stay within the byte budget.",
+)
+_cached_bytes = Gauge(
+    "dpp_template_model_cache_bytes",
+    "Estimated size of the parsed template models currently cached.",
+)
+_cached_entries = Gauge(
+    "dpp_template_model_cache_entries",
+    "Parsed template models currently cached.",
+)
+
+# (template_key, idta_version, source_revision, expected_semantic_id, lookup_fingerprint)
+_ModelKey = tuple[str, str, str, str | None, str | None]
+
+
+@dataclass(frozen=True)
+class ResolvedTemplateModel:
+    """A parsed template with drop-ins applied and the per-element resolution report."""
+
+    parsed: ParsedTemplate
+    resolution_by_element_id: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class TemplateModelCacheStats:
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class TemplateModelCache:
+    """Byte-bounded LRU of shared template models."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[_ModelKey, tuple[ResolvedTemplateModel, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: _ModelKey) -> ResolvedTemplateModel | None:
+        variant = "unresolved" if key[4] is None else "resolved"
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            _lookups_total.labels(variant=variant, result="miss").inc()
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        _lookups_total.labels(variant=variant, result="hit").inc()
+        return entry[0]
+
+    def put(self, key: _ModelKey, model: ResolvedTemplateModel, size_bytes: int) -> None:
+        max_bytes = get_settings().template_model_cache_max_bytes
+        if size_bytes > max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size_bytes -= previous[1]
+        self._entries[key] = (model, size_bytes)
+        self._size_bytes += size_bytes
+        while self._size_bytes > max_bytes:
+            evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size
+            self._evictions += 1
+            _evictions_total.inc()
+            logger.debug(
+                "template_model_evicted",
+                template_key=evicted_key[0],
+                version=evicted_key[1],
+                size_bytes=evicted_size,
+            )
+        _cached_bytes.set(self._size_bytes)
+        _cached_entries.set(len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+        self._hits = self._misses = self._evictions = 0
+        _cached_bytes.set(0)
+        _cached_entries.set(0)
+
+    def stats(self) -> TemplateModelCacheStats:
+        return TemplateModelCacheStats(
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+            max_bytes=get_settings().template_model_cache_max_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+
+_models = TemplateModelCache()
+
+
+def template_model_cache_stats() -> TemplateModelCacheStats:
+    """Return size and hit/miss/eviction counters of the process-wide cache."""
+    return _models.stats()
+
+
+def _model_key(
+    template: Template,
+    expected_semantic_id: str | None,
+    lookup_fingerprint: str | None,
+) -> _ModelKey | None:
+    source_revision = template_source_revision(template)
+    if source_revision is None:
+        return None
+    return (
+        str(template.template_key),
+        str(template.idta_version),
+        source_revision,
+        expected_semantic_id,
+        lookup_fingerprint,
+    )
+
+
+def _estimated_size(template: Template) -> int:
+    try:
+        return len(orjson.dumps(template.template_json))
+    except (TypeError, orjson.JSONEncodeError):
+        return len(template.template_aasx or b"")
+
+
+def load_parsed_template(
+    template: Template,
+    expected_semantic_id: str | None,
+    load: Callable[[], ParsedTemplate],
+) -> ParsedTemplate:
+    """Return the shared, read-only parsed model of ``template``.
+
+    ``load`` parses the template on a miss; its exceptions propagate and
+    nothing is cached.
+    """
+    key = _model_key(template, expected_semantic_id, None)
+    if key is None:
+        return load()
+    cached = _models.get(key)
+    if cached is not None:
+        return cached.parsed
+    parsed = load()
+    _models.put(key, ResolvedTemplateModel(parsed=parsed), _estimated_size(template))
+    return parsed
+
+
+def load_resolved_template(
+    template: Template,
+    expected_semantic_id: str | None,
+    template_lookup: Mapping[str, Template],
+    *,
+    load: Callable[[], ParsedTemplate],
+    resolve: Callable[[ParsedTemplate], dict[int, dict[str, Any]]],
+) -> ResolvedTemplateModel:
+    """Return the shared model of ``template`` with drop-ins from ``template_lookup`` applied.
+
+    On a miss the shared unresolved model is deep-copied and passed to
+    ``resolve``, which may mutate it and returns the resolution report.
+    """
+    fingerprint = template_lookup_fingerprint(template_lookup)
+    key = _model_key(template, expected_semantic_id, fingerprint) if fingerprint else None
+    if key is not None:
+        cached = _models.get(key)
+        if cached is not None:
+            return cached
+
+    if _model_key(template, expected_semantic_id, None) is None:
+        parsed = load()  # not shared, so no copy is needed
+    else:
+        parsed = copy.deepcopy(load_parsed_template(template, expected_semantic_id, load))
+    resolved = ResolvedTemplateModel(parsed=parsed, resolution_by_element_id=resolve(parsed))
+    if key is not None:
+        _models.put(key, resolved, _estimated_size(template))
+    return resolved
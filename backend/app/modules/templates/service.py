@@ -27,21 +27,32 @@ from app.db.models import Template
 from app.modules.aas.references import reference_to_str
 from app.modules.aas.semantic_ids import normalize_semantic_id
 from app.modules.semantic_registry import resolve_known_template_key_by_semantic_id
-from app.modules.templates.basyx_parser import BasyxTemplateParser
+from app.modules.templates.basyx_parser import BasyxTemplateParser, ParsedTemplate
 from app.modules.templates.catalog import (
     TemplateDescriptor,
     get_template_descriptor,
     list_template_keys,
 )
+from app.modules.templates.contract_cache import (
+    TemplateContractCache,
+    TemplateContractKey,
+    template_lookup_fingerprint,
+    template_source_revision,
+)
 from app.modules.templates.definition import TemplateDefinitionBuilder
 from app.modules.templates.dropin_resolver import TemplateDropInResolver
+from app.modules.templates.model_cache import load_parsed_template, load_resolved_template
 from app.modules.templates.schema_from_definition import DefinitionToSchemaConverter
 from app.modules.units.models import UomDataSpecification, UomRegistryEntry
 from app.modules.units.payload import (
     collect_uom_by_cd_id,
     strip_uom_data_specifications,
 )
-from app.modules.units.registry import UomRegistryService, build_registry_indexes
+from app.modules.units.registry import (
+    UomRegistryService,
+    build_registry_indexes,
+    registry_fingerprint,
+)
 from app.modules.units.validation import build_uom_diagnostics, resolve_uom_for_unit_reference
 
 logger = get_logger(__name__)
@@ -480,33 +491,36 @@ class TemplateRegistryService:
         expected_semantic_id = (
             descriptor.semantic_id if descriptor is not None else template.semantic_id
         )
-        parsed = self._parse_template_model(template, expected_semantic_id)
         resolution_by_element_id: dict[int, dict[str, Any]] = {}
         if template_lookup:
-            parsed_by_template: dict[str, Any] = {}
 
             def source_provider(source_template_key: str) -> model.Submodel | None:
                 source_template = template_lookup.get(source_template_key)
                 if source_template is None:
                     return None
-                if source_template_key not in parsed_by_template:
-                    source_descriptor = get_template_descriptor(source_template_key)
-                    expected_semantic_id = (
-                        source_descriptor.semantic_id
-                        if source_descriptor is not None
-                        else source_template.semantic_id
-                    )
-                    parsed_by_template[source_template_key] = self._parse_template_model(
-                        source_template,
-                        expected_semantic_id,
-                    )
-                return cast(model.Submodel, parsed_by_template[source_template_key].submodel)
-
-            resolution_by_element_id = TemplateDropInResolver().resolve(
-                template_key=template.template_key,
-                submodel=parsed.submodel,
-                source_provider=source_provider,
+                source_descriptor = get_template_descriptor(source_template_key)
+                expected_semantic_id = (
+                    source_descriptor.semantic_id
+                    if source_descriptor is not None
+                    else source_template.semantic_id
+                )
+                return self._load_template_model(source_template, expected_semantic_id).submodel
+
+            resolved = load_resolved_template(
+                template,
+                expected_semantic_id,
+                template_lookup,
+                load=lambda: self._parse_template_model(template, expected_semantic_id),
+                resolve=lambda target: TemplateDropInResolver().resolve(
+                    template_key=template.template_key,
+                    submodel=target.submodel,
+                    source_provider=source_provider,
+                ),
             )
+            parsed = resolved.parsed
+            resolution_by_element_id = resolved.resolution_by_element_id
+        else:
+            parsed = self._load_template_model(template, expected_semantic_id)
 
         builder = TemplateDefinitionBuilder(
             resolution_by_element_id=resolution_by_element_id,
@@ -529,6 +543,18 @@ class TemplateRegistryService:
 
         return definition
 
+    def _load_template_model(
+        self,
+        template: Template,
+        expected_semantic_id: str | None,
+    ) -> ParsedTemplate:
+        """Return the shared, read-only parsed model of ``template``."""
+        return load_parsed_template(
+            template,
+            expected_semantic_id,
+            lambda: self._parse_template_model(template, expected_semantic_id),
+        )
+
     def _parse_template_model(
         self,
         template: Template,
@@ -1882,6 +1908,72 @@ class TemplateRegistryService:
         template_lookup: Mapping[str, Template] | None = None,
         *,
         strict_unknown_model_types: bool = False,
+    ) -> dict[str, Any]:
+        registry_indexes = await self._load_uom_registry_indexes()
+        cache_key = self._template_contract_key(
+            template,
+            template_lookup,
+            registry_by_cd_id=registry_indexes[0],
+            strict_unknown_model_types=strict_unknown_model_types,
+        )
+        contract_cache = TemplateContractCache(self._session)
+        sections = await contract_cache.get(cache_key) if cache_key is not None else None
+        if sections is None:
+            sections = self._build_template_contract_sections(
+                template,
+                template_lookup,
+                registry_indexes=registry_indexes,
+                strict_unknown_model_types=strict_unknown_model_types,
+            )
+            if cache_key is not None:
+                await contract_cache.put(cache_key, sections)
+        return {
+            "template_key": template.template_key,
+            "idta_version": template.idta_version,
+            "semantic_id": template.semantic_id,
+            "definition": sections["definition"],
+            "schema": sections["schema"],
+            "source_metadata": self._source_metadata(template),
+            "dropin_resolution_report": sections["dropin_resolution_report"],
+            "unsupported_nodes": sections["unsupported_nodes"],
+            "doc_hints": sections["doc_hints"],
+            "uom_diagnostics": sections["uom_diagnostics"],
+        }
+
+    def _template_contract_key(
+        self,
+        template: Template,
+        template_lookup: Mapping[str, Template] | None,
+        *,
+        registry_by_cd_id: dict[str, UomRegistryEntry],
+        strict_unknown_model_types: bool,
+    ) -> TemplateContractKey | None:
+        """Return the contract cache key, or ``None`` when an input cannot be pinned."""
+        source_revision = template_source_revision(template)
+        lookup_fingerprint = template_lookup_fingerprint(template_lookup)
+        if source_revision is None or lookup_fingerprint is None:
+            return None
+        return TemplateContractKey(
+            template_key=template.template_key,
+            idta_version=template.idta_version,
+            semantic_id=str(template.semantic_id),
+            source_revision=source_revision,
+            uom_registry_version=registry_fingerprint(registry_by_cd_id.values()),
+            lookup_fingerprint=lookup_fingerprint,
+            strict_unknown_model_types=strict_unknown_model_types,
+        )
+
+    def _build_template_contract_sections(
+        self,
+        template: Template,
+        template_lookup: Mapping[str, Template] | None,
+        *,
+        registry_indexes: tuple[
+            dict[str, UomRegistryEntry],
+            dict[str, list[UomRegistryEntry]],
+            dict[str, list[UomRegistryEntry]],
+        ],
+        strict_unknown_model_types: bool,
     ) -> dict[str, Any]:
         definition = self._generate_template_definition(template, template_lookup=template_lookup)
         concept_descriptions = [
@@ -1890,11 +1982,7 @@ class TemplateRegistryService:
             if isinstance(concept_description, dict)
         ]
         template_uom_by_cd_id = self._template_raw_uom_entries(template)
-        (
-            registry_by_cd_id,
-            registry_by_specific_unit_id,
-            registry_by_symbol,
-        ) = await self._load_uom_registry_indexes()
+        registry_by_cd_id, registry_by_specific_unit_id, registry_by_symbol = registry_indexes
         self._apply_uom_resolution_to_definition(
             concept_descriptions=concept_descriptions,
             template_uom_by_cd_id=template_uom_by_cd_id,
@@ -1926,12 +2014,8 @@ class TemplateRegistryService:
         )
         doc_hints = self._build_doc_hints(definition=definition, template=template)
         return {
-            "template_key": template.template_key,
-            "idta_version": template.idta_version,
-            "semantic_id": template.semantic_id,
             "definition": definition,
             "schema": schema,
-            "source_metadata": self._source_metadata(template),
             "dropin_resolution_report": dropin_resolution_report,
             "unsupported_nodes": unsupported_nodes,
             "doc_hints": doc_hints,
@@ -9,6 +9,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tenant_cache import get_tenant_id_by_hostname
 from app.db.models import TenantDomain, TenantDomainStatus
 
 _HOSTNAME_RE = re.compile(
@@ -139,13 +140,17 @@ class TenantDomainService:
 
     async def resolve_active_tenant_by_hostname(self, hostname: str) -> UUID | None:
         normalized = self.normalize_hostname(hostname)
-        result = await self._session.execute(
-            select(TenantDomain.tenant_id).where(
-                TenantDomain.hostname == normalized,
-                TenantDomain.status == TenantDomainStatus.ACTIVE,
+
+        async def _load() -> UUID | None:
+            result = await self._session.execute(
+                select(TenantDomain.tenant_id).where(
+                    TenantDomain.hostname == normalized,
+                    TenantDomain.status == TenantDomainStatus.ACTIVE,
+                )
             )
-        )
-        return result.scalar_one_or_none()
+            return result.scalar_one_or_none()
+
+        return await get_tenant_id_by_hostname(normalized, _load)
 
     async def get_primary_active_domain(self, tenant_id: UUID) -> TenantDomain | None:
         result = await self._session.execute(
@@ -5,12 +5,17 @@ from app.modules.units.payload import (
     collect_uom_by_cd_id,
     strip_uom_data_specifications,
 )
-from app.modules.units.registry import UomRegistryService, build_registry_indexes
+from app.modules.units.registry import (
+    UomRegistryService,
+    build_registry_indexes,
+    registry_fingerprint,
+)
 from app.modules.units.validation import build_uom_diagnostics
 
 __all__ = [
     "UomRegistryService",
     "build_registry_indexes",
+    "registry_fingerprint",
     "collect_uom_by_cd_id",
     "strip_uom_data_specifications",
     "build_uom_diagnostics",
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -159,6 +161,13 @@ def registry_entries_to_payload(entries: list[UomRegistryEntry]) -> list[dict[st
     return payload
 
 
+def registry_fingerprint(entries: Iterable[UomRegistryEntry]) -> str:
+    """Return a SHA-256 over the effective registry, for keying caches derived from it."""
+    payload = registry_entries_to_payload(list(entries))
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 def _resolve_seed_path() -> Path | None:
     settings = get_settings()
     override = settings.uom_registry_seed_path
@@ -2,6 +2,7 @@
 
 import asyncio
 import secrets
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
@@ -16,7 +17,12 @@ from app.modules.webhooks.client import deliver_webhook
 logger = get_logger(__name__)
 
 # Limit concurrent webhook deliveries to prevent resource exhaustion
-_delivery_semaphore = asyncio.Semaphore(20)
+DELIVERY_CONCURRENCY = 20
+_delivery_semaphore = asyncio.Semaphore(DELIVERY_CONCURRENCY)
+
+
+class WebhookDeliveryError(Exception):
+    """Raised when an awaited event delivery did not reach every subscription."""
 
 
 class WebhookService:
@@ -223,3 +229,86 @@ async def trigger_webhooks(
         asyncio.create_task(
             _deliver_in_background(sub.id, sub.url, sub.secret, event_type, payload)
         )
+
+
+async def _delivered_subscription_ids(
+    db: AsyncSession, subscription_ids: list[UUID], event_id: str, since: datetime
+) -> set[UUID]:
+    """Subscriptions that already accepted ``event_id`` (logged at or after ``since``)."""
+    result = await db.execute(
+        select(WebhookDeliveryLog.subscription_id).where(
+            WebhookDeliveryLog.created_at >= since,
+            WebhookDeliveryLog.subscription_id.in_(subscription_ids),
+            WebhookDeliveryLog.success.is_(True),
+            WebhookDeliveryLog.payload["event_id"].astext == event_id,
+        )
+    )
+    return set(result.scalars().all())
+
+
+async def deliver_event(
+    db: AsyncSession,
+    tenant_id: UUID,
+    event_type: str,
+    payload: dict[str, Any],
+    *,
+    event_id: str,
+    since: datetime,
+    attempt: int = 1,
+) -> None:
+    """
+    Deliver an event to every matching subscription and wait for the outcome.
+
+    Unlike :func:`trigger_webhooks` this raises :class:`WebhookDeliveryError`
+    when any subscription answered non-2xx or could not be reached, so the
+    caller can retry the event.  Subscriptions that already accepted
+    ``event_id`` since ``since`` are skipped, so a retry only re-sends to the
+    ones that failed.  Each attempt is logged in its own session as soon as it
+    finishes, so the logs survive the caller rolling back or giving up early.
+    """
+    settings = get_settings()
+    if not settings.webhook_enabled:
+        return
+
+    subs = await WebhookService(db)._find_matching_subscriptions(tenant_id, event_type)
+    if subs and attempt > 1:
+        delivered = await _delivered_subscription_ids(db, [sub.id for sub in subs], event_id, since)
+        subs = [sub for sub in subs if sub.id not in delivered]
+    if not subs:
+        return
+
+    body = {**payload, "event_id": event_id}
+
+    from app.db.session import get_background_session
+
+    async def _deliver(sub: WebhookSubscription) -> str | None:
+        async with _delivery_semaphore:
+            http_status, response_body, error = await deliver_webhook(
+                url=sub.url, payload=body, secret=sub.secret
+            )
+        success = http_status is not None and 200 <= http_status < 300
+        # Log each outcome as soon as it is known, so a retry after the caller
+        # gives up part-way still skips the subscriptions that accepted it.
+        async with get_background_session() as log_db:
+            log_db.add(
+                WebhookDeliveryLog(
+                    subscription_id=sub.id,
+                    event_type=event_type,
+                    payload=body,
+                    http_status=http_status,
+                    response_body=response_body,
+                    attempt=attempt,
+                    success=success,
+                    error_message=error,
+                )
+            )
+            await log_db.commit()
+        return None if success else f"{sub.id}: {error or f'HTTP {http_status}'}"
+
+    outcomes = await asyncio.gather(*(_deliver(sub) for sub in subs))
+    failures = [failure for failure in outcomes if failure is not None]
+    if failures:
+        raise WebhookDeliveryError(
+            f"Delivery failed for {len(failures)} of {len(subs)} subscriptions: "
+            + "; ".join(failures)
+        )
@@ -12,12 +12,17 @@ from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.crypto.canonicalization import (
-    CANONICALIZATION_RFC8785,
+    CANONICALIZATION_RFC8785_MERKLE_V1,
     SHA256_ALGORITHM,
-    sha256_hex_for_canonicalization,
+)
+from app.core.crypto.environment_digest import (
+    compute_environment_digest,
+    reusable_submodel_digests,
+    stored_environment_digest,
 )
 from app.db.models import DPP, DPPRevision
 from app.modules.dpps.canonical_patch import apply_canonical_patch
+from app.modules.dpps.revision_store import add_revision, materialize_revision
 from app.opcua_agent.deadletter import record_dead_letter
 from app.opcua_agent.ingestion_buffer import BufferEntry, IngestionBuffer
 
@@ -175,6 +180,7 @@ async def _flush_single_dpp(
         .limit(1)
     )
     latest_rev = (await session.scalars(latest_rev_stmt)).first()
+    await materialize_revision(session, latest_rev)
     if latest_rev is None:
         logger.warning("DPP %s has no revisions — skipping flush", dpp_id)
         return FlushOutcome(
@@ -196,10 +202,19 @@ async def _flush_single_dpp(
         )
         current_env = result.aas_env_json
 
-    # Compute digest using RFC 8785 canonicalization for new writes.
-    digest = sha256_hex_for_canonicalization(
+    # Only the patched submodels changed, so every other Merkle leaf of the
+    # previous revision is carried over instead of being rehashed.
+    previous_digest = stored_environment_digest(
+        latest_rev.digest_canonicalization,
+        latest_rev.digest_sha256,
+        latest_rev.digest_leaves,
+    )
+    digest = compute_environment_digest(
         current_env,
-        canonicalization=CANONICALIZATION_RFC8785,
+        reuse=reusable_submodel_digests(
+            previous_digest,
+            changed_submodel_ids=[patch["submodel_id"] for patch in patches],
+        ),
     )
 
     # Create new revision
@@ -210,14 +225,14 @@ async def _flush_single_dpp(
         revision_no=new_revision_no,
         state=latest_rev.state,
         aas_env_json=current_env,
-        digest_sha256=digest,
+        digest_sha256=digest.root,
         digest_algorithm=SHA256_ALGORITHM,
-        digest_canonicalization=CANONICALIZATION_RFC8785,
+        digest_canonicalization=CANONICALIZATION_RFC8785_MERKLE_V1,
+        digest_leaves=digest.to_json(),
         created_by_subject="opcua-agent",
         template_provenance=latest_rev.template_provenance or {},
     )
-    session.add(new_rev)
-    await session.flush()
+    await add_revision(session, new_rev, parent=latest_rev)
 
     logger.info(
         "Flushed DPP %s: revision %d -> %d (%d entries)",
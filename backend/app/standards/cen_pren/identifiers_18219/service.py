@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from urllib.parse import urlparse, urlunparse
 from uuid import UUID
@@ -232,6 +233,28 @@ class IdentifierService:
         )
         return result.scalar_one_or_none() is not None
 
+    async def product_identified_dpp_ids(
+        self, *, tenant_id: UUID, dpp_ids: Sequence[UUID]
+    ) -> set[UUID]:
+        """Subset of ``dpp_ids`` linked to at least one active product identifier."""
+        if not dpp_ids:
+            return set()
+        result = await self._session.execute(
+            select(DPPIdentifier.dpp_id)
+            .join(
+                ExternalIdentifier,
+                DPPIdentifier.external_identifier_id == ExternalIdentifier.id,
+            )
+            .where(
+                DPPIdentifier.tenant_id == tenant_id,
+                DPPIdentifier.dpp_id.in_(dpp_ids),
+                ExternalIdentifier.entity_type == IdentifierEntityType.PRODUCT,
+                ExternalIdentifier.status == ExternalIdentifierStatus.ACTIVE,
+            )
+            .distinct()
+        )
+        return set(result.scalars().all())
+
     async def ensure_dpp_product_identifier_from_asset_ids(
         self,
         *,
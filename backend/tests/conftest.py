@@ -45,6 +45,13 @@ def ensure_test_allowed_issuers(monkeypatch: pytest.MonkeyPatch) -> None:
     get_settings.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def disable_public_response_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the shared Redis response cache out of tests unless a test opts in."""
+    monkeypatch.setenv("PUBLIC_RESPONSE_CACHE_ENABLED", "false")
+    get_settings.cache_clear()
+
+
 @pytest_asyncio.fixture
 async def test_engine():
     """Create test database engine."""
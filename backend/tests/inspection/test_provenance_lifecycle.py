@@ -47,7 +47,15 @@ PROVENANCE_EXPECTED_KEYS = {
 def _session_mock() -> AsyncMock:
     session = AsyncMock()
     session.add = MagicMock()
-    session.flush = AsyncMock()
+
+    async def _flush() -> None:
+        # Mimic the server-side UUID defaults assigned on flush
+        for call in session.add.call_args_list:
+            if getattr(call.args[0], "id", None) is None:
+                call.args[0].id = uuid4()
+
+    session.flush = AsyncMock(side_effect=_flush)
+    session.execute = AsyncMock(return_value=MagicMock())
     session.commit = AsyncMock()
     return session
 
@@ -457,6 +465,7 @@ class TestPublishProvenance:
         )
         dpp = SimpleNamespace(
             id=uuid4(),
+            asset_ids={},
             tenant_id=uuid4(),
             status=DPPStatus.DRAFT,
             current_published_revision_id=None,
@@ -492,6 +501,7 @@ class TestPublishProvenance:
         )
         dpp = SimpleNamespace(
             id=uuid4(),
+            asset_ids={},
             tenant_id=uuid4(),
             status=DPPStatus.PUBLISHED,
             current_published_revision_id=revision.id,
@@ -524,6 +534,7 @@ class TestPublishProvenance:
         )
         dpp = SimpleNamespace(
             id=uuid4(),
+            asset_ids={},
             tenant_id=uuid4(),
             status=DPPStatus.DRAFT,
             current_published_revision_id=None,
@@ -851,6 +862,7 @@ class TestProvenanceNullSafety:
         )
         dpp = SimpleNamespace(
             id=uuid4(),
+            asset_ids={},
             tenant_id=uuid4(),
             status=DPPStatus.DRAFT,
             current_published_revision_id=None,
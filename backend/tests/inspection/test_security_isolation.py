@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from app.modules.dpps.public_router import _filter_public_aas_environment
+from app.modules.dpps.public_projection import filter_public_aas_environment
 from app.modules.dpps.submodel_filter import filter_aas_env_by_espr_tier
 
 
@@ -62,7 +62,7 @@ def test_public_filter_removes_sensitive_keys_and_confidential_elements() -> Non
         },
         "submodels": _aas_env_fixture()["submodels"],
     }
-    filtered = _filter_public_aas_environment(env)
+    filtered = filter_public_aas_environment(env)
 
     # Sensitive top-level key should be stripped by public filtering
     assert "serialNumber" not in str(filtered)
@@ -185,6 +185,76 @@ async def test_flush_single_dpp_deadletters_when_no_revision() -> None:
     assert "no revisions" in (outcome.reason or "").lower()
 
 
+@pytest.mark.asyncio
+async def test_flush_single_dpp_carries_over_unpatched_digest_leaves() -> None:
+    """Only the patched submodel is rehashed; other Merkle leaves are reused."""
+    from app.core.crypto.canonicalization import CANONICALIZATION_RFC8785_MERKLE_V1
+    from app.core.crypto.environment_digest import compute_environment_digest
+    from app.opcua_agent.flush_engine import _flush_single_dpp
+
+    env = {
+        "submodels": [
+            {
+                "id": "sm-1",
+                "submodelElements": [
+                    {"modelType": "Property", "idShort": "Pressure", "value": "1000"}
+                ],
+            },
+            {"id": "sm-2", "submodelElements": []},
+        ]
+    }
+    previous = compute_environment_digest(env)
+    latest_rev = MagicMock(
+        revision_no=3,
+        aas_env_json=env,
+        digest_sha256=previous.root,
+        digest_canonicalization=CANONICALIZATION_RFC8785_MERKLE_V1,
+        digest_leaves=previous.to_json(),
+        template_provenance={},
+    )
+    # A stale leaf for sm-2 proves it is carried over rather than rehashed.
+    latest_rev.digest_leaves["submodels"][1]["sha256"] = "e" * 64
+    latest_rev.digest_sha256 = compute_environment_digest(env, reuse={"sm-2": "e" * 64}).root
+
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
+    lock_result = MagicMock()
+    lock_result.scalar.return_value = True
+    mock_session.execute.return_value = lock_result
+    mock_session.get.return_value = MagicMock()
+    scalars_result = MagicMock()
+    scalars_result.first.return_value = latest_rev
+    mock_session.scalars.return_value = scalars_result
+
+    outcome = await _flush_single_dpp(
+        session=mock_session,
+        tenant_id=uuid.uuid4(),
+        dpp_id=uuid.uuid4(),
+        entries=[
+            BufferEntry(
+                tenant_id=uuid.uuid4(),
+                dpp_id=uuid.uuid4(),
+                mapping_id=uuid.uuid4(),
+                target_submodel_id="sm-1",
+                target_aas_path="Pressure",
+                value=1013.0,
+                timestamp=datetime.now(tz=UTC),
+            )
+        ],
+    )
+
+    assert outcome.status == "ok"
+    new_rev = mock_session.add.call_args.args[0]
+    assert new_rev.digest_canonicalization == CANONICALIZATION_RFC8785_MERKLE_V1
+    leaves = new_rev.digest_leaves["submodels"]
+    assert leaves[0]["sha256"] != previous.submodels[0].sha256
+    assert leaves[1]["sha256"] == "e" * 64
+    assert (
+        new_rev.digest_sha256
+        == compute_environment_digest(new_rev.aas_env_json, reuse={"sm-2": "e" * 64}).root
+    )
+
+
 class _DummyTxn:
     async def __aenter__(self):
         return None
@@ -1,5 +1,14 @@
 """Tests for AAS conformance validation."""
 
+import copy
+import io
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.modules.aas import conformance
 from app.modules.aas.conformance import AASValidationResult, validate_aas_environment
 
 
@@ -230,3 +239,66 @@ class TestValidateAASEnvironment:
         }
         result = validate_aas_environment(env)
         assert any("globalAssetId" in w for w in result.warnings)
+
+
+class TestIncrementalValidation:
+    def setup_method(self) -> None:
+        conformance._part_validations.clear()
+
+    def teardown_method(self) -> None:
+        conformance._part_validations.clear()
+
+    @staticmethod
+    def _env_with_submodels(count: int) -> dict:
+        env = _minimal_aas_env()
+        template = env["submodels"][0]
+        env["submodels"] = [{**copy.deepcopy(template), "id": f"urn:sm:{i}"} for i in range(count)]
+        return env
+
+    def test_unchanged_submodels_reuse_cached_results(self) -> None:
+        env = self._env_with_submodels(3)
+        validate_aas_environment(env)
+
+        env["submodels"][1]["submodelElements"][0]["value"][0]["text"] = "Changed Corp"
+        with patch.object(
+            conformance.basyx_json,
+            "read_aas_json_file",
+            wraps=conformance.basyx_json.read_aas_json_file,
+        ) as reader:
+            result = validate_aas_environment(env)
+
+        assert result.is_valid is True
+        # Lenient and strict read of the one changed submodel only
+        assert reader.call_count == 2
+
+    def test_cached_results_keep_warnings(self) -> None:
+        env = _minimal_aas_env()
+        env["submodels"][0]["submodelElements"].append(
+            {"idShort": "NoSemanticProp", "modelType": "Property", "valueType": "xs:string"}
+        )
+
+        first = validate_aas_environment(env)
+        second = validate_aas_environment(env)
+
+        assert second.warnings == first.warnings
+        assert any("NoSemanticProp" in w for w in second.warnings)
+
+    def test_duplicate_ids_across_submodels_match_a_whole_document_read(self) -> None:
+        env = self._env_with_submodels(2)
+        env["submodels"][1]["id"] = "urn:sm:0"
+        payload = json.dumps(env, sort_keys=True, ensure_ascii=False)
+        with pytest.raises(KeyError) as excinfo:
+            conformance.basyx_json.read_aas_json_file(io.StringIO(payload), failsafe=False)
+
+        result = validate_aas_environment(env)
+
+        assert result.is_valid is False
+        assert result.errors == [f"BaSyx strict deserialization failed: {excinfo.value}"]
+
+    def test_cache_can_be_disabled(self) -> None:
+        settings = SimpleNamespace(aas_validation_cache_max_entries=0)
+        with patch.object(conformance, "get_settings", return_value=settings):
+            result = validate_aas_environment(_minimal_aas_env())
+
+        assert result.is_valid is True
+        assert len(conformance._part_validations) == 0
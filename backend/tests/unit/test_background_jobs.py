@@ -0,0 +1,213 @@
+"""Tests for the shared background job pool and claimed-job runner."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core import background_jobs
+from app.core.background_jobs import (
+    ClaimedJobRunner,
+    JobWorkerPool,
+    discover_in_tenants,
+    record_chunk_attempt,
+)
+from app.db.models import BatchImportJob, BatchImportJobItem, DPPRebuildJob
+
+TENANT_ID = uuid4()
+
+
+def _pool(*, share_jobs: bool) -> JobWorkerPool[Any]:
+    blocked = asyncio.Event()
+
+    async def run(_key: Any) -> None:
+        await blocked.wait()
+
+    return JobWorkerPool("test", run, AsyncMock(return_value=[]), share_jobs=share_jobs)
+
+
+@pytest.mark.asyncio
+async def test_unshared_keys_wait_in_the_queue_once() -> None:
+    pool = _pool(share_jobs=False)
+    assert pool.enqueue(TENANT_ID) is False
+
+    pool.start(2, 3600)
+    try:
+        assert pool.enqueue(TENANT_ID) is True
+        assert pool.enqueue(TENANT_ID) is True
+        assert pool._queue is not None and pool._queue.qsize() == 1
+    finally:
+        await pool.stop()
+
+    assert pool.enqueue(TENANT_ID) is False
+
+
+@pytest.mark.asyncio
+async def test_shared_jobs_are_queued_once_per_worker() -> None:
+    pool = _pool(share_jobs=True)
+    pool.start(3, 3600)
+    try:
+        pool.enqueue((TENANT_ID, uuid4()))
+        assert pool._queue is not None and pool._queue.qsize() == 3
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_discovery_queries_each_tenant_in_its_own_scoped_session() -> None:
+    other_tenant, job_id = uuid4(), uuid4()
+    scoped: list[UUID] = []
+
+    @contextlib.asynccontextmanager
+    async def tenant_session(tenant_id: UUID) -> AsyncIterator[MagicMock]:
+        scoped.append(tenant_id)
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock())
+        rows = [job_id] if tenant_id == TENANT_ID else []
+        session.execute.return_value.scalars.return_value.all.return_value = rows
+        yield session
+
+    with (
+        patch.object(
+            background_jobs,
+            "list_tenant_ids",
+            AsyncMock(return_value=[TENANT_ID, other_tenant]),
+        ),
+        patch.object(background_jobs, "get_tenant_background_session", tenant_session),
+    ):
+        found = await discover_in_tenants(
+            lambda tenant_id: select(DPPRebuildJob.id).where(DPPRebuildJob.tenant_id == tenant_id)
+        )
+
+    assert scoped == [TENANT_ID, other_tenant]
+    assert found == [(TENANT_ID, job_id)]
+
+
+@pytest.mark.asyncio
+async def test_failed_work_finishes_the_job_with_its_error() -> None:
+    work = AsyncMock(side_effect=RuntimeError("templates unavailable"))
+    runner = ClaimedJobRunner(
+        "test", DPPRebuildJob, work, stale_seconds=lambda: 300, poll_interval_seconds=lambda: 0
+    )
+    finish = AsyncMock()
+
+    with (
+        patch.object(runner, "claim", AsyncMock(return_value=True)),
+        patch.object(runner, "finish", finish),
+    ):
+        assert await runner.run(TENANT_ID, uuid4()) is True
+
+    assert finish.await_args.kwargs == {"error": "templates unavailable"}
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_is_refreshed_while_work_runs() -> None:
+    async def work(*_args: Any) -> None:
+        await asyncio.sleep(0.01)
+
+    runner = ClaimedJobRunner(
+        "test", DPPRebuildJob, work, stale_seconds=lambda: 0, poll_interval_seconds=lambda: 0
+    )
+    heartbeat = AsyncMock(return_value=True)
+    job_id = uuid4()
+
+    with (
+        patch.object(runner, "claim", AsyncMock(return_value=True)),
+        patch.object(runner, "heartbeat", heartbeat),
+    ):
+        assert await runner.run(TENANT_ID, job_id) is True
+        beats = heartbeat.await_count
+        await asyncio.sleep(0.01)
+
+    assert beats > 0
+    assert heartbeat.await_count == beats
+    assert heartbeat.await_args.args[:2] == (TENANT_ID, job_id)
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_only_touches_the_claim_it_holds() -> None:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.execute.return_value.scalar_one_or_none.return_value = None
+    session.commit = AsyncMock()
+
+    @contextlib.asynccontextmanager
+    async def tenant_session(_tenant_id: UUID) -> AsyncIterator[MagicMock]:
+        yield session
+
+    runner = ClaimedJobRunner(
+        "test",
+        DPPRebuildJob,
+        AsyncMock(),
+        stale_seconds=lambda: 300,
+        poll_interval_seconds=lambda: 0,
+    )
+    with patch.object(background_jobs, "get_tenant_background_session", tenant_session):
+        assert await runner.heartbeat(TENANT_ID, uuid4(), uuid4()) is False
+
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "SET heartbeat_at=now()" in sql
+    assert "dpp_rebuild_jobs.worker_token = %(worker_token_1)s" in sql
+
+
+def test_resumable_jobs_are_queued_or_have_a_stale_heartbeat() -> None:
+    runner = ClaimedJobRunner(
+        "test",
+        DPPRebuildJob,
+        AsyncMock(),
+        stale_seconds=lambda: 300,
+        poll_interval_seconds=lambda: 0,
+    )
+
+    sql = str(runner.resumable().compile(dialect=postgresql.dialect()))
+
+    assert "dpp_rebuild_jobs.status = %(status_1)s" in sql
+    assert "dpp_rebuild_jobs.heartbeat_at IS NULL" in sql
+    assert "dpp_rebuild_jobs.heartbeat_at < %(heartbeat_at_1)s" in sql
+
+
+@pytest.mark.asyncio
+async def test_chunk_attempts_are_committed_before_work_and_capped() -> None:
+    job_id = uuid4()
+    items = [
+        SimpleNamespace(
+            id=uuid4(), job_id=job_id, tenant_id=TENANT_ID, attempts=attempts, status="pending"
+        )
+        for attempts in (0, 1, 3)
+    ]
+    fresh, taken = items[0], SimpleNamespace(id=items[1].id, attempts=3)
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.execute.return_value.scalars.return_value.all.return_value = [fresh, taken]
+    session.commit = AsyncMock()
+    scope = AsyncMock()
+
+    with patch.object(background_jobs, "scope_session_to_tenant", scope):
+        relocked = await record_chunk_attempt(
+            session, BatchImportJob, BatchImportJobItem, items, max_attempts=3
+        )
+
+    # The exhausted item fails; another worker re-claimed the second one meanwhile.
+    assert relocked == [fresh]
+    assert [(item.attempts, item.status) for item in items] == [
+        (1, "pending"),
+        (2, "pending"),
+        (3, "failed"),
+    ]
+    assert items[2].error == "Gave up after 3 attempts"
+    session.commit.assert_awaited_once()
+    scope.assert_awaited_once_with(session, TENANT_ID)
+    counters, lock = (call.args[0] for call in session.execute.await_args_list)
+    assert "failed=(batch_import_jobs.failed +" in str(
+        counters.compile(dialect=postgresql.dialect())
+    )
+    assert "FOR UPDATE SKIP LOCKED" in str(lock.compile(dialect=postgresql.dialect()))
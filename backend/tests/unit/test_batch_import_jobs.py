@@ -0,0 +1,267 @@
+"""Tests for asynchronous, chunked batch import jobs."""
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.background_jobs import JOB_STATUS_COMPLETED, JOB_STATUS_QUEUED
+from app.modules.dpps import batch_import
+from app.modules.dpps.batch_import import (
+    BatchImportJobService,
+    UploadRecord,
+    iter_upload_records,
+    source_format_for,
+)
+from app.modules.dpps.bulk_create import BulkDPPResult
+from app.modules.dpps.router import _validated_batch_import_item
+
+TENANT_ID = uuid4()
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+async def _collect(records: AsyncIterator[UploadRecord]) -> list[UploadRecord]:
+    return [record async for record in records]
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.flush = AsyncMock()
+    session.begin_nested = MagicMock(side_effect=lambda: contextlib.AsyncExitStack())
+    return session
+
+
+def _job(**overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "id": uuid4(),
+        "tenant_id": TENANT_ID,
+        "tenant_slug": "acme",
+        "requested_by_subject": "publisher-1",
+        "chunk_size": 2,
+        "total": 0,
+        "failed": 0,
+        "status": JOB_STATUS_QUEUED,
+        "finished_at": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_content_types_map_to_upload_formats() -> None:
+    assert source_format_for("application/x-ndjson; charset=utf-8") == "ndjson"
+    assert source_format_for("text/csv") == "csv"
+    assert source_format_for("application/json") == "json"
+    assert source_format_for("application/xml") is None
+
+
+@pytest.mark.asyncio
+async def test_ndjson_is_parsed_across_chunk_boundaries() -> None:
+    records = await _collect(
+        iter_upload_records(
+            _chunks(
+                b'{"asset_ids": {"manufacturerPartId": "P-1"}}\n{"asset', b'_ids": {}}\n\nnot json'
+            ),
+            "ndjson",
+        )
+    )
+
+    assert [record.payload for record in records[:2]] == [
+        {"asset_ids": {"manufacturerPartId": "P-1"}},
+        {"asset_ids": {}},
+    ]
+    assert records[2].payload is None
+    assert records[2].error is not None
+
+
+@pytest.mark.asyncio
+async def test_csv_rows_map_columns_to_create_requests() -> None:
+    upload = (
+        b"manufacturerPartId,serialNumber,selected_templates,initial_data\n"
+        b'P-1,SN-1,digital-nameplate;carbon-footprint,"{""note"":\n'
+        b' ""multi-line""}"\n'
+        b"P-2,,,\n"
+    )
+
+    records = await _collect(iter_upload_records(_chunks(upload[:50], upload[50:]), "csv"))
+
+    assert [record.payload for record in records] == [
+        {
+            "asset_ids": {"manufacturerPartId": "P-1", "serialNumber": "SN-1"},
+            "selected_templates": ["digital-nameplate", "carbon-footprint"],
+            "initial_data": {"note": "multi-line"},
+        },
+        {"asset_ids": {"manufacturerPartId": "P-2"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_staging_inserts_chunks_and_rejects_invalid_items() -> None:
+    session = _session()
+    job = _job()
+    records = [
+        UploadRecord(payload={"asset_ids": {"manufacturerPartId": "P-1"}}),
+        UploadRecord(payload={"asset_ids": "nope"}),
+        UploadRecord(payload=None, error="Invalid JSON line"),
+    ]
+
+    async def upload() -> AsyncIterator[UploadRecord]:
+        for record in records:
+            yield record
+
+    total = await BatchImportJobService(session).stage_items(
+        job,  # type: ignore[arg-type]
+        upload(),
+        validate=_validated_batch_import_item,
+        max_items=10,
+    )
+
+    assert total == 3
+    assert (job.total, job.failed, job.status) == (3, 2, JOB_STATUS_QUEUED)
+    batches = [call.args[1] for call in session.execute.await_args_list]
+    assert [len(rows) for rows in batches] == [2, 1]
+    first, second = batches[0]
+    assert first["status"] == "pending"
+    assert first["payload"]["asset_ids"] == {"manufacturerPartId": "P-1"}
+    assert first["payload"]["selected_templates"] == ["digital-nameplate"]
+    assert second["status"] == "failed"
+    assert second["payload"] is None
+    assert second["error"].startswith("asset_ids")
+
+
+@pytest.mark.asyncio
+async def test_staging_rejects_uploads_over_the_item_limit() -> None:
+    async def upload() -> AsyncIterator[UploadRecord]:
+        for _ in range(3):
+            yield UploadRecord(payload={"asset_ids": {"manufacturerPartId": "P"}})
+
+    with pytest.raises(ValueError, match="limited to 2"):
+        await BatchImportJobService(_session()).stage_items(
+            _job(),  # type: ignore[arg-type]
+            upload(),
+            validate=_validated_batch_import_item,
+            max_items=2,
+        )
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_items_locked_by_other_workers() -> None:
+    session = _session()
+    session.execute.return_value.scalars.return_value.all.return_value = []
+
+    await BatchImportJobService(session).claim_chunk(_job(chunk_size=50))  # type: ignore[arg-type]
+
+    statement = session.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "ORDER BY batch_import_job_items.item_index" in sql
+    assert statement._limit_clause.value == 50
+
+
+@pytest.mark.asyncio
+async def test_process_chunk_falls_back_to_items_when_bulk_creation_fails() -> None:
+    session = _session()
+    job = _job()
+    payload = {"asset_ids": {"manufacturerPartId": "P"}, "selected_templates": ["x"]}
+    items = [
+        SimpleNamespace(item_index=index, payload=payload, attempts=0, status="pending")
+        for index in range(3)
+    ]
+    dpp_id = uuid4()
+    dpp_service = MagicMock()
+    dpp_service.create_dpps_bulk = AsyncMock(side_effect=RuntimeError("insert failed"))
+    dpp_service.create_dpp = AsyncMock(
+        side_effect=[SimpleNamespace(id=dpp_id), ValueError("Template x not found"), KeyError("x")]
+    )
+
+    with patch.object(batch_import, "emit_audit_event", new=AsyncMock()) as audit:
+        result = await BatchImportJobService(session).process_chunk(
+            job,  # type: ignore[arg-type]
+            items,  # type: ignore[arg-type]
+            dpp_service,
+        )
+
+    assert result == (1, 2)
+    # Attempts were counted when the chunk was claimed, not here.
+    assert [(item.status, item.attempts) for item in items] == [
+        ("ok", 0),
+        ("failed", 0),
+        ("failed", 0),
+    ]
+    dpp_service.create_dpps_bulk.assert_awaited_once()
+    assert items[0].dpp_id == dpp_id
+    assert items[1].error == "Template x not found"
+    assert items[2].error == "Import failed"
+    assert dpp_service.create_dpp.await_args_list[0].kwargs["tenant_slug"] == "acme"
+    audit.assert_awaited_once()
+    assert audit.await_args.kwargs["metadata"]["failed"] == 2
+    counters = session.execute.await_args.args[0]
+    assert "succeeded=(batch_import_jobs.succeeded +" in str(
+        counters.compile(dialect=postgresql.dialect())
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_chunk_creates_items_sharing_templates_in_bulk() -> None:
+    session = _session()
+    shared = {"asset_ids": {"manufacturerPartId": "P"}, "selected_templates": ["x"]}
+    other = {"asset_ids": {"manufacturerPartId": "Q"}, "selected_templates": ["y"]}
+    items = [
+        SimpleNamespace(item_index=index, payload=payload, attempts=0, status="pending")
+        for index, payload in enumerate([shared, other, shared])
+    ]
+    dpp_id = uuid4()
+    dpp_service = MagicMock()
+    dpp_service.create_dpps_bulk = AsyncMock(
+        return_value=[BulkDPPResult(index=0, dpp_id=dpp_id), BulkDPPResult(index=1, error="bad")]
+    )
+    dpp_service.create_dpp = AsyncMock(return_value=SimpleNamespace(id=uuid4()))
+
+    with patch.object(batch_import, "emit_audit_event", new=AsyncMock()):
+        result = await BatchImportJobService(session).process_chunk(
+            _job(),  # type: ignore[arg-type]
+            items,  # type: ignore[arg-type]
+            dpp_service,
+        )
+
+    assert result == (2, 1)
+    bulk_call = dpp_service.create_dpps_bulk.await_args.kwargs
+    assert bulk_call["selected_templates"] == ["x"]
+    assert len(bulk_call["items"]) == 2
+    assert dpp_service.create_dpp.await_count == 1
+    assert (items[0].status, items[0].dpp_id) == ("ok", dpp_id)
+    assert (items[2].status, items[2].error) == ("failed", "bad")
+    assert items[1].status == "ok"
+
+
+@pytest.mark.asyncio
+async def test_resume_requeues_failed_items_with_payloads() -> None:
+    session = _session()
+    session.execute.return_value.scalars.return_value.all.return_value = [uuid4(), uuid4()]
+    session.refresh = AsyncMock()
+    job = _job(total=5, failed=3, status=JOB_STATUS_COMPLETED)
+
+    resumed = await BatchImportJobService(session).resume_failed(job)  # type: ignore[arg-type]
+
+    assert resumed == 2
+    items, counters = (
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in session.execute.await_args_list
+    )
+    assert "batch_import_job_items.payload IS NOT NULL" in items
+    assert "attempts=%(attempts)s" in items
+    # The counter is adjusted in SQL, not written back from memory.
+    assert "failed=greatest(batch_import_jobs.failed - %(failed_1)s" in counters
+    assert job.failed == 3
+    session.refresh.assert_awaited_once_with(job)
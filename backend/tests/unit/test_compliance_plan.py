@@ -0,0 +1,217 @@
+"""Tests for compiled compliance rule plans and the report cache."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.modules.compliance import report_cache
+from app.modules.compliance.engine import ComplianceEngine
+from app.modules.compliance.plan import RulePlan
+from app.modules.compliance.report_cache import ComplianceReportCache
+from app.modules.compliance.schemas import ComplianceReport, ComplianceSummary, RuleDefinition
+from app.modules.compliance.service import ComplianceService
+from app.modules.compliance.validators.base import CategoryValidator
+
+GPI_SEMANTIC_ID = "https://admin-shell.io/idta/BatteryPassport/GeneralProductInformation/1/0"
+
+
+def _rule(rule_id: str, field_path: str, semantic_id: str | None = None) -> RuleDefinition:
+    return RuleDefinition(
+        id=rule_id,
+        field_path=field_path,
+        condition="required",
+        severity="critical",
+        message="required",
+        semantic_id=semantic_id,
+    )
+
+
+def _env() -> dict[str, Any]:
+    return {
+        "submodels": [
+            {
+                "idShort": "GeneralProductInformation",
+                "semanticId": {"keys": [{"value": "urn:other"}]},
+                "submodelElements": [{"idShort": "BatteryModel", "value": "wrong-submodel"}],
+            },
+            {
+                "idShort": "GeneralProductInformation",
+                "semanticId": {"keys": [{"value": GPI_SEMANTIC_ID}]},
+                "submodelElements": [
+                    {"idShort": "BatteryModel", "modelType": "Property", "value": "LFP-100"},
+                    {"idShort": "BatteryModel", "modelType": "Property", "value": "duplicate"},
+                    {
+                        "idShort": "Names",
+                        "modelType": "MultiLanguageProperty",
+                        "value": [{"language": "en", "text": "Cell"}],
+                    },
+                    {
+                        "idShort": "Dimensions",
+                        "modelType": {"name": "SubmodelElementCollection"},
+                        "value": [
+                            {"idShort": "Height", "modelType": "Property", "value": "10"},
+                            {
+                                "idShort": "Range",
+                                "modelType": "Range",
+                                "min": "1",
+                                "max": "2",
+                            },
+                        ],
+                    },
+                    {
+                        "idShort": "Site",
+                        "modelType": "Entity",
+                        "statements": [{"idShort": "Country", "value": "DE"}],
+                    },
+                ],
+            },
+        ]
+    }
+
+
+RULES = [
+    _rule("R1", "GeneralProductInformation.BatteryModel", GPI_SEMANTIC_ID),
+    _rule("R2", "GeneralProductInformation.BatteryModel"),
+    _rule("R3", "GeneralProductInformation.Names", GPI_SEMANTIC_ID),
+    _rule("R4", "GeneralProductInformation.Dimensions.Height", GPI_SEMANTIC_ID),
+    _rule("R5", "GeneralProductInformation.Dimensions.Range", GPI_SEMANTIC_ID),
+    _rule("R6", "GeneralProductInformation.Dimensions", GPI_SEMANTIC_ID),
+    _rule("R7", "GeneralProductInformation.Site.Country", GPI_SEMANTIC_ID),
+    _rule("R8", "GeneralProductInformation.Missing", GPI_SEMANTIC_ID),
+    _rule("R9", "Unknown.Field"),
+]
+
+
+def test_plan_resolves_every_rule_like_a_single_rule_lookup() -> None:
+    env = _env()
+
+    values = RulePlan(RULES).resolve(env)
+
+    assert values == [RulePlan([rule]).resolve(env)[0] for rule in RULES]
+    assert values[:5] == [
+        "LFP-100",
+        "wrong-submodel",
+        {"en": "Cell"},
+        "10",
+        {"min": "1", "max": "2"},
+    ]
+    assert values[6:] == ["DE", None, None]
+    assert RulePlan(RULES).resolve({"submodels": "invalid"}) == [None] * len(RULES)
+
+
+def test_plan_groups_rules_by_target_submodel() -> None:
+    plan = RulePlan(RULES)
+
+    assert len(plan._targets) == 3
+    assert [compiled.rule.id for compiled in plan.rules] == [rule.id for rule in RULES]
+
+
+def test_validate_reports_only_unresolved_required_fields() -> None:
+    violations = CategoryValidator().validate(_env(), RULES)
+
+    assert [violation.rule_id for violation in violations] == ["R8", "R9"]
+
+
+def _write_rules(rules_dir: Path, model_message: str) -> None:
+    (rules_dir / "batteries.yaml").write_text(
+        "category: battery\n"
+        'version: "1.0"\n'
+        "rules:\n"
+        "  - id: BAT-001\n"
+        '    field_path: "GeneralProductInformation.BatteryModel"\n'
+        "    condition: required\n"
+        "    severity: critical\n"
+        f'    message: "{model_message}"\n'
+    )
+
+
+def test_ruleset_version_changes_with_rule_file_content(tmp_path: Path) -> None:
+    _write_rules(tmp_path, "Model is required")
+    first = ComplianceEngine(rules_dir=tmp_path).ruleset_version
+    assert ComplianceEngine(rules_dir=tmp_path).ruleset_version == first
+
+    _write_rules(tmp_path, "Battery model is required")
+
+    assert ComplianceEngine(rules_dir=tmp_path).ruleset_version != first
+
+
+def test_default_ruleset_version_is_stable(tmp_path: Path) -> None:
+    rules_dir = Path(ComplianceEngine._default_rules_path())
+    shutil.copytree(rules_dir, tmp_path / "rules")
+
+    assert (
+        ComplianceEngine(rules_dir=tmp_path / "rules").ruleset_version
+        == ComplianceEngine().ruleset_version
+    )
+
+
+def _report(**overrides: Any) -> ComplianceReport:
+    fields: dict[str, Any] = {
+        "dpp_id": uuid4(),
+        "category": "battery",
+        "is_compliant": True,
+        "violations": [],
+        "summary": ComplianceSummary(
+            total_rules=1, passed=1, critical_violations=0, warnings=0, info_count=0
+        ),
+    }
+    fields.update(overrides)
+    return ComplianceReport(**fields)
+
+
+def test_report_cache_evicts_least_recently_used_and_copies() -> None:
+    cache = ComplianceReportCache(max_entries=2)
+    tenant_id = uuid4()
+    keys = [(tenant_id, f"digest-{i}", "", "v1") for i in range(3)]
+    cache.put(keys[0], _report())
+    cache.put(keys[1], _report())
+
+    first = cache.get(keys[0])
+    assert first is not None and first.dpp_id is None
+    first.is_compliant = False
+    cache.put(keys[2], _report())
+
+    assert len(cache) == 2
+    assert cache.get(keys[1]) is None
+    cached = cache.get(keys[0])
+    assert cached is not None and cached.is_compliant is True
+
+
+@pytest.mark.asyncio
+async def test_check_revision_reuses_report_for_the_same_digest() -> None:
+    cache = ComplianceReportCache(max_entries=8)
+    service = ComplianceService(MagicMock())
+    service._engine = MagicMock(ruleset_version="v1")
+    service._engine.evaluate.return_value = _report()
+    tenant_id = uuid4()
+    revisions = [
+        SimpleNamespace(tenant_id=tenant_id, digest_sha256="abc", aas_env_json={}),
+        SimpleNamespace(tenant_id=tenant_id, digest_sha256="abc", aas_env_json=None),
+    ]
+
+    with (
+        patch.object(report_cache, "_cache", cache),
+        patch.object(
+            report_cache,
+            "get_settings",
+            return_value=SimpleNamespace(compliance_report_cache_size=8),
+        ),
+        patch(
+            "app.modules.compliance.service.materialize_revision", new=AsyncMock()
+        ) as materialize,
+    ):
+        first = await service.check_revision(revisions[0])  # type: ignore[arg-type]
+        second = await service.check_revision(revisions[1])  # type: ignore[arg-type]
+        await service.check_revision(revisions[1], category="textile")  # type: ignore[arg-type]
+
+    assert first.dpp_id is not None and second.dpp_id is None
+    assert second.is_compliant is True
+    assert service._engine.evaluate.call_count == 2
+    assert materialize.await_count == 2
@@ -0,0 +1,279 @@
+"""Tests for tenant-wide compliance scans."""
+
+from __future__ import annotations
+
+import contextlib
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ClauseElement
+
+from app.core.executors import SlicedPool
+from app.modules.compliance import scan_pool, scans
+from app.modules.compliance.service import _get_engine
+
+TENANT_ID = uuid4()
+GPI_SEMANTIC_ID = "https://admin-shell.io/idta/BatteryPassport/GeneralProductInformation/1/0"
+
+
+def _battery_env(model: str | None = "LFP-100") -> dict[str, Any]:
+    elements = [
+        {"idShort": "ManufacturerIdentification", "modelType": "Property", "value": "ACME"},
+        {"idShort": "BatteryCategory", "modelType": "Property", "value": "Industrial"},
+    ]
+    if model is not None:
+        elements.append({"idShort": "BatteryModel", "modelType": "Property", "value": model})
+    return {
+        "submodels": [
+            {
+                "idShort": "GeneralProductInformation",
+                "semanticId": {"keys": [{"type": "GlobalReference", "value": GPI_SEMANTIC_ID}]},
+                "modelType": "Submodel",
+                "submodelElements": elements,
+            }
+        ]
+    }
+
+
+def _result(*, rows: list[Any] | None = None, scalars: list[Any] | None = None) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows or []
+    result.scalars.return_value.all.return_value = scalars or []
+    return result
+
+
+def _scan(**overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "id": uuid4(),
+        "tenant_id": TENANT_ID,
+        "category": None,
+        "ruleset_version": _get_engine().ruleset_version,
+        "checkpoint_dpp_id": None,
+        "chunk_size": 100,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _sql(statement: ClauseElement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_scan_page_reuses_stored_reports_and_evaluates_new_revisions() -> None:
+    scan = _scan()
+    reused_dpp, new_dpp, failing_dpp, no_revision_dpp = uuid4(), uuid4(), uuid4(), uuid4()
+    new_revision = SimpleNamespace(id=uuid4(), aas_env_json=_battery_env(model=None))
+    failing_revision = SimpleNamespace(id=uuid4(), aas_env_json=_battery_env())
+    stored_id = uuid4()
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(
+                rows=[
+                    SimpleNamespace(id=uuid4(), dpp_id=reused_dpp, digest_sha256="d-reused"),
+                    SimpleNamespace(id=new_revision.id, dpp_id=new_dpp, digest_sha256="d-new"),
+                    SimpleNamespace(
+                        id=failing_revision.id, dpp_id=failing_dpp, digest_sha256="d-fail"
+                    ),
+                ]
+            ),
+            _result(
+                rows=[
+                    SimpleNamespace(
+                        id=stored_id,
+                        dpp_id=reused_dpp,
+                        revision_digest="d-reused",
+                        category="battery",
+                        is_compliant=True,
+                    ),
+                    SimpleNamespace(
+                        id=uuid4(),
+                        dpp_id=new_dpp,
+                        revision_digest="d-older",
+                        category="battery",
+                        is_compliant=True,
+                    ),
+                ]
+            ),
+            _result(scalars=[new_revision, failing_revision]),
+            MagicMock(),
+            MagicMock(),
+        ]
+    )
+    real_evaluate = _get_engine().evaluate
+
+    def evaluate(env: dict[str, Any], category: str | None = None) -> Any:
+        if env is failing_revision.aas_env_json:
+            raise RuntimeError("broken environment")
+        return real_evaluate(env, category=category)
+
+    with (
+        patch.object(scans, "get_report_cache", return_value=None),
+        patch.object(scans, "materialize_revisions", new=AsyncMock()) as materialize,
+        patch.object(_get_engine(), "evaluate", side_effect=evaluate),
+    ):
+        outcome = await scans.ComplianceScanService(session).scan_page(
+            scan,  # type: ignore[arg-type]
+            [reused_dpp, new_dpp, failing_dpp, no_revision_dpp],
+        )
+
+    assert (outcome.reused, outcome.evaluated, outcome.failed, outcome.skipped) == (1, 1, 1, 1)
+    assert (outcome.compliant, outcome.non_compliant) == (1, 1)
+    assert outcome.errors == [{"dpp_id": str(failing_dpp), "error": "broken environment"}]
+    materialize.assert_awaited_once()
+    insert: ClauseElement
+    reuse: ClauseElement
+    insert, reuse = (call.args[0] for call in session.execute.await_args_list[3:])
+    insert_sql = _sql(insert)
+    assert "INSERT INTO compliance_reports" in insert_sql
+    assert "ON CONFLICT (tenant_id, dpp_id, revision_digest, ruleset_version)" in insert_sql
+    row = insert.compile(dialect=postgresql.dialect()).params
+    assert row["dpp_id_m0"] == new_dpp and row["is_compliant_m0"] is False
+    assert row["revision_digest_m0"] == "d-new" and row["scan_id_m0"] == scan.id
+    assert "UPDATE compliance_reports SET scan_id" in _sql(reuse)
+
+
+@pytest.mark.asyncio
+async def test_category_scans_skip_other_categories_without_evaluating() -> None:
+    scan = _scan(category="textile")
+    dpp_id = uuid4()
+    revision = SimpleNamespace(id=uuid4(), aas_env_json=_battery_env())
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(rows=[SimpleNamespace(id=revision.id, dpp_id=dpp_id, digest_sha256="d")]),
+            _result(),
+            _result(scalars=[revision]),
+        ]
+    )
+
+    with (
+        patch.object(scans, "get_report_cache", return_value=None),
+        patch.object(scans, "materialize_revisions", new=AsyncMock()),
+        patch.object(
+            scans, "evaluate_environments", new=AsyncMock(return_value=("v", []))
+        ) as evaluate,
+    ):
+        outcome = await scans.ComplianceScanService(session).scan_page(
+            scan,  # type: ignore[arg-type]
+            [dpp_id],
+        )
+
+    assert outcome.skipped == 1 and outcome.evaluated == 0
+    assert evaluate.await_args is not None and evaluate.await_args.args[0] == []
+    assert session.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_scan_page_fails_when_rules_changed_since_queueing() -> None:
+    scan = _scan(ruleset_version="queued-version")
+    dpp_id = uuid4()
+    revision = SimpleNamespace(id=uuid4(), aas_env_json=_battery_env())
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(rows=[SimpleNamespace(id=revision.id, dpp_id=dpp_id, digest_sha256="d")]),
+            _result(),
+            _result(scalars=[revision]),
+        ]
+    )
+
+    with (
+        patch.object(scans, "get_report_cache", return_value=None),
+        patch.object(scans, "materialize_revisions", new=AsyncMock()),
+        pytest.raises(ValueError, match="rules changed"),
+    ):
+        await scans.ComplianceScanService(session).scan_page(
+            scan,  # type: ignore[arg-type]
+            [dpp_id],
+        )
+
+
+@pytest.mark.asyncio
+async def test_pooled_evaluation_keeps_environment_order() -> None:
+    environments = [_battery_env(model=None if i % 3 == 0 else f"M-{i}") for i in range(40)]
+
+    pool = SlicedPool(lambda: 2, min_items=16, thread_name_prefix="scan-test")
+    try:
+        with patch.object(scan_pool, "_scan_pool", pool):
+            version, results = await scan_pool.evaluate_environments(environments, _get_engine())
+    finally:
+        pool.shutdown()
+
+    assert version == _get_engine().ruleset_version
+    assert [payload["summary"] for payload, _ in results if payload] == [
+        _get_engine().evaluate(env).summary.model_dump() for env in environments
+    ]
+
+
+@pytest.mark.asyncio
+async def test_summary_aggregates_violations_in_sql() -> None:
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(
+                rows=[
+                    SimpleNamespace(category="battery", reports=3, compliant=2),
+                    SimpleNamespace(category="unknown", reports=1, compliant=1),
+                ]
+            ),
+            _result(
+                rows=[
+                    SimpleNamespace(rule_id="BAT-002", severity="critical", violations=1),
+                    SimpleNamespace(rule_id="BAT-010", severity="warning", violations=3),
+                ]
+            ),
+        ]
+    )
+
+    summary = await scans.ComplianceScanService(session).summarize(_scan())  # type: ignore[arg-type]
+
+    assert summary["by_severity"] == {"critical": 1, "warning": 3, "info": 0}
+    assert summary["by_rule"][0] == {"rule_id": "BAT-002", "severity": "critical", "count": 1}
+    assert summary["by_category"]["battery"] == {"compliant": 2, "non_compliant": 1}
+    rule_sql = _sql(session.execute.await_args_list[1].args[0])
+    assert "jsonb_array_elements(compliance_reports.report_json" in rule_sql
+    assert "compliance_reports.scan_id" in rule_sql
+
+
+@pytest.mark.asyncio
+async def test_run_page_commits_counters_and_checkpoint() -> None:
+    scan = _scan(
+        processed=0,
+        evaluated=0,
+        reused=0,
+        skipped=0,
+        failed=0,
+        compliant=0,
+        non_compliant=0,
+        errors=[],
+        total=2,
+    )
+    dpp_ids = [uuid4(), uuid4()]
+    session = MagicMock()
+    claimed = MagicMock()
+    claimed.scalar_one_or_none.return_value = scan
+    session.execute = AsyncMock(side_effect=[MagicMock(), claimed])
+    session.commit = AsyncMock()
+
+    @contextlib.asynccontextmanager
+    async def background_session() -> Any:
+        yield session
+
+    outcome = scans.ScanPageOutcome(evaluated=1, reused=1, compliant=2)
+    with (
+        patch("app.db.session.get_background_session", background_session),
+        patch.object(scans.ComplianceScanService, "next_page", AsyncMock(return_value=dpp_ids)),
+        patch.object(scans.ComplianceScanService, "scan_page", AsyncMock(return_value=outcome)),
+    ):
+        more = await scans._run_page(TENANT_ID, scan.id, uuid4())
+
+    assert more is True
+    assert (scan.processed, scan.evaluated, scan.reused, scan.compliant) == (2, 1, 1, 2)
+    assert scan.checkpoint_dpp_id == dpp_ids[-1]
+    session.commit.assert_awaited_once()
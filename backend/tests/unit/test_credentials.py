@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import jwt
 import pytest
@@ -80,6 +80,27 @@ class TestDIDService:
         assert len(dumped["authentication"]) == 1
         assert len(dumped["assertionMethod"]) == 1
 
+    def test_did_document_lists_every_signing_kid(self, rsa_pem: str, ec_pem: str) -> None:
+        from app.core.crypto.jws_signer import JWSSigner, load_signing_key
+        from app.modules.credentials.did import DIDService
+
+        signer = JWSSigner(
+            [
+                load_signing_key(rsa_pem, kid="key-1", algorithm="RS256"),
+                load_signing_key(ec_pem, kid="key-2", algorithm="ES256"),
+            ],
+            active_kid="key-2",
+        )
+        svc = DIDService(
+            base_url="https://dpp.example.com", signing_key_pem=rsa_pem, key_id="key-1"
+        )
+
+        doc = svc.generate_did_document("acme", signer.public_jwks())
+
+        assert [vm.id.rsplit("#", 1)[1] for vm in doc.verification_method] == ["key-1", "key-2"]
+        assert doc.verification_method[1].public_key_jwk["crv"] == "P-256"
+        assert doc.assertion_method == [vm.id for vm in doc.verification_method]
+
     def test_ec_key_jwk(self, ec_pem: str) -> None:
         from app.modules.credentials.did import DIDService
 
@@ -431,35 +452,46 @@ class TestVCService:
 
 class TestCredentialPublicRouter:
     @pytest.mark.asyncio
-    @patch("app.modules.credentials.public_router._get_did_service")
-    @patch("app.modules.credentials.public_router.get_settings")
-    async def test_get_public_jwks_returns_key_with_kid(
-        self,
-        mock_get_settings: MagicMock,
-        mock_get_did_service: MagicMock,
+    async def test_jwks_verifies_signatures_from_before_and_after_rotation(
+        self, rsa_pem: str, ec_pem: str
     ) -> None:
+        from app.core.crypto.jws_signer import JWSSigner, load_signing_key
         from app.modules.credentials.public_router import get_public_jwks
 
-        did_service = MagicMock()
-        did_service.export_public_jwk.return_value = {"kty": "RSA", "n": "abc", "e": "AQAB"}
-        mock_get_did_service.return_value = did_service
-
-        settings = MagicMock()
-        settings.dpp_signing_key_id = "dpp-signing-kid"
-        mock_get_settings.return_value = settings
-
-        response = await get_public_jwks()
-
-        assert response == {
-            "keys": [
-                {
-                    "kty": "RSA",
-                    "n": "abc",
-                    "e": "AQAB",
-                    "kid": "dpp-signing-kid",
-                }
-            ]
-        }
+        signer = JWSSigner(
+            [load_signing_key(rsa_pem, kid="key-1", algorithm="RS256")], active_kid="key-1"
+        )
+        before = signer.sign_digest("a" * 64)
+        signer.add_key(load_signing_key(ec_pem, kid="key-2", algorithm="ES256"), activate=True)
+        after = signer.sign_digest("b" * 64)
+
+        with patch("app.modules.credentials.public_router.get_dpp_signer", return_value=signer):
+            jwks = await get_public_jwks()
+
+        assert [key["kid"] for key in jwks["keys"]] == ["key-2", "key-1"]
+        assert all("d" not in key for key in jwks["keys"])
+        keys = jwt.PyJWKSet.from_dict(jwks)
+        for token, digest in ((after, "b" * 64), (before, "a" * 64)):
+            kid = jwt.get_unverified_header(token)["kid"]
+            key = next(key for key in keys.keys if key.key_id == kid)
+            assert (
+                jwt.api_jws.decode(token, key.key, algorithms=[key.algorithm_name])
+                == digest.encode()
+            )
+
+    @pytest.mark.asyncio
+    async def test_jwks_is_unavailable_without_a_signing_key(self) -> None:
+        from fastapi import HTTPException
+
+        from app.modules.credentials.public_router import get_public_jwks
+
+        with (
+            patch("app.modules.credentials.public_router.get_dpp_signer", return_value=None),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await get_public_jwks()
+
+        assert exc_info.value.status_code == 503
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,122 @@
+"""Tests for Merkle-structured AAS environment digests."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from app.core.crypto import environment_digest
+from app.core.crypto.canonicalization import (
+    CANONICALIZATION_RFC8785,
+    CANONICALIZATION_RFC8785_MERKLE_V1,
+    sha256_hex_jcs,
+)
+from app.core.crypto.environment_digest import (
+    EnvironmentDigest,
+    compute_environment_digest,
+    reusable_submodel_digests,
+    stored_environment_digest,
+)
+from app.core.crypto.merkle import verify_inclusion_proof
+
+
+def _env(*submodels: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "assetAdministrationShells": [{"id": "urn:aas:1"}],
+        "submodels": list(submodels),
+        "conceptDescriptions": [],
+    }
+
+
+def _submodel(submodel_id: str, value: str = "v") -> dict[str, Any]:
+    return {"id": submodel_id, "submodelElements": [{"idShort": "p", "value": value}]}
+
+
+def test_leaves_hash_each_submodel_on_its_own() -> None:
+    nameplate, carbon = _submodel("sm-1"), _submodel("sm-2")
+
+    digest = compute_environment_digest(_env(nameplate, carbon))
+
+    assert [leaf.sha256 for leaf in digest.submodels] == [
+        sha256_hex_jcs(nameplate),
+        sha256_hex_jcs(carbon),
+    ]
+    assert digest.root != sha256_hex_jcs(_env(nameplate, carbon))
+
+
+def test_root_binds_submodel_count_and_order() -> None:
+    a, b, c = _submodel("a"), _submodel("b"), _submodel("c")
+
+    roots = {
+        compute_environment_digest(_env(a, b, c)).root,
+        compute_environment_digest(_env(a, b, c, c)).root,
+        compute_environment_digest(_env(b, a, c)).root,
+        compute_environment_digest(_env(a, b)).root,
+    }
+
+    assert len(roots) == 4
+
+
+def test_environment_without_submodels_is_one_leaf() -> None:
+    env = {"assetAdministrationShells": []}
+
+    digest = compute_environment_digest(env)
+
+    assert digest.root == sha256_hex_jcs(env)
+    assert digest.submodels == ()
+
+
+def test_reused_leaves_skip_rehashing_and_keep_the_root() -> None:
+    previous_env = _env(_submodel("sm-1"), _submodel("sm-2"))
+    previous = compute_environment_digest(previous_env)
+    env = _env(_submodel("sm-1", value="changed"), _submodel("sm-2"))
+    reuse = reusable_submodel_digests(previous, changed_submodel_ids=["sm-1"])
+
+    with patch.object(
+        environment_digest, "sha256_hex_jcs", wraps=environment_digest.sha256_hex_jcs
+    ) as hasher:
+        digest = compute_environment_digest(env, reuse=reuse)
+
+    # Shell leaf plus the one changed submodel
+    assert hasher.call_count == 2
+    assert digest == compute_environment_digest(env)
+
+
+def test_equality_reuse_only_covers_unchanged_submodels() -> None:
+    previous_env = _env(_submodel("sm-1"), _submodel("sm-2"), _submodel("dup"), _submodel("dup"))
+    previous = compute_environment_digest(previous_env)
+    env = _env(_submodel("sm-1", value="changed"), _submodel("sm-2"), _submodel("sm-3"))
+
+    reuse = reusable_submodel_digests(previous, previous_env=previous_env, aas_env=env)
+
+    assert reuse == {"sm-2": previous.submodels[1].sha256}
+    assert reusable_submodel_digests(None, previous_env=previous_env, aas_env=env) == {}
+
+
+def test_inclusion_proofs_verify_against_the_root() -> None:
+    digest = compute_environment_digest(_env(*(_submodel(f"sm-{i}") for i in range(5))))
+
+    for position, leaf in enumerate(digest.submodels):
+        proof = digest.submodel_inclusion_proof(position)
+        assert verify_inclusion_proof(leaf.sha256, proof, digest.root)
+
+
+def test_stored_leaves_round_trip_only_when_consistent() -> None:
+    digest = compute_environment_digest(_env(_submodel("sm-1"), {"idShort": "no-id"}))
+    stored = digest.to_json()
+
+    assert EnvironmentDigest.from_json(stored) == digest
+    assert (
+        stored_environment_digest(CANONICALIZATION_RFC8785_MERKLE_V1, digest.root, stored) == digest
+    )
+    assert stored_environment_digest(CANONICALIZATION_RFC8785, digest.root, stored) is None
+    assert stored_environment_digest(CANONICALIZATION_RFC8785_MERKLE_V1, "0" * 64, stored) is None
+    assert EnvironmentDigest.from_json({"shell": "short", "submodels": []}) is None
+
+
+def test_equality_reuse_distinguishes_json_types() -> None:
+    previous_env = _env({"id": "sm-1", "value": 1})
+    previous = compute_environment_digest(previous_env)
+    env = _env({"id": "sm-1", "value": True})
+
+    assert reusable_submodel_digests(previous, previous_env=previous_env, aas_env=env) == {}
@@ -0,0 +1,185 @@
+"""Tests for the bulk DPP creation fast path."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.crypto.environment_digest import compute_environment_digest
+from app.modules.dpps import bulk_create
+from app.modules.dpps.basyx_builder import BasyxDppBuilder
+from app.modules.dpps.bulk_create import BulkDPPItem, compute_environment_digests
+from app.modules.dpps.service import DPPService
+from app.modules.templates import model_cache
+
+TENANT_ID = uuid4()
+NAMEPLATE = "https://admin-shell.io/idta/nameplate/3/0/Nameplate"
+
+
+@pytest.fixture(autouse=True)
+def _clear_models() -> Iterator[None]:
+    model_cache._models.clear()
+    yield
+    model_cache._models.clear()
+
+
+def _template() -> SimpleNamespace:
+    return SimpleNamespace(
+        template_key="digital-nameplate",
+        idta_version="3.0.1",
+        semantic_id=NAMEPLATE,
+        source_file_sha="abc123",
+        fetched_at=datetime(2026, 1, 1, tzinfo=UTC),
+        template_aasx=None,
+        template_json={
+            "submodels": [
+                {
+                    "modelType": "Submodel",
+                    "id": "urn:template:nameplate",
+                    "idShort": "Nameplate",
+                    "semanticId": {
+                        "type": "ExternalReference",
+                        "keys": [{"type": "GlobalReference", "value": NAMEPLATE}],
+                    },
+                    "submodelElements": [
+                        {
+                            "modelType": "Property",
+                            "idShort": "ManufacturerName",
+                            "valueType": "xs:string",
+                        }
+                    ],
+                }
+            ]
+        },
+    )
+
+
+def _builder() -> BasyxDppBuilder:
+    template = _template()
+    template_service = MagicMock()
+    template_service.get_all_templates = AsyncMock(return_value=[template])
+    template_service.get_template = AsyncMock(return_value=template)
+    return BasyxDppBuilder(template_service)
+
+
+def _shell_refs(env: dict[str, Any]) -> list[str]:
+    shell = env["assetAdministrationShells"][0]
+    return sorted(ref["keys"][0]["value"] for ref in shell["submodels"])
+
+
+@pytest.mark.asyncio
+async def test_stamped_environments_match_individually_built_ones() -> None:
+    builder = _builder()
+    asset_ids = [
+        {"manufacturerPartId": "P-1", "serialNumber": "SN-1"},
+        {"manufacturerPartId": "9-X", "globalAssetId": "https://example.org/9-X"},
+    ]
+
+    stamped = await builder.build_environments(
+        [(ids, {}) for ids in asset_ids], ["digital-nameplate"]
+    )
+
+    for ids, env in zip(asset_ids, stamped, strict=True):
+        expected = await builder.build_environment(ids, ["digital-nameplate"], {})
+        assert _shell_refs(env) == _shell_refs(expected)
+        for document in (env, expected):
+            document["assetAdministrationShells"][0].pop("submodels")
+        assert env == expected
+    assert stamped[0]["submodels"][0]["id"] == "urn:dpp:sm:digital-nameplate:P-1"
+
+
+@pytest.mark.asyncio
+async def test_items_with_initial_data_are_instantiated_individually() -> None:
+    builder = _builder()
+
+    envs = await builder.build_environments(
+        [
+            ({"manufacturerPartId": "P-1"}, {}),
+            (
+                {"manufacturerPartId": "P-2"},
+                {"digital-nameplate": {"ManufacturerName": "ACME"}},
+            ),
+        ],
+        ["digital-nameplate"],
+    )
+
+    values = [env["submodels"][0]["submodelElements"][0].get("value") for env in envs]
+    assert values == [None, "ACME"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_creation_writes_rows_in_multi_row_inserts() -> None:
+    dpp_ids = [UUID(f"0192f0e4-7a1b-7c3d-9e4f-a1b2c3d4e5f{i}") for i in range(2)]
+    revision_ids = [uuid4(), uuid4()]
+    ids_result = MagicMock()
+    ids_result.scalars.return_value.all.return_value = [*dpp_ids, *revision_ids]
+    taken_result = MagicMock()
+    taken_result.scalars.return_value.all.return_value = ["0192f0e4"]
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[ids_result, MagicMock(), taken_result, MagicMock(), MagicMock()]
+    )
+    session.flush = AsyncMock()
+
+    service = DPPService.__new__(DPPService)
+    service._session = session
+    service._settings = SimpleNamespace(
+        dpp_required_specific_asset_ids_default=["manufacturerPartId"],
+        dpp_required_specific_asset_ids_by_template={},
+    )
+    service._field_encryptor = None
+    service._basyx_builder = MagicMock()
+    service._basyx_builder.build_environments = AsyncMock(
+        side_effect=lambda items, _templates: [
+            {"submodels": [{"id": f"urn:sm:{ids['manufacturerPartId']}"}]} for ids, _ in items
+        ]
+    )
+    service._ensure_user_exists = AsyncMock()  # type: ignore[method-assign]
+    service._global_asset_id_base = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    service._build_template_provenance = AsyncMock(return_value={})  # type: ignore[method-assign]
+
+    results = await service.create_dpps_bulk(
+        tenant_id=TENANT_ID,
+        tenant_slug="acme",
+        owner_subject="publisher-1",
+        items=[
+            BulkDPPItem(asset_ids={"manufacturerPartId": "P-1"}),
+            BulkDPPItem(asset_ids={"serialNumber": "SN-2"}),
+            BulkDPPItem(asset_ids={"manufacturerPartId": "P-3"}),
+        ],
+        selected_templates=["digital-nameplate"],
+    )
+
+    assert [(result.index, result.dpp_id) for result in results] == [
+        (0, dpp_ids[0]),
+        (1, None),
+        (2, dpp_ids[1]),
+    ]
+    assert results[1].error is not None and "manufacturerPartId" in results[1].error
+    dpp_rows = session.execute.await_args_list[3].args[1]
+    revision_rows = session.execute.await_args_list[4].args[1]
+    assert [row["short_slug"] for row in dpp_rows] == ["0192f0e47a1b", "0192f0e47a1b7c3d"]
+    assert [row["dpp_id"] for row in revision_rows] == dpp_ids
+    expected = compute_environment_digest({"submodels": [{"id": "urn:sm:P-3"}]})
+    assert revision_rows[1]["digest_sha256"] == expected.root
+
+
+@pytest.mark.asyncio
+async def test_digests_skip_the_pool_when_disabled() -> None:
+    envs = [{"submodels": [{"id": f"urn:sm:{i}"}]} for i in range(40)]
+
+    with patch.object(
+        bulk_create, "get_settings", return_value=SimpleNamespace(dpp_bulk_create_digest_workers=0)
+    ):
+        digests = await compute_environment_digests(envs)
+
+    assert [digest.root for digest in digests] == [
+        compute_environment_digest(env).root for env in envs
+    ]
+    assert not bulk_create._digest_pool.started
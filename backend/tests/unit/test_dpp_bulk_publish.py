@@ -0,0 +1,322 @@
+"""Tests for bulk publish with shared gate evaluation."""
+
+from __future__ import annotations
+
+import contextlib
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.background_jobs import ITEM_STATUS_FAILED, ITEM_STATUS_PENDING
+from app.core.config import get_settings
+from app.core.crypto.jws_signer import SigningError
+from app.core.security import abac
+from app.core.security.abac import PolicyDecision, PolicyEffect
+from app.core.security.oidc import TokenPayload
+from app.core.tenancy import TenantContext
+from app.db.models import DPPStatus, VisibilityScope
+from app.modules.dpps import outbox, publish_jobs, router
+from app.modules.dpps.bulk_publish import BulkPublishResult
+from app.modules.dpps.service import DPPService
+from app.standards.cen_pren.identifiers_18219.service import IdentifierService
+
+TENANT_ID = uuid4()
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.flush = AsyncMock()
+    session.begin_nested = MagicMock(side_effect=lambda: contextlib.AsyncExitStack())
+    return session
+
+
+def _dpp(**overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "id": uuid4(),
+        "tenant_id": TENANT_ID,
+        "status": DPPStatus.DRAFT,
+        "owner_subject": "owner-1",
+        "current_published_revision_id": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _revision(dpp_id: Any) -> SimpleNamespace:
+    return SimpleNamespace(dpp_id=dpp_id, aas_env_json={"submodels": [{"id": "sm-1"}]})
+
+
+@pytest.mark.asyncio
+async def test_bulk_publish_reports_blocked_dpps_and_shares_templates() -> None:
+    session = _session()
+    owned, other_owner, archived = (
+        _dpp(),
+        _dpp(owner_subject="owner-2"),
+        _dpp(status=DPPStatus.ARCHIVED),
+    )
+    blocked = _dpp()
+    missing_id = uuid4()
+    session.execute.return_value.scalars.return_value.all.return_value = [
+        owned,
+        other_owner,
+        archived,
+        blocked,
+    ]
+    service = DPPService(session)
+    service._settings = SimpleNamespace(compliance_check_on_publish=False)  # type: ignore[assignment]
+    templates = [SimpleNamespace(template_key="digital-nameplate")]
+    service._template_service = SimpleNamespace(  # type: ignore[assignment]
+        get_all_templates=AsyncMock(return_value=templates)
+    )
+    published_revision_id = uuid4()
+
+    async def assert_publishable(*, dpp_id: Any, **_kwargs: Any) -> None:
+        if dpp_id == blocked.id:
+            raise ValueError("Publish blocked: unsupported node")
+
+    with (
+        patch.object(service, "_is_cen_dpp_enabled", return_value=False),
+        patch.object(
+            service, "_load_data_carrier_publish_gate", AsyncMock(return_value=(False, None))
+        ),
+        patch.object(
+            service,
+            "_latest_revisions",
+            AsyncMock(return_value={dpp.id: _revision(dpp.id) for dpp in (owned, blocked)}),
+        ),
+        patch.object(service, "_assert_revision_publishable", side_effect=assert_publishable),
+        patch.object(
+            service,
+            "_publish_latest_revision",
+            AsyncMock(return_value=SimpleNamespace(id=published_revision_id)),
+        ) as publish_revision,
+        patch.object(service, "_signer", return_value=None),
+    ):
+        results = await service.publish_dpps_bulk(
+            tenant_id=TENANT_ID,
+            dpp_ids=[owned.id, other_owner.id, archived.id, missing_id, blocked.id, owned.id],
+            published_by_subject="owner-1",
+            owner_subject="owner-1",
+        )
+
+    assert [result.dpp_id for result in results] == [
+        owned.id,
+        other_owner.id,
+        archived.id,
+        missing_id,
+        blocked.id,
+    ]
+    assert results[0] == BulkPublishResult(dpp_id=owned.id, revision_id=published_revision_id)
+    assert results[1].error == "Only the owner can publish this DPP"
+    assert results[2].error == "Cannot publish an archived DPP"
+    assert results[3].error == f"DPP {missing_id} not found"
+    assert results[4].error == "Publish blocked: unsupported node"
+    assert [result.published for result in results] == [True, False, False, False, False]
+    service._template_service.get_all_templates.assert_awaited_once()
+    publish_revision.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_product_identified_dpp_ids_uses_one_set_based_query() -> None:
+    session = _session()
+    identified = uuid4()
+    session.execute.return_value.scalars.return_value.all.return_value = [identified]
+
+    result = await IdentifierService(session).product_identified_dpp_ids(
+        tenant_id=TENANT_ID, dpp_ids=[identified, uuid4()]
+    )
+
+    assert result == {identified}
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "SELECT DISTINCT dpp_identifiers.dpp_id" in sql
+    assert "dpp_identifiers.dpp_id IN" in sql
+
+
+@pytest.mark.asyncio
+async def test_process_chunk_records_outcomes_and_enqueues_side_effects_once() -> None:
+    session = _session()
+    ok_dpp = _dpp(status=DPPStatus.PUBLISHED, current_published_revision_id=uuid4())
+    failed_id = uuid4()
+    session.get = AsyncMock(return_value=ok_dpp)
+    job = SimpleNamespace(
+        id=uuid4(),
+        tenant_id=TENANT_ID,
+        requested_by_subject="owner-1",
+        owner_subject=None,
+    )
+    items = [
+        SimpleNamespace(dpp_id=ok_dpp.id, attempts=0, status="pending", error=None),
+        SimpleNamespace(dpp_id=failed_id, attempts=0, status="pending", error=None),
+    ]
+    dpp_service = MagicMock()
+    dpp_service.publish_dpps_bulk = AsyncMock(
+        return_value=[
+            BulkPublishResult(dpp_id=ok_dpp.id, revision_id=ok_dpp.current_published_revision_id),
+            BulkPublishResult(dpp_id=failed_id, error="Cannot publish an archived DPP"),
+        ]
+    )
+
+    with (
+        patch.object(publish_jobs, "record_epcis_lifecycle_event", new=AsyncMock()) as epcis,
+        patch.object(publish_jobs, "record_lifecycle_event", new=AsyncMock()) as lifecycle,
+        patch.object(outbox, "enqueue_entries", new=AsyncMock()) as enqueue,
+        patch.object(publish_jobs, "emit_audit_event", new=AsyncMock()) as audit,
+    ):
+        published = await publish_jobs.PublishJobService(session).process_chunk(
+            job,  # type: ignore[arg-type]
+            items,  # type: ignore[arg-type]
+            dpp_service,
+        )
+
+    assert published == [ok_dpp.id]
+    assert (items[0].status, items[0].revision_id, items[0].attempts) == (
+        publish_jobs.ITEM_STATUS_OK,
+        ok_dpp.current_published_revision_id,
+        0,
+    )
+    assert (items[1].status, items[1].error) == (
+        ITEM_STATUS_FAILED,
+        "Cannot publish an archived DPP",
+    )
+    epcis.assert_awaited_once()
+    lifecycle.assert_awaited_once()
+    enqueue.assert_awaited_once()
+    assert {row["dpp_id"] for row in enqueue.await_args.args[1]} == {ok_dpp.id}
+    assert audit.await_args.kwargs["metadata"]["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_create_job_rejects_more_dpps_than_allowed() -> None:
+    settings = SimpleNamespace(dpp_bulk_publish_max_items=2, dpp_bulk_publish_chunk_size=10)
+
+    with (
+        patch.object(publish_jobs, "get_settings", return_value=settings),
+        pytest.raises(ValueError, match="limited to 2 DPPs"),
+    ):
+        await publish_jobs.PublishJobService(_session()).create_job(
+            tenant_id=TENANT_ID,
+            requested_by_subject="owner-1",
+            owner_subject=None,
+            dpp_ids=[uuid4(), uuid4(), uuid4()],
+        )
+
+
+def _publisher(sub: str) -> TenantContext:
+    now = datetime.now(UTC)
+    user = TokenPayload(
+        sub=sub,
+        email=None,
+        email_verified=False,
+        preferred_username=sub,
+        roles=["publisher"],
+        bpn=None,
+        org=None,
+        clearance="public",
+        exp=now,
+        iat=now,
+        raw_claims={},
+    )
+    return TenantContext(
+        tenant_id=TENANT_ID,
+        tenant_slug="acme",
+        tenant_name="Acme",
+        user=user,
+        roles=("publisher",),
+        member_role=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_publish_job_fails_dpps_denied_by_the_publish_policy() -> None:
+    owned = _dpp(owner_subject="publisher-1", visibility_scope=VisibilityScope.OWNER_TEAM)
+    foreign = _dpp(owner_subject="owner-2", visibility_scope=VisibilityScope.OWNER_TEAM)
+    session = _session()
+    session.execute.return_value.all.return_value = [owned, foreign]
+    session.add = MagicMock()
+    session.commit = AsyncMock()
+
+    async def refresh(job: Any) -> None:
+        job.id = uuid4()
+
+    session.refresh = AsyncMock(side_effect=refresh)
+
+    async def evaluate(context: abac.ABACContext) -> PolicyDecision:
+        # Mirrors dpp-edit-owner: a non-admin publisher may only publish own DPPs.
+        if context.resource["owner_subject"] == context.subject["sub"]:
+            return PolicyDecision(effect=PolicyEffect.ALLOW, policy_id="dpp-edit-owner")
+        return PolicyDecision(effect=PolicyEffect.DENY, reason="Not the owner")
+
+    opa_settings = get_settings().model_copy(update={"opa_enabled": True})
+    with (
+        patch.object(router, "get_settings", return_value=opa_settings),
+        patch.object(abac, "get_settings", return_value=opa_settings),
+        patch.object(abac._opa_client, "evaluate", new=evaluate),
+        patch.object(router, "emit_audit_event", new=AsyncMock()),
+        patch.object(publish_jobs, "enqueue_publish_job", return_value=True),
+    ):
+        response = await router.create_bulk_publish_job(
+            router.BulkPublishRequest(dpp_ids=[owned.id, foreign.id]),
+            MagicMock(),
+            session,
+            _publisher("publisher-1"),
+        )
+
+    assert response.total == 2
+    assert session.add.call_args.args[0].failed == 1
+    items = session.execute.await_args_list[-1].args[1]
+    assert [(item["dpp_id"], item["status"], item["error"]) for item in items] == [
+        (owned.id, ITEM_STATUS_PENDING, None),
+        (foreign.id, ITEM_STATUS_FAILED, "Not the owner"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_publish_reports_a_signing_failure_on_its_dpp_only() -> None:
+    session = _session()
+    dpps = [_dpp(), _dpp()]
+    session.execute.return_value.scalars.return_value.all.return_value = dpps
+    service = DPPService(session)
+    service._settings = SimpleNamespace(compliance_check_on_publish=False)  # type: ignore[assignment]
+    revision_id = uuid4()
+
+    async def publish_revision(
+        dpp: Any, _revision: Any, _subject: str, *, sign: Any
+    ) -> SimpleNamespace:
+        return SimpleNamespace(id=revision_id, signed_jws=sign(f"digest-{dpp.id}"))
+
+    def sign_digest(digest: str) -> str:
+        if digest == f"digest-{dpps[1].id}":
+            raise SigningError("JWS signing failed: HSM unavailable")
+        return "jws"
+
+    with (
+        patch.object(service, "_is_cen_dpp_enabled", return_value=False),
+        patch.object(
+            service, "_load_data_carrier_publish_gate", AsyncMock(return_value=(False, None))
+        ),
+        patch.object(
+            service,
+            "_latest_revisions",
+            AsyncMock(return_value={dpp.id: SimpleNamespace(aas_env_json={}) for dpp in dpps}),
+        ),
+        patch.object(service, "_publish_latest_revision", side_effect=publish_revision),
+        patch.object(service, "_sign_digest", side_effect=sign_digest),
+    ):
+        results = await service.publish_dpps_bulk(
+            tenant_id=TENANT_ID,
+            dpp_ids=[dpp.id for dpp in dpps],
+            published_by_subject="owner-1",
+        )
+
+    assert results == [
+        BulkPublishResult(dpp_id=dpps[0].id, revision_id=revision_id),
+        BulkPublishResult(dpp_id=dpps[1].id, error="JWS signing failed: HSM unavailable"),
+    ]
+    assert session.begin_nested.call_count == 2
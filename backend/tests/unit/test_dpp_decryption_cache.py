@@ -0,0 +1,130 @@
+"""Tests for the opt-in cache of decrypted revision environments and DEKs."""
+
+from __future__ import annotations
+
+import base64
+import os
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.encryption import ConnectorConfigEncryptor, DEKCache, DPPFieldEncryptor
+from app.modules.dpps import decryption_cache
+from app.modules.dpps.service import DPPService
+
+TENANT_ID = uuid4()
+ENCRYPTED = [{"type": "Confidentiality", "value": "encrypted"}]
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Iterator[None]:
+    decryption_cache._environments.clear()
+    decryption_cache._deks.clear()
+    yield
+    decryption_cache._environments.clear()
+    decryption_cache._deks.clear()
+
+
+def _settings(*tenant_ids: UUID, max_bytes: int = 1 << 20) -> SimpleNamespace:
+    return SimpleNamespace(
+        dpp_decryption_cache_tenant_ids=[str(tenant_id) for tenant_id in tenant_ids],
+        dpp_decryption_cache_ttl_seconds=60,
+        dpp_decryption_cache_max_bytes=max_bytes,
+        dpp_dek_cache_ttl_seconds=15,
+        dpp_dek_cache_max_entries=8,
+    )
+
+
+def _encrypted_service() -> tuple[DPPService, SimpleNamespace, list[Any]]:
+    key_encryptor = ConnectorConfigEncryptor(base64.b64encode(os.urandom(32)).decode("ascii"))
+    encryptor = DPPFieldEncryptor(key_encryptor)
+    env = {"submodels": [{"id": "urn:sm:1", "value": "secret", "qualifiers": ENCRYPTED}]}
+    stored = encryptor.prepare_for_storage(env, tenant_id=TENANT_ID)
+    rows = [
+        SimpleNamespace(
+            id=item.ref_id,
+            json_pointer_path=item.json_pointer_path,
+            cipher_text=item.cipher_text,
+            nonce=item.nonce,
+        )
+        for item in stored.encrypted_fields
+    ]
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    service = DPPService.__new__(DPPService)
+    service._session = MagicMock()
+    service._session.execute = AsyncMock(return_value=result)
+    service._field_encryptor = encryptor
+    service._encryption_baselines = {}
+    revision = SimpleNamespace(
+        id=uuid4(),
+        tenant_id=TENANT_ID,
+        aas_env_json=stored.aas_env_json,
+        wrapped_dek=stored.wrapped_dek,
+        kek_id=stored.kek_id,
+        dek_wrapping_algorithm=stored.dek_wrapping_algorithm,
+    )
+    return service, revision, rows
+
+
+@pytest.mark.asyncio
+async def test_opted_in_tenants_reuse_decrypted_environments() -> None:
+    service, revision, _ = _encrypted_service()
+
+    with patch.object(decryption_cache, "get_settings", return_value=_settings(TENANT_ID)):
+        first = await service.get_revision_aas_for_reader(revision)  # type: ignore[arg-type]
+        first["submodels"].clear()
+        second = await service.get_revision_aas_for_reader(revision)  # type: ignore[arg-type]
+
+    assert second["submodels"][0]["value"] == "secret"
+    assert service._session.execute.await_count == 1
+    assert revision.id in service._encryption_baselines
+    assert len(decryption_cache._deks) == 1
+
+
+@pytest.mark.asyncio
+async def test_other_tenants_decrypt_every_time() -> None:
+    service, revision, _ = _encrypted_service()
+
+    with patch.object(decryption_cache, "get_settings", return_value=_settings(uuid4())):
+        await service.get_revision_aas_for_reader(revision)  # type: ignore[arg-type]
+        await service.get_revision_aas_for_reader(revision)  # type: ignore[arg-type]
+
+    assert service._session.execute.await_count == 2
+    assert len(decryption_cache._environments) == 0
+    assert len(decryption_cache._deks) == 0
+
+
+def test_expired_and_evicted_entries_are_scrubbed() -> None:
+    cache = decryption_cache.DecryptedEnvironmentCache()
+    ids = [uuid4(), uuid4()]
+    env = {"value": "secret"}
+
+    with patch.object(decryption_cache, "get_settings", return_value=_settings(max_bytes=20)):
+        cache.put(ids[0], tenant_id=TENANT_ID, wrapped_dek="w", env=env, baseline=None)
+        first_payload = cache._entries[ids[0]].payload
+        cache.put(ids[1], tenant_id=TENANT_ID, wrapped_dek="w", env=env, baseline=None)
+
+    assert len(cache) == 1
+    assert set(first_payload) == {0}
+    assert cache.get(ids[1], tenant_id=TENANT_ID, wrapped_dek="other") is None
+    assert len(cache) == 0
+
+
+def test_dek_cache_expires_before_serving_stale_keys() -> None:
+    cache = DEKCache(ttl_seconds=5, max_entries=1)
+
+    with patch("app.core.encryption.time.monotonic", return_value=100.0):
+        cache.put("kek", "wrapped-1", b"a" * 32)
+        buffer = cache._entries[("kek", "wrapped-1")][0]
+        cache.put("kek", "wrapped-2", b"b" * 32)
+        assert cache.get("kek", "wrapped-2") == b"b" * 32
+    with patch("app.core.encryption.time.monotonic", return_value=106.0):
+        assert cache.get("kek", "wrapped-2") is None
+
+    assert set(buffer) == {0}
+    assert len(cache) == 0
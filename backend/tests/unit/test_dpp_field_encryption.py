@@ -0,0 +1,157 @@
+"""Tests for DPP field-level encryption with ciphertext carried across revisions."""
+
+from __future__ import annotations
+
+import base64
+import copy
+import os
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.encryption import (
+    ConnectorConfigEncryptor,
+    DPPEncryptionResult,
+    DPPFieldEncryptor,
+)
+from app.modules.dpps.service import DPPService
+
+TENANT_ID = uuid4()
+ENCRYPTED = [{"type": "Confidentiality", "value": "encrypted"}]
+
+
+def _key() -> str:
+    return base64.b64encode(os.urandom(32)).decode("ascii")
+
+
+def _encryptor(keyring: dict[str, str], active: str) -> DPPFieldEncryptor:
+    return DPPFieldEncryptor(ConnectorConfigEncryptor(keyring=keyring, active_key_id=active))
+
+
+def _env(serial: str = "SN-1", batch: str = "B-1") -> dict[str, Any]:
+    return {
+        "submodels": [
+            {
+                "id": "urn:sm:1",
+                "submodelElements": [
+                    {"idShort": "Serial", "value": serial, "qualifiers": ENCRYPTED},
+                    {"idShort": "Batch", "value": batch, "qualifiers": ENCRYPTED},
+                    {"idShort": "Public", "value": "open"},
+                ],
+            }
+        ]
+    }
+
+
+def _rows(result: DPPEncryptionResult) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=item.ref_id,
+            json_pointer_path=item.json_pointer_path,
+            cipher_text=item.cipher_text,
+            nonce=item.nonce,
+        )
+        for item in result.encrypted_fields
+    ]
+
+
+def _decrypt(
+    encryptor: DPPFieldEncryptor,
+    result: DPPEncryptionResult,
+    rows: list[SimpleNamespace],
+    **kwargs: Any,
+) -> Any:
+    return encryptor.decrypt_revision(
+        result.aas_env_json,
+        tenant_id=TENANT_ID,
+        encrypted_rows=rows,
+        wrapped_dek=result.wrapped_dek,
+        kek_id=result.kek_id,
+        dek_wrapping_algorithm=result.dek_wrapping_algorithm,
+        **kwargs,
+    )
+
+
+def _value(env: dict[str, Any], index: int) -> Any:
+    return env["submodels"][0]["submodelElements"][index]["value"]
+
+
+def test_unchanged_fields_keep_their_ciphertext_and_dek() -> None:
+    encryptor = _encryptor({"k1": _key()}, "k1")
+    parent = encryptor.prepare_for_storage(_env(), tenant_id=TENANT_ID)
+    parent_rows = _rows(parent)
+    decrypted = _decrypt(encryptor, parent, parent_rows)
+
+    child = encryptor.prepare_for_storage(
+        _env(batch="B-2"), tenant_id=TENANT_ID, baseline=decrypted.baseline
+    )
+
+    assert child.wrapped_dek == parent.wrapped_dek
+    assert [item.json_pointer_path for item in child.encrypted_fields] == [
+        "/submodels/0/submodelElements/1/value"
+    ]
+    assert child.carried_ref_ids == [parent_rows[0].id]
+    assert _value(child.aas_env_json, 0) == _value(parent.aas_env_json, 0)
+    reread = _decrypt(encryptor, child, [parent_rows[0], *_rows(child)])
+    assert reread.aas_env_json == _env(batch="B-2")
+
+
+def test_rotated_kek_re_encrypts_under_a_fresh_dek() -> None:
+    keyring = {"old": _key(), "new": _key()}
+    parent_encryptor = _encryptor(keyring, "old")
+    parent = parent_encryptor.prepare_for_storage(_env(), tenant_id=TENANT_ID)
+    decrypted = _decrypt(parent_encryptor, parent, _rows(parent))
+
+    child = _encryptor(keyring, "new").prepare_for_storage(
+        _env(), tenant_id=TENANT_ID, baseline=decrypted.baseline
+    )
+
+    assert child.kek_id == "new"
+    assert child.carried_ref_ids == []
+    assert len(child.encrypted_fields) == 2
+
+
+def test_selective_reads_decrypt_only_requested_pointers() -> None:
+    encryptor = _encryptor({"k1": _key()}, "k1")
+    parent = encryptor.prepare_for_storage(_env(), tenant_id=TENANT_ID)
+    serial_pointer = "/submodels/0/submodelElements/0"
+    refs = encryptor.marker_paths(parent.aas_env_json, pointers=[serial_pointer])
+    rows = [row for row in _rows(parent) if str(row.id) in refs]
+
+    decrypted = _decrypt(encryptor, parent, rows, pointers=[serial_pointer])
+
+    assert len(refs) == 1
+    assert _value(decrypted.aas_env_json, 0) == "SN-1"
+    assert _value(decrypted.aas_env_json, 1) == _value(parent.aas_env_json, 1)
+
+    child = encryptor.prepare_for_storage(
+        copy.deepcopy(decrypted.aas_env_json), tenant_id=TENANT_ID, baseline=decrypted.baseline
+    )
+    assert child.encrypted_fields == []
+    assert len(child.carried_ref_ids) == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_pointer_reads_skip_row_lookup() -> None:
+    encryptor = _encryptor({"k1": _key()}, "k1")
+    stored = encryptor.prepare_for_storage(_env(), tenant_id=TENANT_ID)
+    service = DPPService.__new__(DPPService)
+    service._session = MagicMock()
+    service._session.execute = AsyncMock()
+    service._field_encryptor = encryptor
+    revision = SimpleNamespace(
+        id=uuid4(),
+        tenant_id=TENANT_ID,
+        aas_env_json=stored.aas_env_json,
+        wrapped_dek=stored.wrapped_dek,
+        kek_id=stored.kek_id,
+        dek_wrapping_algorithm=stored.dek_wrapping_algorithm,
+    )
+
+    env = await service.get_revision_aas_for_reader(revision, pointers=())  # type: ignore[arg-type]
+
+    assert env is stored.aas_env_json
+    service._session.execute.assert_not_awaited()
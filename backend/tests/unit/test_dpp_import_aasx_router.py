@@ -133,6 +133,7 @@ async def test_import_aasx_strips_uom_before_validation() -> None:
         visibility_scope=SimpleNamespace(value="owner_team"),
         asset_ids={"manufacturerPartId": "MP-1"},
         qr_payload="https://example.test/dpp",
+        short_slug=None,
         created_at=datetime.now(UTC),
         updated_at=datetime.now(UTC),
     )
@@ -0,0 +1,340 @@
+"""Tests for the transactional outbox of post-publish side effects."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import DPPStatus
+from app.modules.dpps import outbox
+from app.modules.webhooks import service as webhook_service
+
+TENANT_ID = uuid4()
+
+
+def _settings(**overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "webhook_timeout_seconds": 5,
+        "webhook_max_subscriptions": 25,
+        "dpp_outbox_max_attempts": 3,
+        "dpp_outbox_retry_base_seconds": 10,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture(autouse=True)
+def _settings_patch() -> Iterator[None]:
+    with patch.object(outbox, "get_settings", return_value=_settings()):
+        yield
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.commit = AsyncMock()
+    return session
+
+
+@contextlib.contextmanager
+def _tenant_sessions(session: MagicMock) -> Iterator[MagicMock]:
+    @contextlib.asynccontextmanager
+    async def tenant_session(tenant_id: Any) -> Any:
+        assert tenant_id == TENANT_ID
+        yield session
+
+    with patch.object(outbox, "get_tenant_background_session", tenant_session):
+        yield session
+
+
+def _compiled(session: MagicMock, index: int = -1) -> str:
+    statement = session.execute.await_args_list[index].args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _entry(effect: str, **overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "id": uuid4(),
+        "tenant_id": TENANT_ID,
+        "dpp_id": uuid4(),
+        "revision_id": uuid4(),
+        "effect": effect,
+        "payload": {"created_by": "publisher-1"},
+        "status": outbox.STATUS_PENDING,
+        "attempts": 0,
+        "available_at": None,
+        "last_error": None,
+        "processed_at": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.mark.asyncio
+async def test_publish_enqueues_one_idempotent_entry_per_side_effect() -> None:
+    session = _session()
+    revision_id = uuid4()
+    dpp = SimpleNamespace(
+        id=uuid4(),
+        tenant_id=TENANT_ID,
+        status=DPPStatus.PUBLISHED,
+        current_published_revision_id=revision_id,
+    )
+
+    await outbox.enqueue_publish_side_effects(session, dpp, created_by="publisher-1")  # type: ignore[arg-type]
+
+    sql = _compiled(session)
+    assert "ON CONFLICT ON CONSTRAINT uq_dpp_outbox_tenant_key DO NOTHING" in sql
+    rows = outbox.publish_side_effects(dpp, created_by="publisher-1")  # type: ignore[arg-type]
+    assert [row["effect"] for row in rows] == [
+        outbox.EFFECT_WEBHOOK,
+        outbox.EFFECT_RESOLVER_LINKS,
+        outbox.EFFECT_SHELL_DESCRIPTOR,
+    ]
+    assert all(str(revision_id) in row["idempotency_key"] for row in rows)
+    assert rows[0]["payload"]["payload"]["status"] == "published"
+
+
+def _webhook_entry(**overrides: Any) -> SimpleNamespace:
+    return _entry(
+        outbox.EFFECT_WEBHOOK,
+        payload={"event_type": "DPP_PUBLISHED", "payload": {"event": "DPP_PUBLISHED"}},
+        created_at=datetime.now(UTC),
+        **overrides,
+    )
+
+
+def _subscription(url: str) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), url=url, secret="secret", events=["DPP_PUBLISHED"])
+
+
+@contextlib.contextmanager
+def _webhook_delivery(
+    subscriptions: list[SimpleNamespace], statuses: dict[str, int]
+) -> Iterator[tuple[AsyncMock, list[Any]]]:
+    logged: list[Any] = []
+    log_session = MagicMock()
+    log_session.add = MagicMock(side_effect=logged.append)
+    log_session.commit = AsyncMock()
+
+    @contextlib.asynccontextmanager
+    async def background_session() -> Any:
+        yield log_session
+
+    async def deliver(url: str, **_: Any) -> tuple[int, str, None]:
+        if url not in statuses:
+            await asyncio.Event().wait()
+        return statuses[url], "", None
+
+    deliver_mock = AsyncMock(side_effect=deliver)
+    with (
+        patch.object(
+            webhook_service, "get_settings", return_value=SimpleNamespace(webhook_enabled=True)
+        ),
+        patch.object(
+            webhook_service.WebhookService,
+            "_find_matching_subscriptions",
+            new=AsyncMock(return_value=subscriptions),
+        ),
+        patch.object(webhook_service, "deliver_webhook", new=deliver_mock),
+        patch("app.db.session.get_background_session", background_session),
+    ):
+        yield deliver_mock, logged
+
+
+@pytest.mark.asyncio
+async def test_webhook_delivery_carries_the_entry_id_as_event_id() -> None:
+    entry = _webhook_entry(attempts=1)
+    subscription = _subscription("https://a.example/hook")
+
+    with (
+        _tenant_sessions(_session()) as session,
+        _webhook_delivery([subscription], {subscription.url: 204}) as (deliver, logged),
+    ):
+        delivered = await outbox.deliver_entry(entry)  # type: ignore[arg-type]
+
+    assert delivered is True
+    assert entry.status == outbox.STATUS_DONE
+    assert "dpp_outbox.attempts = %(attempts_1)s" in _compiled(session)
+    session.commit.assert_awaited_once()
+    assert deliver.await_args.kwargs["payload"] == {
+        "event": "DPP_PUBLISHED",
+        "event_id": str(entry.id),
+    }
+    assert [log.success for log in logged] == [True]
+
+
+@pytest.mark.asyncio
+async def test_failed_webhook_delivery_reschedules_the_entry() -> None:
+    entry = _webhook_entry(attempts=1)
+    accepted, failing = _subscription("https://a.example/hook"), _subscription("https://b.example")
+
+    with (
+        _tenant_sessions(_session()),
+        _webhook_delivery([accepted, failing], {accepted.url: 200, failing.url: 503}) as (
+            _,
+            logged,
+        ),
+    ):
+        before = datetime.now(UTC)
+        delivered = await outbox.deliver_entry(entry)  # type: ignore[arg-type]
+
+    assert delivered is False
+    assert (entry.status, entry.attempts) == (outbox.STATUS_PENDING, 1)
+    assert entry.available_at >= before + timedelta(seconds=10)
+    assert "HTTP 503" in entry.last_error
+    assert [(log.subscription_id, log.success) for log in logged] == [
+        (accepted.id, True),
+        (failing.id, False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_webhook_retry_skips_subscriptions_that_accepted_the_event() -> None:
+    entry = _webhook_entry(attempts=2)
+    accepted, failing = _subscription("https://a.example/hook"), _subscription("https://b.example")
+    session = _session()
+    session.execute.return_value.scalars.return_value.all.return_value = [accepted.id]
+
+    with (
+        _tenant_sessions(session),
+        _webhook_delivery([accepted, failing], {failing.url: 200}) as (deliver, _),
+    ):
+        delivered = await outbox.deliver_entry(entry)  # type: ignore[arg-type]
+
+    assert delivered is True
+    assert [call.kwargs["url"] for call in deliver.await_args_list] == [failing.url]
+    assert "webhook_delivery_log.success IS true" in _compiled(session, 0)
+
+
+@pytest.mark.asyncio
+async def test_webhook_deadline_keeps_the_logs_of_finished_deliveries() -> None:
+    entry = _webhook_entry(attempts=1)
+    accepted, hanging = _subscription("https://a.example/hook"), _subscription("https://b.example")
+
+    with (
+        _tenant_sessions(_session()),
+        _webhook_delivery([accepted, hanging], {accepted.url: 200}) as (_, logged),
+        patch.object(outbox, "webhook_deadline_seconds", return_value=0.05),
+    ):
+        delivered = await outbox.deliver_entry(entry)  # type: ignore[arg-type]
+
+    assert delivered is False
+    assert entry.status == outbox.STATUS_PENDING
+    assert [(log.subscription_id, log.success) for log in logged] == [(accepted.id, True)]
+
+
+def test_webhook_deadline_leaves_room_for_queued_http_timeouts() -> None:
+    with patch.object(
+        outbox,
+        "get_settings",
+        return_value=_settings(webhook_timeout_seconds=10, webhook_max_subscriptions=25),
+    ):
+        # 25 subscriptions over 20 delivery slots take two rounds, plus one spare.
+        assert outbox.webhook_deadline_seconds() == 10 * 3 + 30
+
+
+@pytest.mark.asyncio
+async def test_database_effects_are_not_bound_by_the_webhook_deadline() -> None:
+    session = _session()
+    session.get = AsyncMock(return_value=SimpleNamespace(id=uuid4()))
+    entry = _entry(outbox.EFFECT_RESOLVER_LINKS, attempts=1)
+
+    async def slow_register(*_: Any) -> None:
+        await asyncio.sleep(0.05)
+
+    with (
+        _tenant_sessions(session),
+        patch.object(outbox, "register_resolver_links", new=slow_register),
+        patch.object(outbox, "webhook_deadline_seconds", return_value=0.01),
+    ):
+        assert await outbox.deliver_entry(entry) is True  # type: ignore[arg-type]
+
+    assert entry.status == outbox.STATUS_DONE
+
+
+@pytest.mark.asyncio
+async def test_failed_effects_are_retried_with_backoff_then_marked_failed() -> None:
+    session = _session()
+    session.get = AsyncMock(return_value=SimpleNamespace(id=uuid4()))
+    entry = _entry(outbox.EFFECT_RESOLVER_LINKS, attempts=2)
+    register = AsyncMock(side_effect=RuntimeError("resolver down"))
+
+    with _tenant_sessions(session), patch.object(outbox, "register_resolver_links", new=register):
+        before = datetime.now(UTC)
+        assert await outbox.deliver_entry(entry) is False  # type: ignore[arg-type]
+
+        assert (entry.status, entry.last_error) == (outbox.STATUS_PENDING, "resolver down")
+        assert entry.available_at >= before + timedelta(seconds=20)
+
+        entry.attempts += 1
+        assert await outbox.deliver_entry(entry) is False  # type: ignore[arg-type]
+
+    assert (entry.status, entry.attempts) == (outbox.STATUS_FAILED, 3)
+    assert entry.processed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_entries_locked_by_other_workers() -> None:
+    session = _session()
+    session.execute.return_value.scalars.return_value.all.return_value = []
+
+    await outbox.claim_due_entries(session, TENANT_ID, limit=20)
+
+    statement = session.execute.await_args.args[0]
+    sql = _compiled(session)
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "dpp_outbox.available_at <= now()" in sql
+    assert statement._limit_clause.value == 20
+
+
+@pytest.mark.asyncio
+async def test_lease_counts_the_attempt_and_commits_before_delivery() -> None:
+    entries = [_entry(outbox.EFFECT_WEBHOOK), _entry(outbox.EFFECT_RESOLVER_LINKS)]
+    session = _session()
+    session.execute.return_value.scalars.return_value.all.return_value = entries
+
+    with _tenant_sessions(session):
+        before = datetime.now(UTC)
+        entry, more_due = await outbox.lease_next_entry(TENANT_ID)
+
+    assert (entry, more_due) == (entries[0], True)
+    assert entries[0].attempts == 1
+    assert entries[0].available_at >= before + outbox.lease_duration()
+    assert entries[1].attempts == 0
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_drain_delivers_one_leased_entry_at_a_time() -> None:
+    entries = [_entry(outbox.EFFECT_RESOLVER_LINKS) for _ in range(2)]
+    leases = iter([(entries[0], True), (entries[1], False), (None, False)])
+    order: list[str] = []
+
+    async def lease(_tenant_id: Any) -> tuple[Any, bool]:
+        order.append("lease")
+        return next(leases)
+
+    async def deliver(entry: Any) -> bool:
+        order.append(f"deliver {entries.index(entry)}")
+        return True
+
+    with (
+        patch.object(outbox, "get_settings", return_value=_settings(dpp_outbox_batch_size=5)),
+        patch.object(outbox, "lease_next_entry", new=lease),
+        patch.object(outbox, "deliver_entry", new=deliver),
+        patch.object(outbox, "notify_outbox") as notify,
+    ):
+        assert await outbox.drain_tenant(TENANT_ID) == 2
+
+    assert order == ["lease", "deliver 0", "lease", "deliver 1", "lease"]
+    notify.assert_called_once_with(TENANT_ID)
@@ -19,7 +19,15 @@ DIGITAL_NAMEPLATE_SEMANTIC_ID = "https://admin-shell.io/idta/DigitalNameplate/Na
 def _session_mock() -> AsyncMock:
     session = AsyncMock()
     session.add = MagicMock()
-    session.flush = AsyncMock()
+
+    async def _flush() -> None:
+        # Mimic the server-side UUID defaults assigned on flush
+        for call in session.add.call_args_list:
+            if getattr(call.args[0], "id", None) is None:
+                call.args[0].id = uuid4()
+
+    session.flush = AsyncMock(side_effect=_flush)
+    session.execute = AsyncMock(return_value=MagicMock())
     return session
 
 
@@ -234,6 +242,7 @@ class TestProvenancePropagation:
 
         dpp = SimpleNamespace(
             id=uuid4(),
+            asset_ids={},
             tenant_id=uuid4(),
             status=DPPStatus.DRAFT,
             current_published_revision_id=None,
@@ -0,0 +1,205 @@
+"""Tests for resumable background rebuild-all jobs."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.background_jobs import JOB_STATUS_RUNNING
+from app.modules.dpps import rebuild_jobs
+from app.modules.dpps.rebuild_jobs import DPPRebuildJobService, rebuild_progress
+
+TENANT_ID = uuid4()
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.flush = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+def _sessions(session: MagicMock) -> Any:
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[MagicMock]:
+        yield session
+
+    return factory
+
+
+def _job(**overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "id": uuid4(),
+        "tenant_id": TENANT_ID,
+        "requested_by_subject": "admin-1",
+        "status": JOB_STATUS_RUNNING,
+        "total": 10,
+        "processed": 0,
+        "updated": 0,
+        "skipped": 0,
+        "failed": 0,
+        "errors": [],
+        "checkpoint_dpp_id": None,
+        "chunk_size": 3,
+        "concurrency": 2,
+        "started_at": None,
+        "heartbeat_at": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _sql(statement: Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_pages_continue_after_the_checkpoint_in_id_order() -> None:
+    session = _session()
+    checkpoint = uuid4()
+
+    await DPPRebuildJobService(session).next_page(_job(checkpoint_dpp_id=checkpoint))  # type: ignore[arg-type]
+
+    statement = session.execute.await_args.args[0]
+    sql = _sql(statement)
+    assert "dpps.id > %(id_1)s" in sql
+    assert "ORDER BY dpps.id" in sql
+    assert statement._limit_clause.value == 3
+
+
+@pytest.mark.asyncio
+async def test_creating_a_second_active_job_is_rejected() -> None:
+    session = _session()
+    session.execute.return_value.scalar_one_or_none.return_value = _job()
+
+    with pytest.raises(ValueError, match="already queued or running"):
+        await DPPRebuildJobService(session).create_job(
+            tenant_id=TENANT_ID, requested_by_subject="admin-1"
+        )
+    session.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_claim_takes_over_jobs_with_a_stale_heartbeat() -> None:
+    session = _session()
+    session.execute.return_value.scalar_one_or_none.return_value = uuid4()
+    settings = SimpleNamespace(dpp_rebuild_stale_seconds=300)
+
+    with (
+        patch.object(rebuild_jobs, "get_settings", return_value=settings),
+        patch("app.db.session.get_background_session", _sessions(session)),
+    ):
+        claimed = await rebuild_jobs._runner.claim(TENANT_ID, uuid4(), uuid4())
+
+    assert claimed is True
+    sql = _sql(session.execute.await_args_list[-1].args[0])
+    assert "dpp_rebuild_jobs.heartbeat_at <" in sql
+    assert "coalesce(dpp_rebuild_jobs.started_at, now())" in sql
+    session.commit.assert_awaited_once()
+
+
+def test_eta_extrapolates_the_observed_rate() -> None:
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    job = _job(
+        total=1000,
+        processed=250,
+        started_at=started,
+        heartbeat_at=started + timedelta(seconds=50),
+    )
+
+    progress = rebuild_progress(job)  # type: ignore[arg-type]
+
+    assert progress.percent == 25.0
+    assert progress.rate_per_second == 5.0
+    assert progress.eta_seconds == 150
+    assert rebuild_progress(_job(processed=0)).eta_seconds is None  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_pages_rebuild_at_most_concurrency_dpps_at_once() -> None:
+    running = 0
+    peak = 0
+
+    async def rebuild_one(*_: Any) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return "updated"
+
+    with patch.object(rebuild_jobs, "_rebuild_one", side_effect=rebuild_one):
+        outcomes = await rebuild_jobs._rebuild_page(
+            _job(concurrency=2),  # type: ignore[arg-type]
+            [uuid4() for _ in range(5)],
+            [],
+        )
+
+    assert outcomes == ["updated"] * 5
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_records_counters_cursor_and_capped_errors() -> None:
+    session = _session()
+    job = _job(processed=3, updated=1, skipped=2, errors=[{"dpp_id": "x", "error": "e"}] * 99)
+    session.execute.return_value.scalar_one_or_none.return_value = job
+    dpp_ids = sorted(UUID(int=index) for index in range(1, 4))
+
+    with patch("app.db.session.get_background_session", _sessions(session)):
+        result = await rebuild_jobs._checkpoint(
+            TENANT_ID, job.id, uuid4(), dpp_ids, ["updated", "boom", "broken"]
+        )
+
+    assert result is job
+    assert (job.processed, job.updated, job.skipped, job.failed) == (6, 2, 2, 2)
+    assert job.checkpoint_dpp_id == dpp_ids[-1]
+    assert len(job.errors) == 100
+    assert job.errors[-1] == {"dpp_id": str(dpp_ids[1]), "error": "boom"}
+    assert "dpp_rebuild_jobs.worker_token =" in _sql(session.execute.await_args.args[0])
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_resumes_from_the_checkpoint_and_completes() -> None:
+    session = _session()
+    checkpoint = UUID(int=5)
+    job = _job(processed=5, checkpoint_dpp_id=checkpoint, refresh_templates=True)
+    session.get = AsyncMock(return_value=job)
+    pages = [[UUID(int=6), UUID(int=7)], []]
+
+    async def next_page(_self: Any, _job: Any) -> list[UUID]:
+        return pages.pop(0)
+
+    template_service = MagicMock()
+    template_service.get_all_templates = AsyncMock(return_value=[SimpleNamespace()])
+    template_service.refresh_all_templates = AsyncMock()
+    checkpoint_mock = AsyncMock(return_value=job)
+    finish = AsyncMock()
+
+    with (
+        patch.object(rebuild_jobs._runner, "claim", AsyncMock(return_value=True)),
+        patch("app.db.session.get_background_session", _sessions(session)),
+        patch.object(rebuild_jobs, "TemplateRegistryService", return_value=template_service),
+        patch.object(DPPRebuildJobService, "next_page", next_page),
+        patch.object(rebuild_jobs, "_rebuild_page", AsyncMock(return_value=["skipped"] * 2)),
+        patch.object(rebuild_jobs, "_checkpoint", checkpoint_mock),
+        patch.object(rebuild_jobs._runner, "finish", finish),
+    ):
+        assert await rebuild_jobs.run_rebuild_job(TENANT_ID, job.id) is True
+
+    # Templates are only refreshed before the first chunk of a run.
+    template_service.refresh_all_templates.assert_not_awaited()
+    assert checkpoint_mock.await_args.args[3] == [UUID(int=6), UUID(int=7)]
+    assert finish.await_args.kwargs == {"error": None}
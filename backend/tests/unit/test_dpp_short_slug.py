@@ -0,0 +1,123 @@
+"""Tests for indexed DPP short-link slugs."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.modules.dpps.service import DPPService
+from app.modules.dpps.short_slug import normalize_short_slug, short_slug_candidates
+from app.modules.qr.service import QRCodeService
+
+_DPP_ID = UUID("0192f0e4-7a1b-7c3d-9e4f-a1b2c3d4e5f6")
+
+
+def _scalars_result(values: list[str]) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = values
+    return result
+
+
+class TestShortSlugHelpers:
+    def test_candidates_grow_from_8_hex_to_full_id(self) -> None:
+        candidates = short_slug_candidates(_DPP_ID)
+        assert candidates[0] == "0192f0e4"
+        assert candidates[-1] == _DPP_ID.hex
+        assert all(_DPP_ID.hex.startswith(candidate) for candidate in candidates)
+
+    @pytest.mark.parametrize("slug", ["0192F0E4", " 0192f0e4 ", "0192f0e47a1b"])
+    def test_normalize_accepts_hex_prefixes(self, slug: str) -> None:
+        assert normalize_short_slug(slug) == slug.strip().lower()
+
+    @pytest.mark.parametrize("slug", ["", "0192f0e", "0192f0eg", "x" * 8, "a" * 33])
+    def test_normalize_rejects_impossible_slugs(self, slug: str) -> None:
+        assert normalize_short_slug(slug) is None
+
+
+class TestAssignShortSlug:
+    @pytest.mark.asyncio()
+    async def test_uses_8_hex_prefix_when_free(self) -> None:
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[MagicMock(), _scalars_result([])])
+        dpp = SimpleNamespace(id=_DPP_ID, tenant_id=uuid4(), short_slug=None)
+
+        await DPPService(session)._assign_short_slug(dpp)  # type: ignore[arg-type]
+
+        assert dpp.short_slug == "0192f0e4"
+
+    @pytest.mark.asyncio()
+    async def test_falls_back_to_longer_prefix_on_collision(self) -> None:
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[MagicMock(), _scalars_result(["0192f0e4", "0192f0e47a1b"])]
+        )
+        dpp = SimpleNamespace(id=_DPP_ID, tenant_id=uuid4(), short_slug=None)
+
+        await DPPService(session)._assign_short_slug(dpp)  # type: ignore[arg-type]
+
+        assert dpp.short_slug == "0192f0e47a1b7c3d"
+
+
+class TestGetDppBySlug:
+    @pytest.mark.asyncio()
+    async def test_invalid_slug_skips_query(self) -> None:
+        session = AsyncMock()
+        assert await DPPService(session).get_dpp_by_slug("not-hex!", uuid4()) is None
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio()
+    async def test_exact_slug_lookup(self) -> None:
+        dpp = SimpleNamespace(id=_DPP_ID)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = dpp
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=result)
+
+        found = await DPPService(session).get_dpp_by_slug("0192F0E4", uuid4())
+
+        assert found is dpp
+        statement = str(session.execute.await_args.args[0])
+        assert "dpps.short_slug =" in statement
+        assert "LIKE" not in statement
+
+
+class TestSharedPrefixShortLinks:
+    @pytest.mark.asyncio()
+    async def test_dpps_sharing_a_prefix_resolve_to_their_own_passport(self) -> None:
+        tenant_id = uuid4()
+        first = SimpleNamespace(id=_DPP_ID, tenant_id=tenant_id, short_slug=None)
+        second = SimpleNamespace(
+            id=UUID("0192f0e4-7a1b-7c3d-9e4f-000000000001"), tenant_id=tenant_id, short_slug=None
+        )
+        allocation = AsyncMock()
+        allocation.execute = AsyncMock(side_effect=[MagicMock(), _scalars_result([])])
+        await DPPService(allocation)._assign_short_slug(first)  # type: ignore[arg-type]
+        allocation.execute.side_effect = [MagicMock(), _scalars_result([first.short_slug])]
+        await DPPService(allocation)._assign_short_slug(second)  # type: ignore[arg-type]
+
+        by_slug = {dpp.short_slug: dpp for dpp in (first, second)}
+
+        async def execute(statement: Any) -> MagicMock:
+            result = MagicMock()
+            slug = statement.compile().params["short_slug_1"]
+            result.scalar_one_or_none.return_value = by_slug.get(slug)
+            return result
+
+        lookup = AsyncMock()
+        lookup.execute = AsyncMock(side_effect=execute)
+        qr = QRCodeService()
+        for dpp in (first, second):
+            url = qr.build_dpp_url(str(dpp.id), tenant_slug="acme", short_slug=dpp.short_slug)
+            slug = url.rsplit("/p/", 1)[1]
+            assert await DPPService(lookup).get_dpp_by_slug(slug, tenant_id) is dpp
+        assert first.short_slug == "0192f0e4"
+        assert second.short_slug == "0192f0e47a1b"
+
+    def test_short_link_without_stored_slug_uses_full_url(self) -> None:
+        url = QRCodeService().build_dpp_url(str(_DPP_ID), tenant_slug="acme")
+
+        assert url.endswith(f"/t/acme/dpp/{_DPP_ID}")
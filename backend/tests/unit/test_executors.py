@@ -0,0 +1,49 @@
+"""Tests for the lazily started worker pools used by batch paths."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.executors import SlicedPool
+
+
+def _double(part: list[int]) -> list[int]:
+    return [value * 2 for value in part]
+
+
+@pytest.mark.asyncio
+async def test_small_inputs_and_disabled_pools_are_left_to_the_caller() -> None:
+    assert await SlicedPool(lambda: 2, min_items=10).map_slices(_double, [1, 2, 3]) is None
+
+    disabled = SlicedPool(lambda: 0, min_items=1)
+    assert await disabled.map_slices(_double, list(range(20))) is None
+    assert not disabled.started
+
+
+@pytest.mark.asyncio
+async def test_slices_are_mapped_in_input_order() -> None:
+    pool = SlicedPool(lambda: 2, min_items=1, slices_per_worker=2, thread_name_prefix="test")
+    try:
+        parts = await pool.map_slices(_double, list(range(10)))
+    finally:
+        pool.shutdown()
+
+    assert parts is not None and len(parts) == 4
+    assert [value for part in parts for value in part] == [value * 2 for value in range(10)]
+    assert not pool.started
+
+
+def test_pool_restarts_when_its_size_changes() -> None:
+    workers = [2]
+    pool = SlicedPool(lambda: workers[0], min_items=1, thread_name_prefix="test")
+    try:
+        first = pool.executor()
+        assert isinstance(first, ThreadPoolExecutor)
+        assert pool.executor() is first
+
+        workers[0] = 3
+        assert pool.executor() is not first
+    finally:
+        pool.shutdown()
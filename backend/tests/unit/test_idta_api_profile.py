@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import json
 from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -21,6 +22,11 @@ from app.modules.dpps.idta_schemas import (
     decode_cursor,
     encode_cursor,
 )
+from app.modules.dpps.public_projection import (
+    build_public_projection,
+    build_public_submodels,
+    projection_key_for_tier,
+)
 
 # ======================================================================
 # Schema serialization tests
@@ -206,6 +212,29 @@ def _encode_b64(s: str) -> str:
     return base64.urlsafe_b64encode(s.encode()).decode().rstrip("=")
 
 
+def _projection_row(revision: MagicMock, espr_tier: str | None) -> MagicMock:
+    """Row returned by the published-projection lookup for ``revision``."""
+    row = MagicMock()
+    row.id = revision.id
+    row.revision_no = revision.revision_no
+    row.digest_sha256 = revision.digest_sha256
+    row.payload = build_public_projection(revision.aas_env_json, projection_key_for_tier(espr_tier))
+    return row
+
+
+def _submodel_row(revision: MagicMock, submodel_id: str) -> MagicMock:
+    """Row returned by the published-submodel lookup for ``revision``."""
+    stored = {sm.submodel_id: sm for sm in build_public_submodels(revision.aas_env_json)}
+    row = MagicMock()
+    row.id = revision.id
+    row.revision_no = revision.revision_no
+    row.digest_sha256 = revision.digest_sha256
+    row.has_submodel_rows = bool(stored)
+    row.semantic_id = stored[submodel_id].semantic_id if submodel_id in stored else None
+    row.payload = stored[submodel_id].payload if submodel_id in stored else None
+    return row
+
+
 # ======================================================================
 # ServiceDescription endpoint
 # ======================================================================
@@ -267,14 +296,14 @@ class TestContentValueQueryParam:
         dpp_result = MagicMock()
         dpp_result.scalar_one_or_none.return_value = dpp
         rev_result = MagicMock()
-        rev_result.scalar_one_or_none.return_value = revision
+        rev_result.one_or_none.return_value = _submodel_row(revision, "urn:example:nameplate")
 
         db.execute = AsyncMock(side_effect=[tenant_result, dpp_result, rev_result])
 
         aas_id_b64 = _encode_b64(f"urn:uuid:{dpp.id}")
         sm_id_b64 = _encode_b64("urn:example:nameplate")
 
-        result = await get_submodel_by_id(
+        response = await get_submodel_by_id(
             tenant_slug="default",
             aas_id_b64=aas_id_b64,
             submodel_id_b64=sm_id_b64,
@@ -282,6 +311,7 @@ class TestContentValueQueryParam:
             espr_tier=None,
             content="normal",
         )
+        result = json.loads(response.body)
 
         assert "id" in result
         assert "submodelElements" in result
@@ -301,14 +331,14 @@ class TestContentValueQueryParam:
         dpp_result = MagicMock()
         dpp_result.scalar_one_or_none.return_value = dpp
         rev_result = MagicMock()
-        rev_result.scalar_one_or_none.return_value = revision
+        rev_result.one_or_none.return_value = _submodel_row(revision, "urn:example:nameplate")
 
         db.execute = AsyncMock(side_effect=[tenant_result, dpp_result, rev_result])
 
         aas_id_b64 = _encode_b64(f"urn:uuid:{dpp.id}")
         sm_id_b64 = _encode_b64("urn:example:nameplate")
 
-        result = await get_submodel_by_id(
+        response = await get_submodel_by_id(
             tenant_slug="default",
             aas_id_b64=aas_id_b64,
             submodel_id_b64=sm_id_b64,
@@ -316,6 +346,7 @@ class TestContentValueQueryParam:
             espr_tier=None,
             content="value",
         )
+        result = json.loads(response.body)
 
         assert "submodelElements" in result
         assert "id" not in result
@@ -344,18 +375,19 @@ class TestListSubmodelRefs:
         dpp_result = MagicMock()
         dpp_result.scalar_one_or_none.return_value = dpp
         rev_result = MagicMock()
-        rev_result.scalar_one_or_none.return_value = revision
+        rev_result.one_or_none.return_value = _projection_row(revision, None)
 
         db.execute = AsyncMock(side_effect=[tenant_result, dpp_result, rev_result])
 
         aas_id_b64 = _encode_b64(f"urn:uuid:{dpp.id}")
 
-        refs = await list_submodel_refs(
+        response = await list_submodel_refs(
             tenant_slug="default",
             aas_id_b64=aas_id_b64,
             db=db,
             espr_tier=None,
         )
+        refs = json.loads(response.body)
 
         assert len(refs) == 1
         assert refs[0]["id"] == "urn:example:nameplate"
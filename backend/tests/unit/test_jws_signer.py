@@ -0,0 +1,213 @@
+"""Tests for preloaded JWS signing keys, rotation and batch/detached signing."""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from app.core.crypto import jws_signer
+from app.core.crypto.jws_signer import (
+    JWSSigner,
+    SigningError,
+    attach_payload,
+    load_signing_key,
+)
+from app.core.crypto.signing import (
+    generate_signing_keypair,
+    load_ed25519_private_key,
+    sign_merkle_root,
+    verify_signature,
+)
+from app.modules.dpps.service import DPPService
+
+
+def _ec_keypair() -> tuple[str, str]:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    return private_pem, public_pem
+
+
+def _settings(**overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "dpp_signing_key": "",
+        "dpp_signing_key_id": "key-1",
+        "dpp_signing_algorithm": "ES256",
+        "dpp_signing_keys_file": "",
+        "dpp_signing_keys_reload_seconds": 30,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_signatures_verify_and_carry_the_kid() -> None:
+    private_pem, public_pem = _ec_keypair()
+    signer = JWSSigner(
+        [load_signing_key(private_pem, kid="key-1", algorithm="ES256")], active_kid="key-1"
+    )
+
+    token = signer.sign_digest("abc123")
+
+    assert jwt.get_unverified_header(token)["kid"] == "key-1"
+    assert DPPService.verify_jws(token, "abc123", public_pem) is True
+
+
+def test_invalid_keys_are_rejected_when_loaded() -> None:
+    with pytest.raises(SigningError, match="Invalid signing key 'key-1'"):
+        load_signing_key("not-a-valid-pem-key", kid="key-1", algorithm="RS256")
+    with pytest.raises(SigningError, match="Unsupported JWS algorithm"):
+        load_signing_key("secret", kid="key-1", algorithm="XS999")
+
+
+def test_keys_rotate_by_kid_and_retired_keys_stay_usable() -> None:
+    old_pem, old_public = _ec_keypair()
+    new_pem, new_public = _ec_keypair()
+    signer = JWSSigner(
+        [load_signing_key(old_pem, kid="key-1", algorithm="ES256")], active_kid="key-1"
+    )
+
+    signer.add_key(load_signing_key(new_pem, kid="key-2", algorithm="ES256"), activate=True)
+
+    assert signer.active_kid == "key-2"
+    assert DPPService.verify_jws(signer.sign_digest("abc"), "abc", new_public) is True
+    assert DPPService.verify_jws(signer.sign_digest("abc", kid="key-1"), "abc", old_public) is True
+    with pytest.raises(SigningError, match="active"):
+        signer.remove_key("key-2")
+    signer.remove_key("key-1")
+    with pytest.raises(SigningError, match="Unknown signing key"):
+        signer.sign_digest("abc", kid="key-1")
+
+
+def test_keyring_file_changes_are_picked_up_without_a_restart(tmp_path: Path) -> None:
+    first_pem, _ = _ec_keypair()
+    second_pem, second_public = _ec_keypair()
+    keyring = tmp_path / "keyring.json"
+
+    def write(active_kid: str, entries: list[tuple[str, str]], mtime: int) -> None:
+        keyring.write_text(
+            json.dumps(
+                {
+                    "active_kid": active_kid,
+                    "keys": [
+                        {"kid": kid, "algorithm": "ES256", "private_key": pem}
+                        for kid, pem in entries
+                    ],
+                }
+            )
+        )
+        os.utime(keyring, (mtime, mtime))
+
+    write("file-1", [("file-1", first_pem)], 1_000)
+    signer = JWSSigner(
+        [load_signing_key(first_pem, kid="env-key", algorithm="ES256")],
+        active_kid="env-key",
+        keys_file=str(keyring),
+        reload_interval_seconds=0,
+    )
+    assert signer.active_kid == "file-1"
+
+    write("file-2", [("file-1", first_pem), ("file-2", second_pem)], 2_000)
+    token = signer.sign_digest("abc")
+
+    assert jwt.get_unverified_header(token)["kid"] == "file-2"
+    assert DPPService.verify_jws(token, "abc", second_public) is True
+
+    keyring.write_text("{not json")
+    os.utime(keyring, (3_000, 3_000))
+    assert signer.active_kid == "file-2"
+
+
+def test_detached_signatures_verify_once_the_payload_is_attached() -> None:
+    private_pem, public_pem = _ec_keypair()
+    signer = JWSSigner(
+        [load_signing_key(private_pem, kid="key-1", algorithm="ES256")], active_kid="key-1"
+    )
+
+    detached = signer.sign_digest("abc123", detached=True)
+
+    header, payload, _signature = detached.split(".")
+    assert header and payload == ""
+    assert DPPService.verify_jws(attach_payload(detached, b"abc123"), "abc123", public_pem)
+    assert not DPPService.verify_jws(attach_payload(detached, b"other"), "other", public_pem)
+
+
+def test_batch_signing_in_a_thread_pool_uses_one_key() -> None:
+    private_pem, public_pem = _ec_keypair()
+    signer = JWSSigner(
+        [load_signing_key(private_pem, kid="key-1", algorithm="ES256")], active_kid="key-1"
+    )
+    digests = [f"digest-{i}" for i in range(20)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        tokens = signer.sign_digests(digests, executor=executor)
+
+    assert len(tokens) == len(digests)
+    for digest, token in zip(digests, tokens, strict=True):
+        assert DPPService.verify_jws(token, digest, public_pem) is True
+
+
+@pytest.mark.asyncio
+async def test_sign_digests_batch_uses_the_configured_pool() -> None:
+    signer = JWSSigner(
+        [load_signing_key("a-shared-secret-of-at-least-32-bytes", kid="hs", algorithm="HS256")],
+        active_kid="hs",
+    )
+    digests = [f"digest-{i}" for i in range(40)]
+
+    with patch.object(
+        jws_signer, "get_settings", return_value=SimpleNamespace(dpp_signing_batch_workers=2)
+    ):
+        try:
+            tokens = await jws_signer.sign_digests_batch(signer, digests)
+            assert jws_signer._signing_pool.started
+        finally:
+            jws_signer.shutdown_signing_pool()
+
+    assert tokens == signer.sign_digests(digests)
+
+
+def test_dpp_signer_is_loaded_once_per_configuration() -> None:
+    private_pem, _ = _ec_keypair()
+    settings = _settings(dpp_signing_key=private_pem)
+
+    with patch.object(jws_signer, "_dpp_signers", {}):
+        first = jws_signer.get_dpp_signer(settings)  # type: ignore[arg-type]
+        second = jws_signer.get_dpp_signer(settings)  # type: ignore[arg-type]
+        assert first is second
+        assert jws_signer.get_dpp_signer(_settings()) is None  # type: ignore[arg-type]
+        with pytest.raises(SigningError, match="Invalid signing keyring"):
+            jws_signer.get_dpp_signer(  # type: ignore[arg-type]
+                _settings(dpp_signing_key=private_pem, dpp_signing_keys_file="/nonexistent.json")
+            )
+
+
+def test_merkle_signing_key_is_parsed_once() -> None:
+    private_pem, public_pem = generate_signing_keypair()
+    load_ed25519_private_key.cache_clear()
+
+    signatures = [sign_merkle_root(root, private_pem) for root in ("aa", "bb")]
+
+    assert load_ed25519_private_key.cache_info().misses == 1
+    assert verify_signature("aa", signatures[0], public_pem) is True
+    assert verify_signature("bb", signatures[1], public_pem) is True
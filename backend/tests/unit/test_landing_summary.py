@@ -0,0 +1,164 @@
+"""Tests for the incrementally maintained public landing summary."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import DPPStatus
+from app.modules.dpps.landing_summary import LandingSummaryService, manufacturer_part_id
+
+
+def _session(*results: Any) -> AsyncMock:
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=[*results] if results else None)
+    return session
+
+
+def _sql(session: AsyncMock) -> list[str]:
+    return [
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in session.execute.await_args_list
+    ]
+
+
+def _dpp(asset_ids: dict[str, Any] | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        tenant_id=uuid4(),
+        asset_ids=asset_ids if asset_ids is not None else {"manufacturerPartId": "P-1"},
+    )
+
+
+def _statuses(*statuses: DPPStatus) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(statuses)
+    return result
+
+
+class TestManufacturerPartId:
+    @pytest.mark.parametrize(
+        ("asset_ids", "expected"),
+        [
+            ({"manufacturerPartId": "P-1"}, "P-1"),
+            ({"manufacturerPartId": ""}, None),
+            ({"manufacturerPartId": 42}, "42"),
+            ({}, None),
+            (None, None),
+        ],
+    )
+    def test_matches_jsonb_text_extraction(
+        self, asset_ids: dict[str, Any] | None, expected: str | None
+    ) -> None:
+        assert manufacturer_part_id(asset_ids) == expected
+
+
+class TestRecordPublishAndArchive:
+    @pytest.mark.asyncio()
+    async def test_first_publish_counts_dpp_family_and_trace(self) -> None:
+        session = _session()
+
+        await LandingSummaryService(session).record_published(_dpp(), newly_published=True)
+
+        lock_sql, upsert_sql = _sql(session)
+        assert "pg_advisory_xact_lock_shared" in lock_sql
+        assert "INSERT INTO public_landing_product_families" in upsert_sql
+        assert "INSERT INTO public_landing_summaries" in upsert_sql
+        assert "dpps.has_epcis_events" in upsert_sql
+        assert "latest_publish_at = greatest(" in upsert_sql
+
+    @pytest.mark.asyncio()
+    async def test_republish_only_advances_latest_publish(self) -> None:
+        session = _session()
+
+        await LandingSummaryService(session).record_published(_dpp(), newly_published=False)
+
+        _, upsert_sql = _sql(session)
+        assert "public_landing_product_families" not in upsert_sql
+        assert "has_epcis_events" not in upsert_sql
+        assert "now()" in upsert_sql
+
+    @pytest.mark.asyncio()
+    async def test_archive_without_part_id_skips_family(self) -> None:
+        session = _session()
+
+        await LandingSummaryService(session).record_archived(_dpp({}))
+
+        _, upsert_sql = _sql(session)
+        assert "public_landing_product_families" not in upsert_sql
+        assert "has_epcis_events" in upsert_sql
+
+
+class TestRecordEpcisEvents:
+    @pytest.mark.asyncio()
+    async def test_counts_newly_traced_published_dpps(self) -> None:
+        session = _session(_statuses(DPPStatus.PUBLISHED, DPPStatus.DRAFT), None, None)
+
+        await LandingSummaryService(session).record_epcis_events(uuid4(), [uuid4(), uuid4()])
+
+        flag_sql, lock_sql, upsert_sql = _sql(session)
+        assert "UPDATE dpps SET has_epcis_events" in flag_sql
+        assert "has_epcis_events IS false" in flag_sql
+        assert "pg_advisory_xact_lock_shared" in lock_sql
+        assert "INSERT INTO public_landing_summaries" in upsert_sql
+        upsert = session.execute.await_args_list[2].args[0].compile()
+        assert upsert.params["dpps_with_traceability"] == 1
+
+    @pytest.mark.asyncio()
+    async def test_already_traced_dpps_leave_summary_alone(self) -> None:
+        session = _session(_statuses())
+
+        await LandingSummaryService(session).record_epcis_events(uuid4(), [uuid4()])
+
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio()
+    async def test_no_events_is_a_no_op(self) -> None:
+        session = _session()
+
+        await LandingSummaryService(session).record_epcis_events(uuid4(), [])
+
+        session.execute.assert_not_awaited()
+
+
+class TestReconcileAndRead:
+    @pytest.mark.asyncio()
+    async def test_reconcile_recounts_under_exclusive_lock(self) -> None:
+        latest = datetime(2026, 2, 9, tzinfo=UTC)
+        counts = MagicMock()
+        counts.one.return_value = SimpleNamespace(
+            published_dpps=5,
+            active_product_families=2,
+            dpps_with_traceability=1,
+            latest_publish_at=latest,
+        )
+        session = _session(None, counts, None, None, None)
+
+        summary = await LandingSummaryService(session).reconcile(uuid4())
+
+        assert (summary.published_dpps, summary.active_product_families) == (5, 2)
+        assert summary.dpps_with_traceability == 1
+        assert summary.latest_publish_at == latest
+        lock_sql, count_sql, delete_sql, families_sql, upsert_sql = _sql(session)
+        assert "pg_advisory_xact_lock(" in lock_sql
+        assert "FROM dpps" in count_sql
+        assert "DELETE FROM public_landing_product_families" in delete_sql
+        assert "GROUP BY" in families_sql
+        assert "reconciled_at" in upsert_sql
+
+    @pytest.mark.asyncio()
+    async def test_missing_summary_row_reads_as_zero(self) -> None:
+        result = MagicMock()
+        result.one_or_none.return_value = None
+        session = _session(result)
+
+        summary = await LandingSummaryService(session).get_summary(uuid4())
+
+        assert summary.published_dpps == 0
+        assert summary.latest_publish_at is None
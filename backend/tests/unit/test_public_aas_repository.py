@@ -8,6 +8,7 @@ and 404 scenarios for invalid tenant/DPP/revision/submodel.
 from __future__ import annotations
 
 import base64
+import json
 from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -17,6 +18,11 @@ import pytest
 from fastapi import HTTPException
 
 from app.db.models import DPPStatus, TenantStatus
+from app.modules.dpps.public_projection import (
+    build_public_projection,
+    build_public_submodels,
+    projection_key_for_tier,
+)
 from app.modules.dpps.public_router import _decode_b64
 
 # ======================================================================
@@ -77,6 +83,7 @@ def _make_dpp(*, status: DPPStatus = DPPStatus.PUBLISHED, tenant_id=None):
     dpp.status = status
     dpp.tenant_id = tenant_id or uuid4()
     dpp.asset_ids = {"manufacturerPartId": "PART-001"}
+    dpp.short_slug = None
     dpp.created_at = datetime.now(UTC)
     dpp.updated_at = datetime.now(UTC)
     dpp.current_published_revision_id = uuid4()
@@ -124,6 +131,29 @@ def _encode_b64(s: str) -> str:
     return base64.urlsafe_b64encode(s.encode()).decode().rstrip("=")
 
 
+def _projection_row(revision: MagicMock, espr_tier: str | None) -> MagicMock:
+    """Row returned by the published-projection lookup for ``revision``."""
+    row = MagicMock()
+    row.id = revision.id
+    row.revision_no = revision.revision_no
+    row.digest_sha256 = revision.digest_sha256
+    row.payload = build_public_projection(revision.aas_env_json, projection_key_for_tier(espr_tier))
+    return row
+
+
+def _submodel_row(revision: MagicMock, submodel_id: str) -> MagicMock:
+    """Row returned by the published-submodel lookup for ``revision``."""
+    stored = {sm.submodel_id: sm for sm in build_public_submodels(revision.aas_env_json)}
+    row = MagicMock()
+    row.id = revision.id
+    row.revision_no = revision.revision_no
+    row.digest_sha256 = revision.digest_sha256
+    row.has_submodel_rows = bool(stored)
+    row.semantic_id = stored[submodel_id].semantic_id if submodel_id in stored else None
+    row.payload = stored[submodel_id].payload if submodel_id in stored else None
+    return row
+
+
 # ======================================================================
 # Shell endpoint with ESPR tier filtering
 # ======================================================================
@@ -150,7 +180,7 @@ class TestShellEndpointWithTier:
         dpp_result.scalar_one_or_none.return_value = dpp
         # Third call: repo.get_published_revision
         rev_result = MagicMock()
-        rev_result.scalar_one_or_none.return_value = revision
+        rev_result.one_or_none.return_value = _projection_row(revision, "consumer")
 
         db.execute = AsyncMock(side_effect=[tenant_result, dpp_result, rev_result])
 
@@ -164,8 +194,9 @@ class TestShellEndpointWithTier:
         )
 
         # Consumer tier should see nameplate but not the internal submodel
-        assert response.aas_environment is not None
-        submodel_ids = [sm["id"] for sm in response.aas_environment.get("submodels", [])]
+        aas_environment = json.loads(response.body)["aas_environment"]
+        assert aas_environment is not None
+        submodel_ids = [sm["id"] for sm in aas_environment.get("submodels", [])]
         assert "urn:example:nameplate" in submodel_ids
         assert "urn:example:internal" not in submodel_ids
 
@@ -184,7 +215,7 @@ class TestShellEndpointWithTier:
         dpp_result = MagicMock()
         dpp_result.scalar_one_or_none.return_value = dpp
         rev_result = MagicMock()
-        rev_result.scalar_one_or_none.return_value = revision
+        rev_result.one_or_none.return_value = _projection_row(revision, "manufacturer")
 
         db.execute = AsyncMock(side_effect=[tenant_result, dpp_result, rev_result])
 
@@ -197,8 +228,9 @@ class TestShellEndpointWithTier:
             espr_tier="manufacturer",
         )
 
-        assert response.aas_environment is not None
-        assert len(response.aas_environment.get("submodels", [])) == 2
+        aas_environment = json.loads(response.body)["aas_environment"]
+        assert aas_environment is not None
+        assert len(aas_environment.get("submodels", [])) == 2
 
 
 # ======================================================================
@@ -224,7 +256,7 @@ class TestSubmodelEndpointTierFiltering:
         dpp_result = MagicMock()
         dpp_result.scalar_one_or_none.return_value = dpp
         rev_result = MagicMock()
-        rev_result.scalar_one_or_none.return_value = revision
+        rev_result.one_or_none.return_value = _submodel_row(revision, "urn:example:internal")
 
         db.execute = AsyncMock(side_effect=[tenant_result, dpp_result, rev_result])
 
@@ -265,20 +297,21 @@ class TestSubmodelValueEndpoint:
         dpp_result = MagicMock()
         dpp_result.scalar_one_or_none.return_value = dpp
         rev_result = MagicMock()
-        rev_result.scalar_one_or_none.return_value = revision
+        rev_result.one_or_none.return_value = _submodel_row(revision, "urn:example:nameplate")
 
         db.execute = AsyncMock(side_effect=[tenant_result, dpp_result, rev_result])
 
         aas_id_b64 = _encode_b64(f"urn:uuid:{dpp.id}")
         submodel_id_b64 = _encode_b64("urn:example:nameplate")
 
-        result = await get_submodel_value(
+        response = await get_submodel_value(
             tenant_slug="default",
             aas_id_b64=aas_id_b64,
             submodel_id_b64=submodel_id_b64,
             db=db,
             espr_tier=None,
         )
+        result = json.loads(response.body)
 
         assert "submodelElements" in result
         assert len(result["submodelElements"]) == 1
@@ -388,7 +421,7 @@ class TestPublicAAS404Scenarios:
         dpp_result = MagicMock()
         dpp_result.scalar_one_or_none.return_value = dpp
         rev_result = MagicMock()
-        rev_result.scalar_one_or_none.return_value = revision
+        rev_result.one_or_none.return_value = _submodel_row(revision, "urn:example:does-not-exist")
 
         db.execute = AsyncMock(side_effect=[tenant_result, dpp_result, rev_result])
 
@@ -14,6 +14,9 @@ from uuid import uuid4
 import jwt
 import pytest
 
+from app.core.crypto.canonicalization import CANONICALIZATION_RFC8785_MERKLE_V1
+from app.core.crypto.environment_digest import compute_environment_digest
+from app.core.crypto.merkle import verify_inclusion_proof
 from app.db.models import DataCarrierStatus, DPPStatus, TenantStatus
 from app.modules.dpps.public_router import (
     PublicDPPResponse,
@@ -247,6 +250,58 @@ async def test_integrity_bundle_includes_crypto_metadata_and_anchor(
     assert payload["anchor"]["anchor_id"] == anchor.id
     assert payload["anchor"]["signatureKid"] == "audit-signing-kid"
     assert payload["anchor"]["tsaTokenPresent"] is True
+    assert payload["shellDigestSha256"] is None
+    assert payload["submodelProofs"] == []
+
+
+@pytest.mark.asyncio
+@patch("app.modules.dpps.public_router.get_settings")
+async def test_integrity_bundle_proves_public_submodels_in_merkle_digest(
+    mock_settings: MagicMock,
+) -> None:
+    tenant = _make_tenant(slug="default")
+    dpp = _make_dpp(tenant_id=tenant.id)
+    revision = _make_revision(dpp.id)
+    revision.tenant_id = tenant.id
+    revision.signed_jws = None
+    digest = compute_environment_digest(
+        {"submodels": [{"id": "sm-public"}, {"id": "sm-confidential"}, {"id": "sm-other"}]}
+    )
+    revision.digest_sha256 = digest.root
+    revision.digest_canonicalization = CANONICALIZATION_RFC8785_MERKLE_V1
+    revision.digest_leaves = digest.to_json()
+    mock_settings.return_value = MagicMock(api_v1_prefix="/api/v1")
+
+    session = AsyncMock()
+    tenant_result = MagicMock()
+    tenant_result.scalar_one_or_none.return_value = tenant
+    dpp_result = MagicMock()
+    dpp_result.scalar_one_or_none.return_value = dpp
+    revision_result = MagicMock()
+    revision_result.scalar_one_or_none.return_value = revision
+    anchor_result = MagicMock()
+    anchor_result.scalar_one_or_none.return_value = None
+    public_ids_result = MagicMock()
+    public_ids_result.scalars.return_value.all.return_value = ["sm-public", "sm-other"]
+    session.execute.side_effect = [
+        tenant_result,
+        dpp_result,
+        revision_result,
+        anchor_result,
+        public_ids_result,
+    ]
+
+    response = await get_public_dpp_integrity_bundle("default", dpp.id, session)
+    payload = response.model_dump(by_alias=True)
+
+    assert payload["digestCanonicalization"] == CANONICALIZATION_RFC8785_MERKLE_V1
+    assert payload["shellDigestSha256"] == digest.shell_sha256
+    proofs = payload["submodelProofs"]
+    assert [proof["submodelId"] for proof in proofs] == ["sm-public", "sm-other"]
+    assert [proof["leafIndex"] for proof in proofs] == [1, 3]
+    for proof in proofs:
+        path = [(step["siblingSha256"], step["side"]) for step in proof["proof"]]
+        assert verify_inclusion_proof(proof["leafSha256"], path, payload["digest_sha256"])
 
 
 @pytest.mark.asyncio
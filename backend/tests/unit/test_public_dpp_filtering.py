@@ -7,17 +7,17 @@ while public elements (including those with no qualifier) pass through.
 
 from __future__ import annotations
 
-from app.modules.dpps.public_router import (
-    _element_is_public,
-    _filter_public_aas_environment,
-    _filter_public_asset_ids,
+from app.modules.dpps.public_projection import (
+    element_is_public,
+    filter_public_aas_environment,
+    filter_public_asset_ids,
 )
 
 
 def test_element_without_qualifier_treated_as_public() -> None:
     """Elements with no qualifiers are treated as public by default."""
     element: dict = {"idShort": "ManufacturerName", "value": "ACME Corp"}
-    assert _element_is_public(element) is True
+    assert element_is_public(element) is True
 
 
 def test_element_with_public_qualifier_is_public() -> None:
@@ -27,7 +27,7 @@ def test_element_with_public_qualifier_is_public() -> None:
         "value": "ACME Corp",
         "qualifiers": [{"type": "Confidentiality", "value": "public"}],
     }
-    assert _element_is_public(element) is True
+    assert element_is_public(element) is True
 
 
 def test_element_with_confidential_qualifier_is_not_public() -> None:
@@ -37,7 +37,7 @@ def test_element_with_confidential_qualifier_is_not_public() -> None:
         "value": "1234.56",
         "qualifiers": [{"type": "Confidentiality", "value": "confidential"}],
     }
-    assert _element_is_public(element) is False
+    assert element_is_public(element) is False
 
 
 def test_element_with_private_qualifier_is_not_public() -> None:
@@ -47,11 +47,11 @@ def test_element_with_private_qualifier_is_not_public() -> None:
         "value": "xyz",
         "qualifiers": [{"type": "Confidentiality", "value": "Private"}],
     }
-    assert _element_is_public(element) is False
+    assert element_is_public(element) is False
 
 
 def test_filter_removes_confidential_elements() -> None:
-    """_filter_public_aas_environment strips confidential elements from submodels."""
+    """filter_public_aas_environment strips confidential elements from submodels."""
     aas_env: dict = {
         "submodels": [
             {
@@ -73,7 +73,7 @@ def test_filter_removes_confidential_elements() -> None:
         ]
     }
 
-    filtered = _filter_public_aas_environment(aas_env)
+    filtered = filter_public_aas_environment(aas_env)
     elements = filtered["submodels"][0]["submodelElements"]
     id_shorts = [el["idShort"] for el in elements]
     assert "ManufacturerName" in id_shorts
@@ -94,7 +94,7 @@ def test_filter_returns_all_public_elements() -> None:
             }
         ]
     }
-    filtered = _filter_public_aas_environment(aas_env)
+    filtered = filter_public_aas_environment(aas_env)
     assert len(filtered["submodels"][0]["submodelElements"]) == 2
 
 
@@ -115,7 +115,7 @@ def test_filter_does_not_mutate_original() -> None:
             }
         ]
     }
-    _filter_public_aas_environment(aas_env)
+    filter_public_aas_environment(aas_env)
     assert len(aas_env["submodels"][0]["submodelElements"]) == 2
 
 
@@ -148,7 +148,7 @@ def test_filter_removes_confidential_nested_elements() -> None:
         ]
     }
 
-    filtered = _filter_public_aas_environment(aas_env)
+    filtered = filter_public_aas_environment(aas_env)
     nested_values = filtered["submodels"][0]["submodelElements"][0]["value"]
     id_shorts = [entry["idShort"] for entry in nested_values]
     assert "PublicInner" in id_shorts
@@ -170,7 +170,7 @@ def test_filter_removes_sensitive_public_keys_from_aas_environment() -> None:
         "owner_subject": "user-123",
         "read_point": "line-7",
     }
-    filtered = _filter_public_aas_environment(aas_env)
+    filtered = filter_public_aas_environment(aas_env)
     assert "payload" not in filtered
     assert "owner_subject" not in filtered
     assert "read_point" not in filtered
@@ -184,7 +184,7 @@ def test_filter_public_asset_ids_removes_sensitive_identifiers() -> None:
         "globalAssetId": "urn:asset:secret",
         "customSafeCode": "SAFE-123",
     }
-    filtered = _filter_public_asset_ids(asset_ids)
+    filtered = filter_public_asset_ids(asset_ids)
     assert filtered == {
         "manufacturerPartId": "PART-001",
         "customSafeCode": "SAFE-123",
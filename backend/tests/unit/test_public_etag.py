@@ -0,0 +1,179 @@
+"""Tests for ETag / If-None-Match handling on public read endpoints."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.etag import etag_matches, not_modified_response, strong_etag
+from app.db.models import DPPStatus
+
+
+def _scalar(value: Any) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = value
+    return result
+
+
+def _row(value: Any) -> MagicMock:
+    result = MagicMock()
+    result.one_or_none.return_value = value
+    return result
+
+
+def _published_dpp(tenant_id: Any) -> SimpleNamespace:
+    now = datetime.now(UTC)
+    return SimpleNamespace(
+        id=uuid4(),
+        tenant_id=tenant_id,
+        status=DPPStatus.PUBLISHED,
+        asset_ids={"manufacturerPartId": "P-1"},
+        short_slug=None,
+        created_at=now,
+        updated_at=now,
+        current_published_revision_id=uuid4(),
+    )
+
+
+class TestEtagHelpers:
+    def test_strong_etag_is_quoted_and_deterministic(self) -> None:
+        etag = strong_etag("dpp", "abc", None)
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == strong_etag("dpp", "abc", None)
+
+    def test_none_and_empty_parts_differ(self) -> None:
+        assert strong_etag("a", None) != strong_etag("a", "")
+
+    def test_if_none_match_list_wildcard_and_weak(self) -> None:
+        etag = strong_etag("x")
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches(f"W/{etag}", etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+    def test_not_modified_repeats_validators(self) -> None:
+        response = not_modified_response('"abc"', "public, max-age=60")
+        assert response.status_code == 304
+        assert response.headers["ETag"] == '"abc"'
+        assert response.headers["Cache-Control"] == "public, max-age=60"
+        assert response.body == b""
+
+
+class TestPublicDppConditional:
+    @pytest.mark.asyncio()
+    async def test_200_carries_etag_and_cache_control(self) -> None:
+        from app.modules.dpps.public_router import get_published_dpp
+
+        tenant = SimpleNamespace(id=uuid4(), slug="default")
+        dpp = _published_dpp(tenant.id)
+        projection = SimpleNamespace(
+            id=dpp.current_published_revision_id,
+            revision_no=1,
+            digest_sha256="d" * 64,
+            payload=b'{"submodels":[]}',
+        )
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_scalar(tenant), _scalar(dpp), _row(projection)])
+
+        response = await get_published_dpp(tenant_slug="default", dpp_id=dpp.id, db=db)
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+        assert "max-age" in response.headers["Cache-Control"]
+
+    @pytest.mark.asyncio()
+    async def test_matching_etag_returns_304_without_loading_projection(self) -> None:
+        from app.modules.dpps.public_router import get_published_dpp
+
+        tenant = SimpleNamespace(id=uuid4(), slug="default")
+        dpp = _published_dpp(tenant.id)
+        projection = SimpleNamespace(
+            id=dpp.current_published_revision_id,
+            revision_no=1,
+            digest_sha256="d" * 64,
+            payload=b'{"submodels":[]}',
+        )
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_scalar(tenant), _scalar(dpp), _row(projection)])
+        first = await get_published_dpp(tenant_slug="default", dpp_id=dpp.id, db=db)
+        etag = first.headers["ETag"]
+
+        ref = SimpleNamespace(
+            id=dpp.current_published_revision_id, revision_no=1, digest_sha256="d" * 64
+        )
+        db.execute = AsyncMock(side_effect=[_scalar(tenant), _scalar(dpp), _row(ref)])
+        second = await get_published_dpp(
+            tenant_slug="default", dpp_id=dpp.id, db=db, if_none_match=etag
+        )
+
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert db.execute.await_count == 3
+
+    @pytest.mark.asyncio()
+    async def test_stale_etag_after_republish_returns_200(self) -> None:
+        from app.modules.dpps.public_router import get_published_dpp
+
+        tenant = SimpleNamespace(id=uuid4(), slug="default")
+        dpp = _published_dpp(tenant.id)
+        ref = SimpleNamespace(
+            id=dpp.current_published_revision_id, revision_no=2, digest_sha256="e" * 64
+        )
+        projection = SimpleNamespace(
+            id=dpp.current_published_revision_id,
+            revision_no=2,
+            digest_sha256="e" * 64,
+            payload=b'{"submodels":[]}',
+        )
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[_scalar(tenant), _scalar(dpp), _row(ref), _row(projection)]
+        )
+
+        response = await get_published_dpp(
+            tenant_slug="default", dpp_id=dpp.id, db=db, if_none_match='"stale"'
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != '"stale"'
+
+
+class TestRegistryConditional:
+    @pytest.mark.asyncio()
+    async def test_shell_descriptor_304(self) -> None:
+        import base64
+
+        from fastapi import Response
+
+        from app.modules.registry.public_router import public_get_shell_descriptor
+
+        tenant = SimpleNamespace(id=uuid4(), slug="default")
+        record = SimpleNamespace(
+            aas_id="urn:aas:1",
+            id_short="Shell",
+            global_asset_id="urn:asset:1",
+            specific_asset_ids=[],
+            submodel_descriptors=[],
+            updated_at=datetime.now(UTC),
+        )
+        aas_id_b64 = base64.urlsafe_b64encode(b"urn:aas:1").decode().rstrip("=")
+
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_scalar(tenant), _scalar(record)])
+        response = Response()
+        await public_get_shell_descriptor("default", aas_id_b64, db, response)
+        etag = response.headers["ETag"]
+
+        db.execute = AsyncMock(side_effect=[_scalar(tenant), _scalar(record)])
+        result = await public_get_shell_descriptor(
+            "default", aas_id_b64, db, Response(), if_none_match=etag
+        )
+
+        assert isinstance(result, Response)
+        assert result.status_code == 304
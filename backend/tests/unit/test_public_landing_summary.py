@@ -34,6 +34,30 @@ class _FakeScalarResult:
         return self._value
 
 
+class _FakeRowResult:
+    def __init__(self, row: object) -> None:
+        self._row = row
+
+    def one_or_none(self) -> object:
+        return self._row
+
+
+def _summary_row(
+    published: int | None,
+    families: int | None,
+    traced: int | None,
+    latest_publish: datetime | None,
+) -> _FakeRowResult:
+    return _FakeRowResult(
+        SimpleNamespace(
+            published_dpps=published,
+            active_product_families=families,
+            dpps_with_traceability=traced,
+            latest_publish_at=latest_publish,
+        )
+    )
+
+
 class _FakeSession:
     def __init__(self, results: list[object]) -> None:
         self._results = list(results)
@@ -79,10 +103,7 @@ async def test_public_landing_summary_success(_app: FastAPI) -> None:
     fake_session = _FakeSession(
         [
             _FakeScalarResult(tenant),  # _resolve_tenant
-            _FakeScalarResult(12),  # published_dpps
-            _FakeScalarResult(4),  # active_product_families
-            _FakeScalarResult(7),  # dpps_with_traceability
-            _FakeScalarResult(latest_publish),  # latest_publish_at
+            _summary_row(12, 4, 7, latest_publish),
         ]
     )
 
@@ -125,8 +146,12 @@ async def test_public_landing_summary_success(_app: FastAPI) -> None:
         "email",
     }
     assert not (set(body.keys()) & blocked)
-    sql_fragments = [str(stmt) for stmt in fake_session.statements[1:]]
-    assert all("dpps.status = :status_1" in sql for sql in sql_fragments[:3])
+    # One read of the maintained summary row, no aggregation over dpps
+    assert len(fake_session.statements) == 2
+    summary_sql = str(fake_session.statements[1])
+    assert "FROM public_landing_summaries" in summary_sql
+    assert "FROM dpps" not in summary_sql
+    assert "epcis_events" not in summary_sql
 
     _app.dependency_overrides.clear()
 
@@ -153,10 +178,7 @@ async def test_public_landing_summary_returns_zeroed_aggregates_when_no_data(_ap
     fake_session = _FakeSession(
         [
             _FakeScalarResult(tenant),  # _resolve_tenant
-            _FakeScalarResult(None),  # published_dpps
-            _FakeScalarResult(None),  # active_product_families
-            _FakeScalarResult(None),  # dpps_with_traceability
-            _FakeScalarResult(None),  # latest_publish_at
+            _summary_row(None, None, None, None),
         ]
     )
 
@@ -187,10 +209,7 @@ async def test_public_scoped_landing_summary_default_scope(_app: FastAPI) -> Non
     fake_session = _FakeSession(
         [
             _FakeScalarResult(tenant),  # _resolve_tenant
-            _FakeScalarResult(3),  # published_dpps
-            _FakeScalarResult(2),  # active_product_families
-            _FakeScalarResult(1),  # dpps_with_traceability
-            _FakeScalarResult(latest_publish),  # latest_publish_at
+            _summary_row(3, 2, 1, latest_publish),
         ]
     )
 
@@ -222,10 +241,7 @@ async def test_public_scoped_landing_summary_all_scope(_app: FastAPI) -> None:
     latest_publish = datetime(2026, 2, 9, 12, 0, tzinfo=UTC)
     fake_session = _FakeSession(
         [
-            _FakeScalarResult(21),  # published_dpps
-            _FakeScalarResult(11),  # active_product_families
-            _FakeScalarResult(8),  # dpps_with_traceability
-            _FakeScalarResult(latest_publish),  # latest_publish_at
+            _summary_row(21, 11, 8, latest_publish),
         ]
     )
 
@@ -0,0 +1,306 @@
+"""Tests for precomputed public projections of published revisions."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.db.models import DPPPublicProjection, DPPPublishedSubmodel, DPPStatus, RevisionState
+from app.modules.dpps.public_projection import (
+    PROJECTION_DENIED,
+    PROJECTION_FULL,
+    build_public_projection,
+    build_public_projections,
+    build_public_submodels,
+    projection_key_for_tier,
+    projection_keys,
+    submodel_in_projection,
+)
+from app.modules.dpps.repository import AASRepositoryService
+from app.modules.dpps.service import DPPService
+
+
+def _env() -> dict:
+    return {
+        "assetAdministrationShells": [{"id": "urn:aas:1", "idShort": "Shell"}],
+        "submodels": [
+            {
+                "id": "urn:sm:nameplate",
+                "idShort": "DigitalNameplate",
+                "semanticId": {
+                    "keys": [
+                        {"type": "Submodel", "value": "https://admin-shell.io/zvei/nameplate/2/0"}
+                    ]
+                },
+                "submodelElements": [
+                    {"modelType": "Property", "idShort": "ManufacturerName", "value": "Acme"},
+                    {
+                        "modelType": "Property",
+                        "idShort": "Margin",
+                        "value": "4.2",
+                        "qualifiers": [{"type": "Confidentiality", "value": "confidential"}],
+                    },
+                ],
+            },
+            {
+                "id": "urn:sm:internal",
+                "idShort": "Internal",
+                "semanticId": {"keys": [{"type": "Submodel", "value": "urn:internal:sm"}]},
+                "submodelElements": [],
+            },
+        ],
+    }
+
+
+class TestProjectionKeys:
+    def test_anonymous_maps_to_consumer(self) -> None:
+        assert projection_key_for_tier(None) == "consumer"
+        assert projection_key_for_tier("  ") == "consumer"
+
+    def test_unrestricted_tiers_share_full_projection(self) -> None:
+        assert projection_key_for_tier("manufacturer") == PROJECTION_FULL
+        assert projection_key_for_tier("market_surveillance_authority") == PROJECTION_FULL
+
+    def test_unknown_tier_fails_closed(self) -> None:
+        assert projection_key_for_tier("alien") == PROJECTION_DENIED
+
+    def test_every_tier_resolves_to_a_stored_key(self) -> None:
+        keys = set(projection_keys())
+        for tier in (None, "consumer", "recycler", "manufacturer", "alien"):
+            assert projection_key_for_tier(tier) in keys
+
+
+class TestBuildProjections:
+    def test_full_projection_drops_confidential_elements(self) -> None:
+        full = json.loads(build_public_projection(_env(), PROJECTION_FULL))
+        elements = full["submodels"][0]["submodelElements"]
+        assert [el["idShort"] for el in elements] == ["ManufacturerName"]
+        assert len(full["submodels"]) == 2
+
+    def test_denied_projection_has_no_submodels(self) -> None:
+        denied = json.loads(build_public_projection(_env(), PROJECTION_DENIED))
+        assert denied["submodels"] == []
+        assert denied["assetAdministrationShells"]
+
+    def test_all_projections_match_individual_builds(self) -> None:
+        env = _env()
+        projections = build_public_projections(env)
+        assert set(projections) == set(projection_keys())
+        for key, payload in projections.items():
+            assert payload == build_public_projection(env, key)
+
+    def test_source_environment_is_not_mutated(self) -> None:
+        env = _env()
+        build_public_projections(env)
+        assert env == _env()
+
+
+class TestBuildSubmodels:
+    def test_one_filtered_row_per_submodel(self) -> None:
+        rows = build_public_submodels(_env())
+        assert [row.submodel_id for row in rows] == ["urn:sm:nameplate", "urn:sm:internal"]
+        assert rows[0].semantic_id == "https://admin-shell.io/zvei/nameplate/2/0"
+        nameplate = json.loads(rows[0].payload)
+        assert [el["idShort"] for el in nameplate["submodelElements"]] == ["ManufacturerName"]
+
+    def test_digest_tracks_only_its_own_submodel(self) -> None:
+        env = _env()
+        before = {row.submodel_id: row.digest_sha256 for row in build_public_submodels(env)}
+        env["submodels"][1]["idShort"] = "Changed"
+        after = {row.submodel_id: row.digest_sha256 for row in build_public_submodels(env)}
+        assert before["urn:sm:nameplate"] == after["urn:sm:nameplate"]
+        assert before["urn:sm:internal"] != after["urn:sm:internal"]
+
+    def test_confidential_submodel_and_duplicates_are_skipped(self) -> None:
+        env = _env()
+        env["submodels"][1]["qualifiers"] = [{"type": "Confidentiality", "value": "secret"}]
+        env["submodels"].append({**env["submodels"][0], "idShort": "Duplicate"})
+        rows = build_public_submodels(env)
+        assert [row.submodel_id for row in rows] == ["urn:sm:nameplate"]
+        assert json.loads(rows[0].payload)["idShort"] == "DigitalNameplate"
+
+    def test_tier_check_matches_projections(self) -> None:
+        env = _env()
+        rows = build_public_submodels(env)
+        for key in projection_keys():
+            projected = json.loads(build_public_projection(env, key))
+            visible = {sm["id"] for sm in projected["submodels"]}
+            assert {
+                row.submodel_id for row in rows if submodel_in_projection(row.semantic_id, key)
+            } == visible
+
+
+class TestPublishStoresProjections:
+    @pytest.mark.asyncio()
+    async def test_publish_adds_one_projection_per_key(self) -> None:
+        session = AsyncMock()
+        session.add = MagicMock()
+        session.add_all = MagicMock()
+        service = DPPService(session)
+        service._settings = SimpleNamespace(compliance_check_on_publish=False)
+        service._sign_digest = MagicMock(return_value=None)
+
+        dpp = SimpleNamespace(
+            id=uuid4(),
+            asset_ids={},
+            tenant_id=uuid4(),
+            status=DPPStatus.DRAFT,
+            current_published_revision_id=None,
+        )
+        revision = SimpleNamespace(
+            id=uuid4(),
+            tenant_id=dpp.tenant_id,
+            dpp_id=dpp.id,
+            revision_no=1,
+            state=RevisionState.DRAFT,
+            digest_sha256="digest",
+            aas_env_json={"submodels": []},
+        )
+        service.get_dpp = AsyncMock(return_value=dpp)
+        service.get_latest_revision = AsyncMock(return_value=revision)
+
+        await service.publish_dpp(dpp.id, dpp.tenant_id, "owner")
+
+        added = session.add_all.call_args_list[0].args[0]
+        assert all(isinstance(row, DPPPublicProjection) for row in added)
+        assert {row.projection_key for row in added} == set(projection_keys())
+        assert {row.revision_id for row in added} == {revision.id}
+
+    def test_store_adds_one_row_per_submodel(self) -> None:
+        session = AsyncMock()
+        session.add_all = MagicMock()
+        dpp = SimpleNamespace(id=uuid4(), tenant_id=uuid4())
+        revision = SimpleNamespace(id=uuid4(), aas_env_json=_env())
+
+        DPPService(session)._store_public_projections(dpp, revision)  # type: ignore[arg-type]
+
+        submodels = session.add_all.call_args_list[1].args[0]
+        assert all(isinstance(row, DPPPublishedSubmodel) for row in submodels)
+        assert [row.submodel_id for row in submodels] == ["urn:sm:nameplate", "urn:sm:internal"]
+        assert {row.revision_id for row in submodels} == {revision.id}
+        assert all(len(row.digest_sha256) == 64 for row in submodels)
+
+
+class TestRepositoryProjectionReads:
+    @pytest.mark.asyncio()
+    async def test_returns_stored_payload(self) -> None:
+        dpp = SimpleNamespace(current_published_revision_id=uuid4(), tenant_id=uuid4())
+        row = SimpleNamespace(
+            id=dpp.current_published_revision_id,
+            revision_no=3,
+            digest_sha256="d" * 64,
+            payload=b'{"submodels":[]}',
+        )
+        result = MagicMock()
+        result.one_or_none.return_value = row
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        projection = await AASRepositoryService(session).get_published_projection(
+            dpp, PROJECTION_FULL
+        )
+
+        assert projection is not None
+        assert projection.payload == b'{"submodels":[]}'
+        assert projection.revision_no == 3
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_legacy_revision_is_projected_on_read(self) -> None:
+        dpp = SimpleNamespace(current_published_revision_id=uuid4(), tenant_id=uuid4())
+        row = SimpleNamespace(
+            id=dpp.current_published_revision_id,
+            revision_no=1,
+            digest_sha256="d" * 64,
+            payload=None,
+        )
+        revision = SimpleNamespace(aas_env_json=_env())
+        projection_result = MagicMock()
+        projection_result.one_or_none.return_value = row
+        revision_result = MagicMock()
+        revision_result.scalar_one_or_none.return_value = revision
+        session = AsyncMock()
+        session.execute.side_effect = [projection_result, revision_result]
+
+        projection = await AASRepositoryService(session).get_published_projection(dpp, "consumer")
+
+        assert projection is not None
+        assert projection.payload == build_public_projection(_env(), "consumer")
+
+
+class TestRepositorySubmodelReads:
+    @staticmethod
+    def _row(**overrides: object) -> SimpleNamespace:
+        values: dict[str, object] = {
+            "id": uuid4(),
+            "revision_no": 2,
+            "digest_sha256": "d" * 64,
+            "semantic_id": "https://admin-shell.io/zvei/nameplate/2/0",
+            "payload": b'{"id":"urn:sm:nameplate"}',
+            "has_submodel_rows": True,
+        }
+        values.update(overrides)
+        return SimpleNamespace(**values)
+
+    @pytest.mark.asyncio()
+    async def test_reads_single_stored_row(self) -> None:
+        dpp = SimpleNamespace(current_published_revision_id=uuid4(), tenant_id=uuid4())
+        result = MagicMock()
+        result.one_or_none.return_value = self._row()
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        published = await AASRepositoryService(session).get_published_submodel(
+            dpp, "urn:sm:nameplate", PROJECTION_FULL
+        )
+
+        assert published is not None
+        assert published.payload == b'{"id":"urn:sm:nameplate"}'
+        session.execute.assert_awaited_once()
+        statement = str(session.execute.await_args.args[0])
+        assert "aas_env_json" not in statement
+        assert "dpp_public_projections" not in statement
+
+    @pytest.mark.asyncio()
+    async def test_tier_hidden_row_has_no_payload(self) -> None:
+        dpp = SimpleNamespace(current_published_revision_id=uuid4(), tenant_id=uuid4())
+        result = MagicMock()
+        result.one_or_none.return_value = self._row(semantic_id="urn:internal:sm")
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        published = await AASRepositoryService(session).get_published_submodel(
+            dpp, "urn:sm:internal", "consumer"
+        )
+
+        assert published is not None
+        assert published.payload is None
+
+    @pytest.mark.asyncio()
+    async def test_legacy_revision_reads_projection(self) -> None:
+        dpp = SimpleNamespace(current_published_revision_id=uuid4(), tenant_id=uuid4())
+        submodel_result = MagicMock()
+        submodel_result.one_or_none.return_value = self._row(
+            semantic_id=None, payload=None, has_submodel_rows=False
+        )
+        projection_result = MagicMock()
+        projection_result.one_or_none.return_value = SimpleNamespace(
+            id=dpp.current_published_revision_id,
+            revision_no=2,
+            digest_sha256="d" * 64,
+            payload=build_public_projection(_env(), PROJECTION_FULL),
+        )
+        session = AsyncMock()
+        session.execute.side_effect = [submodel_result, projection_result]
+
+        published = await AASRepositoryService(session).get_published_submodel(
+            dpp, "urn:sm:internal", PROJECTION_FULL
+        )
+
+        assert published is not None
+        assert published.payload is not None
+        assert json.loads(published.payload)["idShort"] == "Internal"
@@ -0,0 +1,243 @@
+"""Tests for the shared Redis response cache of public DPP endpoints."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core import cache
+from app.db.models import DPPStatus
+from app.modules.dpps.public_cache import (
+    dpp_cache_tag,
+    invalidate_public_dpp,
+    public_cache_key,
+    published_cache_key,
+    shells_cache_tag,
+    shells_generation,
+)
+
+
+class _FakePipeline:
+    def __init__(self, client: _FakeRedis) -> None:
+        self._client = client
+        self._ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> _FakePipeline:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    def set(self, key: str, value: bytes, **_options: Any) -> None:
+        self._ops.append(("set", (key, value)))
+
+    def sadd(self, key: str, member: str) -> None:
+        self._ops.append(("sadd", (key, member)))
+
+    def expire(self, key: str, _ttl: int) -> None:
+        self._ops.append(("expire", (key,)))
+
+    def smembers(self, key: str) -> None:
+        self._ops.append(("smembers", (key,)))
+
+    async def execute(self) -> list[Any]:
+        results: list[Any] = []
+        for op, args in self._ops:
+            if op == "set":
+                self._client.store[args[0]] = args[1]
+                results.append(True)
+            elif op == "sadd":
+                self._client.sets.setdefault(args[0], set()).add(args[1])
+                results.append(1)
+            elif op == "smembers":
+                results.append(set(self._client.sets.get(args[0], set())))
+            else:
+                results.append(True)
+        return results
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.store.get(key)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.store.get(key, b"0")) + 1
+        self.store[key] = str(value).encode()
+        return value
+
+    async def delete(self, *keys: str) -> int:
+        for key in keys:
+            self.store.pop(key, None)
+            self.sets.pop(key, None)
+        return len(keys)
+
+    def pipeline(self, **_options: Any) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    client = _FakeRedis()
+    monkeypatch.setattr(cache, "get_cache_redis", AsyncMock(return_value=client))
+    return client
+
+
+class TestCacheKeys:
+    def test_key_varies_by_tier_and_content(self) -> None:
+        tenant_id = uuid4()
+        base = public_cache_key(tenant_id, "submodel", "urn:aas:1\nurn:sm:1", tier="consumer")
+        assert base != public_cache_key(tenant_id, "submodel", "urn:aas:1\nurn:sm:1", tier="full")
+        assert base != public_cache_key(
+            tenant_id, "submodel", "urn:aas:1\nurn:sm:1", tier="consumer", content="value"
+        )
+        assert str(tenant_id) in base
+
+    def test_key_varies_by_tenant(self) -> None:
+        assert public_cache_key(uuid4(), "dpp", "x") != public_cache_key(uuid4(), "dpp", "x")
+
+    def test_published_key_varies_by_revision(self) -> None:
+        now = datetime.now(UTC)
+        dpp = SimpleNamespace(current_published_revision_id=uuid4(), updated_at=now)
+        republished = SimpleNamespace(current_published_revision_id=uuid4(), updated_at=now)
+
+        key = published_cache_key("k", dpp)  # type: ignore[arg-type]
+        assert key != published_cache_key("k", republished)  # type: ignore[arg-type]
+
+
+class TestCacheStore:
+    @pytest.mark.asyncio()
+    async def test_disabled_cache_has_no_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            cache,
+            "get_settings",
+            lambda: SimpleNamespace(public_response_cache_enabled=False, redis_cache_ttl=60),
+        )
+        assert await cache.get_cache_redis() is None
+
+    @pytest.mark.asyncio()
+    async def test_read_errors_fail_open(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=ConnectionError("down"))
+        monkeypatch.setattr(cache, "get_cache_redis", AsyncMock(return_value=client))
+        assert await cache.get_cached_response("k") is None
+
+    @pytest.mark.asyncio()
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_invalidation_drops_dpp_and_listing_entries(self) -> None:
+        tenant_id, dpp_id, other_id = uuid4(), uuid4(), uuid4()
+        await cache.cache_response("a", b"1", tags=[dpp_cache_tag(tenant_id, dpp_id)])
+        await cache.cache_response("b", b"2", tags=[shells_cache_tag(tenant_id)])
+        await cache.cache_response("c", b"3", tags=[dpp_cache_tag(tenant_id, other_id)])
+
+        await invalidate_public_dpp(tenant_id, dpp_id)
+
+        assert await cache.get_cached_response("a") is None
+        assert await cache.get_cached_response("b") is None
+        assert await cache.get_cached_response("c") == b"3"
+
+    @pytest.mark.asyncio()
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_invalidation_advances_the_listing_generation(self) -> None:
+        tenant_id = uuid4()
+        assert await shells_generation(tenant_id) == 0
+
+        await invalidate_public_dpp(tenant_id, uuid4())
+
+        assert await shells_generation(tenant_id) == 1
+
+
+class TestReadThrough:
+    @staticmethod
+    def _published(tenant_id: Any) -> tuple[SimpleNamespace, SimpleNamespace]:
+        now = datetime.now(UTC)
+        dpp = SimpleNamespace(
+            id=uuid4(),
+            tenant_id=tenant_id,
+            status=DPPStatus.PUBLISHED,
+            asset_ids={"manufacturerPartId": "P-1"},
+            short_slug=None,
+            created_at=now,
+            updated_at=now,
+            current_published_revision_id=uuid4(),
+        )
+        projection_row = SimpleNamespace(
+            id=dpp.current_published_revision_id,
+            revision_no=1,
+            digest_sha256="d" * 64,
+            payload=b'{"submodels":[]}',
+        )
+        return dpp, projection_row
+
+    @staticmethod
+    def _scalar(value: Any) -> MagicMock:
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = value
+        return result
+
+    @staticmethod
+    def _row(value: Any) -> MagicMock:
+        result = MagicMock()
+        result.one_or_none.return_value = value
+        return result
+
+    @pytest.mark.asyncio()
+    async def test_second_read_skips_the_projection_query(self, fake_redis: _FakeRedis) -> None:
+        from app.modules.dpps.public_router import get_published_dpp
+
+        tenant = SimpleNamespace(id=uuid4(), slug="default")
+        dpp, projection_row = self._published(tenant.id)
+
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[self._scalar(tenant), self._scalar(dpp), self._row(projection_row)]
+        )
+        first = await get_published_dpp(tenant_slug="default", dpp_id=dpp.id, db=db)
+
+        db.execute = AsyncMock(side_effect=[self._scalar(tenant), self._scalar(dpp)])
+        second = await get_published_dpp(tenant_slug="default", dpp_id=dpp.id, db=db)
+
+        assert second.body == first.body
+        assert json.loads(second.body)["aas_environment"] == {"submodels": []}
+        assert db.execute.await_count == 2
+
+        await invalidate_public_dpp(tenant.id, dpp.id)
+        assert [key for key in fake_redis.store if "-generation:" not in key] == []
+
+    @pytest.mark.asyncio()
+    @pytest.mark.usefixtures("fake_redis")
+    async def test_late_write_of_an_older_revision_is_not_served(self) -> None:
+        from app.modules.dpps.public_router import get_published_dpp
+
+        tenant = SimpleNamespace(id=uuid4(), slug="default")
+        stale, stale_row = self._published(tenant.id)
+        await invalidate_public_dpp(tenant.id, stale.id)
+
+        # A reader that loaded the old revision writes its entry after the invalidation.
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[self._scalar(tenant), self._scalar(stale), self._row(stale_row)]
+        )
+        await get_published_dpp(tenant_slug="default", dpp_id=stale.id, db=db)
+
+        republished = SimpleNamespace(**{**vars(stale), "current_published_revision_id": uuid4()})
+        fresh_row = SimpleNamespace(
+            **{**vars(stale_row), "id": republished.current_published_revision_id}
+        )
+        fresh_row.payload = b'{"submodels":[{"id":"sm-2"}]}'
+        db.execute = AsyncMock(
+            side_effect=[self._scalar(tenant), self._scalar(republished), self._row(fresh_row)]
+        )
+        response = await get_published_dpp(tenant_slug="default", dpp_id=stale.id, db=db)
+
+        assert json.loads(response.body)["aas_environment"] == {"submodels": [{"id": "sm-2"}]}
+        assert db.execute.await_count == 3
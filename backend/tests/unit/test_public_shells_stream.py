@@ -0,0 +1,164 @@
+"""Tests for the streaming NDJSON crawl of the public shells listing."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import orjson
+import pytest
+from fastapi.responses import StreamingResponse
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import DPPStatus, TenantStatus
+from app.modules.dpps import public_router
+from app.modules.dpps.idta_schemas import encode_cursor
+from app.modules.dpps.public_projection import PROJECTION_FULL, build_public_projection
+from app.modules.dpps.public_router import NDJSON_MEDIA_TYPE, list_shells
+from app.modules.dpps.repository import AASRepositoryService, PublishedProjection
+
+_ENV = {"assetAdministrationShells": [], "submodels": []}
+
+
+class _StreamResult:
+    """Async-iterable stand-in for a streamed SQLAlchemy result."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+        self.close = AsyncMock()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        for row in self._rows:
+            yield row
+
+
+def _dpp() -> SimpleNamespace:
+    now = datetime.now(UTC)
+    return SimpleNamespace(
+        id=uuid4(),
+        status=DPPStatus.PUBLISHED,
+        asset_ids={"manufacturerPartId": "PART-001"},
+        short_slug=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _stream_row(dpp: Any, *, payload: bytes | None, legacy_env: Any = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        DPP=dpp,
+        revision_id=uuid4(),
+        revision_no=1,
+        digest_sha256="abc123",
+        payload=payload,
+        legacy_env=legacy_env,
+    )
+
+
+class TestStreamPublishedShells:
+    @pytest.mark.asyncio()
+    async def test_uses_server_side_cursor_in_id_order(self) -> None:
+        after = uuid4()
+        result = _StreamResult([])
+        session = AsyncMock()
+        session.stream = AsyncMock(return_value=result)
+
+        rows = [
+            row
+            async for row in AASRepositoryService(session).stream_published_shells(
+                uuid4(), PROJECTION_FULL, after=after, batch_size=50
+            )
+        ]
+
+        assert rows == []
+        stmt = session.stream.await_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 50
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ORDER BY dpps.id" in sql
+        assert "dpps.id >" in sql
+        result.close.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_yields_stored_legacy_and_missing_projections(self) -> None:
+        stored, legacy, unpublished = _dpp(), _dpp(), _dpp()
+        missing = SimpleNamespace(DPP=unpublished, revision_id=None)
+        session = AsyncMock()
+        session.stream = AsyncMock(
+            return_value=_StreamResult(
+                [
+                    _stream_row(stored, payload=b'{"submodels":[]}'),
+                    _stream_row(legacy, payload=None, legacy_env=_ENV),
+                    missing,
+                ]
+            )
+        )
+
+        rows = [
+            row
+            async for row in AASRepositoryService(session).stream_published_shells(
+                uuid4(), PROJECTION_FULL
+            )
+        ]
+
+        assert [dpp for dpp, _ in rows] == [stored, legacy, unpublished]
+        assert rows[0][1] is not None
+        assert rows[0][1].payload == b'{"submodels":[]}'
+        assert rows[1][1] is not None
+        assert rows[1][1].payload == build_public_projection(_ENV, PROJECTION_FULL)
+        assert rows[2][1] is None
+
+
+class TestListShellsStreaming:
+    @pytest.mark.asyncio()
+    async def test_ndjson_streams_one_shell_per_line(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        tenant = SimpleNamespace(id=uuid4(), slug="acme", status=TenantStatus.ACTIVE)
+        monkeypatch.setattr(public_router, "_resolve_tenant", AsyncMock(return_value=tenant))
+        monkeypatch.setattr(public_router, "_NDJSON_FLUSH_BYTES", 1)
+
+        dpps = [_dpp(), _dpp()]
+        projection = PublishedProjection(
+            revision_id=uuid4(), revision_no=2, digest_sha256="abc123", payload=b'{"x":1}'
+        )
+        calls: list[dict[str, Any]] = []
+
+        async def _stream(
+            _self: AASRepositoryService, tenant_id: Any, projection_key: str, **kwargs: Any
+        ) -> AsyncIterator[tuple[Any, PublishedProjection | None]]:
+            calls.append({"tenant_id": tenant_id, "projection_key": projection_key, **kwargs})
+            yield dpps[0], projection
+            yield dpps[1], None
+
+        @asynccontextmanager
+        async def _session() -> AsyncIterator[MagicMock]:
+            yield MagicMock()
+
+        monkeypatch.setattr(AASRepositoryService, "stream_published_shells", _stream)
+        monkeypatch.setattr(public_router, "get_background_session", _session)
+
+        after = uuid4()
+        response = await list_shells(
+            "acme",
+            AsyncMock(),
+            limit=10,
+            cursor=encode_cursor(after),
+            if_none_match=None,
+            accept=f"{NDJSON_MEDIA_TYPE}, application/json;q=0.5",
+        )
+
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == NDJSON_MEDIA_TYPE
+        chunks = [chunk async for chunk in response.body_iterator]
+        assert len(chunks) == 2
+        lines = [orjson.loads(line) for line in b"".join(chunks).splitlines()]  # type: ignore[arg-type]
+        assert [line["id"] for line in lines] == [str(dpp.id) for dpp in dpps]
+        assert lines[0]["aas_environment"] == {"x": 1}
+        assert lines[0]["current_revision_no"] == 2
+        assert lines[1]["aas_environment"] is None
+        assert calls == [
+            {"tenant_id": tenant.id, "projection_key": PROJECTION_FULL, "after": after}
+        ]
@@ -0,0 +1,54 @@
+"""Tests for pre-serialized JSON response assembly."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.core.raw_json import raw_json_response, splice_model_json, splice_raw_json
+
+
+class _Envelope(BaseModel):
+    id: str
+    product_identifier: str | None = Field(default=None, alias="productIdentifier")
+    aas_environment: dict[str, Any] | None = None
+
+
+class TestSpliceRawJson:
+    def test_splices_raw_member(self) -> None:
+        content = splice_raw_json({"id": "x"}, "env", b'{"a":[1,2]}')
+        assert json.loads(content) == {"id": "x", "env": {"a": [1, 2]}}
+
+    def test_none_becomes_null(self) -> None:
+        assert json.loads(splice_raw_json({"id": "x"}, "env", None)) == {"id": "x", "env": None}
+
+    def test_empty_envelope(self) -> None:
+        assert json.loads(splice_raw_json({}, "env", b"[]")) == {"env": []}
+
+
+class TestSpliceModelJson:
+    def test_matches_pydantic_serialization(self) -> None:
+        environment = {"submodels": [{"id": "urn:sm:1", "submodelElements": []}]}
+        envelope = _Envelope(id="x", productIdentifier="P-1")
+
+        content = splice_model_json(
+            envelope,
+            "aas_environment",
+            json.dumps(environment).encode(),
+            by_alias=True,
+        )
+
+        expected = _Envelope(id="x", productIdentifier="P-1", aas_environment=environment)
+        assert json.loads(content) == expected.model_dump(mode="json", by_alias=True)
+
+    def test_placeholder_value_is_not_emitted_twice(self) -> None:
+        content = splice_model_json(_Envelope(id="x"), "aas_environment", b"{}")
+        assert content.count(b"aas_environment") == 1
+
+    def test_response_is_not_reencoded(self) -> None:
+        response = raw_json_response(b'{"a":1}', headers={"ETag": '"e"'})
+        assert response.body == b'{"a":1}'
+        assert response.media_type == "application/json"
+        assert response.headers["ETag"] == '"e"'
@@ -26,17 +26,21 @@ async def test_cleanup_removes_old_drafts_beyond_limit() -> None:
     select_result = MagicMock()
     select_result.scalars.return_value.all.return_value = old_ids
 
+    # No newer revision is stored as a delta on the old ones
+    dependents_result = MagicMock()
+    dependents_result.scalars.return_value.all.return_value = []
+
     # Mock the delete
     delete_result = MagicMock()
 
-    session.execute = AsyncMock(side_effect=[select_result, delete_result])
+    session.execute = AsyncMock(side_effect=[select_result, dependents_result, delete_result])
 
     with patch.object(service, "_settings") as mock_settings:
         mock_settings.dpp_max_draft_revisions = 10
         count = await service._cleanup_old_draft_revisions(dpp_id, tenant_id)
 
     assert count == 5
-    assert session.execute.call_count == 2
+    assert session.execute.call_count == 3
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,264 @@
+"""Tests for delta-encoded DPP revision storage."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import RevisionState
+from app.modules.dpps import revision_store
+from app.modules.dpps.revision_store import (
+    add_revision,
+    apply_environment_delta,
+    detach_revisions,
+    diff_environment,
+    materialize_revision,
+    promote_to_keyframe,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    revision_store._environments.clear()
+    yield
+    revision_store._environments.clear()
+
+
+def _settings(mode: str = "delta", interval: int = 20, cache: int = 256) -> SimpleNamespace:
+    return SimpleNamespace(
+        dpp_revision_storage_mode=mode,
+        dpp_revision_keyframe_interval=interval,
+        dpp_revision_cache_max_entries=cache,
+    )
+
+
+def _env(value: Any = "v", *, extra: int = 0) -> dict[str, Any]:
+    return {
+        "assetAdministrationShells": [{"id": "urn:aas:1"}],
+        "submodels": [
+            {"id": f"sm-{i}", "submodelElements": [{"idShort": "p", "value": value}]}
+            for i in range(2 + extra)
+        ],
+    }
+
+
+def _revision(env: dict[str, Any] | None, **overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "id": uuid4(),
+        "dpp_id": uuid4(),
+        "state": RevisionState.DRAFT,
+        "aas_env_json": env,
+        "env_delta": None,
+        "delta_base_revision_id": None,
+        "delta_depth": 0,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _roundtrip(old: Any, new: Any) -> Any:
+    return apply_environment_delta(copy.deepcopy(old), diff_environment(old, new))
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        (_env(), _env("changed")),
+        (_env(), _env(extra=3)),
+        (_env(extra=3), _env()),
+        ({"a/b": 1, "c~d": [1, 2]}, {"a/b": 2, "c~d": [1]}),
+        ({"flag": 1}, {"flag": True}),
+        ({"x": {"y": 1}}, {"x": [1]}),
+        ([1, 2], {"root": "replaced"}),
+    ],
+)
+def test_diff_then_apply_reproduces_the_new_document(old: Any, new: Any) -> None:
+    result = _roundtrip(old, new)
+
+    assert result == new
+    assert type(result) is type(new)
+    if isinstance(new, dict) and "flag" in new:
+        assert result["flag"] is True
+
+
+def test_diff_only_touches_changed_subtrees() -> None:
+    delta = diff_environment(_env(), _env("changed"))
+
+    assert delta == [
+        {"op": "replace", "path": "/submodels/0/submodelElements/0/value", "value": "changed"},
+        {"op": "replace", "path": "/submodels/1/submodelElements/0/value", "value": "changed"},
+    ]
+    assert diff_environment(_env(), _env()) == []
+
+
+def test_apply_rejects_a_patch_that_does_not_fit() -> None:
+    with pytest.raises(ValueError, match="does not match"):
+        apply_environment_delta({}, [{"op": "remove", "path": "/missing"}])
+
+
+@pytest.mark.asyncio
+async def test_add_revision_stores_a_delta_and_keeps_the_environment() -> None:
+    parent = _revision(_env(), delta_depth=2)
+    revision = _revision(_env("changed"), dpp_id=parent.dpp_id)
+    session = MagicMock()
+    session.flush = AsyncMock()
+    stored: dict[str, Any] = {}
+    session.add.side_effect = lambda obj: stored.update(
+        aas_env_json=obj.aas_env_json, env_delta=obj.env_delta
+    )
+
+    with (
+        patch.object(revision_store, "get_settings", return_value=_settings()),
+        patch.object(revision_store, "set_committed_value", setattr),
+    ):
+        await add_revision(session, revision, parent=parent)
+
+    assert stored["aas_env_json"] is None
+    assert stored["env_delta"] == diff_environment(_env(), _env("changed"))
+    assert revision.delta_base_revision_id == parent.id
+    assert revision.delta_depth == 3
+    assert revision.aas_env_json == _env("changed")
+    assert revision_store._environments.get(revision.id) == _env("changed")
+
+
+@pytest.mark.parametrize(
+    ("settings", "revision_overrides", "parent_overrides"),
+    [
+        (_settings(mode="full"), {}, {}),
+        (_settings(interval=3), {}, {"delta_depth": 2}),
+        (_settings(), {"state": RevisionState.PUBLISHED}, {}),
+        (_settings(), {"dpp_id": uuid4()}, {}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_add_revision_writes_keyframes_when_a_delta_is_not_allowed(
+    settings: SimpleNamespace,
+    revision_overrides: dict[str, Any],
+    parent_overrides: dict[str, Any],
+) -> None:
+    dpp_id = uuid4()
+    parent = _revision(_env(), dpp_id=dpp_id, **parent_overrides)
+    revision = _revision(_env("changed"), **{"dpp_id": dpp_id, **revision_overrides})
+    session = MagicMock()
+    session.flush = AsyncMock()
+
+    with patch.object(revision_store, "get_settings", return_value=settings):
+        await add_revision(session, revision, parent=parent)
+
+    session.add.assert_called_once_with(revision)
+    assert revision.aas_env_json == _env("changed")
+    assert revision.delta_base_revision_id is None
+
+
+@pytest.mark.asyncio
+async def test_materialize_applies_the_delta_to_a_cached_parent() -> None:
+    base_id = uuid4()
+    revision_store._environments.put(base_id, _env())
+    revision = _revision(
+        None,
+        env_delta=diff_environment(_env(), _env("changed")),
+        delta_base_revision_id=base_id,
+        delta_depth=1,
+    )
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    with patch.object(revision_store, "set_committed_value", setattr):
+        await materialize_revision(session, revision)
+
+    assert revision.aas_env_json == _env("changed")
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_materialize_replays_the_chain_from_the_keyframe() -> None:
+    envs = [_env("v0"), _env("v1"), _env("v2", extra=1)]
+    keyframe_id, middle_id = uuid4(), uuid4()
+    rows = [
+        SimpleNamespace(
+            id=middle_id,
+            delta_base_revision_id=keyframe_id,
+            env_delta=diff_environment(envs[0], envs[1]),
+            aas_env_json=None,
+        ),
+        SimpleNamespace(
+            id=keyframe_id, delta_base_revision_id=None, env_delta=None, aas_env_json=envs[0]
+        ),
+    ]
+    revision = _revision(
+        None,
+        env_delta=diff_environment(envs[1], envs[2]),
+        delta_base_revision_id=middle_id,
+        delta_depth=2,
+    )
+    result = MagicMock()
+    result.all.return_value = rows
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+
+    with patch.object(revision_store, "set_committed_value", setattr):
+        await materialize_revision(session, revision)
+
+    assert revision.aas_env_json == envs[2]
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "WITH RECURSIVE revision_chain" in sql
+
+
+@pytest.mark.asyncio
+async def test_promote_to_keyframe_rewrites_the_row() -> None:
+    revision = _revision(_env(), env_delta=[], delta_base_revision_id=uuid4(), delta_depth=4)
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    with patch.object(revision_store, "set_committed_value", setattr):
+        await promote_to_keyframe(session, revision)
+
+    statement = session.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE dpp_revisions SET aas_env_json=")
+    assert revision.delta_base_revision_id is None
+    assert revision.env_delta is None
+    assert revision.delta_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_detach_promotes_dependents_outside_the_deleted_set() -> None:
+    doomed = [uuid4(), uuid4()]
+    dependent = _revision(_env(), env_delta=[], delta_base_revision_id=doomed[1], delta_depth=1)
+    dependents_result = MagicMock()
+    dependents_result.scalars.return_value.all.return_value = [dependent]
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[dependents_result, MagicMock()])
+
+    with patch.object(revision_store, "set_committed_value", setattr):
+        await detach_revisions(session, doomed)
+
+    select_sql = str(
+        session.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect())
+    )
+    assert "delta_base_revision_id IN" in select_sql
+    assert "dpp_revisions.id NOT IN" in select_sql
+    assert dependent.delta_base_revision_id is None
+    assert session.execute.await_count == 2
+
+
+def test_cache_is_bounded_and_hands_out_copies() -> None:
+    ids = [uuid4() for _ in range(3)]
+
+    with patch.object(revision_store, "get_settings", return_value=_settings(cache=2)):
+        for revision_id in ids:
+            revision_store._environments.put(revision_id, _env())
+
+    assert len(revision_store._environments) == 2
+    assert revision_store._environments.get(ids[0]) is None
+    first = revision_store._environments.get(ids[2])
+    assert first is not None
+    first["submodels"].clear()
+    assert revision_store._environments.get(ids[2]) == _env()
@@ -0,0 +1,184 @@
+"""Tests for the persistent template contract cache."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.modules.templates import contract_cache
+from app.modules.templates.contract_cache import (
+    TemplateContractKey,
+    template_lookup_fingerprint,
+    template_source_revision,
+)
+from app.modules.templates.service import TemplateRegistryService
+from app.modules.units.models import UomDataSpecification, UomRegistryEntry
+
+
+@pytest.fixture(autouse=True)
+def _clear_memory_tier() -> Iterator[None]:
+    contract_cache._memory_tier.clear()
+    yield
+    contract_cache._memory_tier.clear()
+
+
+def _template(**overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "template_key": "technical-data",
+        "idta_version": "2.0.1",
+        "semantic_id": "https://example.org/technical-data",
+        "resolved_version": "2.0.1",
+        "source_repo_ref": "main",
+        "source_file_path": "TechnicalData/template.json",
+        "source_file_sha": "abc123",
+        "source_kind": "json",
+        "selection_strategy": "deterministic_v2",
+        "source_url": "https://example.org/template.json",
+        "catalog_status": "published",
+        "catalog_folder": None,
+        "display_name": "Technical Data",
+        "fetched_at": datetime(2026, 1, 1, tzinfo=UTC),
+        "template_aasx": None,
+        "template_json": {"conceptDescriptions": []},
+        "template_json_raw": {"conceptDescriptions": []},
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _registry_entry(symbol: str) -> UomRegistryEntry:
+    data_specification = UomDataSpecification.from_payload(
+        {"preferredName": {"en": "metre"}, "symbol": symbol, "specificUnitID": "MTR"}
+    )
+    assert data_specification is not None
+    return UomRegistryEntry(cd_id="urn:unit:m", data_specification=data_specification)
+
+
+def _service(stored: dict[str, Any] | None = None) -> TemplateRegistryService:
+    session = MagicMock()
+    read_result = MagicMock()
+    read_result.scalar_one_or_none.return_value = stored
+    session.execute = AsyncMock(return_value=read_result)
+    service = TemplateRegistryService(session)
+    service._generate_template_definition = MagicMock(  # type: ignore[method-assign]
+        side_effect=lambda *_args, **_kwargs: {
+            "submodel": {"idShort": "TechnicalData", "elements": []}
+        }
+    )
+    service._load_uom_registry_indexes = AsyncMock(  # type: ignore[method-assign]
+        return_value=({}, {}, {})
+    )
+    return service
+
+
+def _key(**overrides: Any) -> TemplateContractKey:
+    fields: dict[str, Any] = {
+        "template_key": "technical-data",
+        "idta_version": "2.0.1",
+        "semantic_id": "https://example.org/technical-data",
+        "source_revision": "abc123",
+        "uom_registry_version": "0" * 64,
+        "lookup_fingerprint": "1" * 64,
+        "strict_unknown_model_types": False,
+    }
+    fields.update(overrides)
+    return TemplateContractKey(**fields)
+
+
+def test_key_digest_covers_every_input() -> None:
+    variants = [
+        _key(),
+        _key(source_revision="def456"),
+        _key(uom_registry_version="2" * 64),
+        _key(lookup_fingerprint="3" * 64),
+        _key(strict_unknown_model_types=True),
+        _key(semantic_id="urn:other"),
+    ]
+
+    assert len({key.digest for key in variants}) == len(variants)
+
+
+def test_unpinned_templates_are_not_cached() -> None:
+    unpinned = _template(source_file_sha=None, fetched_at=None)
+
+    assert template_source_revision(_template(source_file_sha=None)) == (
+        "fetched:2026-01-01T00:00:00+00:00"
+    )
+    assert template_source_revision(unpinned) is None
+    assert template_lookup_fingerprint({"a": _template(), "b": unpinned}) is None
+    assert template_lookup_fingerprint({"a": _template()}) != template_lookup_fingerprint(
+        {"a": _template(source_file_sha="def456")}
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_contracts_are_served_from_memory() -> None:
+    service = _service()
+    template = _template()
+    lookup = {"technical-data": template}
+
+    first = await service.generate_template_contract(template, template_lookup=lookup)
+    first["definition"]["submodel"]["idShort"] = "mutated by caller"
+    template.display_name = "Renamed"
+    second = await service.generate_template_contract(template, template_lookup=lookup)
+
+    assert service._generate_template_definition.call_count == 1
+    assert second["definition"]["submodel"]["idShort"] == "TechnicalData"
+    assert second["source_metadata"]["display_name"] == "Renamed"
+    statements = [
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in service._session.execute.await_args_list
+    ]
+    assert any("ON CONFLICT (cache_key) DO NOTHING" in sql for sql in statements)
+    assert any("template_contracts.source_revision !=" in sql for sql in statements)
+
+
+@pytest.mark.asyncio
+async def test_registry_changes_regenerate_the_contract() -> None:
+    service = _service()
+    template = _template()
+
+    await service.generate_template_contract(template)
+    service._load_uom_registry_indexes = AsyncMock(  # type: ignore[method-assign]
+        return_value=({"urn:unit:m": _registry_entry("m")}, {}, {})
+    )
+    await service.generate_template_contract(template)
+
+    assert service._generate_template_definition.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_persisted_contracts_skip_generation() -> None:
+    stored = {
+        "definition": {"submodel": {"idShort": "Stored"}},
+        "schema": {"type": "object"},
+        "dropin_resolution_report": [],
+        "unsupported_nodes": [],
+        "doc_hints": {},
+        "uom_diagnostics": {"summary": {}, "issues": []},
+    }
+    service = _service(stored=stored)
+
+    contract = await service.generate_template_contract(_template())
+
+    service._generate_template_definition.assert_not_called()
+    assert contract["definition"]["submodel"]["idShort"] == "Stored"
+    assert contract["source_metadata"]["source_file_sha"] == "abc123"
+    assert len(contract_cache._memory_tier) == 1
+
+
+@pytest.mark.asyncio
+async def test_storage_failures_fall_back_to_generation() -> None:
+    service = _service()
+    service._session.execute = AsyncMock(side_effect=RuntimeError("no table"))
+
+    contract = await service.generate_template_contract(_template())
+
+    assert contract["definition"]["submodel"]["idShort"] == "TechnicalData"
+    assert service._generate_template_definition.call_count == 1
@@ -0,0 +1,151 @@
+"""Tests for the process-wide parsed template model cache."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from basyx.aas import model
+
+from app.modules.dpps.basyx_builder import BasyxDppBuilder
+from app.modules.templates import model_cache
+from app.modules.templates.basyx_parser import ParsedTemplate
+from app.modules.templates.model_cache import (
+    load_parsed_template,
+    load_resolved_template,
+    template_model_cache_stats,
+)
+
+SEMANTIC_ID = "https://example.org/nameplate"
+
+
+@pytest.fixture(autouse=True)
+def _clear_models() -> Iterator[None]:
+    model_cache._models.clear()
+    yield
+    model_cache._models.clear()
+
+
+def _template(**overrides: Any) -> SimpleNamespace:
+    fields: dict[str, Any] = {
+        "template_key": "digital-nameplate",
+        "idta_version": "3.0.1",
+        "semantic_id": SEMANTIC_ID,
+        "source_file_sha": "abc123",
+        "fetched_at": datetime(2026, 1, 1, tzinfo=UTC),
+        "template_aasx": None,
+        "template_json": {
+            "submodels": [
+                {
+                    "modelType": "Submodel",
+                    "id": "urn:template:nameplate",
+                    "idShort": "Nameplate",
+                    "semanticId": {
+                        "type": "ExternalReference",
+                        "keys": [{"type": "GlobalReference", "value": SEMANTIC_ID}],
+                    },
+                    "submodelElements": [
+                        {
+                            "modelType": "Property",
+                            "idShort": "ManufacturerName",
+                            "valueType": "xs:string",
+                        }
+                    ],
+                }
+            ]
+        },
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _parsed(id_short: str = "Nameplate") -> ParsedTemplate:
+    submodel = model.Submodel(id_="urn:template:nameplate", id_short=id_short)
+    store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore([submodel])
+    return ParsedTemplate(store=store, submodel=submodel, concept_descriptions=[])
+
+
+def _settings(max_bytes: int) -> SimpleNamespace:
+    return SimpleNamespace(template_model_cache_max_bytes=max_bytes)
+
+
+def test_repeated_loads_share_one_parsed_model() -> None:
+    load = MagicMock(side_effect=lambda: _parsed())
+    template = _template()
+
+    first = load_parsed_template(template, SEMANTIC_ID, load)
+    second = load_parsed_template(template, SEMANTIC_ID, load)
+    changed = load_parsed_template(_template(source_file_sha="def456"), SEMANTIC_ID, load)
+
+    assert first is second
+    assert changed is not first
+    assert load.call_count == 2
+    stats = template_model_cache_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+
+
+def test_unpinned_templates_are_parsed_every_time() -> None:
+    load = MagicMock(side_effect=lambda: _parsed())
+    template = _template(source_file_sha=None, fetched_at=None)
+
+    load_parsed_template(template, SEMANTIC_ID, load)
+    load_parsed_template(template, SEMANTIC_ID, load)
+
+    assert load.call_count == 2
+    assert template_model_cache_stats().entries == 0
+
+
+def test_byte_budget_evicts_least_recently_used_models() -> None:
+    templates = [_template(source_file_sha=f"sha-{i}") for i in range(3)]
+    entry_size = model_cache._estimated_size(templates[0])
+
+    with patch.object(model_cache, "get_settings", return_value=_settings(entry_size * 2)):
+        for template in templates:
+            load_parsed_template(template, SEMANTIC_ID, _parsed)
+        stats = template_model_cache_stats()
+        oversized = _template(template_json={"blob": "x" * entry_size * 3})
+        load_parsed_template(oversized, SEMANTIC_ID, _parsed)
+
+    assert stats.entries == 2
+    assert stats.evictions == 1
+    assert stats.size_bytes == entry_size * 2
+    assert template_model_cache_stats().entries == 2
+
+
+def test_resolved_variants_copy_instead_of_mutating_the_shared_model() -> None:
+    template = _template()
+    lookup = {"digital-nameplate": template}
+
+    def resolve(parsed: ParsedTemplate) -> dict[int, dict[str, Any]]:
+        parsed.submodel.id_short = "Resolved"
+        return {id(parsed.submodel): {"status": "resolved"}}
+
+    resolver = MagicMock(side_effect=resolve)
+    first = load_resolved_template(template, SEMANTIC_ID, lookup, load=_parsed, resolve=resolver)
+    second = load_resolved_template(template, SEMANTIC_ID, lookup, load=_parsed, resolve=resolver)
+    shared = load_parsed_template(template, SEMANTIC_ID, _parsed)
+
+    assert first is second
+    assert resolver.call_count == 1
+    assert first.parsed.submodel.id_short == "Resolved"
+    assert shared.submodel.id_short == "Nameplate"
+    assert first.resolution_by_element_id == {id(first.parsed.submodel): {"status": "resolved"}}
+
+
+def test_builder_parses_each_template_once() -> None:
+    builder = BasyxDppBuilder(MagicMock())
+    template = _template()
+
+    with patch.object(
+        builder._template_parser, "parse_json", wraps=builder._template_parser.parse_json
+    ) as parse_json:
+        first = builder._parse_template(template, SEMANTIC_ID)
+        second = builder._parse_template(template, SEMANTIC_ID)
+
+    assert first is second
+    assert first.submodel.id_short == "Nameplate"
+    assert parse_json.call_count == 1
@@ -0,0 +1,124 @@
+"""Tests for the in-process tenant slug/hostname resolution cache."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core import tenant_cache
+from app.core.tenant_cache import (
+    TENANT_CACHE_CHANNEL,
+    CachedTenant,
+    get_tenant_by_slug,
+)
+from app.db.models import TenantStatus
+from app.modules.tenant_domains.service import TenantDomainService
+
+
+def _tenant(slug: str = "default") -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), slug=slug, name="Default", status=TenantStatus.ACTIVE)
+
+
+def _session(*values: object) -> AsyncMock:
+    results = []
+    for value in values:
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = value
+        results.append(result)
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=results)
+    return session
+
+
+@pytest.fixture()
+def listening() -> Iterator[None]:
+    tenant_cache._set_listening(True)
+    yield
+    tenant_cache._set_listening(False)
+
+
+class TestWithoutListener:
+    @pytest.mark.asyncio()
+    async def test_reads_through_and_returns_row(self) -> None:
+        tenant = _tenant()
+        session = _session(tenant, tenant)
+
+        assert await get_tenant_by_slug(session, "default") is tenant
+        assert await get_tenant_by_slug(session, "default") is tenant
+        assert session.execute.await_count == 2
+
+
+@pytest.mark.usefixtures("listening")
+class TestWithListener:
+    @pytest.mark.asyncio()
+    async def test_second_lookup_is_served_from_cache(self) -> None:
+        tenant = _tenant()
+        session = _session(tenant)
+
+        first = await get_tenant_by_slug(session, " Default ", active_only=True)
+        second = await get_tenant_by_slug(session, "default", active_only=True)
+
+        assert first == second == CachedTenant.from_tenant(tenant)  # type: ignore[arg-type]
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio()
+    async def test_active_only_is_cached_separately(self) -> None:
+        session = _session(None, _tenant())
+
+        assert await get_tenant_by_slug(session, "default", active_only=True) is None
+        assert await get_tenant_by_slug(session, "default") is not None
+
+    @pytest.mark.asyncio()
+    async def test_notification_drops_only_affected_table(self) -> None:
+        session = _session(_tenant(), _tenant())
+        await get_tenant_by_slug(session, "default")
+        tenant_cache._tenant_ids_by_hostname._entries["dpp.example.com"] = (1e12, uuid4())
+
+        tenant_cache._on_notification(None, 0, TENANT_CACHE_CHANNEL, "tenants")
+        await get_tenant_by_slug(session, "default")
+
+        assert session.execute.await_count == 2
+        assert len(tenant_cache._tenant_ids_by_hostname) == 1
+
+    @pytest.mark.asyncio()
+    async def test_change_during_load_is_not_cached(self) -> None:
+        tenant = _tenant()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = tenant
+
+        async def _execute(_stmt: object) -> MagicMock:
+            tenant_cache.invalidate_tenant_cache("tenants")
+            return result
+
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=_execute)
+
+        await get_tenant_by_slug(session, "default")
+
+        assert len(tenant_cache._tenants_by_slug) == 0
+
+    @pytest.mark.asyncio()
+    async def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        settings = SimpleNamespace(tenant_cache_ttl_seconds=60, tenant_cache_max_entries=2)
+        monkeypatch.setattr(tenant_cache, "get_settings", lambda: settings)
+        session = _session(_tenant("a"), _tenant("b"), _tenant("c"))
+
+        for slug in ("a", "b", "c"):
+            await get_tenant_by_slug(session, slug)
+
+        assert len(tenant_cache._tenants_by_slug) == 2
+        assert ("a", False) not in tenant_cache._tenants_by_slug._entries
+
+    @pytest.mark.asyncio()
+    async def test_hostname_lookup_is_cached(self) -> None:
+        tenant_id = uuid4()
+        session = _session(tenant_id)
+        service = TenantDomainService(session)
+
+        assert await service.resolve_active_tenant_by_hostname("DPP.Example.com") == tenant_id
+        assert await service.resolve_active_tenant_by_hostname("dpp.example.com") == tenant_id
+        assert session.execute.await_count == 1
@@ -0,0 +1,147 @@
+"""Tests for single-round-trip tenant context resolution."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.core.security import identity_sync
+from app.core.security.identity_sync import (
+    claims_fingerprint,
+    claims_recently_synced,
+    remember_synced_claims,
+)
+from app.core.security.oidc import TokenPayload
+from app.core.tenancy import _tenant_context_statement, resolve_tenant_context
+from app.db.models import TenantRole, TenantStatus
+
+
+@pytest.fixture(autouse=True)
+def _clear_synced_claims() -> Iterator[None]:
+    identity_sync._synced_claims.clear()
+    yield
+    identity_sync._synced_claims.clear()
+
+
+def _token(*, email: str = "user@example.com", roles: list[str] | None = None) -> TokenPayload:
+    return TokenPayload(
+        sub="user-123",
+        email=email,
+        email_verified=True,
+        preferred_username="user",
+        roles=roles if roles is not None else ["publisher"],
+        bpn=None,
+        org=None,
+        clearance=None,
+        exp=datetime.now(UTC),
+        iat=datetime.now(UTC),
+        raw_claims={},
+    )
+
+
+def _context_row(
+    *,
+    status: TenantStatus = TenantStatus.ACTIVE,
+    member_role: TenantRole | None = TenantRole.PUBLISHER,
+    user_writes: int | None = 0,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        slug="acme",
+        name="Acme",
+        status=status,
+        member_role=member_role,
+        current_tenant="",
+        user_writes=user_writes,
+    )
+
+
+def _session(row: Any) -> AsyncMock:
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def _sql(user: TokenPayload) -> str:
+    return str(_tenant_context_statement("acme", user).compile(dialect=postgresql.dialect()))
+
+
+class TestTenantContextStatement:
+    def test_upserts_user_when_claims_not_cached(self) -> None:
+        sql = _sql(_token())
+        assert "INSERT INTO users" in sql
+        assert "ON CONFLICT (subject) DO UPDATE" in sql
+        assert "set_config" in sql
+        assert "tenant_members" in sql
+
+    def test_skips_upsert_when_claims_cached(self) -> None:
+        user = _token()
+        remember_synced_claims(user)
+        sql = _sql(user)
+        assert "INSERT INTO users" not in sql
+        assert "set_config" in sql
+
+
+class TestClaimsCache:
+    def test_fingerprint_tracks_mirrored_claims(self) -> None:
+        assert claims_fingerprint(_token()) == claims_fingerprint(_token())
+        assert claims_fingerprint(_token()) != claims_fingerprint(_token(email="new@example.com"))
+
+    def test_changed_claims_are_not_recently_synced(self) -> None:
+        remember_synced_claims(_token())
+        assert claims_recently_synced(_token())
+        assert not claims_recently_synced(_token(email="new@example.com"))
+
+
+class TestResolveTenantContext:
+    @pytest.mark.asyncio()
+    async def test_member_resolves_in_one_round_trip(self) -> None:
+        user = _token()
+        session = _session(_context_row())
+
+        context = await resolve_tenant_context("ACME", session, user)
+
+        assert session.execute.await_count == 1
+        assert context.tenant_slug == "acme"
+        assert context.member_role == TenantRole.PUBLISHER
+        assert "publisher" in context.roles
+        assert claims_recently_synced(user)
+
+    @pytest.mark.asyncio()
+    async def test_written_user_row_is_not_remembered(self) -> None:
+        user = _token()
+
+        await resolve_tenant_context("acme", _session(_context_row(user_writes=1)), user)
+
+        assert not claims_recently_synced(user)
+
+    @pytest.mark.asyncio()
+    async def test_unknown_tenant_is_404(self) -> None:
+        with pytest.raises(HTTPException) as exc_info:
+            await resolve_tenant_context("missing", _session(None), _token())
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio()
+    async def test_inactive_tenant_is_403(self) -> None:
+        row = _context_row(status=TenantStatus.DISABLED)
+        with pytest.raises(HTTPException) as exc_info:
+            await resolve_tenant_context("acme", _session(row), _token())
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio()
+    async def test_non_member_is_403(self) -> None:
+        session = _session(_context_row(member_role=None))
+        with pytest.raises(HTTPException) as exc_info:
+            await resolve_tenant_context("acme", session, _token())
+        assert exc_info.value.status_code == 403
+        assert session.execute.await_count == 1
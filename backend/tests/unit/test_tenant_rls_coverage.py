@@ -100,6 +100,42 @@ _RLS_0045 = {
     "tenant_domains",
 }
 
+# Tables with RLS from migration 0047
+_RLS_0047 = {
+    "dpp_public_projections",
+}
+
+_RLS_0049 = {
+    "dpp_published_submodels",
+}
+
+# Tables with RLS from migration 0051
+_RLS_0051 = {
+    "public_landing_summaries",
+    "public_landing_product_families",
+}
+
+# Tables with RLS from migration 0056
+_RLS_0056 = {
+    "dpp_rebuild_jobs",
+}
+
+# Tables with RLS from migration 0057
+_RLS_0057 = {
+    "dpp_outbox",
+}
+
+# Tables with RLS from migration 0058
+_RLS_0058 = {
+    "dpp_publish_jobs",
+    "dpp_publish_job_items",
+}
+
+# Tables with RLS from migration 0059
+_RLS_0059 = {
+    "compliance_scans",
+}
+
 TABLES_WITH_RLS = (
     _RLS_0005
     | _RLS_0008_0009
@@ -113,6 +149,13 @@ TABLES_WITH_RLS = (
     | _RLS_0036
     | _RLS_0041_0043
     | _RLS_0045
+    | _RLS_0047
+    | _RLS_0049
+    | _RLS_0051
+    | _RLS_0056
+    | _RLS_0057
+    | _RLS_0058
+    | _RLS_0059
 )
 
 # Tenant-scoped tables that do not currently inherit TenantScopedMixin.